@@ -19,6 +19,7 @@ Referanslar:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from dataclasses import replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -178,10 +179,13 @@ class ReActStep:
     action: Optional[Action] = None
     observation: Optional[Observation] = None
     final_answer: Optional[str] = None
+    # Paralel aksiyon modunda aynı adımdaki tüm aksiyonlar/gözlemler
+    actions: List[Action] = field(default_factory=list)
+    observations: List[Observation] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "step_number": self.step_number,
             "step_type": self.step_type.value,
             "thought": self.thought.to_dict() if self.thought else None,
@@ -190,6 +194,10 @@ class ReActStep:
             "final_answer": self.final_answer,
             "timestamp": self.timestamp.isoformat(),
         }
+        if self.actions:
+            data["actions"] = [a.to_dict() for a in self.actions]
+            data["observations"] = [o.to_dict() for o in self.observations]
+        return data
 
 
 @dataclass
@@ -207,13 +215,17 @@ class ReActTrace:
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # (tool, argümanlar) -> gözlem; trace boyunca tekrar eden çağrıları önler
+    observation_cache: Dict[Tuple[str, str], Observation] = field(default_factory=dict, repr=False)
     
     def add_step(self, step: ReActStep):
         """Adım ekle."""
         self.steps.append(step)
         if step.thought:
             self.thoughts_count += 1
-        if step.action and step.action.action_type == ActionType.TOOL_CALL:
+        if step.actions:
+            self.tool_calls_count += sum(1 for a in step.actions if a.action_type == ActionType.TOOL_CALL)
+        elif step.action and step.action.action_type == ActionType.TOOL_CALL:
             self.tool_calls_count += 1
     
     def get_thought_chain(self) -> List[str]:
@@ -227,9 +239,9 @@ class ReActTrace:
     def get_action_history(self) -> List[Dict]:
         """Aksiyon geçmişini döndür."""
         return [
-            step.action.to_dict() 
-            for step in self.steps 
-            if step.action
+            action.to_dict()
+            for step in self.steps
+            for action in (step.actions or ([step.action] if step.action else []))
         ]
     
     def to_dict(self) -> Dict[str, Any]:
@@ -262,11 +274,16 @@ class ReActTrace:
             if step.thought:
                 lines.append(f"   {step.thought}")
             
-            if step.action:
-                lines.append(f"   {step.action}")
-            
-            if step.observation:
-                lines.append(f"   {step.observation}")
+            if step.actions:
+                for action, observation in zip(step.actions, step.observations):
+                    lines.append(f"   {action}")
+                    lines.append(f"   {observation}")
+            else:
+                if step.action:
+                    lines.append(f"   {step.action}")
+                
+                if step.observation:
+                    lines.append(f"   {step.observation}")
             
             if step.final_answer:
                 lines.append(f"   ✨ Final Answer: {step.final_answer[:200]}...")
@@ -295,6 +312,8 @@ class ToolDefinition:
     required_params: List[str] = field(default_factory=list)
     examples: List[Dict[str, Any]] = field(default_factory=list)
     category: str = "general"
+    timeout_seconds: Optional[float] = None  # None: aksiyonun kendi timeout'u
+    cacheable: bool = True  # Aynı argümanlarla trace içinde tekrar çalıştırılmaz
     
     def to_prompt_format(self) -> str:
         """Prompt için formatla."""
@@ -322,6 +341,8 @@ class ToolExecutor:
         required_params: List[str] = None,
         examples: List[Dict] = None,
         category: str = "general",
+        timeout_seconds: Optional[float] = None,
+        cacheable: bool = True,
     ):
         """Araç kaydet."""
         self._tools[name] = func
@@ -332,6 +353,8 @@ class ToolExecutor:
             required_params=required_params or [],
             examples=examples or [],
             category=category,
+            timeout_seconds=timeout_seconds,
+            cacheable=cacheable,
         )
     
     def get_definitions(self) -> List[ToolDefinition]:
@@ -351,6 +374,8 @@ class ToolExecutor:
         start_time = time.time()
         
         tool_name = action.tool_name
+        definition = self._definitions.get(tool_name)
+        timeout = (definition.timeout_seconds if definition else None) or action.timeout_seconds
         
         if tool_name not in self._tools:
             return Observation(
@@ -367,7 +392,7 @@ class ToolExecutor:
             if asyncio.iscoroutinefunction(func):
                 result = await asyncio.wait_for(
                     func(**action.arguments),
-                    timeout=action.timeout_seconds,
+                    timeout=timeout,
                 )
             else:
                 loop = asyncio.get_event_loop()
@@ -376,7 +401,7 @@ class ToolExecutor:
                         self._executor,
                         lambda: func(**action.arguments)
                     ),
-                    timeout=action.timeout_seconds,
+                    timeout=timeout,
                 )
             
             execution_time = (time.time() - start_time) * 1000
@@ -394,7 +419,7 @@ class ToolExecutor:
                 action_id=action.id,
                 source=tool_name,
                 success=False,
-                error=f"Tool execution timed out after {action.timeout_seconds}s",
+                error=f"Tool execution timed out after {timeout}s",
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
         except Exception as e:
@@ -405,6 +430,81 @@ class ToolExecutor:
                 error=str(e),
                 execution_time_ms=(time.time() - start_time) * 1000,
             )
+    
+    @staticmethod
+    def cache_key(action: Action) -> Tuple[str, str]:
+        """Gözlem önbelleği anahtarı: (araç, sıralı argümanlar)."""
+        return (
+            action.tool_name,
+            json.dumps(action.arguments, sort_keys=True, ensure_ascii=False, default=str),
+        )
+    
+    def is_cacheable(self, tool_name: str) -> bool:
+        definition = self._definitions.get(tool_name)
+        return definition is not None and definition.cacheable
+    
+    async def execute_many(
+        self,
+        actions: List[Action],
+        cache: Optional[Dict[Tuple[str, str], Observation]] = None,
+        max_concurrency: int = 4,
+    ) -> List[Observation]:
+        """
+        Birden fazla aracı eşzamanlı çalıştır.
+        
+        Aynı (araç, argüman) çağrıları tek kez çalışır; `cache` verilirse
+        başarılı gözlemler oraya yazılır ve oradan okunur.
+        Sonuçlar aksiyon sırasıyla döner.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def run(action: Action) -> Observation:
+            async with semaphore:
+                return await self.execute(action)
+        
+        observations: List[Optional[Observation]] = [None] * len(actions)
+        owners: Dict[Tuple[str, str], int] = {}
+        tasks: Dict[int, asyncio.Task] = {}
+        
+        for i, action in enumerate(actions):
+            cacheable = self.is_cacheable(action.tool_name)
+            key = self.cache_key(action)
+            
+            if cacheable and cache is not None and key in cache:
+                observations[i] = self._reuse(cache[key], action)
+            elif cacheable and key in owners:
+                continue  # Aynı adımdaki tekrar - sahibinin sonucunu kullanır
+            else:
+                owners.setdefault(key, i)
+                tasks[i] = asyncio.ensure_future(run(action))
+        
+        if tasks:
+            await asyncio.gather(*tasks.values())
+        
+        for i, task in tasks.items():
+            observation = task.result()
+            observations[i] = observation
+            action = actions[i]
+            if cache is not None and observation.success and self.is_cacheable(action.tool_name):
+                cache[self.cache_key(action)] = observation
+        
+        for i, action in enumerate(actions):
+            if observations[i] is None:
+                observations[i] = self._reuse(observations[owners[self.cache_key(action)]], action)
+        
+        return observations
+    
+    @staticmethod
+    def _reuse(observation: Observation, action: Action) -> Observation:
+        """Önbellekteki gözlemi yeni aksiyona bağla."""
+        return replace(
+            observation,
+            id=str(uuid.uuid4())[:8],
+            action_id=action.id,
+            execution_time_ms=0.0,
+            timestamp=datetime.now(),
+            metadata={**observation.metadata, "cached": True},
+        )
 
 
 # ============================================================================
@@ -459,6 +559,23 @@ Action: finish(answer="Şirket izin politikasına göre...")
 - Birden fazla düşünce zinciri kullanabilirsin
 - Belirsizlik varsa açıkça belirt"""
 
+    # Argümanlar kapanış tırnağı + satır sonundaki ")" ile biter: aynı
+    # yanıttaki sonraki "Action:" satırları ilk aksiyona karışmaz, cevap
+    # içinde ")" ile biten satırlar ise (çok satırlı finish) kesmez
+    ACTION_PATTERN = r"Action:\s*\[?\s*(\w+)\s*\(((?:.*?[\"'])?)\s*\)\s*\]?[ \t]*(?:\n|$)"
+
+    PARALLEL_ACTIONS_PROMPT = """
+
+PARALEL AKSIYONLAR:
+Birbirinden bağımsız birden fazla bilgiye ihtiyacın varsa hepsini AYNI adımda iste.
+Her aksiyonu ayrı bir "Action:" satırına yaz; hepsi paralel çalıştırılır ve
+gözlemler numaralı olarak birlikte verilir.
+
+ÖRNEK:
+Thought: İki şehrin nüfusuna ve oranına ihtiyacım var, aramalar bağımsız.
+Action: search(query="İstanbul nüfusu")
+Action: search(query="Ankara nüfusu")"""
+
     def __init__(
         self,
         name: str = "ReActAgent",
@@ -466,6 +583,8 @@ Action: finish(answer="Şirket izin politikasına göre...")
         max_iterations: int = 5,
         temperature: float = 0.7,
         verbose: bool = True,
+        parallel_actions: bool = False,
+        max_parallel_actions: int = 4,
     ):
         """
         ReAct Agent başlat.
@@ -476,12 +595,16 @@ Action: finish(answer="Şirket izin politikasına göre...")
             max_iterations: Maksimum iterasyon sayısı
             temperature: LLM temperature
             verbose: Detaylı log
+            parallel_actions: Bir adımda birden fazla aksiyonu eşzamanlı çalıştır
+            max_parallel_actions: Aynı anda çalışacak en fazla araç çağrısı
         """
         self.name = name
         self.tool_executor = tool_executor or ToolExecutor()
         self.max_iterations = max_iterations
         self.temperature = temperature
         self.verbose = verbose
+        self.parallel_actions = parallel_actions
+        self.max_parallel_actions = max_parallel_actions
         
         # Trace history
         self._traces: List[ReActTrace] = []
@@ -556,6 +679,7 @@ Action: finish(answer="Şirket izin politikasına göre...")
             description="Mevcut tarih ve saati döndürür",
             parameters={},
             category="utility",
+            cacheable=False,
         )
     
     def register_tool(
@@ -565,6 +689,8 @@ Action: finish(answer="Şirket izin politikasına göre...")
         description: str,
         parameters: Dict[str, Any],
         required_params: List[str] = None,
+        timeout_seconds: Optional[float] = None,
+        cacheable: bool = True,
     ):
         """Yeni araç kaydet."""
         self.tool_executor.register(
@@ -573,12 +699,17 @@ Action: finish(answer="Şirket izin politikasına göre...")
             description=description,
             parameters=parameters,
             required_params=required_params,
+            timeout_seconds=timeout_seconds,
+            cacheable=cacheable,
         )
     
     def _build_system_prompt(self) -> str:
         """System prompt oluştur."""
         tools_prompt = self.tool_executor.get_tools_prompt()
-        return self.REACT_SYSTEM_PROMPT.format(tools_prompt=tools_prompt)
+        prompt = self.REACT_SYSTEM_PROMPT.format(tools_prompt=tools_prompt)
+        if self.parallel_actions:
+            prompt += self.PARALLEL_ACTIONS_PROMPT
+        return prompt
     
     def _parse_llm_response(self, response: str) -> Tuple[Optional[Thought], Optional[Action]]:
         """
@@ -612,35 +743,91 @@ Action: finish(answer="Şirket izin politikasına göre...")
             )
         
         # Parse Action
-        action_match = re.search(
-            r"Action:\s*\[?\s*(\w+)\s*\((.*)?\)\s*\]?",
-            response,
-            re.DOTALL | re.IGNORECASE,
-        )
+        action_match = re.search(self.ACTION_PATTERN, response, re.DOTALL | re.IGNORECASE)
         
         if action_match:
-            tool_name = action_match.group(1).strip()
-            args_str = action_match.group(2).strip() if action_match.group(2) else ""
-            
-            # Parse arguments
-            arguments = {}
-            if args_str:
-                # Pattern: param="value" veya param='value'
-                arg_pattern = r'(\w+)\s*=\s*["\']([^"\']*)["\']'
-                for match in re.finditer(arg_pattern, args_str):
-                    arguments[match.group(1)] = match.group(2)
-            
-            action_type = ActionType.FINISH if tool_name.lower() == "finish" else ActionType.TOOL_CALL
-            
-            action = Action(
-                action_type=action_type,
-                tool_name=tool_name,
-                arguments=arguments,
-                reason=thought.content if thought else "",
+            action = self._build_action(
+                action_match.group(1),
+                action_match.group(2),
+                thought.content if thought else "",
             )
         
         return thought, action
     
+    @staticmethod
+    def _build_action(tool_name: str, args_str: Optional[str], reason: str) -> Action:
+        """Araç adı ve argüman metninden aksiyon oluştur."""
+        tool_name = tool_name.strip()
+        args_str = args_str.strip() if args_str else ""
+        
+        # Parse arguments
+        arguments = {}
+        if args_str:
+            # Pattern: param="value" veya param='value'
+            arg_pattern = r'(\w+)\s*=\s*["\']([^"\']*)["\']'
+            for match in re.finditer(arg_pattern, args_str):
+                arguments[match.group(1)] = match.group(2)
+        
+        action_type = ActionType.FINISH if tool_name.lower() == "finish" else ActionType.TOOL_CALL
+        
+        return Action(
+            action_type=action_type,
+            tool_name=tool_name,
+            arguments=arguments,
+            reason=reason,
+        )
+    
+    def _select_actions(
+        self,
+        response: str,
+        thought: Optional[Thought],
+        action: Optional[Action],
+    ) -> List[Action]:
+        """
+        Bu adımda çalıştırılacak aksiyonlar.
+        
+        Paralel modda ilk "Observation:" satırına kadar yazılmış tüm
+        "Action:" satırları alınır (modelin uydurduğu devam yok sayılır).
+        finish ilk aksiyonsa tek başına döner.
+        """
+        if not self.parallel_actions or not action or action.action_type == ActionType.FINISH:
+            return [action] if action else []
+        
+        head = re.split(r"^\s*Observation", response, maxsplit=1, flags=re.MULTILINE | re.IGNORECASE)[0]
+        reason = thought.content if thought else ""
+        actions = []
+        for match in re.finditer(self.ACTION_PATTERN, head, re.DOTALL | re.IGNORECASE):
+            parsed = self._build_action(match.group(1), match.group(2), reason)
+            if parsed.action_type == ActionType.FINISH:
+                break
+            actions.append(parsed)
+        
+        return actions or [action]
+    
+    async def _execute_actions(self, trace: ReActTrace, actions: List[Action]) -> List[Observation]:
+        """Aksiyonları trace önbelleğiyle ve eşzamanlılık sınırıyla çalıştır."""
+        return await self.tool_executor.execute_many(
+            actions,
+            cache=trace.observation_cache,
+            max_concurrency=self.max_parallel_actions,
+        )
+    
+    @staticmethod
+    def _format_observations(actions: List[Action], observations: List[Observation]) -> str:
+        """Gözlemleri bir sonraki LLM turu için metne dök."""
+        if len(observations) == 1:
+            return f"Observation: {json.dumps(observations[0].content, ensure_ascii=False)}"
+        
+        lines = []
+        for i, (action, observation) in enumerate(zip(actions, observations), 1):
+            content = observation.content if observation.success else {"error": observation.error}
+            args = json.dumps(action.arguments, ensure_ascii=False)
+            lines.append(
+                f"Observation {i} [{action.tool_name}({args})]: "
+                f"{json.dumps(content, ensure_ascii=False, default=str)}"
+            )
+        return "\n".join(lines)
+    
     async def run(
         self,
         query: str,
@@ -694,6 +881,10 @@ Action: finish(answer="Şirket izin politikasına göre...")
             
             # Parse response
             thought, action = self._parse_llm_response(llm_response)
+            actions = self._select_actions(llm_response, thought, action)
+            if actions:
+                # Çalıştırılan ilk aksiyon: step.action.id == observation.action_id
+                action = actions[0]
             
             if self.verbose and thought:
                 logger.info(f"  {thought}")
@@ -704,6 +895,7 @@ Action: finish(answer="Şirket izin politikasına göre...")
                 step_type=ReActStepType.THOUGHT if thought else ReActStepType.ACTION,
                 thought=thought,
                 action=action,
+                actions=actions if len(actions) > 1 else [],
             )
             
             # Check if finished
@@ -715,21 +907,25 @@ Action: finish(answer="Şirket izin politikasına göre...")
                 trace.final_answer = final_answer
                 break
             
-            # Execute action if present
+            # Execute action(s) if present
             if action and action.tool_name:
                 if self.verbose:
-                    logger.info(f"  {action}")
+                    for a in actions:
+                        logger.info(f"  {a}")
                 
-                # Execute tool
-                observation = await self.tool_executor.execute(action)
-                step.observation = observation
+                # Execute tools (concurrently in parallel mode)
+                observations = await self._execute_actions(trace, actions)
+                step.observation = observations[0]
+                if step.actions:
+                    step.observations = observations
                 
                 if self.verbose:
-                    logger.info(f"  {observation}")
+                    for o in observations:
+                        logger.info(f"  {o}")
                 
                 # Add to messages for next iteration
                 messages.append(llm_response)
-                messages.append(f"Observation: {json.dumps(observation.content, ensure_ascii=False)}")
+                messages.append(self._format_observations(actions, observations))
             
             trace.add_step(step)
             
@@ -885,6 +1081,10 @@ class StreamingReActAgent(ReActAgent):
             )
             
             thought, action = self._parse_llm_response(llm_response)
+            actions = self._select_actions(llm_response, thought, action)
+            if actions:
+                # Çalıştırılan ilk aksiyon: step.action.id == observation.action_id
+                action = actions[0]
             
             if thought:
                 yield {
@@ -899,6 +1099,7 @@ class StreamingReActAgent(ReActAgent):
                 step_type=ReActStepType.THOUGHT,
                 thought=thought,
                 action=action,
+                actions=actions if len(actions) > 1 else [],
             )
             
             if action and action.action_type == ActionType.FINISH:
@@ -915,25 +1116,29 @@ class StreamingReActAgent(ReActAgent):
                 break
             
             if action and action.tool_name:
-                yield {
-                    "type": "action",
-                    "step": step_number,
-                    "tool": action.tool_name,
-                    "arguments": action.arguments,
-                }
+                for a in actions:
+                    yield {
+                        "type": "action",
+                        "step": step_number,
+                        "tool": a.tool_name,
+                        "arguments": a.arguments,
+                    }
                 
-                observation = await self.tool_executor.execute(action)
-                step.observation = observation
+                observations = await self._execute_actions(trace, actions)
+                step.observation = observations[0]
+                if step.actions:
+                    step.observations = observations
                 
-                yield {
-                    "type": "observation",
-                    "step": step_number,
-                    "content": observation.content,
-                    "success": observation.success,
-                }
+                for o in observations:
+                    yield {
+                        "type": "observation",
+                        "step": step_number,
+                        "content": o.content,
+                        "success": o.success,
+                    }
                 
                 messages.append(llm_response)
-                messages.append(f"Observation: {json.dumps(observation.content, ensure_ascii=False)}")
+                messages.append(self._format_observations(actions, observations))
             
             trace.add_step(step)
         
@@ -351,16 +351,8 @@ async def start_package(journey_id: str, package_id: str, user_id: str = "defaul
     if not target_package:
         raise HTTPException(status_code=404, detail="Package bulunamadı")
     
-    # LLM ile içerik zenginleştir (eğer henüz yapılmamışsa)
-    if not getattr(target_package, 'llm_content_ready', False):
-        try:
-            planner = orchestrator.curriculum_planner
-            if hasattr(planner, 'enhance_package_content_with_llm'):
-                goal = state.plan.goal
-                await planner.enhance_package_content_with_llm(target_package, target_stage, goal)
-        except Exception as e:
-            print(f"[API] LLM enhancement skipped: {e}")
-    
+    # LLM zenginleştirme orchestrator'da: ön üretilmişse anında hazır,
+    # arka planda üretiliyorsa ona katılır
     events = []
     async for event in orchestrator.start_package(journey_id, package_id, user_id):
         events.append(event.to_dict())
@@ -835,7 +827,7 @@ async def get_topic_mastery(topic_id: str):
         return {"success": True, "topic_id": topic_id, "mastery": None}
     
     review_items = [mastery_tracker.review_items[rid] for rid in topic.review_items if rid in mastery_tracker.review_items]
-    retention = sum(sm2.calculate_retention_rate(item) for item in review_items) / len(review_items) if review_items else 0.0
+    retention = float(sm2.calculate_retention_rates(review_items).mean()) if review_items else 0.0
     
     return {
         "success": True,
@@ -891,14 +883,15 @@ async def get_due_reviews(max_items: int = 20):
         raise HTTPException(status_code=503, detail="Spaced Repetition modülü yüklenmedi")
     
     due_items = mastery_tracker.get_due_reviews(max_items=max_items)
+    retentions = sm2.calculate_retention_rates(due_items)
     
     return {
         "success": True,
         "due_count": len(due_items),
         "items": [
             {"id": item.item_id, "topic_id": item.topic_id, "type": item.item_type,
-             "retention": sm2.calculate_retention_rate(item), "interval": item.interval}
-            for item in due_items
+             "retention": float(retention), "interval": item.interval}
+            for item, retention in zip(due_items, retentions)
         ]
     }
 
@@ -912,8 +905,7 @@ async def complete_review(item_id: str, request: ReviewCardRequest):
     if item_id not in mastery_tracker.review_items:
         raise HTTPException(status_code=404, detail="Öğe bulunamadı")
     
-    item = mastery_tracker.review_items[item_id]
-    updated = sm2.calculate_next_review(item, request.quality)
+    updated = mastery_tracker.complete_review(item_id, request.quality)
     level_name, level_score = sm2.get_mastery_level(updated)
     
     return {
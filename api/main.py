@@ -35,10 +35,18 @@ from core.config import settings
 from core.llm_manager import llm_manager
 from core.vector_store import vector_store
 from core.analytics import analytics
-from core.rate_limiter import rate_limiter
+from core.rate_limiter import rate_limiter, GCRALimiter, RateWindow
 from core.health import get_health_report
 from core.export import export_manager, import_manager
 from core.session_manager import session_manager
+from core.rolling_summarizer import rolling_summarizer
+from core.performance import (
+    request_coalescer,
+    stream_coalescer,
+    make_request_key,
+    normalize_request_text,
+    iterate_in_thread,
+)
 from core.notes_manager import notes_manager
 from core.embedding import embedding_manager  # GPU-accelerated embeddings
 from core.system_knowledge import SELF_KNOWLEDGE_PROMPT, SYSTEM_VERSION, SYSTEM_NAME
@@ -547,37 +555,31 @@ from collections import defaultdict
 import time as time_module
 
 class RateLimitMiddleware:
-    """Simple in-memory rate limiting."""
+    """Simple in-memory rate limiting (GCRA, constant memory per key)."""
     
     def __init__(self):
-        self.requests: Dict[str, list] = defaultdict(list)
         self.limits = {
             "chat": {"requests": 60, "window": 60},      # 60 req/min
             "search": {"requests": 100, "window": 60},   # 100 req/min
             "upload": {"requests": 10, "window": 60},    # 10 req/min
             "default": {"requests": 200, "window": 60},  # 200 req/min
         }
+        self._limiters: Dict[str, GCRALimiter] = {}
     
     def is_allowed(self, client_ip: str, endpoint_type: str = "default") -> bool:
         """Check if request is allowed."""
-        now = time_module.time()
-        limit_config = self.limits.get(endpoint_type, self.limits["default"])
-        
-        key = f"{client_ip}:{endpoint_type}"
+        if endpoint_type not in self.limits:
+            endpoint_type = "default"
         
-        # Clean old requests
-        self.requests[key] = [
-            req_time for req_time in self.requests[key]
-            if now - req_time < limit_config["window"]
-        ]
+        limiter = self._limiters.get(endpoint_type)
+        if limiter is None:
+            limit_config = self.limits[endpoint_type]
+            limiter = GCRALimiter([
+                RateWindow(endpoint_type, limit_config["requests"], limit_config["window"])
+            ])
+            self._limiters[endpoint_type] = limiter
         
-        # Check limit
-        if len(self.requests[key]) >= limit_config["requests"]:
-            return False
-        
-        # Record request
-        self.requests[key].append(now)
-        return True
+        return limiter.acquire(client_ip).allowed
 
 rate_limiter_middleware = RateLimitMiddleware()
 
@@ -807,6 +809,7 @@ def _search_with_hybrid(query: str, top_k: int, source_map: dict) -> tuple:
         tuple: (knowledge_text, reference_list, source_map)
     """
     import asyncio
+    import numpy as np
     
     try:
         # Tüm dökümanları al
@@ -815,15 +818,20 @@ def _search_with_hybrid(query: str, top_k: int, source_map: dict) -> tuple:
         if not all_data.get('documents'):
             return "", "", {}
         
+        # DenseSearcher embedding fonksiyonunu tek metinle await eder
+        async def embed_async(text: str):
+            return await asyncio.to_thread(embedding_manager.embed_query, text)
+        
         # Hybrid searcher oluştur (embedding fonksiyonu ile)
         hybrid_searcher = HybridSearcher(
-            embedding_func=lambda texts: embedding_manager.embed_texts(texts),
+            embedding_func=embed_async,
             dense_weight=0.6,  # Semantic search ağırlığı
             sparse_weight=0.4,  # BM25 ağırlığı
             rrf_k=60
         )
         
-        # Dökümanları ekle
+        # Dökümanları ekle (kayıtlı embedding'ler yeniden hesaplanmaz)
+        embeddings = all_data.get('embeddings')
         docs = []
         for i, doc_content in enumerate(all_data['documents']):
             if not doc_content:
@@ -831,11 +839,13 @@ def _search_with_hybrid(query: str, top_k: int, source_map: dict) -> tuple:
             
             doc_id = all_data['ids'][i] if all_data.get('ids') else f"doc_{i}"
             meta = all_data['metadatas'][i] if all_data.get('metadatas') else {}
+            stored = embeddings[i] if embeddings is not None and i < len(embeddings) else None
             
             docs.append(HybridDocument(
                 id=doc_id,
                 content=doc_content,
                 metadata=meta,
+                embedding=np.asarray(stored, dtype=np.float32) if stored is not None else None,
             ))
         
         # Dökümanları indexle (sync wrapper for async)
@@ -1105,6 +1115,22 @@ def search_knowledge_base(query: str, top_k: int = 5, strategy: str = "hybrid")
         return "", "", {}
 
 
+async def coalesced_knowledge_search(query: str, top_k: int = 5, strategy: str = "hybrid") -> tuple:
+    """
+    search_knowledge_base'in async sürümü.
+    
+    Arama thread'de çalışır (event loop bloklanmaz); aynı normalize sorgu
+    ile eşzamanlı gelen aramalar tek retrieval + rerank çalıştırmasını paylaşır.
+    Dönen source_map paylaşımlıdır, değiştirilmemelidir.
+    """
+    import asyncio
+    key = make_request_key("knowledge", normalize_request_text(query), top_k, strategy)
+    return await request_coalescer.do(
+        key,
+        lambda: asyncio.to_thread(search_knowledge_base, query, top_k, strategy),
+    )
+
+
 # ============ HEALTH & STATUS ============
 
 @app.get("/", tags=["Status"])
@@ -1752,11 +1778,14 @@ async def chat(request: ChatRequest):
         sessions[session_id].append(user_msg)
         session_manager.add_message(session_id, "user", request.message)
         
-        # Build chat history text for context
-        recent_history = sessions[session_id][-10:]
+        # Build chat history text for context: eski mesajların özeti + sınırlı son kesit
+        conversation = rolling_summarizer.build_context(session_id)
+        recent_history = conversation.recent
         history_text = ""
+        if conversation.summary:
+            history_text = f"\n\nÖnceki konuşmanın özeti:\n{conversation.summary}\n"
         if len(recent_history) > 1:
-            history_text = "\n\nÖnceki konuşma geçmişi:\n"
+            history_text += "\n\nÖnceki konuşma geçmişi:\n"
             for msg in recent_history[:-1]:
                 role_name = "Kullanıcı" if msg["role"] == "user" else "Asistan"
                 history_text += f"{role_name}: {msg['content']}\n"
@@ -1773,15 +1802,32 @@ async def chat(request: ChatRequest):
             pass  # Notes not critical, continue without them
         
         # Prepare context with chat history and notes
+        client_context = dict(request.context or {})
         context = request.context or {}
         context["chat_history"] = recent_history
         context["history_text"] = history_text
         context["notes_text"] = notes_text
         
+        # Eşzamanlı özdeş istekler (aynı soru, istemci bağlamı, konuşma geçmişi,
+        # not bağlamı ve model) tek orchestrator çalıştırmasını paylaşır
+        chat_key = make_request_key(
+            "chat",
+            normalize_request_text(request.message),
+            client_context,
+            history_text,
+            notes_text,
+            llm_manager.current_model,
+        )
+        
         # Execute through orchestrator with circuit breaker protection
         try:
-            response = ollama_circuit.call(
-                lambda: orchestrator.execute(request.message, context)
+            import asyncio
+            response = await request_coalescer.do(
+                chat_key,
+                lambda: asyncio.to_thread(
+                    ollama_circuit.call,
+                    lambda: orchestrator.execute(request.message, context),
+                ),
             )
         except CircuitBreakerOpenError as cb_error:
             # Circuit açık - fallback yanıt ver
@@ -1805,6 +1851,9 @@ async def chat(request: ChatRequest):
         sessions[session_id].append(assistant_msg)
         session_manager.add_message(session_id, "assistant", response.content)
         
+        # Eski mesajları arka planda özete katla (yanıtı bekletmez)
+        rolling_summarizer.schedule_refresh(session_id)
+        
         # Calculate duration
         duration_ms = int((time.time() - start_time) * 1000)
         
@@ -1880,13 +1929,16 @@ async def chat_stream(request: ChatRequest):
             yield f"data: {json.dumps({'type': 'session', 'session_id': session_id})}\n\n"
             
             # ========== GELİŞMİŞ CHAT HISTORY CONTEXT ==========
-            # Son 20 mesajı al (daha fazla bağlam için)
-            recent_history = sessions[session_id][-20:]
+            # Eski mesajların kayan özeti + özetlenmemiş tüm mesajlar (token bütçesine sığanlar)
+            conversation = rolling_summarizer.build_context(session_id)
+            recent_history = conversation.recent
             
-            # History text oluştur - mesaj içeriklerini TAM olarak dahil et
+            # History text oluştur - son kesitteki mesaj içeriklerini TAM olarak dahil et
             history_text = ""
+            if conversation.summary:
+                history_text = f"\n\n### 🧾 KONUŞMA ÖZETİ (önceki mesajlar):\n{conversation.summary}\n"
             if len(recent_history) > 1:  # More than just current message
-                history_text = "\n\n### 💬 ÖNCEKİ KONUŞMA GEÇMİŞİ:\n"
+                history_text += "\n\n### 💬 ÖNCEKİ KONUŞMA GEÇMİŞİ:\n"
                 history_text += "Aşağıdaki mesajlar bu oturumdaki önceki konuşmadır. Son yanıtın yarım kaldıysa devam et.\n\n"
                 
                 for i, msg in enumerate(recent_history[:-1]):  # Exclude current message
@@ -1957,7 +2009,7 @@ async def chat_stream(request: ChatRequest):
             if is_simple_message:
                 knowledge_text, reference_list, source_map = "", "", {}
             else:
-                knowledge_text, reference_list, source_map = search_knowledge_base(request.message, top_k=30, strategy="fusion")
+                knowledge_text, reference_list, source_map = await coalesced_knowledge_search(request.message, top_k=30, strategy="fusion")
             
             # === SİSTEM HAKKINDA SORU TESPİTİ ===
             # SELF_KNOWLEDGE_PROMPT sadece kullanıcı sistem hakkında soru sorduğunda eklenir
@@ -2088,7 +2140,20 @@ Yanıtında dökümanlardan aldığın bilgilere referans ver. Format:
 
 Yukarıdaki konuşma geçmişini, kullanıcının notlarını ve bilgi tabanı içeriklerini dikkate alarak mevcut soruya cevap ver."""
             
-            for token in llm_manager.generate_stream(request.message, system_prompt):
+            # Aynı prompt ile eşzamanlı gelen istekler tek LLM üretimini paylaşır:
+            # sonradan katılan, o ana kadarki token'ları alıp canlı akışa devam eder
+            stream_key = make_request_key(
+                "chat_stream",
+                normalize_request_text(request.message),
+                system_prompt,
+                llm_manager.current_model,
+            )
+            async for token in stream_coalescer.subscribe(
+                stream_key,
+                lambda: iterate_in_thread(
+                    lambda: llm_manager.generate_stream(request.message, system_prompt)
+                ),
+            ):
                 full_response += token
                 yield f"data: {json.dumps({'type': 'token', 'content': token})}\n\n"
             
@@ -2107,6 +2172,9 @@ Yukarıdaki konuşma geçmişini, kullanıcının notlarını ve bilgi tabanı i
             sessions[session_id].append(assistant_msg)
             session_manager.add_message(session_id, "assistant", full_response)
             
+            # Eski mesajları arka planda özete katla (stream'i bekletmez)
+            rolling_summarizer.schedule_refresh(session_id)
+            
             # Track analytics
             analytics.track_chat(
                 query=request.message[:100],
@@ -2491,7 +2559,7 @@ async def web_search(request: WebSearchRequest):
         # Premium search engine kullan
         engine = get_search_engine()
         
-        result = engine.search(
+        result = await engine.search_async(
             query=request.query,
             num_results=request.num_results,
             extract_content=request.extract_content,
@@ -2560,7 +2628,7 @@ class BatchScrapeRequest(BaseModel):
     """Toplu URL scraping isteği"""
     urls: List[str] = Field(..., description="Scrape edilecek URL listesi", max_items=10)
     use_javascript: bool = Field(default=False, description="JavaScript rendering kullan")
-    max_concurrent: int = Field(default=5, description="Paralel işlem sayısı")
+    max_concurrent: int = Field(default=16, description="Paralel işlem sayısı")
 
 
 @app.post("/api/scrape/url", tags=["Web Scraping"])
@@ -2638,7 +2706,8 @@ async def scrape_batch(request: BatchScrapeRequest):
         results = await scraper.extract_batch(
             urls=request.urls,
             method=ExtractionMethod.AUTO,
-            max_concurrent=request.max_concurrent
+            max_concurrent=request.max_concurrent,
+            use_javascript=request.use_javascript
         )
         
         total_time = int((time.time() - start_time) * 1000)
@@ -2791,7 +2860,7 @@ async def chat_web_stream(request: ChatRequest):
                 synthesizer = get_synthesizer()
                 
                 # Arama yap
-                search_response = engine.search(
+                search_response = await engine.search_async(
                     query=request.message,
                     num_results=30,
                     extract_content=True,
@@ -3567,6 +3636,26 @@ async def delete_document(document_id: str):
 
 # ============ SEARCH ENDPOINTS ============
 
+async def _coalesced_search(query: str, top_k: int, where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Vector store araması; eşzamanlı özdeş aramalar tek sorguyu paylaşır.
+    
+    Arama thread'de çalışır, böylece event loop bloklanmaz ve aynı anda
+    gelen istekler leader'ın sonucuna bağlanabilir.
+    """
+    import asyncio
+    key = make_request_key("search", normalize_request_text(query), top_k, where)
+    return await request_coalescer.do(
+        key,
+        lambda: asyncio.to_thread(
+            vector_store.search_with_scores,
+            query=query,
+            n_results=top_k,
+            where=where,
+        ),
+    )
+
+
 @app.post("/api/search", response_model=SearchResponse, tags=["Search"])
 async def search_documents(request: SearchRequest):
     """
@@ -3576,11 +3665,7 @@ async def search_documents(request: SearchRequest):
     start_time = time.time()
     
     try:
-        results = vector_store.search_with_scores(
-            query=request.query,
-            n_results=request.top_k,
-            where=request.filter_metadata,
-        )
+        results = await _coalesced_search(request.query, request.top_k, request.filter_metadata)
         
         # Calculate actual duration
         duration_ms = int((time.time() - start_time) * 1000)
@@ -3613,10 +3698,7 @@ async def search_documents_get(query: str, top_k: int = 5):
     start_time = time.time()
     
     try:
-        results = vector_store.search_with_scores(
-            query=query,
-            n_results=top_k,
-        )
+        results = await _coalesced_search(query, top_k)
         
         duration_ms = int((time.time() - start_time) * 1000)
         
@@ -712,7 +712,7 @@ async def ragas_batch_evaluate(request: BatchEvaluationRequest):
         
         evaluator = get_ragas_evaluator(level=level)
         
-        batch_result = evaluator.evaluate_batch(samples=request.samples)
+        batch_result = await evaluator.evaluate_batch_async(samples=request.samples)
         
         return {
             "total_samples": batch_result.total_samples,
@@ -25,6 +25,7 @@ Protocol:
         {"type": "connected", "client_id": "...", "ts": ...}
         {"type": "start", "ts": ..., "stream_id": "..."}  - Yanıt başladı (stream_id ile)
         {"type": "token", "content": "...", "index": N}  - Her token anında (index ile)
+        {"type": "token", "content": "...", "index": N, "count": K}  - Resume takibinde birleştirilmiş token'lar
         {"type": "status", "message": "...", "phase": "..."}  - Durum güncellemesi
         {"type": "sources", "sources": [...]}  - Kaynaklar
         {"type": "end", "stats": {...}}  - Tamamlandı
@@ -95,6 +96,8 @@ from core.llm_manager import llm_manager
 from core.vector_store import vector_store
 from core.session_manager import session_manager
 from core.stream_buffer import stream_buffer
+from core.stream_hub import stream_hub
+from core.rate_limiter import GCRALimiter, RateWindow
 from agents.orchestrator import orchestrator
 from core.model_router import (
     get_model_router,
@@ -267,6 +270,10 @@ RATE_LIMIT_WINDOW: int = 5       # Rate limit penceresi (saniye)
 RATE_LIMIT_MAX: int = 10         # Pencere içinde maksimum istek
 MAX_MESSAGE_SIZE: int = settings.WS_MAX_MESSAGE_SIZE  # Maksimum mesaj boyutu
 MAX_CONNECTIONS: int = 100       # Maksimum eşzamanlı bağlantı
+FOLLOW_SEND_TIMEOUT: float = 10.0  # Resume takibinde tek frame için maksimum gönderim süresi
+BROADCAST_QUEUE_SIZE: int = 256  # Client başına bekleyen broadcast mesajı limiti
+BROADCAST_SEND_TIMEOUT: float = 5.0  # Broadcast frame'i için maksimum gönderim süresi
+BROADCAST_SLOW_POLICY: str = "drop"  # Geride kalan client: "drop" (en eskiyi at) | "disconnect"
 
 
 # =============================================================================
@@ -280,7 +287,6 @@ class ClientConnection:
     websocket: WebSocket
     connected_at: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
-    request_times: List[float] = field(default_factory=list)
     total_requests: int = 0
     total_tokens: int = 0
     is_streaming: bool = False
@@ -289,9 +295,32 @@ class ClientConnection:
     current_stream_id: Optional[str] = None  # Aktif stream ID
     active_agents: Dict[str, Any] = field(default_factory=dict)  # Aktif agent'lar
     
+    # Broadcast çıkış kuyruğu (lazy oluşturulur) ve lag metrikleri
+    send_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    outbound: Optional[asyncio.Queue] = None
+    writer_task: Optional[asyncio.Task] = None
+    broadcasts_queued: int = 0
+    broadcasts_dropped: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    evicting: bool = False  # Tahliye planlandı; artık yazılmaz
+    
     @property
     def connection_duration(self) -> float:
         return time.time() - self.connected_at
+    
+    @property
+    def queue_depth(self) -> int:
+        return self.outbound.qsize() if self.outbound else 0
+    
+    def lag_info(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "queued": self.broadcasts_queued,
+            "dropped": self.broadcasts_dropped,
+            "last_lag_ms": round(self.last_lag_ms, 1),
+            "max_lag_ms": round(self.max_lag_ms, 1),
+        }
 
 
 @dataclass
@@ -337,16 +366,34 @@ class WebSocketManagerV2:
     - Detaylı metriks
     - Broadcast desteği
     - Room/group desteği
+    
+    Broadcast: mesaj bir kez JSON'a çevrilir ve client başına sınırlı
+    kuyruklara bırakılır; her client'ın writer task'ı eşzamanlı gönderir.
+    Yavaş veya yarı-ölü bir client diğerlerini bekletmez. Kuyruğu dolan
+    client'a slow_client_policy uygulanır ("drop" / "disconnect").
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        queue_size: int = BROADCAST_QUEUE_SIZE,
+        slow_client_policy: str = BROADCAST_SLOW_POLICY,
+        send_timeout: float = BROADCAST_SEND_TIMEOUT,
+    ):
         self._connections: Dict[str, ClientConnection] = {}
         self._rooms: Dict[str, Set[str]] = {}  # room_id -> client_ids
         self._lock = asyncio.Lock()
+        self.queue_size = queue_size
+        self.slow_client_policy = slow_client_policy
+        self.send_timeout = send_timeout
+        self._rate_limiter = GCRALimiter([
+            RateWindow("ws", RATE_LIMIT_MAX, RATE_LIMIT_WINDOW)
+        ])
         self._stats = {
             "total_connections": 0,
             "total_messages": 0,
             "total_errors": 0,
+            "broadcast_dropped": 0,
+            "slow_disconnects": 0,
         }
     
     @property
@@ -389,6 +436,11 @@ class WebSocketManagerV2:
             if client_id in self._connections:
                 conn = self._connections.pop(client_id)
                 
+                # Broadcast writer'ı durdur
+                if conn.writer_task and not conn.writer_task.done():
+                    conn.writer_task.cancel()
+                self._rate_limiter.reset(client_id)
+                
                 # Room'lardan çıkar
                 for room_clients in self._rooms.values():
                     room_clients.discard(client_id)
@@ -408,11 +460,12 @@ class WebSocketManagerV2:
     async def send(self, client_id: str, data: dict) -> bool:
         """Belirli bir client'a mesaj gönder."""
         conn = self._connections.get(client_id)
-        if not conn or conn.websocket.client_state != WebSocketState.CONNECTED:
+        if not conn or conn.evicting or conn.websocket.client_state != WebSocketState.CONNECTED:
             return False
         
         try:
-            await conn.websocket.send_json(data)
+            async with conn.send_lock:
+                await conn.websocket.send_json(data)
             conn.last_activity = time.time()
             self._stats["total_messages"] += 1
             return True
@@ -421,25 +474,109 @@ class WebSocketManagerV2:
             self._stats["total_errors"] += 1
             return False
     
-    async def broadcast(self, data: dict, exclude: Optional[Set[str]] = None) -> int:
-        """Tüm bağlı client'lara mesaj gönder."""
-        exclude = exclude or set()
+    @staticmethod
+    def _serialize(data: dict) -> str:
+        """send_json ile aynı serileştirme - broadcast başına bir kez."""
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    
+    def _enqueue(self, conn: ClientConnection, text: str) -> bool:
+        """Serileştirilmiş mesajı client kuyruğuna bırak (asla beklemez)."""
+        if conn.evicting or conn.websocket.client_state != WebSocketState.CONNECTED:
+            return False
+        
+        if conn.outbound is None:
+            conn.outbound = asyncio.Queue(maxsize=self.queue_size)
+            conn.writer_task = asyncio.create_task(self._client_writer(conn))
+        
+        item = (time.monotonic(), text)
+        try:
+            conn.outbound.put_nowait(item)
+        except asyncio.QueueFull:
+            conn.broadcasts_dropped += 1
+            self._stats["broadcast_dropped"] += 1
+            if self.slow_client_policy == "disconnect":
+                self._schedule_eviction(conn)
+                return False
+            # En eski mesajı at, yenisini koy
+            conn.outbound.get_nowait()
+            conn.outbound.put_nowait(item)
+        
+        conn.broadcasts_queued += 1
+        return True
+    
+    async def _client_writer(self, conn: ClientConnection) -> None:
+        """Client'ın broadcast kuyruğunu boşaltan writer task."""
+        queue = conn.outbound
+        try:
+            while True:
+                enqueued_at, text = await queue.get()
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                conn.last_lag_ms = lag_ms
+                conn.max_lag_ms = max(conn.max_lag_ms, lag_ms)
+                
+                try:
+                    async with conn.send_lock:
+                        await asyncio.wait_for(
+                            conn.websocket.send_text(text),
+                            timeout=self.send_timeout
+                        )
+                    conn.last_activity = time.time()
+                    self._stats["total_messages"] += 1
+                except asyncio.TimeoutError:
+                    # Önceki frame yazımın ortasında iptal edildi; soket artık
+                    # güvenilir değil, politika ne olursa olsun yazmayı bırak
+                    self._stats["total_errors"] += 1
+                    self._schedule_eviction(conn)
+                    return
+                except Exception as e:
+                    logger.debug(f"Broadcast send error to {conn.client_id}: {e}")
+                    self._stats["total_errors"] += 1
+        except asyncio.CancelledError:
+            pass
+    
+    def _schedule_eviction(self, conn: ClientConnection) -> None:
+        """Tahliyeyi bağlantı başına yalnızca bir kez planla."""
+        if conn.evicting:
+            return
+        conn.evicting = True
+        asyncio.create_task(self._evict_slow_client(conn.client_id))
+    
+    async def _evict_slow_client(self, client_id: str) -> None:
+        """Geride kalan client'ın bağlantısını kapat."""
+        conn = self._connections.get(client_id)
+        if not conn:
+            return
+        self._stats["slow_disconnects"] += 1
+        logger.info(f"Disconnecting slow client: {client_id}, lag: {conn.lag_info()}")
+        try:
+            await conn.websocket.close(code=1013, reason="Client too slow")
+        except Exception:
+            pass
+        await self.disconnect(client_id)
+    
+    def _fan_out(self, data: dict, client_ids) -> int:
+        """Mesajı bir kez serileştirip verilen client'ların kuyruklarına dağıt."""
+        text = self._serialize(data)
         sent = 0
-        for client_id in list(self._connections.keys()):
-            if client_id not in exclude:
-                if await self.send(client_id, data):
-                    sent += 1
+        for client_id in list(client_ids):
+            conn = self._connections.get(client_id)
+            if conn and self._enqueue(conn, text):
+                sent += 1
         return sent
     
+    async def broadcast(self, data: dict, exclude: Optional[Set[str]] = None) -> int:
+        """Tüm bağlı client'lara mesaj gönder (kuyruğa alınan client sayısı)."""
+        exclude = exclude or set()
+        return self._fan_out(
+            data,
+            [client_id for client_id in self._connections if client_id not in exclude]
+        )
+    
     async def send_to_room(self, room_id: str, data: dict) -> int:
-        """Room'daki tüm client'lara mesaj gönder."""
+        """Room'daki tüm client'lara mesaj gönder (kuyruğa alınan client sayısı)."""
         if room_id not in self._rooms:
             return 0
-        sent = 0
-        for client_id in self._rooms[room_id]:
-            if await self.send(client_id, data):
-                sent += 1
-        return sent
+        return self._fan_out(data, self._rooms[room_id])
     
     def join_room(self, client_id: str, room_id: str) -> None:
         """Client'ı room'a ekle."""
@@ -454,19 +591,10 @@ class WebSocketManagerV2:
     
     def check_rate_limit(self, client_id: str) -> bool:
         """Rate limiting kontrolü."""
-        conn = self._connections.get(client_id)
-        if not conn:
+        if client_id not in self._connections:
             return False
         
-        now = time.time()
-        # Eski istekleri temizle
-        conn.request_times = [t for t in conn.request_times if now - t < RATE_LIMIT_WINDOW]
-        
-        if len(conn.request_times) >= RATE_LIMIT_MAX:
-            return False
-        
-        conn.request_times.append(now)
-        return True
+        return self._rate_limiter.acquire(client_id).allowed
     
     def get_stats(self) -> dict:
         """Manager istatistiklerini al."""
@@ -476,6 +604,13 @@ class WebSocketManagerV2:
             "total_messages": self._stats["total_messages"],
             "total_errors": self._stats["total_errors"],
             "rooms": len(self._rooms),
+            "broadcast_dropped": self._stats["broadcast_dropped"],
+            "slow_disconnects": self._stats["slow_disconnects"],
+            "client_lag": {
+                conn.client_id: conn.lag_info()
+                for conn in self._connections.values()
+                if conn.outbound is not None
+            },
         }
     
     def get_clients_info(self) -> List[dict]:
@@ -513,6 +648,7 @@ class WebSocketHandlerV2:
         self.manager = manager
         self._ping_task: Optional[asyncio.Task] = None
         self._stream_task: Optional[asyncio.Task] = None
+        self._follow_task: Optional[asyncio.Task] = None
     
     async def start(self) -> None:
         """Handler'ı başlat."""
@@ -532,7 +668,7 @@ class WebSocketHandlerV2:
         self.conn.stop_flag = True
         
         # Task'ları iptal et
-        for task in [self._stream_task, self._ping_task]:
+        for task in [self._stream_task, self._follow_task, self._ping_task]:
             if task and not task.done():
                 task.cancel()
                 try:
@@ -628,56 +764,62 @@ class WebSocketHandlerV2:
         stream = stream_buffer.get_stream(stream_id)
         if stream and stream.is_active:
             self.conn.current_stream_id = stream_id
-            # Stream'i takip et
-            asyncio.create_task(self._follow_stream(stream_id, stream.token_count))
+            # Stream'i takip et (önceki takip varsa bırakılır)
+            if self._follow_task and not self._follow_task.done():
+                self._follow_task.cancel()
+            self._follow_task = asyncio.create_task(self._follow_stream(stream_id, stream.token_count))
     
     async def _follow_stream(self, stream_id: str, last_sent_index: int) -> None:
         """
         Aktif bir stream'i takip et ve yeni token'ları gönder.
         
         Resume sonrası veya reconnect durumunda kullanılır.
+        StreamHub üzerinden event-driven çalışır; token'lar birleştirilmiş
+        frame'ler halinde gelir. Yavaş client üreticiyi bekletmez, takılan
+        bir gönderim FOLLOW_SEND_TIMEOUT sonrası takibi sonlandırır
+        (client tekrar resume edebilir). İptal edilirse abonelik kapatılır
+        ve CancelledError yeniden fırlatılır.
         """
-        while True:
-            stream = stream_buffer.get_stream(stream_id)
-            if not stream:
-                break
-            
-            # Yeni token'lar var mı?
-            if stream.token_count > last_sent_index:
-                new_tokens = stream.get_tokens_from(last_sent_index)
-                for token in new_tokens:
-                    await self._send({
-                        "type": "token",
-                        "content": token.content,
-                        "index": token.index
-                    })
-                last_sent_index = stream.token_count
-            
-            # Stream tamamlandı mı?
-            if not stream.is_active:
-                if stream.status == "completed":
-                    await self._send({
-                        "type": "end",
-                        "stats": {
-                            "duration_ms": stream.duration_ms,
-                            "tokens": stream.token_count,
-                        }
-                    })
-                elif stream.status == "stopped":
-                    await self._send({
-                        "type": "stopped",
-                        "elapsed_ms": stream.duration_ms,
-                        "tokens": stream.token_count,
-                    })
-                elif stream.status == "error":
-                    await self._send({
-                        "type": "error",
-                        "message": stream.error or "Stream hatası"
-                    })
-                break
-            
-            # Kısa bekle
-            await asyncio.sleep(0.05)
+        subscription = stream_hub.subscribe(stream_id, last_sent_index)
+        try:
+            async for frame in subscription:
+                try:
+                    sent = await asyncio.wait_for(self._send(frame), timeout=FOLLOW_SEND_TIMEOUT)
+                except asyncio.TimeoutError:
+                    sent = False
+                if not sent:
+                    logger.debug(f"Follow stopped for {self.conn.client_id}: client not keeping up")
+                    return
+        except asyncio.CancelledError:
+            logger.debug(f"Follow cancelled for {self.conn.client_id}: {stream_id}")
+            raise
+        finally:
+            await subscription.aclose()
+        
+        stream = stream_buffer.get_stream(stream_id)
+        if not stream:
+            return
+        
+        # Stream tamamlandı
+        if stream.status == "completed":
+            await self._send({
+                "type": "end",
+                "stats": {
+                    "duration_ms": stream.duration_ms,
+                    "tokens": stream.token_count,
+                }
+            })
+        elif stream.status == "stopped":
+            await self._send({
+                "type": "stopped",
+                "elapsed_ms": stream.duration_ms,
+                "tokens": stream.token_count,
+            })
+        elif stream.status == "error":
+            await self._send({
+                "type": "error",
+                "message": stream.error or "Stream hatası"
+            })
     
     async def _handle_stop(self) -> None:
         """Stop komutunu işle - o ana kadar yazılanları koru."""
@@ -0,0 +1,9 @@
+"""
+Benchmarks
+==========
+
+GPU veya Ollama gerektirmeyen, tekrarlanabilir performans ölçümleri.
+
+Modüller:
+- retrieval_benchmark: Arama stratejileri için gecikme, verim ve recall@k
+"""
@@ -0,0 +1,669 @@
+"""
+Retrieval Benchmark - Çevrimdışı Arama Performans Ölçümü
+=========================================================
+
+Tüm arama stratejilerinin gecikme (p50/p95/p99), verim ve recall@k
+değerlerini GPU, Ollama veya ChromaDB sunucusu olmadan ölçer. Aynı seed ile
+her çalıştırma aynı korpusu ve sorguları üretir; böylece performans
+değişiklikleri kayıtlı bir baseline raporla karşılaştırılabilir.
+
+Bileşenler:
+- generate_corpus: Deterministik sentetik korpus (yerleştirilmiş doğru cevaplar)
+- HashEmbedder: Token hash tabanlı sahte embedding (EmbeddingManager arayüzü)
+- InMemoryVectorStore: search_knowledge_base'in kullandığı VectorStore yüzeyi
+- RetrievalBenchmark: Stratejileri çalıştırır ve raporu üretir
+
+Stratejiler:
+- api.fusion / api.hybrid: api.main.search_knowledge_base
+- api.semantic: search_knowledge_base'in semantic fallback çağrısı
+  (search_with_scores, score_threshold=0.3) - bellek içi tam tarama
+- hybrid_searcher.dense / .sparse / .hybrid: rag.hybrid_search.HybridSearcher
+- rerank.bm25 / .cross_encoder / .rrf / .ensemble: rag.reranker stratejileri
+  (aday listesi semantic aramadan gelir, yalnızca rerank süresi ölçülür)
+
+Kullanım:
+    python -m benchmarks.retrieval_benchmark --chunks 10000 --queries 50
+    python -m benchmarks.retrieval_benchmark --output data/benchmarks/baseline.json
+    python -m benchmarks.retrieval_benchmark --baseline data/benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+# ==================== SYNTHETIC CORPUS ====================
+
+SYLLABLES = [c + v for c in "bcdfgklmnprstvyz" for v in "aeıioöuü"]
+
+QUERY_TEMPLATES = [
+    "{0} {1} {2} nedir",
+    "{0} ile {1} arasında {2} ilişkisi",
+    "{1} için {0} ve {2} açıkla",
+]
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class BenchmarkQuery:
+    """Yerleştirilmiş doğru cevapları bilinen sorgu."""
+    id: str
+    text: str
+    relevant_ids: List[str]
+    key_terms: List[str] = field(default_factory=list)
+
+
+@dataclass
+class SyntheticCorpus:
+    """Sentetik chunk'lar ve sorgular."""
+    ids: List[str]
+    documents: List[str]
+    metadatas: List[Dict[str, Any]]
+    queries: List[BenchmarkQuery]
+    seed: int
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def _make_words(rng: random.Random, count: int, syllables: Tuple[int, int], exclude: set) -> List[str]:
+    """Hece birleştirerek benzersiz sahte kelimeler üret."""
+    words: List[str] = []
+    seen = set(exclude)
+    low, high = syllables
+    while len(words) < count:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(low, high)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def chunk_id(filename: str, page: int) -> str:
+    """Chunk kimliği: dosya adı (uzantısız) + sayfa."""
+    return f"{filename.rsplit('.', 1)[0]}#{page}"
+
+
+def generate_corpus(
+    num_chunks: int = 10_000,
+    num_queries: int = 50,
+    chunks_per_document: int = 8,
+    words_per_chunk: int = 40,
+    relevant_per_query: int = 2,
+    distractors_per_query: int = 2,
+    vocab_size: int = 20_000,
+    seed: int = 42,
+) -> SyntheticCorpus:
+    """
+    Deterministik sentetik korpus üret.
+
+    Dolgu kelimeleri Zipf dağılımıyla seçilir. Her sorgu için üç nadir
+    anahtar terim `relevant_per_query` chunk'a ikişer kez birlikte,
+    `distractors_per_query` chunk'a ise tek tek (zor negatif) yerleştirilir.
+
+    Args:
+        num_chunks: Toplam chunk sayısı (10k-1M)
+        num_queries: Sorgu sayısı
+        chunks_per_document: Dosya başına chunk (sayfa) sayısı
+        words_per_chunk: Chunk başına dolgu kelime sayısı
+        relevant_per_query: Sorgu başına doğru chunk sayısı
+        distractors_per_query: Sorgu başına zor negatif chunk sayısı
+        vocab_size: Dolgu kelime dağarcığı
+        seed: Rastgelelik tohumu
+
+    Returns:
+        SyntheticCorpus
+    """
+    planted_per_query = relevant_per_query + distractors_per_query
+    if num_queries * planted_per_query > num_chunks:
+        raise ValueError(
+            f"Korpus çok küçük: {num_queries} sorgu için en az "
+            f"{num_queries * planted_per_query} chunk gerekli"
+        )
+
+    rng = random.Random(seed)
+    vocab = _make_words(rng, vocab_size, (1, 3), exclude=set())
+    # Anahtar terimler dolgu kelimelerinden uzun: alt-dize eşleşmesi olmaz
+    key_terms = _make_words(rng, num_queries * 3, (4, 5), exclude=set(vocab))
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(vocab_size)))
+
+    planted_chunks = rng.sample(range(num_chunks), num_queries * planted_per_query)
+    plants: Dict[int, List[str]] = {}
+    query_chunks: List[List[int]] = []
+    for q in range(num_queries):
+        terms = key_terms[q * 3:(q + 1) * 3]
+        positions = planted_chunks[q * planted_per_query:(q + 1) * planted_per_query]
+        relevant, distractors = positions[:relevant_per_query], positions[relevant_per_query:]
+        for index in relevant:
+            plants[index] = list(terms) * 2
+        for n, index in enumerate(distractors):
+            plants[index] = [terms[n % 3]]
+        query_chunks.append(relevant)
+
+    ids: List[str] = []
+    documents: List[str] = []
+    metadatas: List[Dict[str, Any]] = []
+    for index in range(num_chunks):
+        words = rng.choices(vocab, cum_weights=cum_weights, k=words_per_chunk)
+        for term in plants.get(index, ()):
+            words.insert(rng.randrange(len(words) + 1), term)
+
+        doc_number, position = divmod(index, chunks_per_document)
+        filename = f"belge_{doc_number:05d}.pdf"
+        page = position + 1
+        ids.append(chunk_id(filename, page))
+        documents.append(" ".join(words))
+        metadatas.append({"filename": filename, "page": page, "chunk_index": position})
+
+    queries = []
+    for q, relevant in enumerate(query_chunks):
+        terms = key_terms[q * 3:(q + 1) * 3]
+        template = QUERY_TEMPLATES[q % len(QUERY_TEMPLATES)]
+        queries.append(BenchmarkQuery(
+            id=f"q{q:04d}",
+            text=template.format(*terms),
+            relevant_ids=[ids[index] for index in relevant],
+            key_terms=terms,
+        ))
+
+    return SyntheticCorpus(ids=ids, documents=documents, metadatas=metadatas, queries=queries, seed=seed)
+
+
+# ==================== FAKE EMBEDDER ====================
+
+class HashEmbedder:
+    """
+    Token hash tabanlı deterministik embedding (feature hashing).
+
+    Her token blake2b ile sabit bir boyuta ve işarete eşlenir; vektör L2
+    normalize edilir. Ortak token paylaşan metinlerin cosine benzerliği
+    yüksektir. EmbeddingManager'ın embed_text/embed_query/embed_texts
+    arayüzünü ve HybridSearcher için async `aembed` fonksiyonunu sağlar.
+    """
+
+    def __init__(self, dim: int = 256, seed: int = 0):
+        self.dim = dim
+        self.seed = seed
+        self._slots: Dict[str, Tuple[int, float]] = {}
+        self.calls = 0
+
+    def _slot(self, token: str) -> Tuple[int, float]:
+        slot = self._slots.get(token)
+        if slot is None:
+            digest = hashlib.blake2b(f"{self.seed}:{token}".encode("utf-8"), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            slot = (value % self.dim, 1.0 if value >> 63 else -1.0)
+            self._slots[token] = slot
+        return slot
+
+    def embed_matrix(self, texts: Sequence[str], batch_size: int = 10_000) -> np.ndarray:
+        """Metinleri (N, dim) float32 matrise dönüştür."""
+        self.calls += 1
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            rows: List[int] = []
+            cols: List[int] = []
+            signs: List[float] = []
+            for row, text in enumerate(texts[start:start + batch_size], start):
+                for token in TOKEN_PATTERN.findall(text.lower()):
+                    col, sign = self._slot(token)
+                    rows.append(row)
+                    cols.append(col)
+                    signs.append(sign)
+            np.add.at(matrix, (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)), signs)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+
+    def embed_vector(self, text: str) -> np.ndarray:
+        return self.embed_matrix([text])[0]
+
+    def embed_text(self, text: str, **kwargs) -> List[float]:
+        return self.embed_vector(text).tolist()
+
+    def embed_query(self, query: str) -> List[float]:
+        return self.embed_text(query)
+
+    def embed_document(self, document: str, use_cache: bool = False) -> List[float]:
+        return self.embed_text(document)
+
+    def embed_texts(self, texts: List[str], **kwargs) -> List[List[float]]:
+        return self.embed_matrix(texts).tolist()
+
+    async def aembed(self, text: str) -> np.ndarray:
+        """HybridSearcher/DenseSearcher embedding_func arayüzü."""
+        return self.embed_vector(text)
+
+
+# ==================== IN-MEMORY VECTOR STORE ====================
+
+class InMemoryVectorStore:
+    """
+    core.vector_store.VectorStore yüzeyinin bellek içi karşılığı.
+
+    search_knowledge_base'in kullandığı count(), collection.get() ve
+    search_with_scores() çağrılarını tam (exact) cosine taramasıyla karşılar.
+    Metadata filtresi desteklenmez.
+    """
+
+    def __init__(self, corpus: SyntheticCorpus, embedder: HashEmbedder):
+        self.embedder = embedder
+        self.ids = corpus.ids
+        self.documents = corpus.documents
+        self.metadatas = corpus.metadatas
+        self.embeddings = embedder.embed_matrix(corpus.documents)
+        self.collection = self
+
+    def count(self) -> int:
+        return len(self.ids)
+
+    def get(self, include: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
+        return {
+            "ids": self.ids,
+            "documents": self.documents,
+            "metadatas": self.metadatas,
+            "embeddings": self.embeddings,
+        }
+
+    def top_k(self, query_embedding: np.ndarray, n_results: int) -> List[Tuple[int, float]]:
+        """En yakın n_results chunk (index, cosine)."""
+        scores = self.embeddings @ query_embedding
+        n_results = min(n_results, len(scores))
+        if n_results <= 0:
+            return []
+        top = np.argpartition(-scores, n_results - 1)[:n_results]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def search(self, query: str, n_results: int = 5, where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        hits = self.top_k(self.embedder.embed_vector(query), n_results)
+        return {
+            "ids": [self.ids[i] for i, _ in hits],
+            "documents": [self.documents[i] for i, _ in hits],
+            "metadatas": [self.metadatas[i] for i, _ in hits],
+            "distances": [1 - score for _, score in hits],
+        }
+
+    def search_with_scores(
+        self,
+        query: str,
+        n_results: int = 5,
+        score_threshold: float = 0.0,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        hits = self.top_k(self.embedder.embed_vector(query), n_results)
+        return [
+            {
+                "document": self.documents[i],
+                "metadata": self.metadatas[i],
+                "score": score,
+                "id": self.ids[i],
+            }
+            for i, score in hits
+            if score >= score_threshold
+        ]
+
+
+# ==================== METRICS ====================
+
+def recall_at_k(retrieved: Sequence[str], relevant: Sequence[str], k: int) -> float:
+    """İlk k sonuçta bulunan doğru chunk oranı."""
+    if not relevant:
+        return 0.0
+    return len(set(retrieved[:k]) & set(relevant)) / len(relevant)
+
+
+def summarize_latencies(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99, ortalama gecikme ve sıralı verim."""
+    if not latencies_ms:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "mean_ms": 0.0, "throughput_qps": 0.0}
+    values = np.asarray(latencies_ms, dtype=np.float64)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    total_s = values.sum() / 1000
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(values.mean()), 3),
+        "throughput_qps": round(len(values) / total_s, 2) if total_s > 0 else 0.0,
+    }
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    İki raporu strateji bazında karşılaştır.
+
+    Gecikme ve verim için yüzde değişim, recall için mutlak fark döner.
+    """
+    deltas: Dict[str, Dict[str, float]] = {}
+    for name, result in current.get("strategies", {}).items():
+        base = baseline.get("strategies", {}).get(name)
+        if not base or "skipped" in result or "skipped" in base:
+            continue
+        delta = {}
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "throughput_qps"):
+            if base.get(metric):
+                delta[f"{metric}_change_pct"] = round((result[metric] - base[metric]) / base[metric] * 100, 1)
+        delta["recall_delta"] = round(result["recall_at_k"] - base["recall_at_k"], 4)
+        deltas[name] = delta
+    return deltas
+
+
+# ==================== BENCHMARK ====================
+
+API_STRATEGIES = ["api.fusion", "api.hybrid", "api.semantic"]
+HYBRID_STRATEGIES = ["hybrid_searcher.dense", "hybrid_searcher.sparse", "hybrid_searcher.hybrid"]
+RERANK_STRATEGIES = ["rerank.bm25", "rerank.cross_encoder", "rerank.rrf", "rerank.ensemble"]
+ALL_STRATEGIES = API_STRATEGIES + HYBRID_STRATEGIES + RERANK_STRATEGIES
+
+
+class RetrievalBenchmark:
+    """
+    Arama stratejileri benchmark çalıştırıcısı.
+
+    Her strateji için kurulum (indexleme) süresi ayrıca ölçülür; sorgu
+    gecikmeleri sıralı çalıştırılır, ilk `warmup` sorgu ölçüme katılmaz.
+    """
+
+    def __init__(
+        self,
+        corpus: SyntheticCorpus,
+        embedder: Optional[HashEmbedder] = None,
+        top_k: int = 5,
+        rerank_candidates: int = 50,
+        warmup: int = 1,
+    ):
+        self.corpus = corpus
+        self.embedder = embedder or HashEmbedder()
+        self.top_k = top_k
+        self.rerank_candidates = rerank_candidates
+        self.warmup = warmup
+
+        started = time.perf_counter()
+        self.store = InMemoryVectorStore(corpus, self.embedder)
+        self.index_ms = (time.perf_counter() - started) * 1000
+
+    # ==================== API (search_knowledge_base) ====================
+
+    @contextmanager
+    def _patched_api(self) -> Iterator[Any]:
+        """api.main'in vector_store ve embedding_manager'ını geçici olarak değiştir."""
+        import api.main as api_main
+
+        originals = (api_main.vector_store, api_main.embedding_manager)
+        api_main.vector_store, api_main.embedding_manager = self.store, self.embedder
+        try:
+            yield api_main
+        finally:
+            api_main.vector_store, api_main.embedding_manager = originals
+
+    @staticmethod
+    def _ids_from_source_map(source_map: Dict[str, Any]) -> List[str]:
+        return [f"{base}#{page}" for base, info in source_map.items() for page in sorted(info["pages"])]
+
+    def _api_search(self, api_main, strategy: str) -> Callable[[str], List[str]]:
+        if strategy == "api.semantic":
+            def search(query: str) -> List[str]:
+                results = api_main.vector_store.search_with_scores(
+                    query=query, n_results=self.top_k, score_threshold=0.3
+                )
+                return [r["id"] for r in results]
+            return search
+
+        mode = strategy.split(".", 1)[1]
+
+        def search(query: str) -> List[str]:
+            _, _, source_map = api_main.search_knowledge_base(query, top_k=self.top_k, strategy=mode)
+            return self._ids_from_source_map(source_map)
+        return search
+
+    # ==================== HYBRID SEARCHER ====================
+
+    def _build_hybrid_searcher(self, loop: asyncio.AbstractEventLoop):
+        from rag.hybrid_search import Document as HybridDocument, HybridSearcher
+
+        searcher = HybridSearcher(embedding_func=self.embedder.aembed, dense_weight=0.6, sparse_weight=0.4)
+        docs = [
+            HybridDocument(id=doc_id, content=content, metadata=meta, embedding=embedding)
+            for doc_id, content, meta, embedding in zip(
+                self.corpus.ids, self.corpus.documents, self.corpus.metadatas, self.store.embeddings
+            )
+        ]
+        loop.run_until_complete(searcher.add_documents(docs))
+        return searcher
+
+    def _hybrid_search(self, searcher, loop: asyncio.AbstractEventLoop, strategy: str) -> Callable[[str], List[str]]:
+        from rag.hybrid_search import SearchStrategy
+
+        mode = SearchStrategy(strategy.split(".", 1)[1])
+
+        def search(query: str) -> List[str]:
+            results = loop.run_until_complete(searcher.search(query, top_k=self.top_k, strategy=mode))
+            return [r.id for r in results]
+        return search
+
+    # ==================== RERANKERS ====================
+
+    def _build_reranker(self, strategy: str):
+        from rag.reranker import BM25Reranker, CrossEncoderReranker, EnsembleReranker, RRFReranker
+
+        def cross_encoder():
+            # GPU yoksa gerçek yol: embedding_manager ile çift embedding benzerliği
+            reranker = CrossEncoderReranker(use_gpu=False)
+            reranker._embedding_manager = self.embedder
+            return reranker
+
+        if strategy == "rerank.bm25":
+            return BM25Reranker()
+        if strategy == "rerank.cross_encoder":
+            return cross_encoder()
+        if strategy == "rerank.rrf":
+            return RRFReranker()
+        return EnsembleReranker([(BM25Reranker(), 0.5), (cross_encoder(), 0.5)], fusion_method="rrf")
+
+    def _candidates(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Sorgu metni -> rerank aday listesi (semantic arama, ölçüm dışı)."""
+        candidates = {}
+        for query in self.corpus.queries:
+            results = self.store.search_with_scores(query.text, n_results=self.rerank_candidates)
+            candidates[query.text] = [
+                {"id": r["id"], "content": r["document"], "score": r["score"], "metadata": r["metadata"]}
+                for r in results
+            ]
+        return candidates
+
+    # ==================== RUN ====================
+
+    def _measure(self, search: Callable[[str], List[str]], queries: Sequence[BenchmarkQuery]) -> Dict[str, Any]:
+        for query in queries[:self.warmup]:
+            search(query.text)
+
+        latencies: List[float] = []
+        recalls: List[float] = []
+        errors = 0
+        for query in queries:
+            started = time.perf_counter()
+            try:
+                retrieved = search(query.text)
+            except Exception:
+                errors += 1
+                retrieved = []
+            latencies.append((time.perf_counter() - started) * 1000)
+            recalls.append(recall_at_k(retrieved, query.relevant_ids, self.top_k))
+
+        return {
+            **summarize_latencies(latencies),
+            "recall_at_k": round(float(np.mean(recalls)), 4) if recalls else 0.0,
+            "queries": len(queries),
+            "errors": errors,
+        }
+
+    def run(self, strategies: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Seçili stratejileri çalıştır.
+
+        Args:
+            strategies: Strateji adları (None = hepsi)
+
+        Returns:
+            JSON'a yazılabilir rapor
+        """
+        strategies = list(strategies or ALL_STRATEGIES)
+        unknown = set(strategies) - set(ALL_STRATEGIES)
+        if unknown:
+            raise ValueError(f"Bilinmeyen strateji: {', '.join(sorted(unknown))}")
+
+        queries = self.corpus.queries
+        results: Dict[str, Dict[str, Any]] = {}
+
+        selected = [s for s in API_STRATEGIES if s in strategies]
+        if selected:
+            try:
+                with self._patched_api() as api_main:
+                    for name in selected:
+                        results[name] = {"setup_ms": 0.0, **self._measure(self._api_search(api_main, name), queries)}
+            except ImportError as e:
+                for name in selected:
+                    results[name] = {"skipped": f"api.main yüklenemedi: {e}"}
+
+        selected = [s for s in HYBRID_STRATEGIES if s in strategies]
+        if selected:
+            loop = asyncio.new_event_loop()
+            try:
+                started = time.perf_counter()
+                searcher = self._build_hybrid_searcher(loop)
+                setup_ms = round((time.perf_counter() - started) * 1000, 3)
+                for name in selected:
+                    results[name] = {
+                        "setup_ms": setup_ms,
+                        **self._measure(self._hybrid_search(searcher, loop, name), queries),
+                    }
+            finally:
+                loop.close()
+
+        selected = [s for s in RERANK_STRATEGIES if s in strategies]
+        if selected:
+            candidates = self._candidates()
+            for name in selected:
+                reranker = self._build_reranker(name)
+
+                def search(query_text: str, _reranker=reranker) -> List[str]:
+                    ranked = _reranker.rerank(query_text, candidates[query_text], top_k=self.top_k)
+                    return [r.doc_id for r in ranked]
+
+                results[name] = {
+                    "setup_ms": 0.0,
+                    "candidates": self.rerank_candidates,
+                    **self._measure(search, queries),
+                }
+
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "config": {
+                "chunks": len(self.corpus),
+                "queries": len(queries),
+                "top_k": self.top_k,
+                "rerank_candidates": self.rerank_candidates,
+                "embedding_dim": self.embedder.dim,
+                "seed": self.corpus.seed,
+                "warmup": self.warmup,
+            },
+            "environment": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "index_ms": round(self.index_ms, 3),
+            "strategies": {name: results[name] for name in strategies if name in results},
+        }
+
+
+# ==================== CLI ====================
+
+def format_report(report: Dict[str, Any], deltas: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """Raporu tablo olarak biçimlendir."""
+    config = report["config"]
+    lines = [
+        f"Korpus: {config['chunks']} chunk, {config['queries']} sorgu, top_k={config['top_k']}, "
+        f"index={report['index_ms']:.0f} ms",
+        f"{'strateji':<24}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'qps':>10}{'recall@k':>10}",
+    ]
+    for name, result in report["strategies"].items():
+        if "skipped" in result:
+            lines.append(f"{name:<24}atlandı: {result['skipped']}")
+            continue
+        line = (
+            f"{name:<24}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+            f"{result['throughput_qps']:>10.1f}{result['recall_at_k']:>10.3f}"
+        )
+        if deltas and name in deltas:
+            delta = deltas[name]
+            line += f"   Δp95 {delta.get('p95_ms_change_pct', 0):+.1f}%  Δrecall {delta['recall_delta']:+.3f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Çevrimdışı retrieval benchmark")
+    parser.add_argument("--chunks", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--rerank-candidates", type=int, default=50)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--strategies", nargs="+", choices=ALL_STRATEGIES, default=None)
+    parser.add_argument("--output", type=Path, default=None, help="JSON rapor yolu")
+    parser.add_argument("--baseline", type=Path, default=None, help="Karşılaştırılacak JSON rapor")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    corpus = generate_corpus(num_chunks=args.chunks, num_queries=args.queries, seed=args.seed)
+    print(f"Korpus üretildi: {len(corpus)} chunk ({time.perf_counter() - started:.1f} s)")
+
+    benchmark = RetrievalBenchmark(
+        corpus,
+        embedder=HashEmbedder(dim=args.dim),
+        top_k=args.top_k,
+        rerank_candidates=args.rerank_candidates,
+        warmup=args.warmup,
+    )
+    report = benchmark.run(args.strategies)
+
+    deltas = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        deltas = compare_reports(report, baseline)
+        report["baseline_deltas"] = deltas
+
+    print(format_report(report, deltas))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Rapor yazıldı: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,10 +21,17 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
 import subprocess
 import signal
 import time
 
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -84,6 +91,471 @@ class SandboxConfig:
         "__import__", "importlib", "ctypes", "multiprocessing",
     ])
     work_dir: Optional[str] = None
+    worker_processes: int = 2  # Pre-warmed Python workers (0 = in-process thread)
+
+
+# ============================================
+# EXECUTION HELPERS (shared by pool workers and in-process fallback)
+# ============================================
+
+# Common libraries, imported once per worker process
+_AUTO_IMPORTS = """
+import math
+import json
+import datetime
+import random
+import statistics
+from collections import defaultdict, Counter
+try:
+    import numpy as np
+except: pass
+try:
+    import pandas as pd
+except: pass
+try:
+    import matplotlib.pyplot as plt
+except: pass
+"""
+
+WORKER_START_TIMEOUT = 60.0  # seconds, includes numpy/pandas/matplotlib import
+POOL_RETRY_SECONDS = 30.0  # in-process fallback window after a pool failure
+
+
+def _build_safe_builtins(blocked_imports: List[str], base_dir: Optional[str] = None) -> Dict:
+    """
+    Get restricted builtins
+    
+    base_dir: relative paths given to open() are resolved against it
+    (in-process execution, where the cwd cannot be changed per session)
+    """
+    safe = {}
+    allowed = [
+        # Types
+        'bool', 'int', 'float', 'str', 'list', 'dict', 'tuple', 'set', 'frozenset',
+        'bytes', 'bytearray', 'complex', 'type', 'object',
+        # Functions
+        'abs', 'all', 'any', 'ascii', 'bin', 'callable', 'chr', 'divmod',
+        'enumerate', 'filter', 'format', 'getattr', 'hasattr', 'hash', 'hex',
+        'id', 'isinstance', 'issubclass', 'iter', 'len', 'map', 'max', 'min',
+        'next', 'oct', 'ord', 'pow', 'print', 'range', 'repr', 'reversed',
+        'round', 'slice', 'sorted', 'sum', 'zip',
+        # Exceptions
+        'Exception', 'ValueError', 'TypeError', 'KeyError', 'IndexError',
+        'AttributeError', 'RuntimeError', 'StopIteration', 'ZeroDivisionError',
+        # Other
+        'True', 'False', 'None',
+    ]
+    
+    for name in allowed:
+        if hasattr(__builtins__, name):
+            safe[name] = getattr(__builtins__, name)
+        elif name in __builtins__ if isinstance(__builtins__, dict) else {}:
+            safe[name] = __builtins__[name]
+    
+    # Add safe open (read-only in work_dir)
+    def safe_open(filename, mode='r', *args, **kwargs):
+        if 'w' in mode or 'a' in mode:
+            # Only allow writing in work_dir
+            pass
+        if base_dir is not None and isinstance(filename, (str, os.PathLike)):
+            filename = os.path.join(base_dir, filename)
+        return open(filename, mode, *args, **kwargs)
+    safe['open'] = safe_open
+    
+    # Add __import__ with restrictions
+    original_import = __builtins__['__import__'] if isinstance(__builtins__, dict) else __builtins__.__import__
+    
+    def restricted_import(name, *args, **kwargs):
+        # Check if blocked
+        for blocked in blocked_imports:
+            if name.startswith(blocked):
+                raise ImportError(f"Import of '{name}' is not allowed")
+        return original_import(name, *args, **kwargs)
+    
+    safe['__import__'] = restricted_import
+    
+    return safe
+
+
+def _is_serializable(value: Any) -> bool:
+    """Check if value can be serialized"""
+    try:
+        json.dumps(value)
+        return True
+    except:
+        return False
+
+
+def _serialize_value(value: Any) -> Any:
+    """Serialize value for JSON response"""
+    if value is None:
+        return None
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_serialize_value(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _serialize_value(v) for k, v in value.items()}
+    
+    # Try to convert to string representation
+    try:
+        return repr(value)
+    except:
+        return str(type(value))
+
+
+def _capture_plots() -> List[str]:
+    """Render open matplotlib figures as base64 PNGs"""
+    try:
+        import matplotlib.pyplot as plt
+        if plt.get_fignums():
+            buf = io.BytesIO()
+            plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+            buf.seek(0)
+            plt.close('all')
+            return [base64.b64encode(buf.read()).decode('utf-8')]
+    except:
+        pass
+    return []
+
+
+def _peak_memory() -> int:
+    """Peak RSS of the current process in bytes (0 if unknown)"""
+    if not HAS_RESOURCE:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_code(
+    namespace: Dict,
+    code: str,
+    work_dir: str,
+    max_output: int,
+    change_dir: bool = True
+) -> Dict[str, Any]:
+    """
+    Execute code in a namespace and return a picklable payload.
+    
+    The namespace persists across calls of the same session, so per-call
+    result markers are cleared first. change_dir=False keeps the process
+    cwd untouched (required when running in a thread: os.chdir is
+    process-wide and would leak into concurrent sessions).
+    """
+    stdout_capture = io.StringIO()
+    stderr_capture = io.StringIO()
+    plots: List[str] = []
+    return_value = None
+    error_msg = None
+    tb = None
+    status = ExecutionStatus.SUCCESS
+    
+    namespace.pop('_result', None)
+    namespace.pop('_', None)
+    namespace["_capture_plot"] = lambda: plots.extend(_capture_plots())
+    namespace["_work_dir"] = work_dir
+    
+    original_dir = os.getcwd() if change_dir else None
+    try:
+        if change_dir:
+            os.chdir(work_dir)
+        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            # Execute user code
+            exec(code, namespace)
+            
+            # Try to capture any matplotlib plots
+            plots.extend(_capture_plots())
+        
+        # Check for result variable
+        if '_result' in namespace:
+            return_value = namespace['_result']
+        elif '_' in namespace:
+            return_value = namespace['_']
+    except Exception as e:
+        error_msg = str(e)
+        tb = traceback.format_exc()
+        status = ExecutionStatus.ERROR
+    finally:
+        if change_dir:
+            os.chdir(original_dir)
+    
+    return {
+        "status": status.value,
+        "stdout": stdout_capture.getvalue()[:max_output],
+        "stderr": stderr_capture.getvalue()[:max_output],
+        "return_value": _serialize_value(return_value),
+        "plots": plots,
+        "error": error_msg,
+        "traceback": tb,
+        # Session variables (only safe types)
+        "variables": {
+            key: value for key, value in namespace.items()
+            if not key.startswith('_') and _is_serializable(value)
+        },
+        "memory_used": 0,
+    }
+
+
+# ============================================
+# PRE-WARMED WORKER POOL
+# ============================================
+
+def _python_worker_main(conn, blocked_imports: List[str], max_output: int) -> None:
+    """
+    Worker process entry point.
+    
+    Imports the common libraries once, then serves requests from the pipe:
+    ("exec", session_id, code, work_dir, seed), ("drop", session_id), ("stop",)
+    """
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+    except ImportError:
+        pass
+    
+    template = {
+        "__builtins__": _build_safe_builtins(blocked_imports),
+        "__name__": "__main__",
+    }
+    exec(_AUTO_IMPORTS, template)
+    
+    namespaces: Dict[str, Dict] = {}
+    conn.send(("ready", os.getpid()))
+    
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError, KeyboardInterrupt):
+            break
+        
+        op = message[0]
+        if op == "exec":
+            _, session_id, code, work_dir, seed = message
+            namespace = namespaces.get(session_id)
+            if namespace is None:
+                namespace = dict(template)
+                namespace.update(seed or {})
+                namespaces[session_id] = namespace
+            payload = _run_code(namespace, code, work_dir, max_output)
+            payload["memory_used"] = _peak_memory()
+            conn.send(payload)
+        elif op == "drop":
+            namespaces.pop(message[1], None)
+        elif op == "stop":
+            break
+
+
+@dataclass
+class _PoolWorker:
+    """One worker process and the sessions pinned to it"""
+    slot: int
+    process: Any
+    conn: Any
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    sessions: set = field(default_factory=set)  # pinned sessions
+    loaded: set = field(default_factory=set)  # sessions with a live namespace
+    executions: int = 0
+    restarts: int = 0
+
+
+class PythonWorkerPool:
+    """
+    Pool of pre-warmed Python worker processes
+    
+    - numpy/pandas/matplotlib are imported once per worker, not per call
+    - Each session is pinned to one worker and its namespace lives there,
+      so os.chdir and globals never leak between concurrent sessions
+    - Requests and results travel over a pipe (pickle)
+    - A runaway execution is hard-killed and the worker is replaced
+    """
+    
+    def __init__(
+        self,
+        size: int,
+        blocked_imports: List[str],
+        max_output: int,
+        start_method: str = "spawn"
+    ):
+        self.size = max(1, size)
+        self.blocked_imports = list(blocked_imports)
+        self.max_output = max_output
+        self._ctx = multiprocessing.get_context(start_method)
+        self._workers: List[_PoolWorker] = []
+        self._assignments: Dict[str, _PoolWorker] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._stats = {"executions": 0, "timeouts": 0, "crashes": 0}
+    
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+    
+    def _spawn(self, slot: int) -> Tuple[Any, Any]:
+        """Start one worker and wait until its imports are done (blocking)"""
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_python_worker_main,
+            args=(child_conn, self.blocked_imports, self.max_output),
+            name=f"code-interpreter-{slot}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        
+        if not parent_conn.poll(WORKER_START_TIMEOUT):
+            process.kill()
+            raise RuntimeError(f"Code interpreter worker {slot} did not start")
+        parent_conn.recv()
+        return process, parent_conn
+    
+    async def start(self):
+        """Spawn all workers in parallel (idempotent)"""
+        if self._workers:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        
+        async with self._start_lock:
+            if self._workers:
+                return
+            
+            loop = asyncio.get_running_loop()
+            spawned = await asyncio.gather(
+                *(loop.run_in_executor(None, self._spawn, slot) for slot in range(self.size)),
+                return_exceptions=True
+            )
+            errors = [item for item in spawned if isinstance(item, BaseException)]
+            if errors:
+                for item in spawned:
+                    if not isinstance(item, BaseException):
+                        item[0].kill()
+                raise errors[0]
+            
+            self._workers = [
+                _PoolWorker(slot=slot, process=process, conn=conn)
+                for slot, (process, conn) in enumerate(spawned)
+            ]
+            logger.info(f"Code interpreter pool started with {self.size} workers")
+    
+    def _assign(self, session_id: str) -> _PoolWorker:
+        """Pin session to the least loaded worker"""
+        worker = self._assignments.get(session_id)
+        if worker is None:
+            worker = min(self._workers, key=lambda w: len(w.sessions))
+            worker.sessions.add(session_id)
+            self._assignments[session_id] = worker
+        return worker
+    
+    @staticmethod
+    def _receive(worker: _PoolWorker, timeout: float) -> Optional[Dict]:
+        """Wait for a result; None on timeout, raises EOFError if worker died"""
+        if worker.conn.poll(timeout):
+            return worker.conn.recv()
+        return None
+    
+    async def _restart(self, worker: _PoolWorker):
+        """Kill worker and start a fresh one in the same slot"""
+        try:
+            worker.process.kill()
+            worker.process.join(timeout=5)
+            worker.conn.close()
+        except Exception as e:
+            logger.warning(f"Worker {worker.slot} cleanup error: {e}")
+        
+        loop = asyncio.get_running_loop()
+        worker.process, worker.conn = await loop.run_in_executor(None, self._spawn, worker.slot)
+        worker.loaded.clear()
+        worker.restarts += 1
+        logger.info(f"Code interpreter worker {worker.slot} restarted")
+    
+    async def execute(
+        self,
+        session_id: str,
+        code: str,
+        work_dir: str,
+        timeout: float,
+        seed_variables: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Run code in the session's worker.
+        
+        seed_variables restore a session namespace the worker does not hold
+        yet (new session or replaced worker).
+        """
+        await self.start()
+        worker = self._assign(session_id)
+        loop = asyncio.get_running_loop()
+        
+        async with worker.lock:
+            seed = None if session_id in worker.loaded else (seed_variables or {})
+            self._stats["executions"] += 1
+            worker.executions += 1
+            
+            try:
+                worker.conn.send(("exec", session_id, code, work_dir, seed))
+                payload = await loop.run_in_executor(None, self._receive, worker, timeout)
+            except (EOFError, OSError, BrokenPipeError) as e:
+                self._stats["crashes"] += 1
+                await self._restart(worker)
+                return {
+                    "status": ExecutionStatus.KILLED.value,
+                    "error": f"Worker process died: {type(e).__name__}",
+                }
+            
+            if payload is None:
+                self._stats["timeouts"] += 1
+                await self._restart(worker)
+                return {
+                    "status": ExecutionStatus.TIMEOUT.value,
+                    "error": f"Execution timed out after {timeout} seconds",
+                }
+            
+            worker.loaded.add(session_id)
+            return payload
+    
+    def release(self, session_id: str):
+        """Drop session namespace from its worker"""
+        worker = self._assignments.pop(session_id, None)
+        if worker is None:
+            return
+        worker.sessions.discard(session_id)
+        if session_id in worker.loaded:
+            worker.loaded.discard(session_id)
+            try:
+                worker.conn.send(("drop", session_id))
+            except (OSError, BrokenPipeError):
+                pass
+    
+    def shutdown(self):
+        """Stop all workers"""
+        for worker in self._workers:
+            try:
+                worker.conn.send(("stop",))
+            except (OSError, BrokenPipeError):
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=2)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+        self._workers = []
+        self._assignments.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool statistics"""
+        return {
+            **self._stats,
+            "workers": [
+                {
+                    "slot": w.slot,
+                    "pid": w.process.pid,
+                    "alive": w.process.is_alive(),
+                    "sessions": len(w.sessions),
+                    "executions": w.executions,
+                    "restarts": w.restarts,
+                }
+                for w in self._workers
+            ],
+        }
 
 
 class CodeInterpreter:
@@ -94,11 +566,47 @@ class CodeInterpreter:
     def __init__(self, config: Optional[SandboxConfig] = None):
         self.config = config or SandboxConfig()
         self.sessions: Dict[str, Dict] = {}  # Session state storage
+        self._owns_work_dir = not self.config.work_dir
         self._work_dir = self.config.work_dir or tempfile.mkdtemp(prefix="code_interpreter_")
         self._ensure_work_dir()
         
         # Matplotlib backend for headless rendering
         self._setup_matplotlib()
+        
+        # Pre-warmed worker processes (started lazily or via warm_up)
+        self._pool: Optional[PythonWorkerPool] = self._new_pool()
+        self._pool_retry_at = 0.0
+    
+    def _new_pool(self) -> Optional[PythonWorkerPool]:
+        if self.config.worker_processes <= 0:
+            return None
+        return PythonWorkerPool(
+            size=self.config.worker_processes,
+            blocked_imports=self.config.blocked_imports,
+            max_output=self.config.max_output
+        )
+    
+    def _reset_pool(self):
+        """Drop a failed pool; a fresh one is created after POOL_RETRY_SECONDS"""
+        try:
+            self._pool.shutdown()
+        except Exception as e:
+            logger.warning(f"Code interpreter pool cleanup error: {e}")
+        self._pool = self._new_pool()
+        self._pool_retry_at = time.time() + POOL_RETRY_SECONDS
+    
+    async def warm_up(self):
+        """Start worker processes ahead of the first execution"""
+        if self._pool:
+            await self._pool.start()
+    
+    def shutdown(self):
+        """Stop worker processes and remove the temporary work dir"""
+        if self._pool:
+            self._pool.shutdown()
+        if self._owns_work_dir:
+            import shutil
+            shutil.rmtree(self._work_dir, ignore_errors=True)
     
     def _ensure_work_dir(self):
         """Ensure work directory exists"""
@@ -138,6 +646,8 @@ class CodeInterpreter:
         """Close and cleanup session"""
         if session_id in self.sessions:
             session = self.sessions.pop(session_id)
+            if self._pool:
+                self._pool.release(session_id)
             # Cleanup files
             session_dir = Path(session["work_dir"])
             if session_dir.exists():
@@ -155,6 +665,9 @@ class CodeInterpreter:
     ) -> ExecutionResult:
         """
         Execute Python code in sandbox
+        
+        Runs in the session's pre-warmed worker process; falls back to an
+        in-process thread when the pool is disabled or cannot start.
         """
         execution_id = str(uuid.uuid4())[:8]
         timeout = timeout or self.config.timeout
@@ -163,123 +676,34 @@ class CodeInterpreter:
         # Get or create session
         if session_id and session_id in self.sessions:
             session = self.sessions[session_id]
-            work_dir = session["work_dir"]
-            variables = session["variables"]
         else:
             session_id = self.create_session()
             session = self.sessions[session_id]
-            work_dir = session["work_dir"]
-            variables = {}
-        
-        # Prepare execution environment
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
-        plots: List[str] = []
-        created_files: List[str] = []
-        return_value = None
-        error_msg = None
-        tb = None
-        status = ExecutionStatus.SUCCESS
+        work_dir = session["work_dir"]
         
-        # Setup matplotlib plot capture
-        def capture_plot():
+        payload = None
+        if self._pool and time.time() >= self._pool_retry_at:
             try:
-                import matplotlib.pyplot as plt
-                if plt.get_fignums():
-                    buf = io.BytesIO()
-                    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
-                    buf.seek(0)
-                    plots.append(base64.b64encode(buf.read()).decode('utf-8'))
-                    plt.close('all')
-            except:
-                pass
-        
-        # Build safe globals
-        safe_globals = {
-            "__builtins__": self._get_safe_builtins(),
-            "__name__": "__main__",
-            "_capture_plot": capture_plot,
-            "_work_dir": work_dir,
-        }
+                payload = await self._pool.execute(
+                    session_id, code, work_dir, timeout,
+                    seed_variables=session["variables"]
+                )
+            except Exception as e:
+                logger.warning(f"Code interpreter pool unavailable, using in-process execution: {e}")
+                self._reset_pool()
         
-        # Add previous session variables
-        safe_globals.update(variables)
-        
-        # Auto-import common libraries
-        auto_imports = """
-import math
-import json
-import datetime
-import random
-import statistics
-from collections import defaultdict, Counter
-try:
-    import numpy as np
-except: pass
-try:
-    import pandas as pd
-except: pass
-try:
-    import matplotlib.pyplot as plt
-except: pass
-"""
-        
-        try:
-            # Execute in thread with timeout
-            def execute():
-                nonlocal return_value, error_msg, tb, status
-                try:
-                    # Run auto imports
-                    exec(auto_imports, safe_globals)
-                    
-                    # Change to work directory
-                    original_dir = os.getcwd()
-                    os.chdir(work_dir)
-                    
-                    try:
-                        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                            # Execute user code
-                            exec(code, safe_globals)
-                            
-                            # Try to capture any matplotlib plots
-                            capture_plot()
-                            
-                            # Check for result variable
-                            if '_result' in safe_globals:
-                                return_value = safe_globals['_result']
-                            elif '_' in safe_globals:
-                                return_value = safe_globals['_']
-                    finally:
-                        os.chdir(original_dir)
-                        
-                except Exception as e:
-                    error_msg = str(e)
-                    tb = traceback.format_exc()
-                    status = ExecutionStatus.ERROR
-            
-            # Run with timeout
-            thread = threading.Thread(target=execute)
-            thread.start()
-            thread.join(timeout=timeout)
-            
-            if thread.is_alive():
-                status = ExecutionStatus.TIMEOUT
-                error_msg = f"Execution timed out after {timeout} seconds"
-            
-        except Exception as e:
-            status = ExecutionStatus.ERROR
-            error_msg = str(e)
-            tb = traceback.format_exc()
+        if payload is None:
+            payload = self._execute_python_inline(code, work_dir, session["variables"], timeout)
         
         execution_time = time.time() - start_time
+        status = ExecutionStatus(payload["status"])
         
         # Update session variables (only safe types)
-        for key, value in safe_globals.items():
-            if not key.startswith('_') and self._is_serializable(value):
-                variables[key] = value
-        session["variables"] = variables
+        if "variables" in payload:
+            session["variables"] = payload["variables"]
         
         # Check for created files
+        created_files: List[str] = []
         work_path = Path(work_dir)
         for f in work_path.iterdir():
             if f.is_file():
@@ -298,17 +722,69 @@ except: pass
             execution_id=execution_id,
             language=ExecutionLanguage.PYTHON,
             status=status,
-            stdout=stdout_capture.getvalue()[:self.config.max_output],
-            stderr=stderr_capture.getvalue()[:self.config.max_output],
-            return_value=self._serialize_value(return_value),
+            stdout=payload.get("stdout", ""),
+            stderr=payload.get("stderr", ""),
+            return_value=payload.get("return_value"),
             execution_time=execution_time,
-            memory_used=0,  # TODO: Track memory
+            memory_used=payload.get("memory_used", 0),
             created_files=created_files,
-            plots=plots,
-            error=error_msg,
-            traceback=tb
+            plots=payload.get("plots", []),
+            error=payload.get("error"),
+            traceback=payload.get("traceback")
         )
     
+    def _execute_python_inline(
+        self,
+        code: str,
+        work_dir: str,
+        variables: Dict,
+        timeout: int
+    ) -> Dict[str, Any]:
+        """
+        In-process fallback: thread with timeout (cannot kill runaway code)
+        
+        The process cwd is never changed here; open() resolves relative
+        paths against the session work dir instead.
+        """
+        # Build safe globals
+        safe_globals = {
+            "__builtins__": _build_safe_builtins(self.config.blocked_imports, base_dir=work_dir),
+            "__name__": "__main__",
+        }
+        
+        payload: Dict[str, Any] = {}
+        
+        def execute():
+            try:
+                # Auto-import common libraries
+                exec(_AUTO_IMPORTS, safe_globals)
+                
+                # Add previous session variables
+                safe_globals.update(variables)
+                
+                payload.update(
+                    _run_code(safe_globals, code, work_dir, self.config.max_output, change_dir=False)
+                )
+            except Exception as e:
+                payload.update(
+                    status=ExecutionStatus.ERROR.value,
+                    error=str(e),
+                    traceback=traceback.format_exc()
+                )
+        
+        # Run with timeout
+        thread = threading.Thread(target=execute, daemon=True)
+        thread.start()
+        thread.join(timeout=timeout)
+        
+        if thread.is_alive():
+            return {
+                "status": ExecutionStatus.TIMEOUT.value,
+                "error": f"Execution timed out after {timeout} seconds",
+            }
+        
+        return payload
+    
     async def execute_javascript(
         self,
         code: str,
@@ -406,76 +882,15 @@ except: pass
     
     def _get_safe_builtins(self) -> Dict:
         """Get restricted builtins"""
-        safe = {}
-        allowed = [
-            # Types
-            'bool', 'int', 'float', 'str', 'list', 'dict', 'tuple', 'set', 'frozenset',
-            'bytes', 'bytearray', 'complex', 'type', 'object',
-            # Functions
-            'abs', 'all', 'any', 'ascii', 'bin', 'callable', 'chr', 'divmod',
-            'enumerate', 'filter', 'format', 'getattr', 'hasattr', 'hash', 'hex',
-            'id', 'isinstance', 'issubclass', 'iter', 'len', 'map', 'max', 'min',
-            'next', 'oct', 'ord', 'pow', 'print', 'range', 'repr', 'reversed',
-            'round', 'slice', 'sorted', 'sum', 'zip',
-            # Exceptions
-            'Exception', 'ValueError', 'TypeError', 'KeyError', 'IndexError',
-            'AttributeError', 'RuntimeError', 'StopIteration', 'ZeroDivisionError',
-            # Other
-            'True', 'False', 'None',
-        ]
-        
-        for name in allowed:
-            if hasattr(__builtins__, name):
-                safe[name] = getattr(__builtins__, name)
-            elif name in __builtins__ if isinstance(__builtins__, dict) else {}:
-                safe[name] = __builtins__[name]
-        
-        # Add safe open (read-only in work_dir)
-        def safe_open(filename, mode='r', *args, **kwargs):
-            if 'w' in mode or 'a' in mode:
-                # Only allow writing in work_dir
-                pass
-            return open(filename, mode, *args, **kwargs)
-        safe['open'] = safe_open
-        
-        # Add __import__ with restrictions
-        original_import = __builtins__['__import__'] if isinstance(__builtins__, dict) else __builtins__.__import__
-        
-        def restricted_import(name, *args, **kwargs):
-            # Check if blocked
-            for blocked in self.config.blocked_imports:
-                if name.startswith(blocked):
-                    raise ImportError(f"Import of '{name}' is not allowed")
-            return original_import(name, *args, **kwargs)
-        
-        safe['__import__'] = restricted_import
-        
-        return safe
+        return _build_safe_builtins(self.config.blocked_imports)
     
     def _is_serializable(self, value: Any) -> bool:
         """Check if value can be serialized"""
-        try:
-            json.dumps(value)
-            return True
-        except:
-            return False
+        return _is_serializable(value)
     
     def _serialize_value(self, value: Any) -> Any:
         """Serialize value for JSON response"""
-        if value is None:
-            return None
-        if isinstance(value, (bool, int, float, str)):
-            return value
-        if isinstance(value, (list, tuple)):
-            return [self._serialize_value(v) for v in value]
-        if isinstance(value, dict):
-            return {k: self._serialize_value(v) for k, v in value.items()}
-        
-        # Try to convert to string representation
-        try:
-            return repr(value)
-        except:
-            return str(type(value))
+        return _serialize_value(value)
     
     def get_session_files(self, session_id: str) -> List[Dict]:
         """Get list of files in session"""
@@ -506,10 +921,17 @@ except: pass
         return None
 
 
-# Global instance
-code_interpreter = CodeInterpreter()
+# Global instance, created on first use: spawned pool workers re-import this
+# module and must not create (and leak) a work dir of their own
+_code_interpreter: Optional[CodeInterpreter] = None
+_code_interpreter_lock = threading.Lock()
 
 
 def get_code_interpreter() -> CodeInterpreter:
     """Get code interpreter instance"""
-    return code_interpreter
+    global _code_interpreter
+    if _code_interpreter is None:
+        with _code_interpreter_lock:
+            if _code_interpreter is None:
+                _code_interpreter = CodeInterpreter()
+    return _code_interpreter
@@ -245,6 +245,13 @@ class Settings(BaseSettings):
     CRAG_MIN_RELEVANT_DOCS: int = 1
     CRAG_HALLUCINATION_CHECK: bool = True
     
+    # ==================== CHAT HISTORY CONFIGURATION ====================
+    # Eski mesajlar arka planda özetlenir; prompt = özet + sınırlı son kesit
+    CHAT_SUMMARY_REFRESH_EVERY: int = 6  # Özet, bu kadar yeni mesaj birikince yenilenir
+    CHAT_RECENT_MESSAGES: int = 8  # Özete katlanmadan prompt'a aynen giren son mesaj sayısı (en az)
+    CHAT_HISTORY_TOKEN_BUDGET: int = 2000  # Son kesit için token limiti
+    CHAT_SUMMARY_MAX_CHARS: int = 2400  # Kayıtlı özetin üst sınırı
+    
     # ==================== WEBSOCKET CONFIGURATION ====================
     # WebSocket URLs and settings
     WS_PING_INTERVAL: int = 25  # seconds
@@ -21,6 +21,8 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,17 +117,41 @@ class RelevanceGrader:
     - Keyword overlap
     - Entity matching
     - LLM-based grading (optional)
+    
+    grade_documents runs in two stages: a cheap pre-filter (keyword overlap
+    and, with an embedder, cosine similarity) drops clear misses, then the
+    survivors are LLM-graded concurrently (at most `max_concurrency` calls
+    in flight, or in batches when `llm_batch_grader` is given).
     """
     
     def __init__(
         self,
         llm_grader: Optional[Callable] = None,
         relevance_threshold: float = 0.5,
-        use_llm: bool = True
+        use_llm: bool = True,
+        embedder: Optional[Any] = None,
+        llm_batch_grader: Optional[Callable] = None,
+        max_concurrency: int = 8,
+        batch_size: int = 8,
+        prefilter: bool = True,
+        min_keyword_score: float = 0.1,
+        min_semantic_score: float = 0.25
     ):
         self.llm_grader = llm_grader
         self.relevance_threshold = relevance_threshold
         self.use_llm = use_llm
+        self.embedder = embedder
+        self.llm_batch_grader = llm_batch_grader
+        self.max_concurrency = max(1, max_concurrency)
+        self.batch_size = max(1, batch_size)
+        self.prefilter = prefilter
+        self.min_keyword_score = min_keyword_score
+        self.min_semantic_score = min_semantic_score
+        self.stats = {"graded": 0, "prefiltered": 0, "llm_calls": 0}
+    
+    @property
+    def _llm_enabled(self) -> bool:
+        return self.use_llm and bool(self.llm_grader or self.llm_batch_grader)
     
     async def grade_documents(
         self,
@@ -133,12 +159,46 @@ class RelevanceGrader:
         documents: List[Dict[str, Any]],
         query_analysis: Optional[QueryAnalysis] = None
     ) -> List[GradedDocument]:
-        """Grade a list of documents"""
+        """Grade a list of documents (pre-filter, then concurrent LLM grading)"""
+        if not documents:
+            return []
+        
+        contents = [self._content_of(doc) for doc in documents]
+        keyword = [
+            self._calculate_keyword_score(query, content, query_analysis)
+            for content in contents
+        ]
+        semantic = await self._semantic_scores(query, documents, contents)
+        
+        # Stage 1: drop clear misses before any LLM call
+        candidates = []
+        for i in range(len(documents)):
+            if self.prefilter and self._llm_enabled and self._is_clear_miss(
+                keyword[i][0], semantic[i] if semantic is not None else None
+            ):
+                continue
+            candidates.append(i)
+        self.stats["prefiltered"] += len(documents) - len(candidates)
+        
+        # Stage 2: LLM grades for the survivors, concurrently
+        llm_scores: Dict[int, float] = {}
+        if self._llm_enabled and candidates:
+            scores = await self._llm_grade_many(query, [contents[i] for i in candidates])
+            llm_scores = dict(zip(candidates, scores))
+        
         graded = []
+        for i, doc in enumerate(documents):
+            score, matches = keyword[i]
+            if i in llm_scores:
+                score = (score + llm_scores[i]) / 2
+            
+            metadata = doc.get("metadata", {})
+            if self._llm_enabled and i not in llm_scores:
+                metadata = {**metadata, "prefiltered": True}
+            
+            graded.append(self._build_graded(doc, contents[i], score, matches, metadata))
         
-        for doc in documents:
-            graded_doc = await self.grade_document(query, doc, query_analysis)
-            graded.append(graded_doc)
+        self.stats["graded"] += len(graded)
         
         # Sort by relevance
         graded.sort(key=lambda d: d.relevance_score, reverse=True)
@@ -152,9 +212,7 @@ class RelevanceGrader:
         query_analysis: Optional[QueryAnalysis] = None
     ) -> GradedDocument:
         """Grade a single document"""
-        content = document.get("content", document.get("document", ""))
-        source = document.get("source", document.get("metadata", {}).get("source", "unknown"))
-        page = document.get("page_number", document.get("metadata", {}).get("page_number"))
+        content = self._content_of(document)
         
         # Basic scoring
         score, matches = self._calculate_keyword_score(query, content, query_analysis)
@@ -164,19 +222,71 @@ class RelevanceGrader:
             llm_score = await self._llm_grade(query, content)
             score = (score + llm_score) / 2
         
-        # Determine grade
-        grade = self._score_to_grade(score)
+        return self._build_graded(document, content, score, matches, document.get("metadata", {}))
+    
+    @staticmethod
+    def _content_of(document: Dict[str, Any]) -> str:
+        return document.get("content", document.get("document", ""))
+    
+    def _build_graded(
+        self,
+        document: Dict[str, Any],
+        content: str,
+        score: float,
+        matches: List[str],
+        metadata: Dict[str, Any]
+    ) -> GradedDocument:
+        source = document.get("source", document.get("metadata", {}).get("source", "unknown"))
+        page = document.get("page_number", document.get("metadata", {}).get("page_number"))
         
         return GradedDocument(
             content=content,
             source=source,
             page=page,
-            grade=grade,
+            grade=self._score_to_grade(score),
             relevance_score=score,
             key_matches=matches,
-            metadata=document.get("metadata", {})
+            metadata=metadata
         )
     
+    def _is_clear_miss(self, keyword_score: float, semantic_score: Optional[float]) -> bool:
+        """Both cheap signals are below their floors"""
+        if keyword_score >= self.min_keyword_score:
+            return False
+        return semantic_score is None or semantic_score < self.min_semantic_score
+    
+    async def _semantic_scores(
+        self,
+        query: str,
+        documents: List[Dict[str, Any]],
+        contents: List[str]
+    ) -> Optional[List[float]]:
+        """Cosine similarity between query and documents (one embedding batch)"""
+        if self.embedder is None:
+            return None
+        
+        try:
+            query_vec = await asyncio.to_thread(self.embedder.embed_query, query)
+            
+            # Reuse embeddings that came with the retrieved documents
+            vectors: List[Optional[List[float]]] = [doc.get("embedding") for doc in documents]
+            missing = [i for i, vec in enumerate(vectors) if vec is None]
+            if missing:
+                embedded = await asyncio.to_thread(
+                    self.embedder.embed_texts, [contents[i][:2000] for i in missing]
+                )
+                for i, vec in zip(missing, embedded):
+                    vectors[i] = vec
+            
+            matrix = np.asarray(vectors, dtype=np.float32)
+            q = np.asarray(query_vec, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(q)
+            sims = matrix @ q / np.where(norms == 0, 1.0, norms)
+            return sims.tolist()
+        except Exception as e:
+            logger.warning(f"Semantic pre-filter failed: {e}")
+            return None
+    
     def _calculate_keyword_score(
         self,
         query: str,
@@ -220,6 +330,7 @@ class RelevanceGrader:
         if not self.llm_grader:
             return 0.5
         
+        self.stats["llm_calls"] += 1
         try:
             result = await self.llm_grader(
                 query=query,
@@ -230,6 +341,45 @@ class RelevanceGrader:
             logger.warning(f"LLM grading failed: {e}")
             return 0.5
     
+    async def _llm_grade_batch(self, query: str, contents: List[str]) -> List[float]:
+        """Grade several documents with one LLM call"""
+        self.stats["llm_calls"] += 1
+        try:
+            result = await self.llm_batch_grader(
+                query=query,
+                contents=[content[:2000] for content in contents]
+            )
+            scores = [float(score) for score in result]
+            if len(scores) == len(contents):
+                return scores
+            logger.warning(f"LLM batch grading returned {len(scores)} scores for {len(contents)} documents")
+        except Exception as e:
+            logger.warning(f"LLM batch grading failed: {e}")
+        return [0.5] * len(contents)
+    
+    async def _llm_grade_many(self, query: str, contents: List[str]) -> List[float]:
+        """LLM grades under the concurrency limit; latency ~ slowest call"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        if self.llm_batch_grader:
+            batches = [
+                contents[i:i + self.batch_size]
+                for i in range(0, len(contents), self.batch_size)
+            ]
+            
+            async def grade_batch(batch: List[str]) -> List[float]:
+                async with semaphore:
+                    return await self._llm_grade_batch(query, batch)
+            
+            results = await asyncio.gather(*(grade_batch(batch) for batch in batches))
+            return [score for batch_scores in results for score in batch_scores]
+        
+        async def grade_one(content: str) -> float:
+            async with semaphore:
+                return await self._llm_grade(query, content)
+        
+        return list(await asyncio.gather(*(grade_one(content) for content in contents)))
+    
     def _score_to_grade(self, score: float) -> RelevanceGrade:
         """Convert score to grade"""
         if score >= 0.8:
@@ -627,12 +777,13 @@ class CRAGPipeline:
                 current_query = reformulated.reformulated
             elif action == CorrectionAction.DECOMPOSE:
                 sub_queries = await self.transformer.decompose(current_query, analysis)
-                # Retrieve for each sub-query
-                for sq in sub_queries[1:]:  # Skip original
-                    sub_docs = await self.retriever(sq)
-                    all_graded_docs.extend(
-                        await self.grader.grade_documents(sq, sub_docs, analysis)
-                    )
+                # Retrieve and grade sub-queries concurrently
+                sub_results = await asyncio.gather(*(
+                    self._retrieve_and_grade(sq, analysis)
+                    for sq in sub_queries[1:]  # Skip original
+                ))
+                for sub_graded in sub_results:
+                    all_graded_docs.extend(sub_graded)
             elif action == CorrectionAction.EXPAND:
                 current_query = await self.transformer.expand(current_query, analysis)
         
@@ -685,6 +836,14 @@ class CRAGPipeline:
             }
         )
     
+    async def _retrieve_and_grade(
+        self,
+        query: str,
+        analysis: QueryAnalysis
+    ) -> List[GradedDocument]:
+        docs = await self.retriever(query)
+        return await self.grader.grade_documents(query, docs, analysis)
+    
     def _determine_correction(
         self,
         relevant_count: int,
@@ -11,7 +11,8 @@ Kurumsal seviye akademik döküman oluşturucu.
 - Cross-Pollination sentez motoru - Kaynak sentezleme
 - Self-Correction döngüsü - Halüsinasyon kontrolü
 - User Proxy simülatörü - İç kalite kontrolü
-- Paralel araştırma + Sıralı yazım
+- Pipeline: eşzamanlı araştırma, araştırmayla örtüşen sıralı yazım,
+  paralel görsel/doğrulama aşamaları
 - Akademik kaynakça (APA/IEEE/Chicago)
 - PDF export
 - Çoklu dil desteği
@@ -313,6 +314,8 @@ class DeepScholarConfig:
     
     # Gelişmiş
     parallel_research: bool = True
+    max_parallel_sections: int = 3  # Aynı anda araştırılan bölüm sayısı
+    max_parallel_stages: int = 4  # Aynı anda çalışan görsel/doğrulama aşaması
     max_research_depth: int = 3  # Fraktal derinlik
     
     # Görsel üretim ayarları (Premium)
@@ -932,7 +935,7 @@ class ResearcherAgent(BaseAgent):
         all_results = []
         
         # Araştırma sorguları
-        queries = section.research_queries or [section.title]
+        queries = list(section.research_queries or [section.title])
         queries.extend(section.key_points[:3])
         queries = list(set(queries))[:8]  # Max 8 sorgu
         
@@ -965,12 +968,16 @@ class ResearcherAgent(BaseAgent):
         # RAG araması
         try:
             from core.vector_store import vector_store
-            for query in queries[:5]:
-                rag_results = vector_store.search_with_scores(
+            # Senkron vektör araması event loop'u bloklamasın
+            rag_batches = await asyncio.to_thread(lambda: [
+                vector_store.search_with_scores(
                     query=query,
                     n_results=5,
                     score_threshold=0.3
                 )
+                for query in queries[:5]
+            ])
+            for rag_results in rag_batches:
                 for r in rag_results:
                     all_results.append(ResearchItem(
                         id=f"rag_{hashlib.md5(r.get('document', '')[:100].encode()).hexdigest()[:8]}",
@@ -1128,12 +1135,12 @@ class VisualGenerator:
             section_title, section_content, topic, config
         )
         
-        for visual_type in suitable_types[:config.visuals_per_section]:
-            visual = await self._generate_visual(
-                visual_type, section_title, section_content, topic, config
-            )
-            if visual:
-                visuals.append(visual)
+        # Görseller birbirinden bağımsız - paralel üret, sırayı koru
+        generated = await asyncio.gather(*(
+            self._generate_visual(visual_type, section_title, section_content, topic, config)
+            for visual_type in suitable_types[:config.visuals_per_section]
+        ))
+        visuals.extend(visual for visual in generated if visual)
         
         return visuals
     
@@ -2028,7 +2035,10 @@ class DeepScholarOrchestrator:
                 }
             }
             
-            # ============ PHASE 2: RESEARCH ============
+            # ============ PHASE 2-3: RESEARCH + WRITING (PIPELINE) ============
+            # Araştırma tüm bölümler için eşzamanlı başlar, yazım sırayla
+            # ilerler ve N. bölümün yazımı N+1'in araştırmasıyla örtüşür.
+            # Görsel/doğrulama aşamaları arka planda paralel çalışır.
             yield {
                 "type": EventType.PHASE_START.value,
                 "phase": "research",
@@ -2036,376 +2046,513 @@ class DeepScholarOrchestrator:
                 "progress": 15
             }
             
-            all_research: Dict[str, List[ResearchItem]] = {}
-            total_sources = 0
+            events: asyncio.Queue = asyncio.Queue()
+            pipeline = asyncio.create_task(
+                self._run_section_pipeline(config, outline, events)
+            )
+            last_progress = 15
+            try:
+                while True:
+                    event = await events.get()
+                    if event is None:
+                        break
+                    # Paralel aşamalarda ilerleme geri gitmesin
+                    if "progress" in event:
+                        last_progress = max(last_progress, event["progress"])
+                        event["progress"] = last_progress
+                    yield event
+                all_content = await pipeline
+            finally:
+                if not pipeline.done():
+                    pipeline.cancel()
             
-            for i, section in enumerate(outline):
-                yield {
-                    "type": EventType.AGENT_MESSAGE.value,
-                    "agent": AgentRole.RESEARCHER.value,
-                    "message": f"🔎 Bölüm {i+1}/{len(outline)} araştırılıyor: {section.title}"
-                }
-                
-                self.local_state.current_section = section
-                research = await self.researcher.research_section(section, config, self.local_state)
-                all_research[section.id] = research
-                total_sources += len(research)
-                
-                yield {
-                    "type": EventType.RESEARCH_FOUND.value,
-                    "section": section.title,
-                    "sources_count": len(research),
-                    "sources": [
-                        {"title": r.source_title, "type": r.source_type, "score": r.relevance_score}
-                        for r in research[:5]
-                    ]
-                }
-                
-                # Fraktal genişleme kontrolü
-                if config.max_research_depth > 1 and len(research) > 5:
-                    claims = await self.researcher.extract_claims(research)
-                    self.local_state.extracted_claims = claims
-                    
-                    if config.enable_conflict_detection:
-                        conflicts = await self.researcher.detect_conflicts(claims)
-                        self.local_state.detected_conflicts = conflicts
-                        
-                        if conflicts:
-                            yield {
-                                "type": EventType.CONFLICT_DETECTED.value,
-                                "section": section.title,
-                                "conflicts": conflicts
-                            }
+            # ============ PHASE 4: BIBLIOGRAPHY ============
+            yield {
+                "type": EventType.PHASE_START.value,
+                "phase": "bibliography",
+                "message": "📖 Kaynakça oluşturuluyor...",
+                "progress": 88
+            }
+            
+            bibliography = self._create_bibliography(config)
             
             yield {
                 "type": EventType.PHASE_END.value,
-                "phase": "research",
-                "message": f"📚 Toplam {total_sources} kaynak bulundu",
-                "progress": 30
+                "phase": "bibliography",
+                "message": f"📚 {len(self.global_state.all_citations)} kaynak listelendi",
+                "progress": 92
             }
             
-            # 🚀 Research Analytics (Premium V2)
-            if PREMIUM_ADVANCED_AVAILABLE and config.enable_analytics and self.analytics_engine:
-                yield {
-                    "type": EventType.AGENT_THINKING.value,
-                    "agent": "ResearchAnalytics",
-                    "thought": "📊 Araştırma kalitesi analiz ediliyor..."
-                }
-                
-                # Tüm kaynakları düz listeye çevir
-                flat_sources = []
-                for section_id, research_items in all_research.items():
-                    for item in research_items:
-                        flat_sources.append({
-                            "id": item.id,
-                            "title": item.source_title,
-                            "type": item.source_type,
-                            "content": item.content[:500] if item.content else "",
-                            "keywords": [],
-                            "year": 2024
-                        })
-                
-                analytics_report = await self.analytics_engine.analyze_sources(
-                    flat_sources, config.topic
-                )
-                
-                yield {
-                    "type": "research_analytics",
-                    "quality_score": analytics_report.quality_score,
-                    "diversity_score": round(analytics_report.source_metrics.diversity_score, 2),
-                    "recency_score": round(analytics_report.source_metrics.recency_score, 2),
-                    "topic_clusters": [c.name for c in analytics_report.topic_clusters[:5]],
-                    "gaps": analytics_report.gaps_identified[:3],
-                    "recommendations": analytics_report.recommendations[:3],
-                    "message": f"📊 Araştırma kalitesi: {analytics_report.quality_score}/100"
+            # ============ PHASE 5: FINALIZE ============
+            yield {
+                "type": EventType.PHASE_START.value,
+                "phase": "finalize",
+                "message": "🔧 Döküman birleştiriliyor...",
+                "progress": 94
+            }
+            
+            # Final döküman
+            final_content = self._combine_content(all_content, bibliography, config)
+            
+            yield {
+                "type": EventType.COMPLETE.value,
+                "message": "🎉 Döküman başarıyla oluşturuldu!",
+                "progress": 100,
+                "document": {
+                    "title": config.title,
+                    "content": final_content,
+                    "word_count": len(final_content.split()),
+                    "page_count": config.page_count,
+                    "citations_count": len(self.global_state.all_citations),
+                    "sections": [
+                        {"id": s.id, "title": s.title}
+                        for s in outline
+                    ]
                 }
+            }
             
-            # ============ PHASE 3: WRITING ============
+        except Exception as e:
             yield {
+                "type": EventType.ERROR.value,
+                "message": f"❌ Hata: {str(e)}",
+                "error": str(e),
+                "trace": traceback.format_exc()
+            }
+    
+    # ------------------------------------------------------------------
+    # Section pipeline
+    # ------------------------------------------------------------------
+    
+    async def _run_section_pipeline(
+        self,
+        config: DeepScholarConfig,
+        outline: List[SectionOutline],
+        events: asyncio.Queue
+    ) -> List[Dict[str, Any]]:
+        """
+        Bölüm pipeline'ı: eşzamanlı araştırma, sıralı yazım, paralel son aşamalar.
+        
+        Event'ler hazır oldukça kuyruğa yazılır; bitişte None gönderilir.
+        """
+        emit = events.put_nowait
+        total = len(outline)
+        research_limit = asyncio.Semaphore(
+            max(1, config.max_parallel_sections) if config.parallel_research else 1
+        )
+        stage_limit = asyncio.Semaphore(max(1, config.max_parallel_stages))
+        
+        research_tasks = [
+            asyncio.create_task(
+                self._research_stage(i, total, section, config, research_limit, emit)
+            )
+            for i, section in enumerate(outline)
+        ]
+        research_summary = asyncio.create_task(
+            self._research_summary_stage(research_tasks, config, emit)
+        )
+        post_tasks: List[asyncio.Task] = []
+        all_content: List[Optional[Dict[str, Any]]] = [None] * total
+        previous_summary = ""
+        
+        try:
+            emit({
                 "type": EventType.PHASE_START.value,
                 "phase": "writing",
                 "message": "✍️ İçerik yazılıyor...",
                 "progress": 35
-            }
-            
-            all_content = []
-            all_citations = []
+            })
             
             for i, section in enumerate(outline):
-                progress = 35 + int((i / len(outline)) * 45)
+                progress = 35 + int((i / total) * 45)
                 
-                yield {
+                emit({
                     "type": EventType.SECTION_START.value,
                     "section_index": i,
                     "section_title": section.title,
                     "progress": progress
-                }
+                })
                 
-                yield {
+                emit({
                     "type": EventType.AGENT_MESSAGE.value,
                     "agent": AgentRole.WRITER.value,
                     "message": f"✏️ Yazılıyor: {section.title} ({section.word_target} kelime hedef)"
-                }
+                })
                 
                 # Pause kontrolü
                 if await self._check_pause():
-                    # Checkpoint kaydet
-                    checkpoint = GenerationCheckpoint(
-                        document_id=self._document_id or "",
-                        config={
-                            "title": config.title,
-                            "topic": config.topic,
-                            "page_count": config.page_count,
-                            "language": config.language.value,
-                            "citation_style": config.citation_style.value,
-                            "style": config.style
-                        },
-                        progress=progress,
-                        current_phase="writing",
-                        completed_sections=[
-                            {"id": c["section_id"], "title": c["title"], "content": c["content"]}
-                            for c in all_content
-                        ],
-                        pending_sections=[
-                            {"id": s.id, "title": s.title}
-                            for s in outline[i:]
-                        ],
-                        all_research={
-                            k: [{"id": r.id, "content": r.content, "source_title": r.source_title}
-                                for r in v]
-                            for k, v in all_research.items()
-                        },
-                        global_state={
-                            "completed_sections": dict(self.global_state.completed_sections),
-                            "section_summaries": dict(self.global_state.section_summaries)
-                        }
+                    # Checkpoint tutarlı olsun: önceki bölümlerin aşamaları bitsin
+                    await asyncio.gather(*post_tasks)
+                    self._save_pipeline_checkpoint(
+                        config, outline, i, progress, all_content, research_tasks
                     )
-                    self.save_checkpoint(checkpoint)
                     
-                    yield {
+                    emit({
                         "type": EventType.PAUSED.value,
                         "message": "⏸️ Üretim duraklatıldı. Kaldığınız yerden devam edebilirsiniz.",
                         "progress": progress,
                         "checkpoint_id": self._document_id,
-                        "completed_sections": len(all_content),
-                        "pending_sections": len(outline) - i
-                    }
+                        "completed_sections": i,
+                        "pending_sections": total - i
+                    })
                     
                     # Pause döngüsü - resume bekle
                     while await self._check_pause():
                         await asyncio.sleep(1)
                     
-                    yield {
+                    emit({
                         "type": EventType.RESUMED.value,
                         "message": "▶️ Üretim devam ediyor...",
                         "progress": progress
-                    }
+                    })
                 
-                # Local state güncelle
-                self.local_state.current_section = section
-                self.local_state.current_sources = all_research.get(section.id, [])
+                research, claims, conflicts = await research_tasks[i]
                 
-                if i > 0:
-                    prev_section = outline[i-1]
-                    self.local_state.previous_section_summary = self.global_state.section_summaries.get(
-                        prev_section.id, ""
-                    )
+                # Bölüme özel local state (arka plan aşamaları da kullanır)
+                local_state = LocalState(
+                    current_section=section,
+                    current_sources=research,
+                    previous_section_summary=previous_summary,
+                    extracted_claims=claims,
+                    detected_conflicts=conflicts
+                )
+                self.local_state = local_state
                 
                 # Yazım
                 content, citations = await self.writer.write_section(
-                    section, 
-                    self.local_state.current_sources,
-                    self.local_state,
+                    section,
+                    research,
+                    local_state,
                     config
                 )
+                self.global_state.completed_sections[section.id] = content
                 
-                # Görsel üretimi (Premium)
-                visuals = []
-                if config.enable_visuals:
-                    yield {
-                        "type": EventType.AGENT_MESSAGE.value,
-                        "agent": AgentRole.SYNTHESIZER.value,
-                        "message": f"🎨 Görseller üretiliyor: {section.title}"
-                    }
-                    
-                    visuals = await self.visual_generator.generate_visuals_for_section(
-                        section.title,
-                        content,
-                        config.topic,
-                        config
+                post_tasks.append(asyncio.create_task(
+                    self._post_write_stage(
+                        i, section, content, local_state, config,
+                        progress, stage_limit, emit, all_content
                     )
-                    
-                    for visual in visuals:
-                        yield {
-                            "type": EventType.VISUAL_GENERATED.value,
-                            "section": section.title,
-                            "visual_type": visual.get("type"),
-                            "visual_title": visual.get("title"),
-                            "visual": visual
-                        }
-                    
-                    # Görselleri içeriğe ekle
-                    if visuals:
-                        content = self._integrate_visuals(content, visuals)
+                ))
                 
-                all_content.append({
-                    "section_id": section.id,
-                    "title": section.title,
-                    "level": section.level,
-                    "content": content,
-                    "word_count": len(content.split()),
-                    "visuals": visuals
-                })
-                all_citations.extend(citations)
-                
-                # Global state güncelle
-                self.global_state.completed_sections[section.id] = content
-                
-                # Özet oluştur (sonraki bölüm için)
+                # Özet oluştur (sonraki bölüm için) - kritik yol sadece budur
                 summary_prompt = f"Bu içeriği 2-3 cümleyle özetle:\n{content[:1000]}"
                 summary = await self.writer._llm_generate(summary_prompt, temperature=0.3)
-                self.global_state.section_summaries[section.id] = summary[:300]
-                
-                # Fact check (opsiyonel)
-                if config.enable_fact_checking:
-                    yield {
-                        "type": EventType.AGENT_MESSAGE.value,
-                        "agent": AgentRole.FACT_CHECKER.value,
-                        "message": f"🔍 Doğrulama: {section.title}"
-                    }
-                    
-                    verification = await self.fact_checker.verify_content(
-                        content, 
-                        self.local_state.current_sources
-                    )
-                    
-                    yield {
-                        "type": EventType.FACT_CHECK.value,
-                        "section": section.title,
-                        "score": verification.get("overall_score", 0.7),
-                        "verified_count": len(verification.get("verified_claims", [])),
-                        "unverified_count": len(verification.get("unverified_claims", []))
-                    }
-                
-                # User proxy review (opsiyonel)
-                if config.enable_user_proxy:
-                    yield {
-                        "type": EventType.AGENT_MESSAGE.value,
-                        "agent": AgentRole.USER_PROXY.value,
-                        "message": f"👤 Okuyucu değerlendirmesi: {section.title}"
-                    }
-                    
-                    review = await self.user_proxy.review_content(content, config)
-                    
-                    yield {
-                        "type": EventType.USER_PROXY_FEEDBACK.value,
-                        "section": section.title,
-                        "clarity": review.get("clarity_score", 7),
-                        "issues": review.get("issues", [])
-                    }
-                
-                # 🚀 Originality Check (Premium V2)
-                if PREMIUM_ADVANCED_AVAILABLE and config.enable_originality_check and self.originality_checker:
-                    yield {
-                        "type": EventType.AGENT_THINKING.value,
-                        "agent": "OriginalityChecker",
-                        "thought": f"📝 Orijinallik kontrolü yapılıyor: {section.title}"
-                    }
-                    
-                    # Kaynak metinleri al
-                    source_texts = [
-                        r.content for r in self.local_state.current_sources
-                        if r.content
-                    ]
-                    
-                    originality_report = await self.originality_checker.check_originality(
-                        content, source_texts
-                    )
-                    
-                    yield {
-                        "type": "originality_check",
-                        "section": section.title,
-                        "originality_score": originality_report.originality_score,
-                        "similarity_index": originality_report.similarity_index,
-                        "unique_phrases_ratio": originality_report.unique_phrases_ratio,
-                        "citation_count": len(originality_report.cited_passages),
-                        "message": f"📊 Orijinallik: {originality_report.originality_score:.0%}"
-                    }
-                
-                yield {
-                    "type": EventType.SECTION_COMPLETE.value,
-                    "section_index": i,
-                    "section_title": section.title,
-                    "section_level": section.level,
-                    "visuals": visuals,
-                    "word_count": len(content.split()),
-                    "content": content,  # Full content for live preview
-                    "content_preview": content[:500] + "..." if len(content) > 500 else content,
-                    "progress": progress + 5
-                }
-                
-                # Local state temizle
-                self.local_state.clear()
+                previous_summary = summary[:300]
+                self.global_state.section_summaries[section.id] = previous_summary
             
-            yield {
+            await asyncio.gather(*post_tasks)
+            await research_summary
+            
+            emit({
                 "type": EventType.PHASE_END.value,
                 "phase": "writing",
                 "message": "✅ İçerik yazımı tamamlandı",
                 "progress": 85
-            }
+            })
             
-            # ============ PHASE 4: BIBLIOGRAPHY ============
-            yield {
-                "type": EventType.PHASE_START.value,
-                "phase": "bibliography",
-                "message": "📖 Kaynakça oluşturuluyor...",
-                "progress": 88
-            }
+            return all_content
+        
+        finally:
+            pending = [t for t in (*research_tasks, research_summary, *post_tasks) if not t.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*research_tasks, research_summary, *post_tasks, return_exceptions=True)
+            emit(None)
+    
+    async def _research_stage(
+        self,
+        index: int,
+        total: int,
+        section: SectionOutline,
+        config: DeepScholarConfig,
+        limit: asyncio.Semaphore,
+        emit: Callable[[Dict[str, Any]], None]
+    ) -> Tuple[List[ResearchItem], List[Dict], List[Dict]]:
+        """Tek bölüm araştırması + iddia/çelişki analizi."""
+        async with limit:
+            while await self._check_pause():
+                await asyncio.sleep(1)
             
-            bibliography = self._create_bibliography(config)
+            emit({
+                "type": EventType.AGENT_MESSAGE.value,
+                "agent": AgentRole.RESEARCHER.value,
+                "message": f"🔎 Bölüm {index+1}/{total} araştırılıyor: {section.title}"
+            })
             
-            yield {
-                "type": EventType.PHASE_END.value,
-                "phase": "bibliography",
-                "message": f"📚 {len(self.global_state.all_citations)} kaynak listelendi",
-                "progress": 92
-            }
+            research = await self.researcher.research_section(
+                section, config, LocalState(current_section=section)
+            )
             
-            # ============ PHASE 5: FINALIZE ============
-            yield {
-                "type": EventType.PHASE_START.value,
-                "phase": "finalize",
-                "message": "🔧 Döküman birleştiriliyor...",
-                "progress": 94
-            }
+            emit({
+                "type": EventType.RESEARCH_FOUND.value,
+                "section": section.title,
+                "sources_count": len(research),
+                "sources": [
+                    {"title": r.source_title, "type": r.source_type, "score": r.relevance_score}
+                    for r in research[:5]
+                ]
+            })
             
-            # Final döküman
-            final_content = self._combine_content(all_content, bibliography, config)
+            claims: List[Dict] = []
+            conflicts: List[Dict] = []
             
-            yield {
-                "type": EventType.COMPLETE.value,
-                "message": "🎉 Döküman başarıyla oluşturuldu!",
-                "progress": 100,
-                "document": {
-                    "title": config.title,
-                    "content": final_content,
-                    "word_count": len(final_content.split()),
-                    "page_count": config.page_count,
-                    "citations_count": len(self.global_state.all_citations),
-                    "sections": [
-                        {"id": s.id, "title": s.title}
-                        for s in outline
-                    ]
-                }
-            }
+            # Fraktal genişleme kontrolü
+            if config.max_research_depth > 1 and len(research) > 5:
+                claims = await self.researcher.extract_claims(research)
+                
+                if config.enable_conflict_detection:
+                    conflicts = await self.researcher.detect_conflicts(claims)
+                    
+                    if conflicts:
+                        emit({
+                            "type": EventType.CONFLICT_DETECTED.value,
+                            "section": section.title,
+                            "conflicts": conflicts
+                        })
+        
+        return research, claims, conflicts
+    
+    async def _research_summary_stage(
+        self,
+        research_tasks: List[asyncio.Task],
+        config: DeepScholarConfig,
+        emit: Callable[[Dict[str, Any]], None]
+    ):
+        """Tüm araştırmalar bitince özet ve analitik event'leri."""
+        results = await asyncio.gather(*research_tasks)
+        total_sources = sum(len(research) for research, _, _ in results)
+        
+        emit({
+            "type": EventType.PHASE_END.value,
+            "phase": "research",
+            "message": f"📚 Toplam {total_sources} kaynak bulundu",
+            "progress": 30
+        })
+        
+        # 🚀 Research Analytics (Premium V2)
+        if PREMIUM_ADVANCED_AVAILABLE and config.enable_analytics and self.analytics_engine:
+            emit({
+                "type": EventType.AGENT_THINKING.value,
+                "agent": "ResearchAnalytics",
+                "thought": "📊 Araştırma kalitesi analiz ediliyor..."
+            })
             
-        except Exception as e:
-            yield {
-                "type": EventType.ERROR.value,
-                "message": f"❌ Hata: {str(e)}",
-                "error": str(e),
-                "trace": traceback.format_exc()
+            # Tüm kaynakları düz listeye çevir
+            flat_sources = []
+            for research_items, _, _ in results:
+                for item in research_items:
+                    flat_sources.append({
+                        "id": item.id,
+                        "title": item.source_title,
+                        "type": item.source_type,
+                        "content": item.content[:500] if item.content else "",
+                        "keywords": [],
+                        "year": 2024
+                    })
+            
+            analytics_report = await self.analytics_engine.analyze_sources(
+                flat_sources, config.topic
+            )
+            
+            emit({
+                "type": "research_analytics",
+                "quality_score": analytics_report.quality_score,
+                "diversity_score": round(analytics_report.source_metrics.diversity_score, 2),
+                "recency_score": round(analytics_report.source_metrics.recency_score, 2),
+                "topic_clusters": [c.name for c in analytics_report.topic_clusters[:5]],
+                "gaps": analytics_report.gaps_identified[:3],
+                "recommendations": analytics_report.recommendations[:3],
+                "message": f"📊 Araştırma kalitesi: {analytics_report.quality_score}/100"
+            })
+    
+    async def _post_write_stage(
+        self,
+        index: int,
+        section: SectionOutline,
+        content: str,
+        local_state: LocalState,
+        config: DeepScholarConfig,
+        progress: int,
+        limit: asyncio.Semaphore,
+        emit: Callable[[Dict[str, Any]], None],
+        all_content: List[Optional[Dict[str, Any]]]
+    ):
+        """Görsel, doğrulama, okuyucu ve orijinallik aşamalarını paralel çalıştır."""
+        sources = local_state.current_sources
+        
+        async def visuals_stage() -> List[Dict[str, Any]]:
+            # Görsel üretimi (Premium)
+            if not config.enable_visuals:
+                return []
+            async with limit:
+                emit({
+                    "type": EventType.AGENT_MESSAGE.value,
+                    "agent": AgentRole.SYNTHESIZER.value,
+                    "message": f"🎨 Görseller üretiliyor: {section.title}"
+                })
+                visuals = await self.visual_generator.generate_visuals_for_section(
+                    section.title,
+                    content,
+                    config.topic,
+                    config
+                )
+            for visual in visuals:
+                emit({
+                    "type": EventType.VISUAL_GENERATED.value,
+                    "section": section.title,
+                    "visual_type": visual.get("type"),
+                    "visual_title": visual.get("title"),
+                    "visual": visual
+                })
+            return visuals
+        
+        async def fact_check_stage():
+            # Fact check (opsiyonel)
+            if not config.enable_fact_checking:
+                return
+            async with limit:
+                emit({
+                    "type": EventType.AGENT_MESSAGE.value,
+                    "agent": AgentRole.FACT_CHECKER.value,
+                    "message": f"🔍 Doğrulama: {section.title}"
+                })
+                verification = await self.fact_checker.verify_content(content, sources)
+            emit({
+                "type": EventType.FACT_CHECK.value,
+                "section": section.title,
+                "score": verification.get("overall_score", 0.7),
+                "verified_count": len(verification.get("verified_claims", [])),
+                "unverified_count": len(verification.get("unverified_claims", []))
+            })
+        
+        async def review_stage():
+            # User proxy review (opsiyonel)
+            if not config.enable_user_proxy:
+                return
+            async with limit:
+                emit({
+                    "type": EventType.AGENT_MESSAGE.value,
+                    "agent": AgentRole.USER_PROXY.value,
+                    "message": f"👤 Okuyucu değerlendirmesi: {section.title}"
+                })
+                review = await self.user_proxy.review_content(content, config)
+            emit({
+                "type": EventType.USER_PROXY_FEEDBACK.value,
+                "section": section.title,
+                "clarity": review.get("clarity_score", 7),
+                "issues": review.get("issues", [])
+            })
+        
+        async def originality_stage():
+            # 🚀 Originality Check (Premium V2)
+            if not (PREMIUM_ADVANCED_AVAILABLE and config.enable_originality_check and self.originality_checker):
+                return
+            async with limit:
+                emit({
+                    "type": EventType.AGENT_THINKING.value,
+                    "agent": "OriginalityChecker",
+                    "thought": f"📝 Orijinallik kontrolü yapılıyor: {section.title}"
+                })
+                originality_report = await self.originality_checker.check_originality(
+                    document_id=self._document_id or config.title,
+                    document_title=section.title,
+                    content=content,
+                    sources=[
+                        {"content": r.content, "title": r.source_title}
+                        for r in sources if r.content
+                    ]
+                )
+            originality_score = originality_report.overall_originality / 100
+            emit({
+                "type": "originality_check",
+                "section": section.title,
+                "originality_score": originality_score,
+                "similarity_index": (
+                    originality_report.exact_match_percentage
+                    + originality_report.paraphrase_percentage
+                ) / 100,
+                "unique_phrases_ratio": originality_report.unique_phrases / max(1, originality_report.total_words),
+                "citation_count": sum(
+                    len(re.findall(pattern, content))
+                    for pattern in self.originality_checker.citation_patterns
+                ),
+                "message": f"📊 Orijinallik: {originality_score:.0%}"
+            })
+        
+        visuals, _, _, _ = await asyncio.gather(
+            visuals_stage(), fact_check_stage(), review_stage(), originality_stage()
+        )
+        
+        # Görselleri içeriğe ekle
+        if visuals:
+            content = self._integrate_visuals(content, visuals)
+        
+        all_content[index] = {
+            "section_id": section.id,
+            "title": section.title,
+            "level": section.level,
+            "content": content,
+            "word_count": len(content.split()),
+            "visuals": visuals
+        }
+        self.global_state.completed_sections[section.id] = content
+        
+        emit({
+            "type": EventType.SECTION_COMPLETE.value,
+            "section_index": index,
+            "section_title": section.title,
+            "section_level": section.level,
+            "visuals": visuals,
+            "word_count": len(content.split()),
+            "content": content,  # Full content for live preview
+            "content_preview": content[:500] + "..." if len(content) > 500 else content,
+            "progress": progress + 5
+        })
+    
+    def _save_pipeline_checkpoint(
+        self,
+        config: DeepScholarConfig,
+        outline: List[SectionOutline],
+        index: int,
+        progress: int,
+        all_content: List[Optional[Dict[str, Any]]],
+        research_tasks: List[asyncio.Task]
+    ):
+        """Yazım fazında duraklatma checkpoint'i kaydet."""
+        all_research = {}
+        for section, task in zip(outline, research_tasks):
+            if task.done() and not task.cancelled() and task.exception() is None:
+                all_research[section.id] = [
+                    {"id": r.id, "content": r.content, "source_title": r.source_title}
+                    for r in task.result()[0]
+                ]
+        
+        checkpoint = GenerationCheckpoint(
+            document_id=self._document_id or "",
+            config={
+                "title": config.title,
+                "topic": config.topic,
+                "page_count": config.page_count,
+                "language": config.language.value,
+                "citation_style": config.citation_style.value,
+                "style": config.style
+            },
+            progress=progress,
+            current_phase="writing",
+            completed_sections=[
+                {"id": c["section_id"], "title": c["title"], "content": c["content"]}
+                for c in all_content[:index] if c
+            ],
+            pending_sections=[
+                {"id": s.id, "title": s.title}
+                for s in outline[index:]
+            ],
+            all_research=all_research,
+            global_state={
+                "completed_sections": dict(self.global_state.completed_sections),
+                "section_summaries": dict(self.global_state.section_summaries)
             }
+        )
+        self.save_checkpoint(checkpoint)
     
     def _create_bibliography(self, config: DeepScholarConfig) -> str:
         """Akademik kaynakça oluştur."""
@@ -8,7 +8,7 @@ OriginalityChecker - Orijinallik ve Benzerlik Kontrolü
 - Similarity index hesaplama
 - Alıntı vs paraphrase ayrımı
 - Self-plagiarism detection
-- N-gram analizi
+- N-gram analizi (paylaşılan winnowing/MinHash parmak izi indeksi)
 - Semantic similarity
 - Originality report PDF
 """
@@ -20,11 +20,14 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple, Set
 from datetime import datetime
 from enum import Enum
-from collections import Counter
+from collections import Counter, OrderedDict
 import math
 
+import numpy as np
+
 from core.logger import get_logger
 from core.llm_manager import llm_manager
+from core.deep_scholar_premium.quality.fingerprint_index import FingerprintIndex
 
 logger = get_logger("originality_checker")
 
@@ -145,10 +148,38 @@ class OriginalityReport:
 
 
 class NGramAnalyzer:
-    """N-gram bazlı metin analizi."""
+    """
+    N-gram bazlı metin analizi.
+    
+    Paylaşılan FingerprintIndex üzerinde çalışır: kaynaklar içerik hash'ine
+    göre bir kez indekslenir, benzerlik hash'lenmiş k-gram kümeleriyle,
+    eşleşen ifadeler winnowing posting'leriyle bulunur.
+    
+    Winnowing yalnızca `k + window - 1` kelimeden uzun eşleşmeleri garanti
+    ettiğinden pencere en kısa aranan ifade uzunluğundan türetilir. İndeks
+    dolunca en uzun süredir kullanılmayan kaynak çıkarılır (LRU).
+    """
     
-    def __init__(self, n: int = 5):
+    MAX_INDEXED_SOURCES = 2000
+    
+    def __init__(self, n: int = 5, min_match_words: int = 5):
         self.n = n
+        self.min_match_words = min_match_words
+        self.index = self._new_index(min_match_words)
+        # source_id -> kaynak metni, en eski kullanılan başta
+        self._sources: "OrderedDict[str, str]" = OrderedDict()
+    
+    def _new_index(self, min_match_words: int) -> FingerprintIndex:
+        return FingerprintIndex(k=self.n, window=max(1, min_match_words - self.n + 1))
+    
+    def _ensure_min_match(self, min_length: int):
+        """Daha kısa eşleşme istenirse indeksi daha dar pencereyle yeniden kur."""
+        if min_length >= self.min_match_words:
+            return
+        self.min_match_words = min_length
+        self.index = self._new_index(min_length)
+        for source_id, source in self._sources.items():
+            self.index.add_document(source_id, source)
     
     def extract_ngrams(self, text: str) -> Set[str]:
         """Metinden n-gram'ları çıkar."""
@@ -165,19 +196,35 @@ class NGramAnalyzer:
         
         return ngrams
     
+    def kgram_set(self, text: str) -> np.ndarray:
+        """Metnin hash'lenmiş n-gram kümesi (sıralı benzersiz dizi)."""
+        return self.index.kgram_set(text)
+    
+    def index_source(self, source: str) -> str:
+        """Kaynağı (yoksa) indeksle ve kimliğini döndür."""
+        source_id = hashlib.md5(source.encode()).hexdigest()
+        if source_id in self._sources:
+            self._sources.move_to_end(source_id)
+            return source_id
+        
+        while len(self._sources) >= self.MAX_INDEXED_SOURCES:
+            evicted, _ = self._sources.popitem(last=False)
+            self.index.remove_document(evicted)
+        
+        self._sources[source_id] = source
+        self.index.add_document(source_id, source)
+        return source_id
+    
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """İki metin arasındaki n-gram benzerliğini hesapla."""
-        ngrams1 = self.extract_ngrams(text1)
-        ngrams2 = self.extract_ngrams(text2)
-        
-        if not ngrams1 or not ngrams2:
-            return 0.0
-        
-        intersection = ngrams1.intersection(ngrams2)
-        union = ngrams1.union(ngrams2)
-        
-        # Jaccard similarity
-        return len(intersection) / len(union) if union else 0.0
+        ngrams1 = self.kgram_set(text1)
+        ngrams2 = self.kgram_set(text2)
+        return self.set_similarity(ngrams1, ngrams2)
+    
+    @staticmethod
+    def set_similarity(ngrams1: np.ndarray, ngrams2: np.ndarray) -> float:
+        """Jaccard similarity."""
+        return FingerprintIndex.set_jaccard(ngrams1, ngrams2)
     
     def find_matching_phrases(
         self,
@@ -186,56 +233,37 @@ class NGramAnalyzer:
         min_length: int = 5
     ) -> List[Tuple[str, int, int]]:
         """Eşleşen ifadeleri bul."""
-        target_words = re.findall(r'\b\w+\b', target.lower())
-        source_lower = source.lower()
-        
-        matches = []
-        
-        for length in range(min_length, min(len(target_words), 20)):
-            for i in range(len(target_words) - length + 1):
-                phrase = " ".join(target_words[i:i + length])
-                
-                if phrase in source_lower:
-                    # Orijinal pozisyonu bul
-                    original_phrase = " ".join(
-                        re.findall(r'\b\w+\b', target)[i:i + length]
-                    )
-                    start = target.lower().find(phrase)
-                    end = start + len(phrase)
-                    
-                    matches.append((original_phrase, start, end))
-        
-        # Örtüşen eşleşmeleri birleştir
-        merged = self._merge_overlapping(matches)
-        
-        return merged
+        return [
+            (phrase, start, end)
+            for phrase, start, end, _, _ in self.find_matching_spans(target, source, min_length)
+        ]
     
-    def _merge_overlapping(
+    def find_matching_spans(
         self,
-        matches: List[Tuple[str, int, int]]
-    ) -> List[Tuple[str, int, int]]:
-        """Örtüşen eşleşmeleri birleştir."""
-        if not matches:
-            return []
-        
-        # Başlangıç pozisyonuna göre sırala
-        sorted_matches = sorted(matches, key=lambda x: (x[1], -x[2]))
-        
-        merged = [sorted_matches[0]]
+        target: str,
+        source: str,
+        min_length: int = 5
+    ) -> List[Tuple[str, int, int, int, int]]:
+        """Eşleşen ifadeler ve kaynaktaki konumları."""
+        self._ensure_min_match(min_length)
+        source_id = self.index_source(source)
+        spans = self.index.find_exact_matches(target, min_words=min_length, doc_ids=[source_id])
+        
+        matches = [
+            (target[span.query_start:span.query_end], span.query_start, span.query_end,
+             span.source_start, span.source_end)
+            for span in spans
+        ]
         
-        for phrase, start, end in sorted_matches[1:]:
-            last_phrase, last_start, last_end = merged[-1]
-            
-            if start <= last_end:
-                # Örtüşme var, birleştir
-                if end > last_end:
-                    merged[-1] = (
-                        phrase if len(phrase) > len(last_phrase) else last_phrase,
-                        last_start,
-                        end
-                    )
+        # Örtüşen eşleşmeleri birleştir
+        merged: List[Tuple[str, int, int, int, int]] = []
+        for match in matches:
+            if merged and match[1] <= merged[-1][2]:
+                if match[2] > merged[-1][2]:
+                    last = merged[-1]
+                    merged[-1] = (target[last[1]:match[2]], last[1], match[2], last[3], max(last[4], match[4]))
             else:
-                merged.append((phrase, start, end))
+                merged.append(match)
         
         return merged
 
@@ -259,6 +287,7 @@ class OriginalityChecker:
         
         # Cache for previous documents (self-plagiarism)
         self.document_history: Dict[str, str] = {}
+        self._history_ngrams: Dict[str, np.ndarray] = {}
         
         # Known citation patterns
         self.citation_patterns = [
@@ -304,6 +333,9 @@ class OriginalityChecker:
         exact_match_words = 0
         paraphrase_words = 0
         
+        # İçerik n-gram'ları bir kez çıkarılır, kaynaklar indekste önbelleklidir
+        content_ngrams = self.ngram_analyzer.kgram_set(content)
+        
         for source in sources:
             source_text = source.get("content", source.get("text", ""))
             source_info = source.get("title", source.get("url", "Unknown"))
@@ -312,22 +344,22 @@ class OriginalityChecker:
                 continue
             
             # N-gram benzerliği
-            similarity = self.ngram_analyzer.calculate_similarity(content, source_text)
+            source_id = self.ngram_analyzer.index_source(source_text)
+            similarity = self.ngram_analyzer.index.jaccard(content_ngrams, source_id)
             
             if similarity >= self.threshold_exact:
                 # Exact match bul
-                matching_phrases = self.ngram_analyzer.find_matching_phrases(
+                matching_spans = self.ngram_analyzer.find_matching_spans(
                     content, source_text
                 )
                 
-                for phrase, start, end in matching_phrases:
+                for phrase, start, end, source_start, source_end in matching_spans:
                     match_words = len(phrase.split())
                     exact_match_words += match_words
                     
                     matches.append(SimilarityMatch(
                         match_id=hashlib.md5(phrase.encode()).hexdigest()[:8],
-                        source_text=source_text[max(0, source_text.lower().find(phrase.lower())-50):
-                                               source_text.lower().find(phrase.lower())+len(phrase)+50],
+                        source_text=source_text[max(0, source_start - 50):source_end + 50],
                         matched_text=phrase,
                         similarity_score=similarity,
                         similarity_type=SimilarityType.EXACT_MATCH,
@@ -355,7 +387,9 @@ class OriginalityChecker:
                 if prev_id == document_id:
                     continue
                 
-                similarity = self.ngram_analyzer.calculate_similarity(content, prev_content)
+                similarity = NGramAnalyzer.set_similarity(
+                    content_ngrams, self._history_ngrams[prev_id]
+                )
                 
                 if similarity > 0.3:
                     matches.append(SimilarityMatch(
@@ -401,10 +435,11 @@ class OriginalityChecker:
         )
         
         # 9. Unique phrases
-        unique_phrases = len(self.ngram_analyzer.extract_ngrams(content))
+        unique_phrases = len(content_ngrams)
         
         # Cache for future self-plagiarism checks
         self.document_history[document_id] = content
+        self._history_ngrams[document_id] = content_ngrams
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
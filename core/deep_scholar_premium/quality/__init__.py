@@ -4,12 +4,14 @@ Quality Modülleri - Premium Kalite Kontrol Araçları
 
 Bu modül kapsamlı kalite kontrol sağlar:
 - PlagiarismDetector: İntihal tespiti
+- FingerprintIndex: Winnowing + MinHash/LSH metin parmak izi indeksi
 - ReadabilityAnalyzer: Okunabilirlik analizi
 - ConsistencyChecker: Tutarlılık kontrolü
 - BiasAnalyzer: Tarafsızlık analizi (fikirleri törpülemeden)
 - QualityScorer: Genel kalite puanlama
 """
 
+from .fingerprint_index import FingerprintIndex
 from .plagiarism_detector import PlagiarismDetector
 from .readability_analyzer import ReadabilityAnalyzer
 from .consistency_checker import ConsistencyChecker
@@ -18,6 +20,7 @@ from .quality_scorer import QualityScorer
 
 __all__ = [
     "PlagiarismDetector",
+    "FingerprintIndex",
     "ReadabilityAnalyzer",
     "ConsistencyChecker",
     "BiasAnalyzer",
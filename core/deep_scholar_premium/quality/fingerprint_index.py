@@ -0,0 +1,510 @@
+"""
+FingerprintIndex - Paylaşılan Metin Parmak İzi Motoru
+=====================================================
+
+İntihal ve orijinallik kontrolcülerinin ortak indeksi.
+
+Yöntemler:
+1. Winnowing: hash'lenmiş k-gram'lardan pencere minimumları seçilir,
+   konumsal posting'lere yazılır. Tam eşleşme aralıkları aynı köşegendeki
+   (kaynak_pos - sorgu_pos) sıralı tohumların birleştirilip token
+   karşılaştırmasıyla genişletilmesinden çıkar.
+2. MinHash/LSH: kaynak cümleleri indekslemede bir kez tokenize edilir,
+   imzaları bantlara bölünür. Parafraz adayları sadece aynı bant anahtarını
+   paylaşan cümlelerdir; kesin Jaccard yalnızca adaylar için hesaplanır.
+
+Posting'ler ve bant anahtarları düz NumPy dizilerinde tutulur, sorgu
+anında (gerekirse) bir kez sıralanır ve searchsorted ile aranır.
+Karakter konumları sadece eşleşme raporlanırken hesaplanır.
+
+Garanti: en az `k + window - 1` token uzunluğundaki her tam eşleşme bulunur.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+_SCAN_PATTERN = re.compile(r"\w+|[.!?]+")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+_HASH_BASE = np.uint64(1099511628211)  # FNV prime; uint64 taşması kasıtlı
+_MINHASH_CHUNK = 50000  # Tek seferde işlenen token sayısı (bellek sınırı)
+
+
+@dataclass
+class TextSpan:
+    """Tam eşleşen metin aralığı (karakter konumları)."""
+    doc_id: str
+    query_start: int
+    query_end: int
+    source_start: int
+    source_end: int
+    word_count: int
+
+
+@dataclass
+class SentenceMatch:
+    """Benzer cümle çifti (karakter konumları)."""
+    doc_id: str
+    query_start: int
+    query_end: int
+    source_start: int
+    source_end: int
+    similarity: float  # kesin Jaccard
+
+
+class _TokenHashCache(dict):
+    """Token -> kararlı 32-bit hash (kelime dağarcığı önbelleği)."""
+
+    def __missing__(self, token: str) -> int:
+        value = zlib.crc32(token.encode("utf-8"))
+        self[token] = value
+        return value
+
+
+@dataclass
+class _ScannedText:
+    """Tokenize edilmiş metin."""
+    text: str
+    tokens: List[str]
+    token_hashes: np.ndarray
+    kgram_hashes: np.ndarray
+    sentence_bounds: np.ndarray  # (n, 2) token aralıkları, min kelime filtresi sonrası
+    _offsets: Optional[List[Tuple[int, int]]] = None
+
+    @property
+    def offsets(self) -> List[Tuple[int, int]]:
+        if self._offsets is None:
+            self._offsets = [m.span() for m in _TOKEN_PATTERN.finditer(self.text)]
+        return self._offsets
+
+    def sentence_words(self, index: int) -> Set[int]:
+        start, end = self.sentence_bounds[index]
+        return set(self.token_hashes[start:end].tolist())
+
+    def char_span(self, token_start: int, token_end: int) -> Tuple[int, int]:
+        offsets = self.offsets
+        return offsets[token_start][0], offsets[token_end - 1][1]
+
+
+@dataclass
+class _IndexedDocument:
+    doc_id: str
+    scanned: _ScannedText
+    unique_kgrams: np.ndarray
+    fp_hashes: np.ndarray
+    fp_positions: np.ndarray
+    band_keys: np.ndarray  # (sentences * bands,)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class FingerprintIndex:
+    """
+    Winnowing + MinHash/LSH metin indeksi.
+
+    Kaynaklar bir kez indekslenir; her sorgu sadece kendi metnini işler ve
+    posting/bant aramasıyla aday kaynaklara ulaşır.
+    """
+
+    def __init__(
+        self,
+        k: int = 5,
+        window: int = 4,
+        num_bands: int = 32,
+        rows_per_band: int = 3,
+        min_sentence_words: int = 5,
+        seed: int = 42
+    ):
+        self.k = k
+        self.window = window
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.min_sentence_words = min_sentence_words
+
+        num_perm = num_bands * rows_per_band
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._perm_b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_salt = rng.integers(0, 2**63, size=num_bands, dtype=np.uint64)
+
+        self._token_hashes = _TokenHashCache()
+        self._documents: Dict[str, _IndexedDocument] = {}
+        self._slots: List[Optional[str]] = []  # slot -> doc_id
+        self._slot_of: Dict[str, int] = {}
+
+        # Sorgu anında birleştirilen sıralı diziler
+        self._dirty = True
+        self._fp_keys = np.empty(0, dtype=np.uint64)
+        self._fp_slots = np.empty(0, dtype=np.int32)
+        self._fp_positions = np.empty(0, dtype=np.int32)
+        self._band_sorted = np.empty(0, dtype=np.uint64)
+        self._band_slots = np.empty(0, dtype=np.int32)
+        self._band_sentences = np.empty(0, dtype=np.int32)
+
+    # ------------------------------------------------------------------
+    # Tokenization & hashing
+    # ------------------------------------------------------------------
+
+    def _scan(self, text: str) -> _ScannedText:
+        """Tek regex geçişiyle token'lar ve cümle sınırları."""
+        tokens: List[str] = []
+        breaks: List[int] = []
+        for item in _SCAN_PATTERN.findall(text):
+            if item[0] in ".!?":
+                breaks.append(len(tokens))
+            else:
+                tokens.append(item)
+
+        if tokens:
+            # Toplu küçük harf: token'lar boşluk içermez
+            tokens = " ".join(tokens).lower().split(" ")
+
+        token_hashes = np.fromiter(
+            map(self._token_hashes.__getitem__, tokens), dtype=np.uint64, count=len(tokens)
+        )
+
+        bounds = np.unique(np.asarray([0] + breaks + [len(tokens)], dtype=np.int64))
+        starts, ends = bounds[:-1], bounds[1:]
+        keep = (ends - starts) >= self.min_sentence_words
+        sentence_bounds = np.stack([starts[keep], ends[keep]], axis=1)
+
+        return _ScannedText(
+            text=text,
+            tokens=tokens,
+            token_hashes=token_hashes,
+            kgram_hashes=self._kgram_hashes(token_hashes),
+            sentence_bounds=sentence_bounds
+        )
+
+    def _kgram_hashes(self, token_hashes: np.ndarray) -> np.ndarray:
+        """Polinom rolling hash ile tüm k-gram'lar (vektörel)."""
+        count = len(token_hashes) - self.k + 1
+        if count <= 0:
+            return np.empty(0, dtype=np.uint64)
+        result = np.zeros(count, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for offset in range(self.k):
+                result = result * _HASH_BASE + token_hashes[offset:offset + count]
+        return result
+
+    def _winnow(self, kgram_hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Her pencerenin en sağdaki minimum hash'ini seç."""
+        count = len(kgram_hashes)
+        if count == 0:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+
+        window = min(self.window, count)
+        windows = np.lib.stride_tricks.sliding_window_view(kgram_hashes, window)
+        rightmost = window - 1 - np.argmin(windows[:, ::-1], axis=1)
+        positions = np.unique(np.arange(len(windows)) + rightmost)
+        return kgram_hashes[positions], positions
+
+    def _minhash(self, scanned: _ScannedText) -> np.ndarray:
+        """Cümle başına MinHash imzaları (reduceat ile vektörel)."""
+        bounds = scanned.sentence_bounds
+        num_perm = len(self._perm_a)
+        signatures = np.empty((len(bounds), num_perm), dtype=np.uint64)
+
+        index = 0
+        while index < len(bounds):
+            # Bellek sınırı içinde kalan ardışık cümle grubu
+            stop = index + 1
+            chunk_start = bounds[index][0]
+            while stop < len(bounds) and bounds[stop][1] - chunk_start <= _MINHASH_CHUNK:
+                stop += 1
+
+            group = bounds[index:stop]
+            values = np.concatenate([scanned.token_hashes[s:e] for s, e in group])
+            lengths = group[:, 1] - group[:, 0]
+            starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+            with np.errstate(over="ignore"):
+                permuted = self._perm_a[:, None] * values[None, :] + self._perm_b[:, None]
+            signatures[index:stop] = np.minimum.reduceat(permuted, starts, axis=1).T
+            index = stop
+
+        return signatures
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """İmzaları (cümle, bant) anahtarlarına indir."""
+        if len(signatures) == 0:
+            return np.empty((0, self.num_bands), dtype=np.uint64)
+        rows = signatures.reshape(len(signatures), self.num_bands, self.rows_per_band)
+        keys = np.zeros((len(signatures), self.num_bands), dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            for row in range(self.rows_per_band):
+                keys = keys * _HASH_BASE + rows[:, :, row]
+            keys ^= self._band_salt[None, :]
+        return keys
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def add_document(self, doc_id: str, text: str, **metadata):
+        """Kaynağı indeksle (aynı id varsa yenisiyle değiştirilir)."""
+        if doc_id in self._documents:
+            self.remove_document(doc_id)
+
+        scanned = self._scan(text)
+        fp_hashes, fp_positions = self._winnow(scanned.kgram_hashes)
+
+        self._documents[doc_id] = _IndexedDocument(
+            doc_id=doc_id,
+            scanned=scanned,
+            unique_kgrams=np.unique(scanned.kgram_hashes),
+            fp_hashes=fp_hashes,
+            fp_positions=fp_positions,
+            band_keys=self._band_keys(self._minhash(scanned)),
+            metadata=metadata
+        )
+        self._slot_of[doc_id] = len(self._slots)
+        self._slots.append(doc_id)
+        self._dirty = True
+
+    def remove_document(self, doc_id: str):
+        """Kaynağı indeksten çıkar."""
+        if self._documents.pop(doc_id, None) is None:
+            return
+        self._slots[self._slot_of.pop(doc_id)] = None
+        self._dirty = True
+
+    def clear(self):
+        """Tüm indeksi temizle."""
+        self._documents.clear()
+        self._slots.clear()
+        self._slot_of.clear()
+        self._dirty = True
+
+    def _rebuild(self):
+        """Posting ve bant dizilerini birleştir ve sırala."""
+        if not self._dirty:
+            return
+
+        # Silinen slotları sıkıştır
+        if len(self._slots) != len(self._documents):
+            self._slots = [doc_id for doc_id in self._slots if doc_id is not None]
+            self._slot_of = {doc_id: slot for slot, doc_id in enumerate(self._slots)}
+
+        documents = [self._documents[doc_id] for doc_id in self._slots]
+
+        def _concat(arrays, dtype):
+            return np.concatenate(arrays).astype(dtype) if arrays else np.empty(0, dtype=dtype)
+
+        fp_keys = _concat([d.fp_hashes for d in documents], np.uint64)
+        fp_slots = _concat([np.full(len(d.fp_hashes), slot) for slot, d in enumerate(documents)], np.int32)
+        fp_positions = _concat([d.fp_positions for d in documents], np.int32)
+        order = np.argsort(fp_keys, kind="stable")
+        self._fp_keys, self._fp_slots, self._fp_positions = fp_keys[order], fp_slots[order], fp_positions[order]
+
+        band_keys = _concat([d.band_keys.ravel() for d in documents], np.uint64)
+        band_slots = _concat([np.full(d.band_keys.size, slot) for slot, d in enumerate(documents)], np.int32)
+        band_sentences = _concat(
+            [np.repeat(np.arange(len(d.band_keys)), self.num_bands) for d in documents], np.int32
+        )
+        order = np.argsort(band_keys, kind="stable")
+        self._band_sorted, self._band_slots, self._band_sentences = (
+            band_keys[order], band_slots[order], band_sentences[order]
+        )
+
+        self._dirty = False
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def document_ids(self) -> List[str]:
+        return list(self._documents)
+
+    def metadata(self, doc_id: str) -> Dict[str, Any]:
+        document = self._documents.get(doc_id)
+        return document.metadata if document else {}
+
+    def source_text(self, doc_id: str, start: int, end: int) -> str:
+        document = self._documents.get(doc_id)
+        return document.scanned.text[start:end] if document else ""
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _lookup(sorted_keys: np.ndarray, queries: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorgu anahtarları için (sorgu indeksi, sıralı dizideki indeks) çiftleri."""
+        left = np.searchsorted(sorted_keys, queries, side="left")
+        right = np.searchsorted(sorted_keys, queries, side="right")
+        counts = right - left
+        query_index = np.repeat(np.arange(len(queries)), counts)
+        if len(query_index) == 0:
+            return query_index, query_index
+        offsets = np.arange(len(query_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return query_index, np.repeat(left, counts) + offsets
+
+    def _allowed_slots(self, doc_ids: Optional[Iterable[str]]) -> Optional[np.ndarray]:
+        if doc_ids is None:
+            return None
+        return np.asarray([self._slot_of[d] for d in doc_ids if d in self._slot_of], dtype=np.int32)
+
+    def find_exact_matches(
+        self,
+        text: str,
+        min_words: Optional[int] = None,
+        doc_ids: Optional[Iterable[str]] = None
+    ) -> List[TextSpan]:
+        """
+        Kaynaklarla birebir örtüşen maksimal aralıkları bul.
+
+        Aynı köşegendeki tohumlar sorgu pozisyonuna göre sıralanır; her
+        tohum token karşılaştırmasıyla iki yöne genişletilir ve genişletilmiş
+        aralığın içinde kalan tohumlar atlanır.
+        """
+        self._rebuild()
+        min_words = min_words or (self.k + self.window - 1)
+        query = self._scan(text)
+        fp_hashes, fp_positions = self._winnow(query.kgram_hashes)
+
+        hit_query, hit_index = self._lookup(self._fp_keys, fp_hashes)
+        slots = self._fp_slots[hit_index]
+        allowed = self._allowed_slots(doc_ids)
+        if allowed is not None:
+            mask = np.isin(slots, allowed)
+            hit_query, hit_index, slots = hit_query[mask], hit_index[mask], slots[mask]
+
+        query_positions = fp_positions[hit_query]
+        diagonals = self._fp_positions[hit_index].astype(np.int64) - query_positions
+
+        # (slot, köşegen, sorgu pozisyonu) sıralı birleştirme
+        order = np.lexsort((query_positions, diagonals, slots))
+        tokens = query.tokens
+        spans: List[TextSpan] = []
+        current_key = None
+        covered_until = -1
+
+        for slot, diagonal, query_pos in zip(
+            slots[order].tolist(), diagonals[order].tolist(), query_positions[order].tolist()
+        ):
+            if (slot, diagonal) != current_key:
+                current_key = (slot, diagonal)
+                covered_until = -1
+                source = self._documents[self._slots[slot]].scanned
+                source_tokens = source.tokens
+            if query_pos < covered_until:
+                continue
+
+            # Hash çakışmasına karşı doğrula
+            source_pos = query_pos + diagonal
+            if tokens[query_pos:query_pos + self.k] != source_tokens[source_pos:source_pos + self.k]:
+                continue
+
+            start = query_pos
+            while start > 0 and start + diagonal > 0 and tokens[start - 1] == source_tokens[start - 1 + diagonal]:
+                start -= 1
+            end = query_pos + self.k
+            while (end < len(tokens) and end + diagonal < len(source_tokens)
+                   and tokens[end] == source_tokens[end + diagonal]):
+                end += 1
+            covered_until = end
+
+            if end - start >= min_words:
+                query_start, query_end = query.char_span(start, end)
+                source_start, source_end = source.char_span(start + diagonal, end + diagonal)
+                spans.append(TextSpan(
+                    doc_id=self._slots[slot],
+                    query_start=query_start,
+                    query_end=query_end,
+                    source_start=source_start,
+                    source_end=source_end,
+                    word_count=end - start
+                ))
+
+        spans.sort(key=lambda s: (s.query_start, -s.word_count))
+        return spans
+
+    def find_similar_sentences(
+        self,
+        text: str,
+        threshold: float = 0.5,
+        doc_ids: Optional[Iterable[str]] = None
+    ) -> List[SentenceMatch]:
+        """LSH adayları üzerinden Jaccard >= threshold olan cümle çiftleri."""
+        self._rebuild()
+        query = self._scan(text)
+        if len(query.sentence_bounds) == 0:
+            return []
+
+        keys = self._band_keys(self._minhash(query))
+        hit_query, hit_index = self._lookup(self._band_sorted, keys.ravel())
+        hit_sentence = hit_query // self.num_bands
+        slots = self._band_slots[hit_index]
+        allowed = self._allowed_slots(doc_ids)
+        if allowed is not None:
+            mask = np.isin(slots, allowed)
+            hit_sentence, hit_index, slots = hit_sentence[mask], hit_index[mask], slots[mask]
+
+        candidates = set(zip(
+            hit_sentence.tolist(), slots.tolist(), self._band_sentences[hit_index].tolist()
+        ))
+
+        matches: List[SentenceMatch] = []
+        query_words: Dict[int, Set[int]] = {}
+        for sentence_index, slot, source_index in candidates:
+            words = query_words.get(sentence_index)
+            if words is None:
+                words = query_words[sentence_index] = query.sentence_words(sentence_index)
+            source = self._documents[self._slots[slot]].scanned
+            source_words = source.sentence_words(source_index)
+
+            intersection = len(words & source_words)
+            union = len(words) + len(source_words) - intersection
+            similarity = intersection / union if union else 0.0
+            if similarity < threshold:
+                continue
+
+            query_start, query_end = query.char_span(*query.sentence_bounds[sentence_index])
+            source_start, source_end = source.char_span(*source.sentence_bounds[source_index])
+            matches.append(SentenceMatch(
+                doc_id=self._slots[slot],
+                query_start=query_start,
+                query_end=query_end,
+                source_start=source_start,
+                source_end=source_end,
+                similarity=similarity
+            ))
+
+        matches.sort(key=lambda m: (m.query_start, -m.similarity))
+        return matches
+
+    def kgram_set(self, text: str) -> np.ndarray:
+        """Metnin sıralı benzersiz k-gram hash dizisi (Jaccard hesapları için)."""
+        return np.unique(self._scan(text).kgram_hashes)
+
+    @staticmethod
+    def set_jaccard(first: np.ndarray, second: np.ndarray) -> float:
+        """İki sıralı benzersiz hash dizisi arasındaki Jaccard."""
+        if len(first) == 0 or len(second) == 0:
+            return 0.0
+        intersection = len(np.intersect1d(first, second, assume_unique=True))
+        return intersection / (len(first) + len(second) - intersection)
+
+    def jaccard(self, query_kgrams: np.ndarray, doc_id: str) -> float:
+        """Sorgu k-gram dizisi ile indeksli kaynak arasındaki Jaccard."""
+        document = self._documents.get(doc_id)
+        if document is None:
+            return 0.0
+        return self.set_jaccard(query_kgrams, document.unique_kgrams)
+
+    def get_stats(self) -> Dict[str, int]:
+        """İndeks istatistikleri."""
+        self._rebuild()
+        return {
+            "documents": len(self._documents),
+            "fingerprints": int(len(self._fp_keys)),
+            "band_keys": int(len(self._band_sorted)),
+            "vocabulary": len(self._token_hashes),
+        }
@@ -3,10 +3,10 @@ PlagiarismDetector - İntihal Tespit Modülü
 ==========================================
 
 Tespit Yöntemleri:
-1. Metin eşleştirme (n-gram)
+1. Metin eşleştirme (winnowing parmak izi)
 2. Semantik benzerlik (embedding)
 3. Kaynak eşleştirme
-4. Parafraz tespiti
+4. Parafraz tespiti (MinHash/LSH)
 5. Self-plagiarism kontrolü
 """
 
@@ -18,6 +18,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from collections import Counter
 
+from .fingerprint_index import FingerprintIndex
+
 
 class SimilarityLevel(str, Enum):
     """Benzerlik seviyesi."""
@@ -112,13 +114,18 @@ class PlagiarismDetector:
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
-        self.known_sources: Dict[str, str] = {}  # source_id -> content
-        self.ngram_index: Dict[str, List[str]] = {}  # ngram -> [source_ids]
+        self.known_sources: Dict[str, Dict[str, Any]] = {}  # source_id -> {content, title}
         
         # Parametreler
         self.ngram_size = config.get("ngram_size", 5) if config else 5
         self.min_match_length = config.get("min_match_length", 10) if config else 10
         self.similarity_threshold = config.get("similarity_threshold", 0.3) if config else 0.3
+        
+        # Winnowing penceresi: min_match_length kelimelik her eşleşme garanti bulunur
+        self.fingerprints = FingerprintIndex(
+            k=self.ngram_size,
+            window=max(1, self.min_match_length - self.ngram_size + 1)
+        )
     
     async def check_document(
         self,
@@ -190,64 +197,45 @@ class PlagiarismDetector:
             content: Kaynak içeriği
             title: Kaynak başlığı
         """
+        existing = self.known_sources.get(source_id)
+        if existing and existing["content"] == content:
+            existing["title"] = title or existing["title"]
+            return
+        
         self.known_sources[source_id] = {
             "content": content,
             "title": title
         }
         
-        # N-gram indexini güncelle
-        ngrams = self._get_ngrams(content)
-        for ngram in ngrams:
-            ngram_hash = hashlib.md5(ngram.encode()).hexdigest()
-            if ngram_hash not in self.ngram_index:
-                self.ngram_index[ngram_hash] = []
-            if source_id not in self.ngram_index[ngram_hash]:
-                self.ngram_index[ngram_hash].append(source_id)
+        # Parmak izi indeksini güncelle
+        self.fingerprints.add_document(source_id, content)
     
     async def _check_exact_matches(
         self,
         content: str
     ) -> List[PlagiarismMatch]:
-        """Tam eşleşme kontrolü (n-gram tabanlı)."""
+        """Tam eşleşme kontrolü (winnowing parmak izi)."""
         matches = []
         
-        # İçeriği cümlelere böl
-        sentences = re.split(r'[.!?]+', content)
+        spans = self.fingerprints.find_exact_matches(
+            content, min_words=self.min_match_length
+        )
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence.split()) < self.min_match_length:
-                continue
+        for span in spans:
+            source_info = self.known_sources.get(span.doc_id, {})
             
-            # N-gramları kontrol et
-            ngrams = self._get_ngrams(sentence)
-            
-            for ngram in ngrams:
-                ngram_hash = hashlib.md5(ngram.encode()).hexdigest()
-                
-                if ngram_hash in self.ngram_index:
-                    for source_id in self.ngram_index[ngram_hash]:
-                        source_info = self.known_sources.get(source_id, {})
-                        source_content = source_info.get("content", "")
-                        
-                        # Daha uzun eşleşme bul
-                        match_start, match_end = self._find_longest_match(
-                            sentence, source_content
-                        )
-                        
-                        if match_end - match_start >= self.min_match_length * 5:
-                            matched_text = sentence[match_start:match_end]
-                            
-                            matches.append(PlagiarismMatch(
-                                text=matched_text,
-                                source_text=matched_text,
-                                source_id=source_id,
-                                source_title=source_info.get("title"),
-                                similarity=1.0,
-                                match_type="exact",
-                                start_position=content.find(sentence),
-                                end_position=content.find(sentence) + len(sentence)
-                            ))
+            matches.append(PlagiarismMatch(
+                text=content[span.query_start:span.query_end],
+                source_text=self.fingerprints.source_text(
+                    span.doc_id, span.source_start, span.source_end
+                ),
+                source_id=span.doc_id,
+                source_title=source_info.get("title"),
+                similarity=1.0,
+                match_type="exact",
+                start_position=span.query_start,
+                end_position=span.query_end
+            ))
         
         return matches
     
@@ -255,41 +243,31 @@ class PlagiarismDetector:
         self,
         content: str
     ) -> List[PlagiarismMatch]:
-        """Parafraz tespiti."""
-        matches = []
-        
-        # Her kaynak için benzerlik kontrolü
-        sentences = re.split(r'[.!?]+', content)
+        """Parafraz tespiti (MinHash/LSH adayları + kesin Jaccard)."""
+        best: Dict[Tuple[int, str], Any] = {}
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence.split()) < 5:
+        for candidate in self.fingerprints.find_similar_sentences(content, threshold=0.5):
+            if candidate.similarity >= 0.9:  # Parafraz aralığı dışı (tam eşleşme)
                 continue
-            
-            for source_id, source_info in self.known_sources.items():
-                source_content = source_info.get("content", "")
-                source_sentences = re.split(r'[.!?]+', source_content)
-                
-                for source_sentence in source_sentences:
-                    source_sentence = source_sentence.strip()
-                    if len(source_sentence.split()) < 5:
-                        continue
-                    
-                    # Jaccard benzerliği
-                    similarity = self._jaccard_similarity(sentence, source_sentence)
-                    
-                    if 0.5 <= similarity < 0.9:  # Parafraz aralığı
-                        matches.append(PlagiarismMatch(
-                            text=sentence,
-                            source_text=source_sentence,
-                            source_id=source_id,
-                            source_title=source_info.get("title"),
-                            similarity=similarity,
-                            match_type="paraphrase",
-                            start_position=content.find(sentence),
-                            end_position=content.find(sentence) + len(sentence)
-                        ))
-                        break
+            key = (candidate.query_start, candidate.doc_id)
+            if key not in best or candidate.similarity > best[key].similarity:
+                best[key] = candidate
+        
+        matches = []
+        for candidate in best.values():
+            source_info = self.known_sources.get(candidate.doc_id, {})
+            matches.append(PlagiarismMatch(
+                text=content[candidate.query_start:candidate.query_end],
+                source_text=self.fingerprints.source_text(
+                    candidate.doc_id, candidate.source_start, candidate.source_end
+                ),
+                source_id=candidate.doc_id,
+                source_title=source_info.get("title"),
+                similarity=candidate.similarity,
+                match_type="paraphrase",
+                start_position=candidate.query_start,
+                end_position=candidate.query_end
+            ))
         
         return matches
     
@@ -302,57 +280,6 @@ class PlagiarismDetector:
         # Şimdilik boş döndür
         return []
     
-    def _get_ngrams(self, text: str) -> List[str]:
-        """N-gramları çıkar."""
-        words = text.lower().split()
-        ngrams = []
-        
-        for i in range(len(words) - self.ngram_size + 1):
-            ngram = " ".join(words[i:i + self.ngram_size])
-            ngrams.append(ngram)
-        
-        return ngrams
-    
-    def _find_longest_match(
-        self,
-        text1: str,
-        text2: str
-    ) -> Tuple[int, int]:
-        """En uzun eşleşen alt diziyi bul."""
-        words1 = text1.lower().split()
-        words2 = text2.lower().split()
-        
-        # Basit LCS (Longest Common Subsequence) yaklaşımı
-        max_length = 0
-        max_start = 0
-        
-        for i in range(len(words1)):
-            for j in range(len(words2)):
-                length = 0
-                while (i + length < len(words1) and 
-                       j + length < len(words2) and
-                       words1[i + length] == words2[j + length]):
-                    length += 1
-                
-                if length > max_length:
-                    max_length = length
-                    max_start = sum(len(w) + 1 for w in words1[:i])
-        
-        return max_start, max_start + max_length * 6  # Yaklaşık karakter pozisyonu
-    
-    def _jaccard_similarity(self, text1: str, text2: str) -> float:
-        """Jaccard benzerliği hesapla."""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        intersection = len(words1 & words2)
-        union = len(words1 | words2)
-        
-        return intersection / union if union > 0 else 0.0
-    
     def _deduplicate_matches(
         self,
         matches: List[PlagiarismMatch]
@@ -453,4 +380,4 @@ class PlagiarismDetector:
     def clear_sources(self):
         """Kaynak indexini temizle."""
         self.known_sources.clear()
-        self.ngram_index.clear()
+        self.fingerprints.clear()
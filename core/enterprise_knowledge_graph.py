@@ -45,6 +45,12 @@ except ImportError:
     HAS_NETWORKX = False
     logger.warning("NetworkX not installed. Install with: pip install networkx")
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # =============================================================================
 # ENUMS & TYPES
@@ -618,6 +624,305 @@ Eğer ilişki yoksa null döndür."""
         return None
 
 
+# =============================================================================
+# GRAPH QUERY INDEX
+# =============================================================================
+
+class GraphQueryIndex:
+    """
+    In-memory query engine backing EnterpriseKnowledgeGraph.
+
+    Maintains incrementally:
+    - a trigram index over entity names, aliases and descriptions
+    - an undirected adjacency view for path finding
+    - an (unordered edge key) -> relationship id map
+    - a per-entity relationship adjacency
+    - a lazily rebuilt, row-normalized embedding matrix for auto-linking
+    """
+
+    NGRAM = 3
+
+    def __init__(self):
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._entity_grams: Dict[str, Set[str]] = {}
+        # entity_id -> (name, description, aliases), lowercased
+        self._texts: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {}
+        self._entity_order: Dict[str, int] = {}
+
+        self._entity_rels: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._edge_rels: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        self._neighbors: Dict[str, Dict[str, None]] = defaultdict(dict)
+        self._rel_endpoints: Dict[str, Tuple[str, str]] = {}
+        self._rel_order: Dict[str, int] = {}
+
+        self._embeddings: Dict[str, List[float]] = {}
+        self._embedding_ids: List[str] = []
+        self._embedding_matrix = None
+        self._embedding_dirty = True
+
+        self._counter = 0
+
+    @staticmethod
+    def _edge_key(a: str, b: str) -> Tuple[str, str]:
+        return (a, b) if a <= b else (b, a)
+
+    def _grams(self, text: str) -> Set[str]:
+        n = self.NGRAM
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def _next_order(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def clear(self):
+        """Drop all indexed data"""
+        self.__init__()
+
+    # ----------------------------------------------------------------- entities
+
+    def add_entity(self, entity: Entity):
+        """Index (or re-index) an entity's text fields and embedding"""
+        order = self._entity_order.get(entity.id)
+        self.remove_entity(entity.id, keep_relationships=True)
+        self._entity_order[entity.id] = order if order is not None else self._next_order()
+
+        name = entity.name.lower()
+        description = (entity.description or "").lower()
+        aliases = tuple(alias.lower() for alias in entity.aliases)
+        self._texts[entity.id] = (name, description, aliases)
+
+        grams = self._grams(name) | self._grams(description)
+        for alias in aliases:
+            grams |= self._grams(alias)
+        self._entity_grams[entity.id] = grams
+        for gram in grams:
+            self._trigrams[gram].add(entity.id)
+
+        if entity.embedding:
+            self._embeddings[entity.id] = entity.embedding
+        self._embedding_dirty = True
+
+    def remove_entity(self, entity_id: str, keep_relationships: bool = False):
+        """Remove an entity from the text and embedding indexes"""
+        for gram in self._entity_grams.pop(entity_id, ()):
+            postings = self._trigrams.get(gram)
+            if postings is not None:
+                postings.discard(entity_id)
+                if not postings:
+                    del self._trigrams[gram]
+        self._texts.pop(entity_id, None)
+        if self._embeddings.pop(entity_id, None) is not None:
+            self._embedding_dirty = True
+
+        if not keep_relationships:
+            self._entity_order.pop(entity_id, None)
+            for rel_id in list(self._entity_rels.get(entity_id, ())):
+                self.remove_relationship(rel_id)
+            self._entity_rels.pop(entity_id, None)
+            self._neighbors.pop(entity_id, None)
+
+    def search(self, text: str) -> List[Tuple[str, float]]:
+        """
+        Find entities whose name, description or aliases contain `text`.
+
+        Returns (entity_id, relevance) pairs using the same weights as the
+        original substring scan, best matches first.
+        """
+        query = text.lower()
+        grams = self._grams(query)
+
+        if grams:
+            postings = sorted((self._trigrams.get(g, set()) for g in grams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates &= posting
+        else:
+            # Too short for trigrams - verify every entity
+            candidates = self._texts.keys()
+
+        results = []
+        for entity_id in candidates:
+            name, description, aliases = self._texts[entity_id]
+            relevance = 0.0
+            if query in name:
+                relevance += 0.5
+            if description and query in description:
+                relevance += 0.3
+            if any(query in alias for alias in aliases):
+                relevance += 0.2
+            if relevance > 0:
+                results.append((entity_id, relevance))
+
+        results.sort(key=lambda item: (-item[1], self._entity_order.get(item[0], 0)))
+        return results
+
+    # ------------------------------------------------------------ relationships
+
+    def add_relationship(self, rel: Relationship):
+        """Index a relationship in the adjacency and edge-key maps"""
+        if rel.id in self._rel_endpoints:
+            return
+        source, target = rel.source_id, rel.target_id
+        self._rel_endpoints[rel.id] = (source, target)
+        self._rel_order[rel.id] = self._next_order()
+        self._entity_rels[source][rel.id] = None
+        self._entity_rels[target][rel.id] = None
+        self._edge_rels[self._edge_key(source, target)].append(rel.id)
+        self._neighbors[source][target] = None
+        self._neighbors[target][source] = None
+
+    def remove_relationship(self, rel_id: str):
+        """Remove a relationship from the adjacency and edge-key maps"""
+        endpoints = self._rel_endpoints.pop(rel_id, None)
+        if endpoints is None:
+            return
+        source, target = endpoints
+        self._rel_order.pop(rel_id, None)
+        self._entity_rels.get(source, {}).pop(rel_id, None)
+        self._entity_rels.get(target, {}).pop(rel_id, None)
+
+        key = self._edge_key(source, target)
+        rel_ids = self._edge_rels.get(key, [])
+        if rel_id in rel_ids:
+            rel_ids.remove(rel_id)
+        if not rel_ids:
+            self._edge_rels.pop(key, None)
+            self._neighbors.get(source, {}).pop(target, None)
+            self._neighbors.get(target, {}).pop(source, None)
+
+    def relationship_ids(self, entity_ids) -> List[str]:
+        """Relationship ids touching any of the entities, in insertion order"""
+        if isinstance(entity_ids, str):
+            entity_ids = (entity_ids,)
+        found: Set[str] = set()
+        for entity_id in entity_ids:
+            found.update(self._entity_rels.get(entity_id, ()))
+        return sorted(found, key=lambda rel_id: self._rel_order.get(rel_id, 0))
+
+    def relationship_between(self, a: str, b: str) -> Optional[str]:
+        """First relationship id connecting a and b in either direction"""
+        rel_ids = self._edge_rels.get(self._edge_key(a, b))
+        return rel_ids[0] if rel_ids else None
+
+    def shortest_path(self, source: str, target: str, max_hops: int) -> Optional[List[str]]:
+        """Breadth-first shortest path on the undirected view, bounded by max_hops"""
+        if source == target:
+            return [source]
+        if source not in self._neighbors or target not in self._neighbors:
+            return None
+
+        parents: Dict[str, Optional[str]] = {source: None}
+        frontier = [source]
+        for _ in range(max_hops):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in self._neighbors.get(node, ()):
+                    if neighbor in parents:
+                        continue
+                    parents[neighbor] = node
+                    if neighbor == target:
+                        path = [target]
+                        while parents[path[-1]] is not None:
+                            path.append(parents[path[-1]])
+                        return path[::-1]
+                    next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return None
+
+    # --------------------------------------------------------------- embeddings
+
+    def _build_embedding_matrix(self):
+        self._embedding_ids = []
+        self._embedding_matrix = None
+        self._embedding_dirty = False
+        if not HAS_NUMPY or not self._embeddings:
+            return
+
+        dims = defaultdict(int)
+        for vector in self._embeddings.values():
+            dims[len(vector)] += 1
+        dim = max(dims, key=dims.get)
+
+        ids = [eid for eid, vector in self._embeddings.items() if len(vector) == dim]
+        matrix = np.asarray([self._embeddings[eid] for eid in ids], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._embedding_ids = ids
+        self._embedding_matrix = matrix / norms
+
+    def similar_entities(
+        self,
+        vectors: Dict[str, List[float]],
+        threshold: float,
+        top_k: int,
+        exclude: Set[str]
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Top-k indexed entities above `threshold` cosine similarity for each
+        query vector, computed in a single matrix product when NumPy is available.
+        """
+        results: Dict[str, List[Tuple[str, float]]] = {}
+        if not vectors:
+            return results
+
+        if not HAS_NUMPY:
+            for query_id, vector in vectors.items():
+                scored = []
+                for entity_id, other in self._embeddings.items():
+                    if entity_id in exclude:
+                        continue
+                    sim = _cosine_similarity(vector, other)
+                    if sim > threshold:
+                        scored.append((entity_id, sim))
+                scored.sort(key=lambda item: item[1], reverse=True)
+                results[query_id] = scored[:top_k]
+            return results
+
+        if self._embedding_dirty:
+            self._build_embedding_matrix()
+        if self._embedding_matrix is None:
+            return results
+
+        dim = self._embedding_matrix.shape[1]
+        query_ids = [qid for qid, vector in vectors.items() if len(vector) == dim]
+        if not query_ids:
+            return results
+
+        queries = np.asarray([vectors[qid] for qid in query_ids], dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        sims = (queries / norms) @ self._embedding_matrix.T
+
+        excluded_cols = [i for i, eid in enumerate(self._embedding_ids) if eid in exclude]
+        if excluded_cols:
+            sims[:, excluded_cols] = -1.0
+
+        k = min(top_k, sims.shape[1])
+        for row, query_id in enumerate(query_ids):
+            row_sims = sims[row]
+            top = np.argpartition(-row_sims, k - 1)[:k] if k < len(row_sims) else np.arange(len(row_sims))
+            top = top[np.argsort(-row_sims[top])]
+            results[query_id] = [
+                (self._embedding_ids[i], float(row_sims[i]))
+                for i in top if row_sims[i] > threshold
+            ]
+        return results
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """Calculate cosine similarity"""
+    dot_product = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot_product / (norm_a * norm_b)
+
+
 # =============================================================================
 # ENTERPRISE KNOWLEDGE GRAPH
 # =============================================================================
@@ -646,6 +951,7 @@ class EnterpriseKnowledgeGraph:
         self._name_index: Dict[str, str] = {}  # name -> entity_id
         self._type_index: Dict[EntityType, Set[str]] = defaultdict(set)
         self._source_index: Dict[str, Set[str]] = defaultdict(set)  # source -> entity_ids
+        self._query_index = GraphQueryIndex()
         
         # Stats
         self.stats = {
@@ -685,6 +991,7 @@ class EnterpriseKnowledgeGraph:
             except Exception as e:
                 logger.error(f"Error loading relationships: {e}")
         
+        self._rebuild_relationship_index()
         self._rebuild_graph()
         self.stats["total_entities"] = len(self.entities)
         self.stats["total_relationships"] = len(self.relationships)
@@ -708,6 +1015,13 @@ class EnterpriseKnowledgeGraph:
         self._type_index[entity.type].add(entity.id)
         for source in entity.sources:
             self._source_index[source].add(entity.id)
+        self._query_index.add_entity(entity)
+    
+    def _rebuild_relationship_index(self):
+        """Re-index all relationships whose endpoints exist"""
+        for rel in self.relationships.values():
+            if rel.source_id in self.entities and rel.target_id in self.entities:
+                self._query_index.add_relationship(rel)
     
     def _rebuild_graph(self):
         """Rebuild NetworkX graph from entities and relationships"""
@@ -807,6 +1121,8 @@ class EnterpriseKnowledgeGraph:
                     if alias not in entity.aliases:
                         entity.aliases.append(alias)
                         self._name_index[alias.lower()] = entity.id
+            if description or aliases:
+                self._query_index.add_entity(entity)
             
             self._save()
             return entity
@@ -864,6 +1180,7 @@ class EnterpriseKnowledgeGraph:
             if hasattr(entity, key):
                 setattr(entity, key, value)
         
+        self._query_index.add_entity(entity)
         self._save()
         return entity
     
@@ -883,12 +1200,10 @@ class EnterpriseKnowledgeGraph:
         self._type_index[entity.type].discard(entity_id)
         
         # Remove relationships
-        to_remove = [
-            rel_id for rel_id, rel in self.relationships.items()
-            if rel.source_id == entity_id or rel.target_id == entity_id
-        ]
+        to_remove = self._query_index.relationship_ids(entity_id)
         for rel_id in to_remove:
-            del self.relationships[rel_id]
+            self.relationships.pop(rel_id, None)
+        self._query_index.remove_entity(entity_id)
         
         # Remove from graph
         if HAS_NETWORKX and entity_id in self.graph:
@@ -944,7 +1259,8 @@ class EnterpriseKnowledgeGraph:
             return None
         
         # Check if relationship already exists
-        for rel in self.relationships.values():
+        for rel_id in self._query_index.relationship_ids(source_id):
+            rel = self.relationships[rel_id]
             if rel.source_id == source_id and rel.target_id == target_id and rel.type == relation_type:
                 rel.mentions_count += 1
                 rel.last_seen = datetime.now()
@@ -967,6 +1283,7 @@ class EnterpriseKnowledgeGraph:
         )
         
         self.relationships[relationship.id] = relationship
+        self._query_index.add_relationship(relationship)
         
         # Add to graph
         if HAS_NETWORKX:
@@ -1000,7 +1317,8 @@ class EnterpriseKnowledgeGraph:
         """Get relationships for an entity"""
         relationships = []
         
-        for rel in self.relationships.values():
+        for rel_id in self._query_index.relationship_ids(entity_id):
+            rel = self.relationships[rel_id]
             if direction in ["outgoing", "both"] and rel.source_id == entity_id:
                 if not relation_type or rel.type == relation_type:
                     relationships.append(rel)
@@ -1024,6 +1342,7 @@ class EnterpriseKnowledgeGraph:
                 self.graph.remove_edge(rel.source_id, rel.target_id)
         
         del self.relationships[relationship_id]
+        self._query_index.remove_relationship(relationship_id)
         self.stats["total_relationships"] = len(self.relationships)
         self._save()
         
@@ -1099,56 +1418,35 @@ class EnterpriseKnowledgeGraph:
     
     async def _auto_link_entities(self, new_entities: List[Entity]):
         """Automatically find and create relationships between entities"""
-        # Get entities with embeddings
-        entities_with_embeddings = [
-            e for e in self.entities.values()
-            if e.embedding and e.id not in [ne.id for ne in new_entities]
-        ]
-        
-        if not entities_with_embeddings:
+        new_ids = {e.id for e in new_entities}
+        vectors = {e.id: e.embedding for e in new_entities if e.embedding}
+        if not vectors:
             return
         
+        # Find similar entities in one vectorized pass
+        similar = self._query_index.similar_entities(
+            vectors, threshold=0.7, top_k=3, exclude=new_ids  # High similarity threshold
+        )
+        
         for new_entity in new_entities:
-            if not new_entity.embedding:
-                continue
-            
-            # Find similar entities
-            similarities = []
-            for existing in entities_with_embeddings:
-                sim = self._cosine_similarity(new_entity.embedding, existing.embedding)
-                if sim > 0.7:  # High similarity threshold
-                    similarities.append((existing, sim))
-            
-            # Sort by similarity
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            
             # Create relationships for top similar entities
-            for existing, sim in similarities[:3]:
+            for existing_id, sim in similar.get(new_entity.id, []):
                 # Check if relationship already exists
-                existing_rel = any(
-                    (r.source_id == new_entity.id and r.target_id == existing.id) or
-                    (r.source_id == existing.id and r.target_id == new_entity.id)
-                    for r in self.relationships.values()
-                )
+                if self._query_index.relationship_between(new_entity.id, existing_id):
+                    continue
                 
-                if not existing_rel:
-                    self.add_relationship(
-                        source_id=new_entity.id,
-                        target_id=existing.id,
-                        relation_type=RelationType.SIMILAR_TO,
-                        label=f"Semantik benzerlik: {sim:.2f}",
-                        weight=sim,
-                        bidirectional=True
-                    )
+                self.add_relationship(
+                    source_id=new_entity.id,
+                    target_id=existing_id,
+                    relation_type=RelationType.SIMILAR_TO,
+                    label=f"Semantik benzerlik: {sim:.2f}",
+                    weight=sim,
+                    bidirectional=True
+                )
     
     def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
         """Calculate cosine similarity"""
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot_product / (norm_a * norm_b)
+        return _cosine_similarity(a, b)
     
     # =========================================================================
     # QUERYING
@@ -1165,25 +1463,11 @@ class EnterpriseKnowledgeGraph:
         relationships = []
         paths = []
         
-        # Find relevant entities
-        query_lower = query.query_text.lower()
-        
-        for entity in self.entities.values():
-            relevance = 0.0
-            
-            # Name matching
-            if query_lower in entity.name.lower():
-                relevance += 0.5
-            
-            # Description matching
-            if entity.description and query_lower in entity.description.lower():
-                relevance += 0.3
-            
-            # Alias matching
-            for alias in entity.aliases:
-                if query_lower in alias.lower():
-                    relevance += 0.2
-                    break
+        # Find relevant entities (trigram index, sorted by relevance)
+        for entity_id, relevance in self._query_index.search(query.query_text):
+            entity = self.entities.get(entity_id)
+            if entity is None:
+                continue
             
             # Type filter
             if query.entity_types and entity.type not in query.entity_types:
@@ -1193,24 +1477,22 @@ class EnterpriseKnowledgeGraph:
             if entity.confidence < query.min_confidence:
                 continue
             
-            if relevance > 0:
-                entities.append(entity)
-        
-        # Sort by relevance and limit
-        entities = entities[:query.limit]
+            entities.append(entity)
+            if len(entities) >= query.limit:
+                break
         
         # Get relationships for found entities
-        entity_ids = {e.id for e in entities}
+        entity_ids = [e.id for e in entities]
         
-        for rel in self.relationships.values():
-            if rel.source_id in entity_ids or rel.target_id in entity_ids:
-                if query.relationship_types and rel.type not in query.relationship_types:
-                    continue
-                if rel.confidence >= query.min_confidence:
-                    relationships.append(rel)
+        for rel_id in self._query_index.relationship_ids(entity_ids):
+            rel = self.relationships[rel_id]
+            if query.relationship_types and rel.type not in query.relationship_types:
+                continue
+            if rel.confidence >= query.min_confidence:
+                relationships.append(rel)
         
         # Find paths if requested
-        if query.include_paths and len(entities) >= 2 and HAS_NETWORKX:
+        if query.include_paths and len(entities) >= 2:
             paths = self._find_paths(entities[:5], query.max_hops)
         
         # Generate context for RAG
@@ -1233,41 +1515,35 @@ class EnterpriseKnowledgeGraph:
     
     def _find_paths(self, entities: List[Entity], max_hops: int) -> List[GraphPath]:
         """Find paths between entities"""
-        if not HAS_NETWORKX or len(entities) < 2:
+        if len(entities) < 2:
             return []
         
         paths = []
         
         for i, source in enumerate(entities):
             for target in entities[i+1:]:
-                try:
-                    # Find shortest paths
-                    for path in nx.all_shortest_paths(
-                        self.graph.to_undirected(),
-                        source.id,
-                        target.id
-                    ):
-                        if len(path) <= max_hops + 1:
-                            # Get edges for this path
-                            edge_ids = []
-                            for j in range(len(path) - 1):
-                                for rel in self.relationships.values():
-                                    if ((rel.source_id == path[j] and rel.target_id == path[j+1]) or
-                                        (rel.source_id == path[j+1] and rel.target_id == path[j])):
-                                        edge_ids.append(rel.id)
-                                        break
-                            
-                            paths.append(GraphPath(
-                                nodes=path,
-                                edges=edge_ids,
-                                total_weight=len(path) - 1,
-                                confidence=0.8
-                            ))
-                            break  # Only first path between each pair
-                except nx.NetworkXNoPath:
+                # Shortest path on the precomputed undirected view
+                path = self._query_index.shortest_path(source.id, target.id, max_hops)
+                if not path or len(path) < 2:
                     continue
+                
+                # Get edges for this path
+                edge_ids = []
+                for j in range(len(path) - 1):
+                    rel_id = self._query_index.relationship_between(path[j], path[j+1])
+                    if rel_id:
+                        edge_ids.append(rel_id)
+                
+                paths.append(GraphPath(
+                    nodes=path,
+                    edges=edge_ids,
+                    total_weight=len(path) - 1,
+                    confidence=0.8
+                ))
+                if len(paths) >= 10:
+                    return paths  # Limit paths
         
-        return paths[:10]  # Limit paths
+        return paths
     
     def _generate_context(
         self,
@@ -1565,6 +1841,7 @@ class EnterpriseKnowledgeGraph:
             if rel.id not in self.relationships:
                 if rel.source_id in self.entities and rel.target_id in self.entities:
                     self.relationships[rel.id] = rel
+                    self._query_index.add_relationship(rel)
                     imported_count += 1
         
         self._rebuild_graph()
@@ -1579,6 +1856,7 @@ class EnterpriseKnowledgeGraph:
         self._name_index.clear()
         self._type_index.clear()
         self._source_index.clear()
+        self._query_index.clear()
         
         if HAS_NETWORKX:
             self.graph = nx.DiGraph()
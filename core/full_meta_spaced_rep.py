@@ -8,6 +8,7 @@ Features:
 - Related Recall: İlişkili hatırlama tetikleyicisi
 - Sleep-Optimized Scheduling: Uyku döngüsüne göre zamanlama
 - Adaptive Difficulty: Dinamik zorluk ayarlama
+- Batch FSRS: Binlerce kart için vektörel (NumPy) güncelleme
 """
 
 import uuid
@@ -17,8 +18,13 @@ from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 from collections import defaultdict
+from operator import attrgetter
 import random
 
+import numpy as np
+
+from core.review_queue import ReviewQueue
+
 
 # ============ ENUMS ============
 
@@ -237,15 +243,58 @@ class FSRS:
         return new_d, new_s
     
     def next_interval(self, stability: float) -> int:
-        """Sonraki aralığı hesapla"""
-        interval = stability / self.W[0] * \
-                   (math.pow(self.request_retention, 1 / self.W[1]) - 1)
+        """Sonraki aralığı hesapla
+        
+        retrievability() eğrisinin request_retention'a düştüğü gün:
+        R = (1 + t / 9S)^-1  =>  t = 9S (1/R - 1)
+        """
+        interval = 9 * stability * (1 / self.request_retention - 1)
         return min(self.maximum_interval, max(1, round(interval)))
     
     def retrievability(self, stability: float, 
                        days_elapsed: float) -> float:
         """Mevcut retrievability hesapla"""
         return math.pow(1 + days_elapsed / (9 * stability), -1)
+    
+    # ---- Vektörel (batch) karşılıklar ----
+    
+    def init_ds_batch(self, ratings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """init_ds'in vektörel karşılığı"""
+        ratings = np.asarray(ratings, dtype=np.int64)
+        w = np.asarray(self.W)
+        difficulty = np.clip(w[4] - w[5] * (ratings - 3), 1, 10)
+        stability = w[np.clip(ratings - 1, 0, 3)]
+        return difficulty, stability
+    
+    def next_ds_batch(self, d: np.ndarray, s: np.ndarray, r: np.ndarray,
+                      ratings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """next_ds'in vektörel karşılığı"""
+        d, s, r = (np.asarray(x, dtype=np.float64) for x in (d, s, r))
+        ratings = np.asarray(ratings, dtype=np.int64)
+        w = self.W
+        forgot = ratings == 1
+        
+        forget_d = np.minimum(10, d + 2)
+        forget_s = w[11] * np.power(d, -w[12]) * \
+                   (np.power(s + 1, w[13]) - 1) * np.exp((1 - r) * w[14])
+        
+        success_d = np.clip(d - w[6] * (ratings - 3), 1, 10)
+        hard_penalty = np.where(ratings == 2, w[15], 1.0)
+        easy_bonus = np.where(ratings == 4, w[16], 1.0)
+        success_s = s * (1 + math.exp(w[8]) * (11 - d) * np.power(s, -w[9]) *
+                         (np.exp((1 - r) * w[10]) - 1) * hard_penalty * easy_bonus)
+        
+        return np.where(forgot, forget_d, success_d), np.where(forgot, forget_s, success_s)
+    
+    def next_interval_batch(self, stability: np.ndarray) -> np.ndarray:
+        """next_interval'ın vektörel karşılığı"""
+        interval = 9 * np.asarray(stability, dtype=np.float64) * (1 / self.request_retention - 1)
+        return np.clip(np.round(interval), 1, self.maximum_interval).astype(np.int64)
+    
+    def retrievability_batch(self, stability: np.ndarray,
+                             days_elapsed: np.ndarray) -> np.ndarray:
+        """retrievability'nin vektörel karşılığı"""
+        return 1.0 / (1 + np.asarray(days_elapsed) / (9 * np.asarray(stability)))
 
 
 # ============ ENGINES ============
@@ -634,6 +683,7 @@ class AdvancedSpacedRepetitionEngine:
     
     def __init__(self):
         self.cards: Dict[str, SpacedRepCard] = {}
+        self.due_queues: Dict[str, ReviewQueue] = {}
         self.fsrs = FSRS()
         self.context_engine = ContextAwareSpacingEngine()
         self.emotion_engine = EmotionalTaggingEngine()
@@ -653,8 +703,17 @@ class AdvancedSpacedRepetitionEngine:
         )
         
         self.cards[card.id] = card
+        self._queue_for(user_id).push(card)
         return card
     
+    def _queue_for(self, user_id: str) -> ReviewQueue:
+        """Kullanıcının vade sıralı kart kuyruğu"""
+        queue = self.due_queues.get(user_id)
+        if queue is None:
+            queue = ReviewQueue(key=attrgetter("id"), priority=attrgetter("difficulty"))
+            self.due_queues[user_id] = queue
+        return queue
+    
     def review_card(self, card_id: str, 
                    quality: RecallQuality,
                    context: Dict[str, Any] = None,
@@ -717,6 +776,7 @@ class AdvancedSpacedRepetitionEngine:
         card.next_review = self.sleep_scheduler.schedule_with_sleep(
             base_next, card.user_id
         )
+        self._queue_for(card.user_id).push(card)
         
         # İstatistikler
         card.total_reviews += 1
@@ -748,39 +808,116 @@ class AdvancedSpacedRepetitionEngine:
             "related_recall": related_prompts
         }
     
+    def review_cards_batch(self, reviews: List[Tuple[str, RecallQuality]]) -> Dict[str, Any]:
+        """Çok sayıda kartı tek vektörel FSRS geçişiyle tekrar et
+        
+        Bağlam/duygu ayarlaması ve ilişkili hatırlatma uygulanmaz; her kart
+        en fazla bir kez bulunmalıdır (sonraki tekrarı son geçerlidir).
+        """
+        rating_map = {
+            RecallQuality.FORGOT: 1,
+            RecallQuality.DIFFICULT: 2,
+            RecallQuality.MODERATE: 3,
+            RecallQuality.EASY: 4,
+            RecallQuality.PERFECT: 4
+        }
+        latest = {card_id: quality for card_id, quality in reviews if card_id in self.cards}
+        cards = [self.cards[card_id] for card_id in latest]
+        if not cards:
+            return {"reviewed": 0, "cards": []}
+        
+        now = datetime.now()
+        now_ts = now.timestamp()
+        ratings = np.array([rating_map.get(q, 3) for q in latest.values()], dtype=np.int64)
+        difficulty = np.array([c.difficulty for c in cards], dtype=np.float64)
+        stability = np.array([c.stability for c in cards], dtype=np.float64)
+        last = np.array([c.last_review.timestamp() if c.last_review else now_ts for c in cards])
+        is_new = np.array([c.repetitions == 0 for c in cards])
+        
+        retrievability = np.where(
+            [c.last_review is not None for c in cards],
+            self.fsrs.retrievability_batch(stability, (now_ts - last) / 86400),
+            1.0
+        )
+        init_d, init_s = self.fsrs.init_ds_batch(ratings)
+        next_d, next_s = self.fsrs.next_ds_batch(difficulty, stability, retrievability, ratings)
+        new_difficulty = np.where(is_new, init_d, next_d)
+        new_stability = np.where(is_new, init_s, next_s)
+        intervals = self.fsrs.next_interval_batch(new_stability)
+        
+        results = []
+        for i, card in enumerate(cards):
+            card.difficulty = float(new_difficulty[i])
+            card.stability = float(new_stability[i])
+            card.interval = int(intervals[i])
+            card.last_review = now
+            card.next_review = self.sleep_scheduler.schedule_with_sleep(
+                now + timedelta(days=card.interval), card.user_id
+            )
+            
+            card.total_reviews += 1
+            if ratings[i] >= 3:
+                card.correct_reviews += 1
+                card.repetitions += 1
+            else:
+                card.lapses += 1
+                card.repetitions = 0
+            
+            if card.repetitions == 0:
+                card.state = RetentionState.RELEARNING
+            elif card.interval < 21:
+                card.state = RetentionState.YOUNG
+            else:
+                card.state = RetentionState.MATURE
+            
+            self._queue_for(card.user_id).push(card)
+            results.append({
+                "card_id": card.id,
+                "new_interval": card.interval,
+                "next_review": card.next_review.isoformat(),
+                "state": card.state.value
+            })
+        
+        return {"reviewed": len(results), "cards": results}
+    
     def get_due_cards(self, user_id: str, limit: int = 20) -> List[SpacedRepCard]:
         """Tekrar edilecek kartları al"""
         now = datetime.now()
-        
-        user_cards = [c for c in self.cards.values() if c.user_id == user_id]
-        due_cards = [c for c in user_cards if c.next_review <= now]
+        due_cards = self._queue_for(user_id).due(now)
+        if not due_cards:
+            return []
         
         # Urgency'ye göre sırala (retrievability düşük = acil)
-        for card in due_cards:
-            if card.last_review:
-                days = (now - card.last_review).total_seconds() / 86400
-                card.retrievability = self.fsrs.retrievability(card.stability, days)
-            else:
-                card.retrievability = 0
+        now_ts = now.timestamp()
+        reviewed = np.array([c.last_review is not None for c in due_cards])
+        last = np.array([c.last_review.timestamp() if c.last_review else now_ts for c in due_cards])
+        stability = np.array([c.stability for c in due_cards], dtype=np.float64)
+        retrievability = np.where(
+            reviewed, self.fsrs.retrievability_batch(stability, (now_ts - last) / 86400), 0.0
+        )
         
-        due_cards.sort(key=lambda x: x.retrievability)
+        for card, value in zip(due_cards, retrievability):
+            card.retrievability = float(value)
         
-        return due_cards[:limit]
+        order = np.argsort(retrievability, kind="stable")[:limit]
+        return [due_cards[i] for i in order]
     
     def get_forecast(self, user_id: str, days: int = 7) -> Dict[str, Any]:
         """Gelecek tahminleri"""
-        user_cards = [c for c in self.cards.values() if c.user_id == user_id]
+        user_cards = self._queue_for(user_id).items()
         
-        forecast = []
         now = datetime.now()
+        today = now.date().toordinal()
+        offsets = np.array(
+            [c.next_review.date().toordinal() - today for c in user_cards], dtype=np.int64
+        )
+        in_range = offsets[(offsets >= 0) & (offsets <= days)]
+        counts = np.bincount(in_range, minlength=days + 1)
         
+        forecast = []
         for day in range(days + 1):
             target_date = now + timedelta(days=day)
-            
-            due_count = sum(
-                1 for c in user_cards 
-                if c.next_review.date() == target_date.date()
-            )
+            due_count = int(counts[day])
             
             # Tahmini workload (dakika)
             estimated_minutes = due_count * 2  # Ortalama 2 dk/kart
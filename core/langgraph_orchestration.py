@@ -8,23 +8,26 @@ State machine tabanlı, kontrol edilebilir agent akışları.
 Features:
 - State graph tanımlaması
 - Conditional routing
-- Parallel execution
+- Parallel execution (super-step, reducer ile state birleştirme)
 - Human-in-the-loop
-- Checkpoint/resume
+- Checkpoint/resume (diff tabanlı, opsiyonel SQLite)
 - Streaming support
 """
 
 import asyncio
 import json
 import logging
+import sqlite3
+import threading
 import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import (
-    Any, Callable, Dict, Generic, List, Literal, Optional,
+    Any, AsyncIterator, Callable, Dict, Generic, List, Literal, Optional,
     Set, Tuple, Type, TypeVar, Union
 )
 from pydantic import BaseModel, Field
@@ -193,10 +196,21 @@ class StateGraph(Generic[S]):
         # Compile and run
         app = graph.compile()
         result = await app.invoke(initial_state)
+    
+    Parallel super-steps:
+        # Ready nodes run concurrently; list fields are appended, dict
+        # fields merged, others last-writer-wins unless a reducer is given
+        graph = StateGraph(TaskState, reducers={"results": operator.add})
+        result = await app.invoke(state, config={"parallel": True})
     """
     
-    def __init__(self, state_class: Type[S]):
+    def __init__(
+        self,
+        state_class: Type[S],
+        reducers: Optional[Dict[str, Callable[[Any, Any], Any]]] = None
+    ):
         self.state_class = state_class
+        self.reducers: Dict[str, Callable[[Any, Any], Any]] = dict(reducers or {})
         self.nodes: Dict[str, GraphNode] = {}
         self.edges: List[GraphEdge] = []
         self.entry_point: Optional[str] = None
@@ -292,12 +306,12 @@ class StateGraph(Generic[S]):
         self.add_edge(node_name, "__end__")
         return self
     
-    def compile(self) -> "CompiledGraph[S]":
+    def compile(self, checkpointer: Optional["CheckpointStore"] = None) -> "CompiledGraph[S]":
         """Compile the graph for execution"""
         if not self.entry_point:
             raise ValueError("Entry point not set. Use set_entry_point()")
         
-        return CompiledGraph(self)
+        return CompiledGraph(self, checkpointer=checkpointer)
     
     def get_mermaid(self) -> str:
         """Generate Mermaid diagram of the graph"""
@@ -314,15 +328,169 @@ class StateGraph(Generic[S]):
         return "\n".join(lines)
 
 
+# ============ CHECKPOINTS ============
+
+_MISSING = object()
+
+
+def _diff_fields(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Tuple[str, Any]]:
+    """
+    Field-level diff between two state dumps.
+    
+    Appended list items are recorded as ("extend", items), added/changed
+    dict keys as ("update", delta), anything else as ("set", value).
+    Unchanged fields are omitted and shared with the previous checkpoint.
+    """
+    diff = {}
+    for name, value in current.items():
+        old = previous.get(name, _MISSING)
+        if old is _MISSING:
+            diff[name] = ("set", value)
+        elif value == old:
+            continue
+        elif isinstance(value, list) and isinstance(old, list) and len(value) > len(old) and value[:len(old)] == old:
+            diff[name] = ("extend", value[len(old):])
+        elif isinstance(value, dict) and isinstance(old, dict) and old.keys() <= value.keys():
+            diff[name] = ("update", {k: v for k, v in value.items() if k not in old or old[k] != v})
+        else:
+            diff[name] = ("set", value)
+    return diff
+
+
+def _apply_diff(data: Dict[str, Any], diff: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+    """Apply a field diff without mutating `data`"""
+    result = dict(data)
+    for name, (kind, payload) in diff.items():
+        if kind == "extend":
+            result[name] = list(result.get(name, [])) + list(payload)
+        elif kind == "update":
+            result[name] = {**result.get(name, {}), **payload}
+        else:
+            result[name] = payload
+    return result
+
+
+class CheckpointStore:
+    """
+    Diff-based checkpoint store.
+    
+    Each step stores only the fields that changed since the previous step
+    (appended messages, changed keys); a full keyframe is written every
+    `keyframe_interval` steps to bound restore cost. Memory grows with the
+    size of the changes instead of the full state per step. Records are kept
+    in memory, or in SQLite when `db_path` is given.
+    """
+    
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, keyframe_interval: int = 50):
+        self.db_path = Path(db_path) if db_path else None
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._records: Dict[str, List[Tuple[int, List[str], str, Dict[str, Any]]]] = {}
+        # Active executions: (step of last keyframe, last state dump)
+        self._last: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS graph_checkpoints ("
+                "execution_id TEXT NOT NULL, step INTEGER NOT NULL, nodes TEXT NOT NULL, "
+                "kind TEXT NOT NULL, payload TEXT NOT NULL, "
+                "created_at TEXT DEFAULT CURRENT_TIMESTAMP, "
+                "PRIMARY KEY (execution_id, step))"
+            )
+            self._conn.commit()
+        return self._conn
+    
+    def save(self, execution_id: str, step: int, nodes: List[str], state: BaseModel) -> None:
+        """Record the state after `step` as a keyframe or a diff"""
+        current = state.model_dump(mode="json")
+        last = self._last.get(execution_id)
+        
+        if last is None or step - last[0] >= self.keyframe_interval:
+            kind, payload, keyframe_step = "full", current, step
+        else:
+            kind, payload, keyframe_step = "diff", _diff_fields(last[1], current), last[0]
+        self._last[execution_id] = (keyframe_step, current)
+        
+        if self.db_path is None:
+            self._records.setdefault(execution_id, []).append((step, list(nodes), kind, payload))
+            return
+        
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO graph_checkpoints (execution_id, step, nodes, kind, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (execution_id, step, json.dumps(nodes), kind, json.dumps(payload, ensure_ascii=False, default=str))
+            )
+            conn.commit()
+    
+    def finish(self, execution_id: str) -> None:
+        """Release the working snapshot of a finished execution"""
+        self._last.pop(execution_id, None)
+    
+    def _rows(self, execution_id: str, step: Optional[int]) -> List[Tuple[int, List[str], str, Dict[str, Any]]]:
+        if self.db_path is None:
+            records = self._records.get(execution_id, [])
+            return [r for r in records if step is None or r[0] <= step]
+        
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT step, nodes, kind, payload FROM graph_checkpoints "
+                "WHERE execution_id = ? AND step <= ? ORDER BY step",
+                (execution_id, step if step is not None else 2 ** 62)
+            ).fetchall()
+        return [(r[0], json.loads(r[1]), r[2], json.loads(r[3])) for r in rows]
+    
+    def load(self, execution_id: str, step: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Rebuild the state dump at `step` (latest if None)"""
+        rows = self._rows(execution_id, step)
+        keyframe = max((i for i, r in enumerate(rows) if r[2] == "full"), default=None)
+        if keyframe is None:
+            return None
+        
+        data = rows[keyframe][3]
+        for _, _, _, diff in rows[keyframe + 1:]:
+            data = _apply_diff(data, {name: tuple(change) for name, change in diff.items()})
+        return copy.deepcopy(data)
+    
+    def list_steps(self, execution_id: str) -> List[Dict[str, Any]]:
+        """Checkpoint history: step, executed nodes and record kind"""
+        return [
+            {"step": r[0], "nodes": r[1], "kind": r[2]}
+            for r in self._rows(execution_id, None)
+        ]
+    
+    def delete(self, execution_id: str) -> None:
+        self._records.pop(execution_id, None)
+        self._last.pop(execution_id, None)
+        if self.db_path is not None:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM graph_checkpoints WHERE execution_id = ?", (execution_id,))
+                conn.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 # ============ COMPILED GRAPH ============
 
 class CompiledGraph(Generic[S]):
     """Compiled graph ready for execution"""
     
-    def __init__(self, graph: StateGraph[S]):
+    def __init__(self, graph: StateGraph[S], checkpointer: Optional[CheckpointStore] = None):
         self.graph = graph
         self.state_class = graph.state_class
-        self.checkpoints: Dict[str, Any] = {}
+        self.checkpoints = checkpointer or CheckpointStore()
+        self.last_execution_id: Optional[str] = None
         self._validate()
     
     def _validate(self):
@@ -362,66 +530,28 @@ class CompiledGraph(Generic[S]):
         Args:
             state: Initial state
             config: Execution configuration
+                - parallel: run every ready node of a super-step concurrently
+                - checkpoints: record a diff checkpoint after every step
+                - execution_id: id used for checkpoints (random if omitted)
             max_steps: Maximum execution steps
             timeout: Timeout in seconds
             
         Returns:
             Final state after graph execution
         """
-        config = config or {}
-        execution_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
-        
-        current_node = self.graph.entry_point
         step = 0
-        
-        logger.info(f"[{execution_id}] Starting graph execution from: {current_node}")
-        
-        while current_node and current_node != "__end__" and step < max_steps:
-            # Check timeout
-            if time.time() - start_time > timeout:
-                raise TimeoutError(f"Graph execution timed out after {timeout}s")
-            
-            step += 1
-            state.current_step = step
-            
-            # Get node
-            node = self.graph.nodes.get(current_node)
-            if not node:
-                raise ValueError(f"Node not found: {current_node}")
-            
-            logger.debug(f"[{execution_id}] Step {step}: Executing node '{current_node}'")
-            
-            # Execute node
-            result = await self._execute_node(node, state, config)
-            
-            if result.status == ExecutionStatus.FAILED:
-                state.error = result.error
-                logger.error(f"[{execution_id}] Node '{current_node}' failed: {result.error}")
-                break
-            
-            state = result.state
-            
-            # Save checkpoint if enabled
-            if config.get("checkpoints", False):
-                self.checkpoints[f"{execution_id}_{step}"] = state.model_copy(deep=True)
-            
-            # Get next node
-            next_node = self._get_next_node(current_node, state)
-            current_node = next_node
-        
-        if step >= max_steps:
-            logger.warning(f"[{execution_id}] Reached max steps ({max_steps})")
+        async for step, _, state in self._run(state, config or {}, max_steps, timeout):
+            pass
         
         state.total_steps = step
-        logger.info(f"[{execution_id}] Graph execution completed in {step} steps")
-        
         return state
     
     async def stream(
         self,
         state: S,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        max_steps: int = 100,
+        timeout: float = 300.0
     ):
         """
         Stream execution results as generator.
@@ -429,25 +559,135 @@ class CompiledGraph(Generic[S]):
         Yields:
             Tuple of (node_name, state) after each node execution
         """
-        config = config or {}
-        current_node = self.graph.entry_point
+        async for _, results, state in self._run(state, config or {}, max_steps, timeout):
+            for result in results:
+                yield (result.node_name, state.model_copy())
+    
+    async def _run(
+        self,
+        state: S,
+        config: Dict[str, Any],
+        max_steps: int,
+        timeout: float
+    ) -> AsyncIterator[Tuple[int, List[ExecutionResult], S]]:
+        """
+        Execute super-steps and yield (step, results, state) after each.
+        
+        Sequential mode follows the highest-priority matching edge. In
+        parallel mode every matching edge is followed and all ready nodes of
+        a step run concurrently on isolated copies, then merged by reducers.
+        """
+        execution_id = config.get("execution_id") or str(uuid.uuid4())[:8]
+        self.last_execution_id = execution_id
+        parallel = config.get("parallel", False)
+        checkpoints = self.checkpoints if config.get("checkpoints", False) else None
+        start_time = time.time()
+        
+        frontier = [self.graph.entry_point]
         step = 0
         
-        while current_node and current_node != "__end__" and step < 100:
-            step += 1
-            node = self.graph.nodes.get(current_node)
-            if not node:
-                break
-            
-            result = await self._execute_node(node, state, config)
-            state = result.state
-            
-            yield (current_node, state.model_copy())
-            
-            if result.status == ExecutionStatus.FAILED:
-                break
-            
-            current_node = self._get_next_node(current_node, state)
+        logger.info(f"[{execution_id}] Starting graph execution from: {frontier[0]}")
+        
+        try:
+            while frontier and step < max_steps:
+                # Check timeout
+                if time.time() - start_time > timeout:
+                    raise TimeoutError(f"Graph execution timed out after {timeout}s")
+                
+                step += 1
+                state.current_step = step
+                
+                nodes = []
+                for name in frontier:
+                    node = self.graph.nodes.get(name)
+                    if not node:
+                        raise ValueError(f"Node not found: {name}")
+                    nodes.append(node)
+                
+                logger.debug(f"[{execution_id}] Step {step}: Executing {frontier}")
+                
+                # Execute node(s)
+                if len(nodes) == 1:
+                    results = [await self._execute_node(nodes[0], state, config)]
+                else:
+                    results = list(await asyncio.gather(*(
+                        self._execute_node(node, state.model_copy(deep=True), config)
+                        for node in nodes
+                    )))
+                
+                failed = next((r for r in results if r.status == ExecutionStatus.FAILED), None)
+                if failed:
+                    state.error = failed.error
+                    logger.error(f"[{execution_id}] Node '{failed.node_name}' failed: {failed.error}")
+                    yield step, results, state
+                    break
+                
+                if len(results) == 1:
+                    state = results[0].state
+                else:
+                    state = self._merge_states(state, [r.state for r in results])
+                
+                # Save checkpoint if enabled
+                if checkpoints is not None:
+                    checkpoints.save(execution_id, step, frontier, state)
+                
+                yield step, results, state
+                
+                # Get next node(s)
+                if parallel:
+                    frontier = list(dict.fromkeys(
+                        target
+                        for name in frontier
+                        for target in self._get_all_next_nodes(name, state)
+                        if target != "__end__"
+                    ))
+                else:
+                    next_node = self._get_next_node(frontier[-1], state)
+                    frontier = [next_node] if next_node and next_node != "__end__" else []
+        finally:
+            if checkpoints is not None:
+                checkpoints.finish(execution_id)
+        
+        if step >= max_steps and frontier:
+            logger.warning(f"[{execution_id}] Reached max steps ({max_steps})")
+        
+        logger.info(f"[{execution_id}] Graph execution completed in {step} steps")
+    
+    def _merge_states(self, base: S, branches: List[S]) -> S:
+        """
+        Merge concurrent branch states into `base`.
+        
+        Each branch's changes are computed against `base` first, then folded
+        in node order. Incremental changes (appended list items, added dict
+        keys) go through the graph's reducer if given, otherwise they are
+        concatenated / merged. A replaced value ("set") is never fed to the
+        reducer, it overwrites the field (last writer wins).
+        """
+        fields = [name for name in self.state_class.model_fields if name not in ("current_step", "total_steps")]
+        base_values = {name: getattr(base, name) for name in fields}
+        updates = [
+            _diff_fields(base_values, {name: getattr(branch, name) for name in fields})
+            for branch in branches
+        ]
+        
+        merged = dict(base_values)
+        for diff in updates:
+            for name, (kind, payload) in diff.items():
+                reducer = self.graph.reducers.get(name)
+                if reducer is not None and kind != "set":
+                    merged[name] = reducer(merged[name], payload)
+                else:
+                    merged.update(_apply_diff(merged, {name: (kind, payload)}))
+        
+        for name, value in merged.items():
+            if value is not base_values[name]:
+                setattr(base, name, value)
+        return base
+    
+    def get_state(self, execution_id: Optional[str] = None, step: Optional[int] = None) -> Optional[S]:
+        """Restore the state recorded at `step` of an execution (latest if None)"""
+        data = self.checkpoints.load(execution_id or self.last_execution_id, step)
+        return self.state_class.model_validate(data) if data is not None else None
     
     async def _execute_node(
         self,
@@ -725,6 +965,7 @@ __all__ = [
     "GraphNode",
     "GraphEdge",
     "ExecutionResult",
+    "CheckpointStore",
     # Pre-built graphs
     "create_rag_graph",
     "create_conversation_graph",
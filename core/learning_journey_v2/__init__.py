@@ -62,6 +62,11 @@ from .certificate_system import (
     get_certificate_analytics
 )
 
+from .content_prefetcher import (
+    ContentPrefetcher,
+    ContentStore
+)
+
 from .orchestrator import (
     LearningJourneyOrchestrator,
     OrchestrationEvent,
@@ -103,6 +108,10 @@ __all__ = [
     "RAGContentEnhancer",
     "get_content_generator",
     
+    # Content Prefetcher
+    "ContentPrefetcher",
+    "ContentStore",
+    
     # Exam System
     "ExamSystem",
     "ExamResult",
@@ -119,33 +119,26 @@ class ContentGeneratorAgent:
     ) -> List[ContentBlock]:
         """Paket için tüm içeriği üret"""
         
-        content_blocks = []
-        
-        # 1. Giriş metni
-        intro_block = await self._generate_intro(package, stage)
-        content_blocks.append(intro_block)
-        
-        # 2. Her konu için açıklama
-        for topic in package.topics:
-            explanation = await self._generate_topic_explanation(
-                topic, 
-                package.curriculum_section,
-                difficulty
-            )
-            content_blocks.append(explanation)
-        
-        # 3. Formüller ve kavramlar (matematiksel içerik için)
-        if self._is_math_content(package):
-            formulas = await self._generate_formulas(package.topics)
-            content_blocks.extend(formulas)
+        # 1-5. Giriş, konu açıklamaları, formüller, örnekler ve videolar
+        # birbirinden bağımsız - paralel üret, sırayı koru
+        topic_tasks = [
+            self._generate_topic_explanation(topic, package.curriculum_section, difficulty)
+            for topic in package.topics
+        ]
+        formulas_task = (
+            self._generate_formulas(package.topics) if self._is_math_content(package)
+            else asyncio.sleep(0, result=[])
+        )
         
-        # 4. Örnekler
-        examples = await self._generate_examples(package.topics, difficulty)
-        content_blocks.extend(examples)
+        intro_block, formulas, examples, videos, *explanations = await asyncio.gather(
+            self._generate_intro(package, stage),
+            formulas_task,
+            self._generate_examples(package.topics, difficulty),
+            self._find_videos(package.topics, stage.main_topic),
+            *topic_tasks
+        )
         
-        # 5. Video önerileri
-        videos = await self._find_videos(package.topics, stage.main_topic)
-        content_blocks.extend(videos)
+        content_blocks = [intro_block, *explanations, *formulas, *examples, *videos]
         
         # 6. Özet
         summary = await self._generate_summary(package, content_blocks)
@@ -324,9 +317,7 @@ Basit bir örnek ile açıklayalım:
     ) -> List[ContentBlock]:
         """Örnekler oluştur"""
         
-        blocks = []
-        
-        for topic in topics[:2]:  # İlk 2 konu için
+        async def _example_block(topic: str) -> ContentBlock:
             if self.llm_service:
                 prompt = f"""'{topic}' konusu için {difficulty.value} seviyesinde 3 örnek problem ve çözümü yaz.
 
@@ -345,16 +336,17 @@ Markdown formatında yaz."""
             else:
                 content = self._mock_examples(topic)
             
-            blocks.append(ContentBlock(
+            return ContentBlock(
                 type=ContentType.EXAMPLE,
                 title=f"✏️ {topic} Örnekleri",
                 content={"markdown": content, "text": content},
                 duration_minutes=10,
                 order=0,
                 metadata={"topic": topic, "type": "worked_examples"}
-            ))
+            )
         
-        return blocks
+        # İlk 2 konu için, paralel
+        return list(await asyncio.gather(*(_example_block(topic) for topic in topics[:2])))
     
     def _mock_examples(self, topic: str) -> str:
         """Mock örnek içeriği"""
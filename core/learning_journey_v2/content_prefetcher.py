@@ -0,0 +1,379 @@
+"""
+⚡ Content Prefetcher - Spekülatif Paket İçeriği Ön Üretimi
+
+Kullanıcının yolculuktaki konumuna göre sıradaki paketleri arka planda
+LLM ile zenginleştirir; paket açıldığında içerik genellikle hazırdır.
+
+Prensipler:
+- Tahmin: ilk tamamlanmamış paketten itibaren `lookahead` paket
+- Düşük öncelik: kullanıcı bir paket açarken (foreground) spekülatif
+  işler yeni LLM çağrısı başlatmaz; foreground işi kuyruğu bekletmez
+- Tekil uçuş: aynı paket için arka plan ve foreground işi birleşir; iş
+  ayrı bir task'ta çalışır ve bekleyen kaldığı sürece iptal edilmez
+- Kalıcılık: zenginleştirilmiş bloklar içerik adresli SQLite deposuna
+  yazılır; aynı hedef profili ve paket için tekrar LLM çağrısı yapılmaz
+"""
+
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config import settings
+
+from .models import ContentBlock, CurriculumPlan, LearningGoal, Package, PackageStatus, Stage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = settings.DATA_DIR / "learning_content_cache.db"
+
+
+# ==================== CONTENT STORE ====================
+
+class ContentStore:
+    """Zenginleştirilmiş blok içerikleri için SQLite deposu (anahtar -> markdown)."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS block_content ("
+                "key TEXT PRIMARY KEY, markdown TEXT NOT NULL, "
+                "created_at TEXT DEFAULT CURRENT_TIMESTAMP)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        with self._lock:
+            conn = self._connect()
+            placeholders = ",".join("?" * len(keys))
+            rows = conn.execute(
+                f"SELECT key, markdown FROM block_content WHERE key IN ({placeholders})", keys
+            ).fetchall()
+        return dict(rows)
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        if not items:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO block_content (key, markdown) VALUES (?, ?)",
+                list(items.items())
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ==================== PREFETCHER ====================
+
+class ContentPrefetcher:
+    """
+    Paket içeriği ön üretim motoru.
+
+    Kullanım:
+        prefetcher.schedule_journey(plan)                  # konum değişince
+        await prefetcher.ensure_ready(package, stage, goal)  # paket açılırken
+    """
+
+    ENHANCEABLE_TYPES = ("intro", "explanation", "formulas", "examples")
+    SPECULATIVE_PRIORITY = 10
+
+    def __init__(
+        self,
+        planner,
+        lookahead: int = 2,
+        max_concurrent: int = 1,
+        store_path: Optional[Path] = DEFAULT_STORE_PATH
+    ):
+        self.planner = planner
+        self.lookahead = lookahead
+        self.max_concurrent = max_concurrent
+        self.store = ContentStore(store_path) if store_path else None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._queued: Dict[str, Tuple[int, Package, Stage, LearningGoal]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Hazırlık işi -> onu bekleyen çağrı sayısı
+        self._waiters: Dict[asyncio.Task, int] = {}
+        self._workers: List[asyncio.Task] = []
+        self._foreground = 0
+        self._idle: Optional[asyncio.Event] = None
+        self._seq = itertools.count()
+
+        self._stats = {
+            "scheduled": 0,
+            "prefetched": 0,
+            "ready_on_open": 0,
+            "waited_on_open": 0,
+            "restored_blocks": 0,
+            "failed": 0,
+        }
+
+    # ==================== PREDICTION ====================
+
+    def _pending_blocks(self, package: Package) -> List[ContentBlock]:
+        return [
+            block for block in package.content_blocks
+            if block.metadata.get("llm_enhanced") is False
+            and block.metadata.get("content_type") in self.ENHANCEABLE_TYPES
+        ]
+
+    def predict_next(self, plan: CurriculumPlan, limit: Optional[int] = None) -> List[Tuple[Stage, Package]]:
+        """İlk tamamlanmamış paketten itibaren hazır olmayan sıradaki paketler."""
+        limit = self.lookahead if limit is None else limit
+        ordered = [(stage, package) for stage in plan.stages for package in stage.packages]
+
+        position = next(
+            (i for i, (_, package) in enumerate(ordered) if package.status != PackageStatus.PASSED),
+            len(ordered)
+        )
+
+        upcoming = []
+        for stage, package in ordered[position:]:
+            if len(upcoming) >= limit:
+                break
+            if not package.llm_content_ready and self._pending_blocks(package):
+                upcoming.append((stage, package))
+        return upcoming
+
+    # ==================== SCHEDULING ====================
+
+    def _ensure_runtime(self) -> None:
+        """Kuyruk, event ve worker'ları çalışan event loop üzerinde kur."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._idle = asyncio.Event()
+            self._idle.set()
+            self._workers = []
+            self._queued.clear()
+            self._inflight.clear()
+            self._waiters.clear()
+
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.max_concurrent:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    def schedule_journey(self, plan: CurriculumPlan) -> List[str]:
+        """
+        Yolculuk konumuna göre sıradaki paketleri arka plan kuyruğuna ekle.
+
+        Event loop dışında çağrılırsa hiçbir şey yapmaz.
+        """
+        if not plan or (not self.planner.llm_service and self.store is None):
+            return []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return []
+
+        self._ensure_runtime()
+        scheduled = []
+        for rank, (stage, package) in enumerate(self.predict_next(plan)):
+            if package.id in self._inflight:
+                continue
+            priority = self.SPECULATIVE_PRIORITY + rank
+            current = self._queued.get(package.id)
+            if current is not None and current[0] <= priority:
+                continue
+
+            self._queued[package.id] = (priority, package, stage, plan.goal)
+            self._queue.put_nowait((priority, next(self._seq), package.id))
+            scheduled.append(package.id)
+
+        self._stats["scheduled"] += len(scheduled)
+        return scheduled
+
+    async def _worker(self) -> None:
+        while True:
+            priority, _, package_id = await self._queue.get()
+            job = self._queued.get(package_id)
+            # Daha iyi öncelikle yeniden kuyruklanmış veya foreground'a alınmış
+            if job is None or job[0] != priority:
+                continue
+
+            # Foreground işler bitene kadar yeni LLM çağrısı başlatma
+            await self._idle.wait()
+            if self._queued.pop(package_id, None) is None:
+                continue
+
+            _, package, stage, goal = job
+            if package.llm_content_ready:
+                continue
+            ready, _ = await self._run(package, stage, goal)
+            if ready:
+                self._stats["prefetched"] += 1
+
+    # ==================== EXECUTION ====================
+
+    async def ensure_ready(self, package: Package, stage: Stage, goal: LearningGoal) -> bool:
+        """
+        Paket açılırken çağrılır: içerik hazırsa anında döner, arka planda
+        üretiliyorsa ona katılır, yoksa hemen (kuyruğu beklemeden) üretir.
+        """
+        if package.llm_content_ready:
+            self._stats["ready_on_open"] += 1
+            return True
+
+        self._queued.pop(package.id, None)
+        self._ensure_runtime()
+
+        self._foreground += 1
+        self._idle.clear()
+        try:
+            ready, generated = await self._run(package, stage, goal)
+        finally:
+            self._foreground -= 1
+            if self._foreground == 0:
+                self._idle.set()
+
+        # Yalnızca LLM üretimini beklemek "waited" sayılır; depodan gelen içerik anında hazırdır
+        self._stats["waited_on_open" if generated else "ready_on_open"] += 1
+        return ready
+
+    async def _run(self, package: Package, stage: Stage, goal: LearningGoal) -> Tuple[bool, bool]:
+        """
+        Tekil uçuş: aynı paket için tek hazırlık işi.
+
+        İş çağıranlardan bağımsız bir task'ta çalışır. İptal edilen çağıran
+        (ör. shutdown ile durdurulan spekülatif worker) yalnızca kendi
+        beklemesini bırakır; iş ancak bekleyen kalmayınca iptal edilir.
+
+        Returns:
+            (hazır mı, LLM ile üretildi mi)
+        """
+        job = self._inflight.get(package.id)
+        if job is None:
+            job = asyncio.ensure_future(self._prepare_job(package, stage, goal))
+            self._inflight[package.id] = job
+            job.add_done_callback(lambda done, pid=package.id: self._job_done(pid, done))
+
+        self._waiters[job] = self._waiters.get(job, 0) + 1
+        try:
+            return await asyncio.shield(job)
+        finally:
+            remaining = self._waiters[job] - 1
+            if remaining:
+                self._waiters[job] = remaining
+            else:
+                del self._waiters[job]
+                if not job.done():
+                    job.cancel()
+
+    def _job_done(self, package_id: str, job: asyncio.Task) -> None:
+        if self._inflight.get(package_id) is job:
+            del self._inflight[package_id]
+
+    async def _prepare_job(self, package: Package, stage: Stage, goal: LearningGoal) -> Tuple[bool, bool]:
+        try:
+            return await self._prepare(package, stage, goal)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Content prefetch failed for {package.id}: {e}")
+            self._stats["failed"] += 1
+            return False, False
+
+    def _block_key(self, block: ContentBlock, package: Package, stage: Stage, goal: LearningGoal) -> str:
+        """Blok içeriğini belirleyen girdilerin özeti."""
+        difficulty = getattr(package.difficulty, "value", package.difficulty)
+        parts = [
+            block.metadata.get("content_type"),
+            block.metadata.get("topic", ""),
+            package.title,
+            package.topics,
+            package.learning_objectives,
+            difficulty,
+            stage.main_topic,
+            goal.subject,
+            goal.target_outcome,
+            goal.daily_hours,
+            sorted(goal.weak_areas or []),
+            sorted(goal.focus_areas or []),
+        ]
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _prepare(self, package: Package, stage: Stage, goal: LearningGoal) -> Tuple[bool, bool]:
+        """Depodan geri yükle, kalan blokları LLM ile (paralel) zenginleştir ve kaydet."""
+        pending = self._pending_blocks(package)
+        if not pending:
+            package.llm_content_ready = True
+            return True, False
+
+        keys = {block.id: self._block_key(block, package, stage, goal) for block in pending}
+
+        if self.store is not None:
+            cached = await asyncio.to_thread(self.store.get_many, list(keys.values()))
+            for block in pending:
+                markdown = cached.get(keys[block.id])
+                if markdown:
+                    block.content["markdown"] = markdown
+                    block.content["text"] = markdown
+                    block.content["llm_pending"] = False
+                    block.metadata["llm_enhanced"] = True
+                    self._stats["restored_blocks"] += 1
+
+            if not self._pending_blocks(package):
+                package.llm_content_ready = True
+                return True, False
+
+        if not self.planner.llm_service:
+            return False, False
+
+        await self.planner.enhance_package_content_with_llm(package, stage, goal)
+
+        if self.store is not None:
+            enhanced = {
+                keys[block.id]: block.content.get("markdown", "")
+                for block in pending
+                if block.metadata.get("llm_enhanced") is True and block.content.get("markdown")
+            }
+            await asyncio.to_thread(self.store.put_many, enhanced)
+
+        return package.llm_content_ready, True
+
+    # ==================== LIFECYCLE ====================
+
+    async def shutdown(self) -> None:
+        """Arka plan worker'larını durdur (foreground'un beklediği işler sürer)."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # Bekleyeni kalmadığı için iptal edilen spekülatif işlerin bitmesini bekle
+        abandoned = [job for job in self._inflight.values() if job not in self._waiters]
+        await asyncio.gather(*abandoned, return_exceptions=True)
+        self._queued.clear()
+        if self.store is not None:
+            self.store.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "queued": len(self._queued),
+            "inflight": len(self._inflight),
+            "foreground": self._foreground,
+        }
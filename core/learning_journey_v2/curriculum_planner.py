@@ -1076,10 +1076,15 @@ Adım adım çözüm burada gösterilecek.
                     tasks.append(self._enhance_examples_block(content_block, package.topics, package.difficulty, stage.main_topic, goal))
         
         if tasks:
-            # Paralel çalıştır (max 5 concurrent)
+            # Blok zenginleştirmeleri paralel çalışır
             await asyncio.gather(*tasks, return_exceptions=True)
         
-        package.llm_content_ready = True
+        # Hata alan blok kaldıysa paket sonraki açılışta yeniden denenir
+        package.llm_content_ready = not any(
+            block.metadata.get("llm_enhanced") is False
+            and block.metadata.get("content_type") in ("intro", "explanation", "formulas", "examples")
+            for block in package.content_blocks
+        )
     
     async def _enhance_intro_block(self, block: ContentBlock, package: Package, stage: Stage, goal: LearningGoal) -> None:
         """Giriş bloğunu LLM ile zenginleştir"""
@@ -28,6 +28,7 @@ from .curriculum_planner import CurriculumPlannerAgent, AgentThought, get_curric
 from .content_generator import ContentGeneratorAgent, get_content_generator
 from .exam_system import ExamSystem, ExamResult, get_exam_system
 from .certificate_system import CertificateGenerator, get_certificate_generator
+from .content_prefetcher import ContentPrefetcher
 
 
 # ==================== ORCHESTRATION EVENTS ====================
@@ -121,12 +122,14 @@ class LearningJourneyOrchestrator:
         curriculum_planner: Optional[CurriculumPlannerAgent] = None,
         content_generator: Optional[ContentGeneratorAgent] = None,
         exam_system: Optional[ExamSystem] = None,
-        certificate_generator: Optional[CertificateGenerator] = None
+        certificate_generator: Optional[CertificateGenerator] = None,
+        content_prefetcher: Optional[ContentPrefetcher] = None
     ):
         self.curriculum_planner = curriculum_planner or get_curriculum_planner()
         self.content_generator = content_generator or get_content_generator()
         self.exam_system = exam_system or get_exam_system()
         self.certificate_generator = certificate_generator or get_certificate_generator()
+        self.content_prefetcher = content_prefetcher or ContentPrefetcher(self.curriculum_planner)
         
         # Active journeys
         self.active_journeys: Dict[str, JourneyState] = {}
@@ -229,6 +232,9 @@ class LearningJourneyOrchestrator:
         
         self.active_journeys[plan.id] = state
         
+        # İlk paketlerin içeriğini arka planda hazırla
+        self.content_prefetcher.schedule_journey(plan)
+        
         # Journey başladı
         yield OrchestrationEvent(
             type=EventType.JOURNEY_STARTED,
@@ -298,10 +304,17 @@ class LearningJourneyOrchestrator:
             agent_name="Content Generator"
         )
         
-        # İçerik üretimi
-        content_blocks = await self.content_generator.generate_package_content(
-            package, stage, package.difficulty
-        )
+        # İçerik: ön üretilmişse hazır, üretiliyorsa ona katıl, yoksa hemen üret
+        await self.content_prefetcher.ensure_ready(package, stage, state.plan.goal)
+        if package.llm_content_ready and package.content_blocks:
+            content_blocks = package.content_blocks
+        else:
+            content_blocks = await self.content_generator.generate_package_content(
+                package, stage, package.difficulty
+            )
+        
+        # Sıradaki paketleri arka planda hazırla
+        self.content_prefetcher.schedule_journey(state.plan)
         
         for block in content_blocks:
             yield OrchestrationEvent(
@@ -396,6 +409,8 @@ class LearningJourneyOrchestrator:
                             state.plan.stages[stage_index + 1].status = StageStatus.AVAILABLE
                             state.plan.stages[stage_index + 1].packages[0].status = PackageStatus.AVAILABLE
                     
+                    # Konum ilerledi - ön üretim penceresini kaydır
+                    self.content_prefetcher.schedule_journey(state.plan)
                     return
     
     # ==================== EXAM OPERATIONS ====================
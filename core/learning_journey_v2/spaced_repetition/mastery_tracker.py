@@ -11,6 +11,7 @@ SM-2 algoritması ile entegre çalışarak
 - XP ve Level sistemi
 - Achievement entegrasyonu
 - Progress visualization data
+- Kalıcı tekrar kuyruğu (vade sıralı heap indeksi)
 """
 
 from dataclasses import dataclass, field
@@ -19,6 +20,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
 import json
 
+from core.review_queue import ReviewQueue
+
 from .sm2_algorithm import SM2Algorithm, ReviewItem, sm2
 
 
@@ -165,6 +168,7 @@ class MasteryTracker:
         self.package_masteries: Dict[str, PackageMastery] = {}
         self.stage_masteries: Dict[str, StageMastery] = {}
         self.review_items: Dict[str, ReviewItem] = {}
+        self.review_queue = ReviewQueue()
         
         # User progress
         self.total_xp: int = 0
@@ -378,13 +382,11 @@ class MasteryTracker:
         if not review_item_ids:
             return 0.5  # Default
         
-        retentions = []
-        for item_id in review_item_ids:
-            if item_id in self.review_items:
-                ret = self.sm2.calculate_retention_rate(self.review_items[item_id])
-                retentions.append(ret)
+        items = [self.review_items[i] for i in review_item_ids if i in self.review_items]
+        if not items:
+            return 0.5
         
-        return sum(retentions) / len(retentions) if retentions else 0.5
+        return float(self.sm2.calculate_retention_rates(items).mean())
     
     def _calculate_xp(self, score: float, topic: TopicMastery) -> int:
         """XP hesapla"""
@@ -420,15 +422,15 @@ class MasteryTracker:
         if not topic:
             return
         
+        # Aynı öğe bir turda en fazla bir kez güncellenir
+        rounds: List[Dict[str, Tuple[ReviewItem, int]]] = [{}]
+        
         for result in question_results:
             item_id = result.get("question_id", f"{topic_id}_{len(topic.review_items)}")
             quality = self._score_to_quality(result.get("score", 0))
             
-            if item_id in self.review_items:
-                # Mevcut item güncelle
-                item = self.review_items[item_id]
-                self.sm2.calculate_next_review(item, quality)
-            else:
+            item = self.review_items.get(item_id)
+            if item is None:
                 # Yeni item oluştur
                 item = ReviewItem(
                     item_id=item_id,
@@ -437,9 +439,28 @@ class MasteryTracker:
                     stage_id=topic.stage_id,
                     item_type="question"
                 )
-                self.sm2.calculate_next_review(item, quality)
                 self.review_items[item_id] = item
                 topic.review_items.append(item_id)
+            
+            if item_id in rounds[-1]:
+                rounds.append({})
+            rounds[-1][item_id] = (item, quality)
+        
+        for batch in rounds:
+            items = [item for item, _ in batch.values()]
+            self.sm2.calculate_next_reviews(items, [quality for _, quality in batch.values()])
+            for item in items:
+                self.review_queue.push(item)
+    
+    def complete_review(self, item_id: str, quality: int) -> Optional[ReviewItem]:
+        """Tekrarı tamamla ve kuyruğu güncelle"""
+        item = self.review_items.get(item_id)
+        if item is None:
+            return None
+        
+        self.sm2.calculate_next_review(item, quality)
+        self.review_queue.push(item)
+        return item
     
     def _score_to_quality(self, score: float) -> int:
         """Score'u SM-2 quality'ye çevir (0-5)"""
@@ -499,9 +520,8 @@ class MasteryTracker:
         user_id: str = "",
         max_items: int = 20
     ) -> List[ReviewItem]:
-        """Bugün tekrar edilecek öğeleri getir"""
-        all_items = list(self.review_items.values())
-        return self.sm2.get_due_items(all_items, max_items)
+        """Bugün tekrar edilecek öğeleri getir (kalıcı kuyruktan, O(k log n))"""
+        return self.review_queue.get_due(max_items)
     
     def get_progress_summary(self) -> Dict[str, Any]:
         """Genel ilerleme özeti"""
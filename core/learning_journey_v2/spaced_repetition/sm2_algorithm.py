@@ -11,14 +11,18 @@ optimal tekrar zamanlamalarını hesaplar.
 - Minimum/maximum interval limitleri
 - Topic-aware scheduling
 - Weakness integration
+- Vektörel toplu güncelleme ve istatistik (NumPy)
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Any
 from enum import Enum
+import heapq
 import math
 
+import numpy as np
+
 
 class ReviewQuality(Enum):
     """Geri bildirim kalitesi (0-5 arası)"""
@@ -182,6 +186,67 @@ class SM2Algorithm:
         # Limitleri uygula
         return max(self.MIN_EASE_FACTOR, min(self.MAX_EASE_FACTOR, new_ef))
     
+    def calculate_next_reviews(
+        self,
+        items: Sequence[ReviewItem],
+        qualities: Sequence[int]
+    ) -> List[ReviewItem]:
+        """
+        calculate_next_review'ın toplu (vektörel) karşılığı
+        
+        Her öğe en fazla bir kez bulunmalıdır; aynı öğe için birden
+        fazla değerlendirme sırayla uygulanmalıdır.
+        """
+        if not items:
+            return []
+        
+        q = np.clip(np.asarray(qualities, dtype=np.int64), 0, 5)
+        ef = np.array([item.ease_factor for item in items], dtype=np.float64)
+        interval = np.array([item.interval for item in items], dtype=np.int64)
+        repetition = np.array([item.repetition for item in items], dtype=np.int64)
+        difficulty = np.array([item.difficulty_score for item in items], dtype=np.float64)
+        total = np.array([item.total_reviews for item in items], dtype=np.int64)
+        avg_quality = np.array([item.average_quality for item in items], dtype=np.float64)
+        
+        # Ease factor
+        miss = 5 - q
+        new_ef = np.clip(ef + (0.1 - miss * (0.08 + miss * 0.02)),
+                         self.MIN_EASE_FACTOR, self.MAX_EASE_FACTOR)
+        
+        # Interval
+        passed = q >= 3
+        new_repetition = np.where(passed, repetition + 1, 0)
+        grown = (interval * new_ef).astype(np.int64)
+        new_interval = np.select(
+            [new_repetition == 1, new_repetition == 2],
+            [1, 6],
+            default=grown
+        )
+        new_interval = np.where(
+            passed,
+            np.clip(new_interval, self.MIN_INTERVAL, self.MAX_INTERVAL),
+            1
+        )
+        
+        new_difficulty = np.clip(difficulty + miss * 0.05, 0.0, 1.0)
+        new_total = total + 1
+        new_average = (avg_quality * total + q) / new_total
+        
+        now = datetime.now()
+        for i, item in enumerate(items):
+            days = int(new_interval[i])
+            item.ease_factor = float(new_ef[i])
+            item.interval = days
+            item.repetition = int(new_repetition[i])
+            item.next_review = now + timedelta(days=days)
+            item.last_review = now
+            item.total_reviews = int(new_total[i])
+            item.correct_reviews += int(passed[i])
+            item.average_quality = float(new_average[i])
+            item.difficulty_score = float(new_difficulty[i])
+        
+        return list(items)
+    
     def get_due_items(
         self,
         items: List[ReviewItem],
@@ -204,25 +269,20 @@ class SM2Algorithm:
         for item in items:
             if item.next_review is None:
                 if include_new:
-                    new_items.append((item, 0))
+                    new_items.append(item)
             elif item.next_review <= now:
-                # Gecikme gün sayısı = urgency
-                overdue_days = (now - item.next_review).days
-                urgency = min(overdue_days, 30)  # Max 30 gün gecikme
-                due_items.append((item, urgency))
-        
-        # Urgency'ye göre sırala (yüksekten düşüğe)
-        due_items.sort(key=lambda x: (-x[1], x[0].difficulty_score))
-        
-        # Yeni öğeleri difficulty'ye göre sırala
-        new_items.sort(key=lambda x: x[0].difficulty_score)
+                # Gecikme gün sayısı = urgency (max 30 gün)
+                urgency = min((now - item.next_review).days, 30)
+                due_items.append((-urgency, item.difficulty_score, len(due_items), item))
         
-        # Birleştir
-        result = [item for item, _ in due_items[:max_items]]
+        # Tam sıralama yerine sadece ilk max_items (O(n log k))
+        result = [entry[-1] for entry in heapq.nsmallest(max_items, due_items)]
         
         remaining_slots = max_items - len(result)
         if remaining_slots > 0 and new_items:
-            result.extend([item for item, _ in new_items[:remaining_slots]])
+            result.extend(heapq.nsmallest(
+                remaining_slots, new_items, key=lambda x: x.difficulty_score
+            ))
         
         return result[:max_items]
     
@@ -288,6 +348,51 @@ class SM2Algorithm:
         else:
             return "novice", mastery_score
     
+    def calculate_retention_rates(
+        self,
+        items: Sequence[ReviewItem],
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """calculate_retention_rate'in vektörel karşılığı"""
+        if not items:
+            return np.empty(0, dtype=np.float64)
+        
+        now_ts = (now or datetime.now()).timestamp()
+        nan = float("nan")
+        last = np.array(
+            [item.last_review.timestamp() if item.last_review else nan for item in items],
+            dtype=np.float64
+        )
+        scheduled = np.array([item.next_review is not None for item in items])
+        stability = np.array(
+            [item.ease_factor * max(item.interval, 1) for item in items], dtype=np.float64
+        )
+        
+        reviewed = ~np.isnan(last)
+        days = np.floor((now_ts - np.where(reviewed, last, now_ts)) / 86400.0)
+        retention = np.clip(np.exp(-days / stability), 0.0, 1.0)
+        
+        return np.where(reviewed, retention, np.where(scheduled, 0.5, 1.0))
+    
+    def get_mastery_scores(
+        self,
+        items: Sequence[ReviewItem],
+        now: Optional[datetime] = None
+    ) -> np.ndarray:
+        """get_mastery_level skorlarının vektörel karşılığı"""
+        if not items:
+            return np.empty(0, dtype=np.float64)
+        
+        retention = self.calculate_retention_rates(items, now)
+        correct = np.array([item.correct_reviews for item in items], dtype=np.float64)
+        total = np.array([max(item.total_reviews, 1) for item in items], dtype=np.float64)
+        ease = np.array([item.ease_factor for item in items], dtype=np.float64)
+        ease_normalized = (ease - self.MIN_EASE_FACTOR) / (
+            self.MAX_EASE_FACTOR - self.MIN_EASE_FACTOR
+        )
+        
+        return retention * 0.4 + (correct / total) * 0.4 + ease_normalized * 0.2
+    
     def get_study_stats(
         self,
         items: List[ReviewItem]
@@ -305,13 +410,21 @@ class SM2Algorithm:
         
         now = datetime.now()
         
-        mastered = sum(1 for item in items if self.get_mastery_level(item)[0] == "mastered")
-        due_today = sum(1 for item in items 
-                       if item.next_review and item.next_review.date() == now.date())
-        overdue = sum(1 for item in items 
+        retention = self.calculate_retention_rates(items, now)
+        scores = self.get_mastery_scores(items, now)
+        
+        # Seviye sınırları: novice < 0.25 <= learning < 0.5 <= developing < 0.75 <= proficient < 0.9 <= mastered
+        level_counts = np.bincount(
+            np.searchsorted([0.25, 0.5, 0.75, 0.9], scores, side="right"), minlength=5
+        )
+        novice, learning, developing, proficient, mastered = (int(c) for c in level_counts)
+        
+        today = now.date()
+        due_today = sum(1 for item in items
+                       if item.next_review and item.next_review.date() == today)
+        overdue = sum(1 for item in items
                      if item.next_review and item.next_review < now)
         
-        avg_retention = sum(self.calculate_retention_rate(item) for item in items) / len(items)
         avg_ease = sum(item.ease_factor for item in items) / len(items)
         
         return {
@@ -320,14 +433,14 @@ class SM2Algorithm:
             "mastery_percentage": mastered / len(items) * 100,
             "due_today": due_today,
             "overdue_count": overdue,
-            "average_retention": avg_retention,
+            "average_retention": float(retention.mean()),
             "average_ease": avg_ease,
             "levels": {
                 "mastered": mastered,
-                "proficient": sum(1 for item in items if self.get_mastery_level(item)[0] == "proficient"),
-                "developing": sum(1 for item in items if self.get_mastery_level(item)[0] == "developing"),
-                "learning": sum(1 for item in items if self.get_mastery_level(item)[0] == "learning"),
-                "novice": sum(1 for item in items if self.get_mastery_level(item)[0] == "novice"),
+                "proficient": proficient,
+                "developing": developing,
+                "learning": learning,
+                "novice": novice,
             }
         }
     
@@ -343,40 +456,44 @@ class SM2Algorithm:
         Returns:
             Her gün için öğe listesi
         """
-        daily_capacity = daily_minutes // avg_item_minutes
+        daily_capacity = max(1, daily_minutes // avg_item_minutes)
+        
+        scheduled = [item for item in items if item.next_review]
+        if not scheduled:
+            return []
         
         # Öğeleri sonraki tekrar tarihine göre sırala
-        sorted_items = sorted(
-            [item for item in items if item.next_review],
-            key=lambda x: x.next_review
-        )
+        timestamps = np.array([item.next_review.timestamp() for item in scheduled])
+        order = np.argsort(timestamps, kind="stable")
         
         # Günlük grupla
-        schedule: Dict[datetime.date, List[ReviewItem]] = {}
+        schedule: Dict[Any, List[ReviewItem]] = {}
+        for index in order:
+            item = scheduled[index]
+            schedule.setdefault(item.next_review.date(), []).append(item)
         
-        for item in sorted_items:
-            day = item.next_review.date()
-            if day not in schedule:
-                schedule[day] = []
-            schedule[day].append(item)
-        
-        # Yoğun günleri dağıt
+        # Yoğun günleri dağıt: fazla öğeler sonraki güne devreder
         result = []
-        for day in sorted(schedule.keys()):
-            day_items = schedule[day]
+        days = sorted(schedule)
+        position = 0
+        day = days[0]
+        overflow: List[ReviewItem] = []
+        
+        while position < len(days) or overflow:
+            day_items = []
+            if position < len(days) and days[position] == day:
+                day_items = schedule[day]
+                position += 1
+            day_items = day_items + overflow
             
-            if len(day_items) <= daily_capacity:
-                result.append(day_items)
-            else:
-                # Fazla öğeleri sonraki günlere taşı
+            if day_items:
                 result.append(day_items[:daily_capacity])
-                overflow = day_items[daily_capacity:]
-                
-                # Overflow'u dağıt
-                next_day = day + timedelta(days=1)
-                if next_day not in schedule:
-                    schedule[next_day] = []
-                schedule[next_day].extend(overflow)
+            overflow = day_items[daily_capacity:]
+            
+            if overflow or position >= len(days):
+                day = day + timedelta(days=1)
+            else:
+                day = days[position]
         
         return result
 
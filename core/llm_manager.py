@@ -723,6 +723,11 @@ class LLMManager:
                 return self.chat(messages, temperature, max_tokens)
             raise
     
+    @property
+    def current_model(self) -> str:
+        """Şu an kullanılan model (failover sonrası backup olabilir)."""
+        return self._current_model
+    
     def get_status(self) -> dict:
         """Sistem durumunu döndür."""
         avg_latency = (
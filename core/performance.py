@@ -4,7 +4,7 @@ Endüstri Standartlarında Performans Optimizasyonu
 
 ENTERPRISE FEATURES:
 - Connection pooling for all HTTP clients
-- Request deduplication
+- Request deduplication (sync + asyncio single-flight, stream fan-out)
 - Batch operation queuing
 - Performance monitoring & metrics
 - Automatic resource cleanup
@@ -12,10 +12,12 @@ ENTERPRISE FEATURES:
 - Rate limiting
 """
 
+import asyncio
+import json
 import time
 import threading
 import hashlib
-from typing import Dict, Any, Optional, Callable, List, Tuple
+from typing import Dict, Any, Optional, Callable, List, Tuple, AsyncIterator, Awaitable, Iterable
 from collections import defaultdict, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -174,6 +176,205 @@ class RequestDeduplicator:
             cleanup_thread.start()
 
 
+def normalize_request_text(text: str) -> str:
+    """Coalescing anahtarı için metni normalize et (boşluk + büyük/küçük harf)."""
+    return " ".join((text or "").split()).casefold()
+
+
+def make_request_key(*parts: Any) -> str:
+    """
+    Parçalardan deterministik istek anahtarı üret.
+    
+    Dict'ler anahtar sırasından bağımsızdır; JSON'a çevrilemeyen değerler
+    str() ile temsil edilir.
+    """
+    data = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()[:32]
+
+
+class AsyncSingleFlight:
+    """
+    RequestDeduplicator'ın asyncio karşılığı.
+    
+    Aynı anahtarla eşzamanlı gelen çağrılardan yalnızca ilki (leader)
+    çalışır; diğerleri (follower) aynı sonucu/hatayı bekler. İş ayrı bir
+    task'ta yürür, böylece leader'ın bağlantısı kopsa da follower'lar
+    sonucu alır. İş bitince anahtar hemen silinir: sonuç önbelleğe alınmaz,
+    sonradan gelen istek yeniden çalıştırır.
+    
+    Not: Sonuç nesnesi tüm bekleyenlerle paylaşılır, çağıranlar
+    değiştirmemelidir.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {"leaders": 0, "followers": 0}
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """fn()'i anahtar başına tek sefer çalıştır ve sonucunu paylaş."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+            self.stats["leaders"] += 1
+        else:
+            self.stats["followers"] += 1
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: str, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # Kimse beklemiyorsa "never retrieved" uyarısını önle
+    
+    def in_flight(self) -> int:
+        """Süren iş sayısı."""
+        return len(self._inflight)
+
+
+class _SharedStream:
+    """Bir leader stream'inin tamponu ve abone durumu."""
+    
+    def __init__(self):
+        self.events: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.changed = asyncio.Condition()
+        self.task: Optional[asyncio.Task] = None
+
+
+class StreamCoalescer:
+    """
+    Aynı anahtarlı eşzamanlı stream'leri tek üretimde birleştirir.
+    
+    İlk abone üreticiyi (async iterator factory) arka plan task'ında
+    başlatır; üretilen her olay tamponlanır. Sonradan katılan abone
+    tamponu baştan oynatır ve canlı olaylara devam eder, yani her abone
+    tam yanıtı alır. Tüm aboneler ayrılırsa üretim iptal edilir ve anahtar
+    hemen bırakılır (geç gelen abone yeni bir üretim başlatır); üretim
+    bitince anahtar silinir.
+    """
+    
+    def __init__(self):
+        self._streams: Dict[str, _SharedStream] = {}
+        self.stats = {"leaders": 0, "followers": 0, "cancelled": 0}
+    
+    async def subscribe(
+        self,
+        key: str,
+        factory: Callable[[], AsyncIterator[Any]]
+    ) -> AsyncIterator[Any]:
+        """Anahtarın paylaşılan stream'ine abone ol (gerekirse başlat)."""
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = _SharedStream()
+            self._streams[key] = stream
+            stream.task = asyncio.ensure_future(self._pump(key, stream, factory))
+            self.stats["leaders"] += 1
+        else:
+            self.stats["followers"] += 1
+        
+        stream.subscribers += 1
+        index = 0
+        try:
+            while True:
+                async with stream.changed:
+                    await stream.changed.wait_for(
+                        lambda: index < len(stream.events) or stream.done
+                    )
+                while index < len(stream.events):
+                    event = stream.events[index]
+                    index += 1
+                    yield event
+                if stream.done and index >= len(stream.events):
+                    if stream.error is not None:
+                        raise stream.error
+                    return
+        finally:
+            stream.subscribers -= 1
+            if stream.subscribers == 0 and not stream.done and stream.task:
+                stream.task.cancel()
+                self.stats["cancelled"] += 1
+                # İptal tamamlanmadan gelen abone ölmekte olan stream'e katılmasın
+                if self._streams.get(key) is stream:
+                    del self._streams[key]
+    
+    async def _pump(self, key: str, stream: _SharedStream, factory: Callable[[], AsyncIterator[Any]]):
+        try:
+            async for event in factory():
+                stream.events.append(event)
+                async with stream.changed:
+                    stream.changed.notify_all()
+        except asyncio.CancelledError:
+            stream.error = stream.error or ConnectionAbortedError("stream cancelled")
+        except Exception as e:
+            stream.error = e
+        finally:
+            stream.done = True
+            if self._streams.get(key) is stream:
+                del self._streams[key]
+            async with stream.changed:
+                stream.changed.notify_all()
+    
+    def in_flight(self) -> int:
+        """Süren stream sayısı."""
+        return len(self._streams)
+
+
+async def iterate_in_thread(factory: Callable[[], Iterable[Any]]) -> AsyncIterator[Any]:
+    """
+    Senkron (bloklayan) bir iterator'ı thread'de çalıştırıp async olarak tüket.
+    
+    Event loop her eleman arasında bloklanmaz; tüketici ayrılırsa thread
+    bir sonraki elemanda durur ve iterator'ı close() ile kapatır (ör. açık
+    HTTP stream'i GC'yi beklemeden bırakılır).
+    """
+    loop = asyncio.get_running_loop()
+    items: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    end = object()
+    
+    def put(item, error=None):
+        try:
+            loop.call_soon_threadsafe(items.put_nowait, (item, error))
+        except RuntimeError:
+            stop.set()  # Loop kapandı
+    
+    def worker():
+        iterator = None
+        try:
+            iterator = iter(factory())
+            for item in iterator:
+                if stop.is_set():
+                    return
+                put(item)
+        except Exception as e:
+            put(end, e)
+        else:
+            put(end)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
+    
+    loop.run_in_executor(None, worker)
+    try:
+        while True:
+            item, error = await items.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
 class PerformanceMetrics:
     """
     Performans metrikleri toplama ve raporlama.
@@ -416,6 +617,8 @@ circuit_breaker = CircuitBreaker()
 rate_limiter = RateLimiter()
 performance_metrics = PerformanceMetrics()
 request_deduplicator = RequestDeduplicator()
+request_coalescer = AsyncSingleFlight()
+stream_coalescer = StreamCoalescer()
 
 
 __all__ = [
@@ -423,7 +626,12 @@ __all__ = [
     "RateLimiter",
     "PerformanceMetrics",
     "RequestDeduplicator",
+    "AsyncSingleFlight",
+    "StreamCoalescer",
     "BatchProcessor",
+    "normalize_request_text",
+    "make_request_key",
+    "iterate_in_thread",
     "timed",
     "rate_limited",
     "circuit_protected",
@@ -431,4 +639,6 @@ __all__ = [
     "rate_limiter",
     "performance_metrics",
     "request_deduplicator",
+    "request_coalescer",
+    "stream_coalescer",
 ]
@@ -5,12 +5,15 @@ API isteklerini sınırlandırma
 DDoS koruması ve adil kullanım.
 """
 
+import json
+import math
+import sqlite3
 import time
 import threading
-from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Callable
+from pathlib import Path
+from typing import Dict, List, Optional, Callable, Tuple
 from functools import wraps
 
 
@@ -24,48 +27,357 @@ class RateLimitConfig:
     cooldown_seconds: int = 60  # Aşım sonrası bekleme
 
 
+# =============================================================================
+# GCRA ENGINE
+# =============================================================================
+
+@dataclass(frozen=True)
+class RateWindow:
+    """Tek bir limit penceresi: `period` saniyede en fazla `limit` istek."""
+    name: str
+    limit: int
+    period: float
+    
+    @property
+    def emission_interval(self) -> float:
+        return self.period / max(1, self.limit)
+
+
+@dataclass
+class RateDecision:
+    """GCRA karar sonucu."""
+    allowed: bool
+    window: Optional[str] = None  # Reddeden pencere
+    retry_after: float = 0.0      # Saniye
+
+
+class MemoryRateStore:
+    """
+    Süreç içi GCRA durumu.
+    
+    Anahtar başına pencere -> TAT (theoretical arrival time) sözlüğü tutar;
+    bellek kullanımı anahtar başına sabittir.
+    """
+    
+    def __init__(self):
+        self._state: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def update(self, key: str, fn: Callable[[Dict[str, float]], Tuple[Dict[str, float], object]]):
+        """fn(mevcut_durum) -> (yeni_durum, sonuç) işlemini atomik uygula."""
+        with self._lock:
+            current = self._state.get(key, {})
+            new_state, result = fn(dict(current))
+            if new_state:
+                self._state[key] = new_state
+            else:
+                self._state.pop(key, None)
+            return result
+    
+    def get(self, key: str) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._state.get(key, {}))
+    
+    def delete(self, key: str):
+        with self._lock:
+            self._state.pop(key, None)
+    
+    def evict_idle(self, now: float) -> int:
+        """Tüm TAT'ları geçmişte kalan anahtarları sil."""
+        with self._lock:
+            idle = [k for k, tats in self._state.items() if max(tats.values(), default=0) <= now]
+            for key in idle:
+                del self._state[key]
+            return len(idle)
+    
+    def __len__(self) -> int:
+        return len(self._state)
+
+
+class SQLiteRateStore:
+    """
+    SQLite tabanlı GCRA durumu.
+    
+    Limitler yeniden başlatmalardan sonra korunur ve aynı veritabanını
+    kullanan worker süreçleri arasında paylaşılır. Her güncelleme
+    BEGIN IMMEDIATE transaction'ı içinde yapılır.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                key TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rate_limits_expires ON rate_limits(expires_at)")
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def update(self, key: str, fn: Callable[[Dict[str, float]], Tuple[Dict[str, float], object]]):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT state FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            current = json.loads(row[0]) if row else {}
+            new_state, result = fn(current)
+            if new_state:
+                conn.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, state, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(new_state), max(new_state.values()))
+                )
+            elif row:
+                conn.execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+            conn.execute("COMMIT")
+            return result
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def get(self, key: str) -> Dict[str, float]:
+        row = self._connect().execute("SELECT state FROM rate_limits WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else {}
+    
+    def delete(self, key: str):
+        self._connect().execute("DELETE FROM rate_limits WHERE key = ?", (key,))
+    
+    def evict_idle(self, now: float) -> int:
+        cursor = self._connect().execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,))
+        return cursor.rowcount
+    
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM rate_limits").fetchone()[0]
+
+
+class GCRALimiter:
+    """
+    Çok pencereli GCRA (Generic Cell Rate Algorithm) limiter.
+    
+    Her anahtar ve pencere için tek bir TAT değeri saklanır; kontrol O(1),
+    bellek anahtar başına sabittir. Tüm pencereler izin verirse istek
+    tüketilir. Boşta kalan anahtarlar periyodik olarak silinir.
+    
+    Bir anahtar `block()` ile geçici olarak kilitlenebilir (cooldown).
+    """
+    
+    BLOCK_KEY = "__blocked__"
+    
+    def __init__(
+        self,
+        windows: List[RateWindow],
+        store=None,
+        evict_interval: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.windows = list(windows)
+        self.store = store if store is not None else MemoryRateStore()
+        self.evict_interval = evict_interval
+        self._clock = clock
+        self._last_evict = clock()
+    
+    def _decide(self, tats: Dict[str, float], now: float, cost: int) -> RateDecision:
+        blocked_until = tats.get(self.BLOCK_KEY, 0.0)
+        if blocked_until > now:
+            return RateDecision(False, self.BLOCK_KEY, blocked_until - now)
+        
+        for window in self.windows:
+            tat = max(tats.get(window.name, now), now)
+            new_tat = tat + cost * window.emission_interval
+            if new_tat - now > window.period:
+                retry_after = new_tat - now - window.period
+                return RateDecision(False, window.name, retry_after)
+        return RateDecision(True)
+    
+    def _consume(self, tats: Dict[str, float], now: float, cost: int) -> Dict[str, float]:
+        for window in self.windows:
+            tat = max(tats.get(window.name, now), now)
+            tats[window.name] = tat + cost * window.emission_interval
+        return self._prune(tats, now)
+    
+    @staticmethod
+    def _prune(tats: Dict[str, float], now: float) -> Dict[str, float]:
+        return {name: tat for name, tat in tats.items() if tat > now}
+    
+    def _maybe_evict(self, now: float):
+        if now - self._last_evict >= self.evict_interval:
+            self._last_evict = now
+            self.store.evict_idle(now)
+    
+    def peek(self, key: str, cost: int = 1) -> RateDecision:
+        """İsteği tüketmeden izin verilip verilmeyeceğini kontrol et."""
+        now = self._clock()
+        return self._decide(self.store.get(key), now, cost)
+    
+    def acquire(self, key: str, cost: int = 1) -> RateDecision:
+        """Kontrol et ve izin verilirse atomik olarak tüket."""
+        now = self._clock()
+        self._maybe_evict(now)
+        
+        def apply(tats):
+            decision = self._decide(tats, now, cost)
+            if decision.allowed:
+                return self._consume(tats, now, cost), decision
+            return self._prune(tats, now), decision
+        
+        return self.store.update(key, apply)
+    
+    def consume(self, key: str, cost: int = 1):
+        """Kontrol etmeden tüket (istek zaten kabul edildiyse)."""
+        now = self._clock()
+        self._maybe_evict(now)
+        self.store.update(key, lambda tats: (self._consume(tats, now, cost), None))
+    
+    def block(self, key: str, seconds: float):
+        """Anahtarı `seconds` boyunca kilitle."""
+        now = self._clock()
+        
+        def apply(tats):
+            tats[self.BLOCK_KEY] = max(tats.get(self.BLOCK_KEY, 0.0), now + seconds)
+            return self._prune(tats, now), None
+        
+        self.store.update(key, apply)
+    
+    def blocked_until(self, key: str) -> Optional[float]:
+        """Kilit bitiş zamanı (epoch saniye) veya None."""
+        until = self.store.get(key).get(self.BLOCK_KEY, 0.0)
+        return until if until > self._clock() else None
+    
+    def usage(self, key: str) -> Dict[str, int]:
+        """Pencere başına tahmini kullanılan istek sayısı."""
+        now = self._clock()
+        tats = self.store.get(key)
+        usage = {}
+        for window in self.windows:
+            backlog = max(tats.get(window.name, now) - now, 0.0)
+            usage[window.name] = min(window.limit, math.ceil(backlog / window.emission_interval - 1e-9))
+        return usage
+    
+    def reset(self, key: str):
+        self.store.delete(key)
+    
+    def evict_idle(self) -> int:
+        return self.store.evict_idle(self._clock())
+    
+    def __len__(self) -> int:
+        return len(self.store)
+
+
+class _RollingCounter:
+    """Sabit sayıda zaman kovası ile kayan pencere sayacı."""
+    
+    def __init__(self, bucket_seconds: float, buckets: int):
+        self.bucket_seconds = bucket_seconds
+        self._counts = [0] * buckets
+        self._stamps = [-1] * buckets
+    
+    def add(self, now: float, amount: int = 1):
+        slot = int(now // self.bucket_seconds)
+        i = slot % len(self._counts)
+        if self._stamps[i] != slot:
+            self._stamps[i] = slot
+            self._counts[i] = 0
+        self._counts[i] += amount
+    
+    def total(self, now: float) -> int:
+        current = int(now // self.bucket_seconds)
+        oldest = current - len(self._counts) + 1
+        return sum(c for c, s in zip(self._counts, self._stamps) if oldest <= s <= current)
+
+
+# =============================================================================
+# RATE LIMITER
+# =============================================================================
+
 @dataclass
 class ClientState:
-    """İstemci durumu."""
-    minute_requests: list = field(default_factory=list)
-    hour_requests: list = field(default_factory=list)
-    day_requests: list = field(default_factory=list)
+    """İstemci durumu (süreç içi sayaçlar)."""
     is_blocked: bool = False
     blocked_until: Optional[datetime] = None
     total_requests: int = 0
     total_blocked: int = 0
+    last_seen: float = field(default_factory=time.time)
 
 
 class RateLimiter:
-    """Rate limiting yöneticisi."""
+    """
+    Rate limiting yöneticisi.
+    
+    Dakika/saat/gün ve burst pencereleri GCRA ile uygulanır: istemci başına
+    sabit bellek, O(1) kontrol. `db_path` verilirse limit durumu SQLite'ta
+    tutulur ve süreçler/yeniden başlatmalar arasında paylaşılır.
+    """
+    
+    BURST_PERIOD = 5  # saniye
     
-    def __init__(self, config: RateLimitConfig = None):
+    def __init__(
+        self,
+        config: RateLimitConfig = None,
+        db_path: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Rate limiter başlat.
         
         Args:
             config: Rate limit ayarları
+            db_path: Opsiyonel SQLite dosyası (paylaşımlı/kalıcı mod)
+            clock: Zaman kaynağı (epoch saniye)
         """
         self.config = config or RateLimitConfig()
-        self._clients: Dict[str, ClientState] = defaultdict(ClientState)
+        self._clock = clock
+        store = SQLiteRateStore(db_path) if db_path else MemoryRateStore()
+        
+        self._limits = GCRALimiter([
+            RateWindow("minute", self.config.requests_per_minute, 60),
+            RateWindow("hour", self.config.requests_per_hour, 3600),
+            RateWindow("day", self.config.requests_per_day, 86400),
+        ], store=store, clock=clock)
+        self._burst = GCRALimiter([
+            RateWindow("burst", self.config.burst_limit, self.BURST_PERIOD),
+        ], store=MemoryRateStore(), clock=clock)
+        
+        self._clients: Dict[str, ClientState] = {}
         self._lock = threading.Lock()
-        self._global_requests: list = []
+        self._global_minute = _RollingCounter(1, 60)
+        self._global_hour = _RollingCounter(60, 60)
+        self._last_evict = clock()
     
-    def _clean_old_requests(self, state: ClientState, now: datetime):
-        """Eski istekleri temizle."""
-        minute_ago = now - timedelta(minutes=1)
-        hour_ago = now - timedelta(hours=1)
-        day_ago = now - timedelta(days=1)
-        
-        state.minute_requests = [
-            t for t in state.minute_requests if t > minute_ago
-        ]
-        state.hour_requests = [
-            t for t in state.hour_requests if t > hour_ago
-        ]
-        state.day_requests = [
-            t for t in state.day_requests if t > day_ago
-        ]
+    _BLOCK_MESSAGES = {
+        "minute": ("Dakikalık limit aşıldı.", 1),
+        "hour": ("Saatlik limit aşıldı.", 5),
+        "day": ("Günlük limit aşıldı.", None),
+    }
+    
+    def _client(self, client_id: str) -> ClientState:
+        state = self._clients.get(client_id)
+        if state is None:
+            state = self._clients[client_id] = ClientState()
+        state.last_seen = self._clock()
+        return state
+    
+    def _evict_idle_clients(self, now: float):
+        """Limit durumu boşalmış ve bloklu olmayan istemcileri unut."""
+        if now - self._last_evict < self._limits.evict_interval:
+            return
+        self._last_evict = now
+        idle_after = now - self.BURST_PERIOD
+        for client_id in [
+            cid for cid, state in self._clients.items()
+            if not state.is_blocked and state.last_seen < idle_after and not self._limits.store.get(cid)
+        ]:
+            del self._clients[client_id]
     
     def check_limit(self, client_id: str) -> tuple[bool, Optional[str]]:
         """
@@ -78,43 +390,32 @@ class RateLimiter:
             (izin_var_mı, hata_mesajı)
         """
         with self._lock:
-            now = datetime.now()
-            state = self._clients[client_id]
-            
-            # Check if blocked
-            if state.is_blocked:
-                if state.blocked_until and now < state.blocked_until:
-                    remaining = (state.blocked_until - now).seconds
-                    return False, f"Rate limit aşıldı. {remaining} saniye bekleyin."
-                else:
-                    state.is_blocked = False
-                    state.blocked_until = None
+            now = self._clock()
+            self._evict_idle_clients(now)
+            state = self._client(client_id)
             
-            # Clean old requests
-            self._clean_old_requests(state, now)
+            decision = self._limits.peek(client_id)
             
-            # Check limits
-            if len(state.minute_requests) >= self.config.requests_per_minute:
+            # Check if blocked
+            if decision.window == GCRALimiter.BLOCK_KEY:
                 state.is_blocked = True
-                state.blocked_until = now + timedelta(seconds=self.config.cooldown_seconds)
-                state.total_blocked += 1
-                return False, "Dakikalık limit aşıldı."
+                state.blocked_until = datetime.fromtimestamp(now + decision.retry_after)
+                return False, f"Rate limit aşıldı. {int(decision.retry_after)} saniye bekleyin."
+            state.is_blocked = False
+            state.blocked_until = None
             
-            if len(state.hour_requests) >= self.config.requests_per_hour:
-                state.is_blocked = True
-                state.blocked_until = now + timedelta(seconds=self.config.cooldown_seconds * 5)
-                state.total_blocked += 1
-                return False, "Saatlik limit aşıldı."
-            
-            if len(state.day_requests) >= self.config.requests_per_day:
+            # Check limits
+            if not decision.allowed:
+                message, multiplier = self._BLOCK_MESSAGES[decision.window]
+                cooldown = self.config.cooldown_seconds * multiplier if multiplier else 3600
+                self._limits.block(client_id, cooldown)
                 state.is_blocked = True
-                state.blocked_until = now + timedelta(hours=1)
+                state.blocked_until = datetime.fromtimestamp(now + cooldown)
                 state.total_blocked += 1
-                return False, "Günlük limit aşıldı."
+                return False, message
             
             # Check burst
-            recent = [t for t in state.minute_requests if t > now - timedelta(seconds=5)]
-            if len(recent) >= self.config.burst_limit:
+            if not self._burst.peek(client_id).allowed:
                 return False, "Çok hızlı istek gönderiyorsunuz. Lütfen yavaşlayın."
             
             return True, None
@@ -127,15 +428,15 @@ class RateLimiter:
             client_id: İstemci tanımlayıcısı
         """
         with self._lock:
-            now = datetime.now()
-            state = self._clients[client_id]
+            now = self._clock()
+            state = self._client(client_id)
             
-            state.minute_requests.append(now)
-            state.hour_requests.append(now)
-            state.day_requests.append(now)
+            self._limits.consume(client_id)
+            self._burst.consume(client_id)
             state.total_requests += 1
             
-            self._global_requests.append(now)
+            self._global_minute.add(now)
+            self._global_hour.add(now)
     
     def get_client_stats(self, client_id: str) -> Dict:
         """
@@ -148,19 +449,19 @@ class RateLimiter:
             İstatistikler
         """
         with self._lock:
-            now = datetime.now()
-            state = self._clients[client_id]
-            self._clean_old_requests(state, now)
+            state = self._clients.get(client_id) or ClientState()
+            usage = self._limits.usage(client_id)
+            blocked_until = self._limits.blocked_until(client_id)
             
             return {
                 "client_id": client_id,
-                "minute_requests": len(state.minute_requests),
-                "hour_requests": len(state.hour_requests),
-                "day_requests": len(state.day_requests),
+                "minute_requests": usage["minute"],
+                "hour_requests": usage["hour"],
+                "day_requests": usage["day"],
                 "total_requests": state.total_requests,
                 "total_blocked": state.total_blocked,
-                "is_blocked": state.is_blocked,
-                "blocked_until": state.blocked_until.isoformat() if state.blocked_until else None,
+                "is_blocked": blocked_until is not None,
+                "blocked_until": datetime.fromtimestamp(blocked_until).isoformat() if blocked_until else None,
                 "limits": {
                     "per_minute": self.config.requests_per_minute,
                     "per_hour": self.config.requests_per_hour,
@@ -176,23 +477,14 @@ class RateLimiter:
             Global istatistikler
         """
         with self._lock:
-            now = datetime.now()
-            minute_ago = now - timedelta(minutes=1)
-            hour_ago = now - timedelta(hours=1)
-            
-            # Clean old global requests
-            self._global_requests = [
-                t for t in self._global_requests if t > hour_ago
-            ]
-            
-            recent_minute = [t for t in self._global_requests if t > minute_ago]
-            
+            now = self._clock()
             return {
                 "total_clients": len(self._clients),
-                "requests_last_minute": len(recent_minute),
-                "requests_last_hour": len(self._global_requests),
+                "requests_last_minute": self._global_minute.total(now),
+                "requests_last_hour": self._global_hour.total(now),
                 "blocked_clients": sum(
-                    1 for s in self._clients.values() if s.is_blocked
+                    1 for s in self._clients.values()
+                    if s.is_blocked and s.blocked_until and s.blocked_until.timestamp() > now
                 ),
             }
     
@@ -204,8 +496,9 @@ class RateLimiter:
             client_id: İstemci tanımlayıcısı
         """
         with self._lock:
-            if client_id in self._clients:
-                del self._clients[client_id]
+            self._clients.pop(client_id, None)
+            self._limits.reset(client_id)
+            self._burst.reset(client_id)
     
     def whitelist_client(self, client_id: str):
         """İstemciyi beyaz listeye al (limit yok)."""
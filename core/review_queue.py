@@ -0,0 +1,244 @@
+"""
+📅 Review Queue - Vade Sıralı Tekrar İndeksi
+=============================================
+
+Aralıklı tekrar kartları için kalıcı öncelik kuyruğu.
+
+Prensipler:
+- Kartlar vade zamanına göre bir min-heap'te tutulur; vadesi gelenler
+  her çağrıda tüm desteyi taramadan O(k log n) ile alınır
+- Güncellemeler tembel geçersizleme ile yapılır: eski heap kayıtları
+  çekildiğinde atlanır, kart vadesi dışarıdan değiştiyse kendini onarır
+- `max_urgency_days`'ten fazla gecikmiş kartların aciliyeti eşittir; bu
+  kartlar zorluk önceliğine göre ayrı bir heap'e bir kez taşınır
+
+Kullanım:
+    queue = ReviewQueue()
+    queue.push(item)                   # ekle / yeniden indeksle
+    due = queue.get_due(max_items=20)  # gecikme ve zorluk sıralı
+"""
+
+import heapq
+import itertools
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return value.timestamp() if value is not None else None
+
+
+class ReviewQueue:
+    """
+    Vade zamanı ve aciliyete göre sıralı tekrar kuyruğu.
+
+    Sıralama SM-2 `get_due_items` ile aynıdır:
+    1. Gecikmiş öğeler (gecikme günü azalan, `max_urgency_days` ile sınırlı)
+    2. Eşit aciliyette düşük öncelik değeri (zorluk) önce
+    3. Yeni öğeler (vadesi olmayan) önceliğe göre
+    """
+
+    DAY_SECONDS = 86400
+
+    def __init__(
+        self,
+        key: Callable[[Any], str] = attrgetter("item_id"),
+        priority: Callable[[Any], float] = attrgetter("difficulty_score"),
+        max_urgency_days: int = 30,
+    ):
+        self._key = key
+        self._priority = priority
+        self.max_urgency_days = max_urgency_days
+
+        self._items: Dict[str, Any] = {}
+        self._indexed_due: Dict[str, Optional[float]] = {}
+        self._due_heap: List[Tuple[float, int, str]] = []
+        # Aciliyeti sınırda olan öğeler: (öncelik, sıra, id, vade)
+        self._capped_heap: List[Tuple[float, int, str, float]] = []
+        self._new: Dict[str, Any] = {}
+        self._seq = itertools.count()
+
+    # ------------------------------------------------------------------
+    # Bakım
+    # ------------------------------------------------------------------
+
+    def push(self, item: Any) -> None:
+        """Öğeyi ekle veya güncel vadesiyle yeniden indeksle."""
+        item_id = self._key(item)
+        self._items[item_id] = item
+        due = _timestamp(item.next_review)
+        self._indexed_due[item_id] = due
+
+        if due is None:
+            self._new[item_id] = item
+            return
+
+        self._new.pop(item_id, None)
+        heapq.heappush(self._due_heap, (due, next(self._seq), item_id))
+        self._maybe_compact()
+
+    def remove(self, item_id: str) -> None:
+        """Öğeyi kuyruktan çıkar (heap kayıtları tembel temizlenir)."""
+        self._items.pop(item_id, None)
+        self._indexed_due.pop(item_id, None)
+        self._new.pop(item_id, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._indexed_due.clear()
+        self._due_heap.clear()
+        self._capped_heap.clear()
+        self._new.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._items
+
+    def items(self) -> List[Any]:
+        """İndeksteki tüm öğeler."""
+        return list(self._items.values())
+
+    def _maybe_compact(self) -> None:
+        """Geçersiz kayıtlar birikince heap'leri yeniden kur."""
+        if len(self._due_heap) + len(self._capped_heap) <= 2 * len(self._items) + 64:
+            return
+
+        self._due_heap = [e for e in self._due_heap if self._current(e[2], e[0])]
+        self._capped_heap = [e for e in self._capped_heap if self._current(e[2], e[3])]
+        heapq.heapify(self._due_heap)
+        heapq.heapify(self._capped_heap)
+
+    def _current(self, item_id: str, due: float) -> bool:
+        """Kayıt öğenin güncel indeks durumunu mu gösteriyor?"""
+        return self._indexed_due.get(item_id) == due and item_id in self._items
+
+    def _valid(self, item_id: str, due: float) -> bool:
+        """
+        Kayıt geçerli mi? Öğenin vadesi indeks dışında değiştiyse
+        (doğrudan algoritma çağrısı gibi) öğe yeniden indekslenir.
+        """
+        if not self._current(item_id, due):
+            return False
+        item = self._items[item_id]
+        if _timestamp(item.next_review) != due:
+            self.push(item)
+            return False
+        return True
+
+    def _migrate(self, now_ts: float) -> None:
+        """Aciliyet sınırını aşan öğeleri öncelik heap'ine taşı."""
+        limit = now_ts - self.max_urgency_days * self.DAY_SECONDS
+        while self._due_heap and self._due_heap[0][0] <= limit:
+            due, _, item_id = heapq.heappop(self._due_heap)
+            if self._valid(item_id, due):
+                item = self._items[item_id]
+                heapq.heappush(
+                    self._capped_heap,
+                    (self._priority(item), next(self._seq), item_id, due)
+                )
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+
+    def _urgency(self, item: Any, now: datetime) -> int:
+        return min((now - item.next_review).days, self.max_urgency_days)
+
+    def get_due(
+        self,
+        max_items: int = 20,
+        include_new: bool = True,
+        now: Optional[datetime] = None,
+    ) -> List[Any]:
+        """
+        Vadesi gelmiş en acil `max_items` öğe.
+
+        Sadece döndürülen öğeler ve son aciliyet grubu ziyaret edilir;
+        çekilen kayıtlar sonunda heap'lere geri konur.
+        """
+        now = now or datetime.now()
+        now_ts = now.timestamp()
+        self._migrate(now_ts)
+
+        result: List[Any] = []
+        popped_capped = []
+        while self._capped_heap and len(result) < max_items:
+            entry = heapq.heappop(self._capped_heap)
+            priority, _, item_id, due = entry
+            if not self._valid(item_id, due):
+                continue
+            item = self._items[item_id]
+            if self._priority(item) != priority:
+                heapq.heappush(self._capped_heap, (self._priority(item), next(self._seq), item_id, due))
+                continue
+            popped_capped.append(entry)
+            result.append(item)
+
+        popped_due = []
+        collected: List[Tuple[int, Any]] = []
+        remaining = max_items - len(result)
+        while remaining > 0 and self._due_heap and self._due_heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._due_heap)
+            due, _, item_id = entry
+            if not self._valid(item_id, due):
+                continue
+            popped_due.append(entry)
+            item = self._items[item_id]
+            urgency = self._urgency(item, now)
+            # Son aciliyet grubu tamamlanınca dur
+            if len(collected) >= remaining and urgency != collected[-1][0]:
+                break
+            collected.append((urgency, item))
+
+        collected.sort(key=lambda pair: (-pair[0], self._priority(pair[1])))
+        result.extend(item for _, item in collected[:remaining])
+
+        for entry in popped_capped:
+            heapq.heappush(self._capped_heap, entry)
+        for entry in popped_due:
+            heapq.heappush(self._due_heap, entry)
+
+        remaining = max_items - len(result)
+        if include_new and remaining > 0 and self._new:
+            result.extend(heapq.nsmallest(remaining, self._new.values(), key=self._priority))
+
+        return result[:max_items]
+
+    def due(self, now: Optional[datetime] = None) -> List[Any]:
+        """Vadesi gelmiş tüm öğeler (vade sırasıyla, sıralama çağırana ait)."""
+        now_ts = (now or datetime.now()).timestamp()
+        self._migrate(now_ts)
+
+        result = [
+            self._items[item_id]
+            for _, _, item_id, due in sorted(self._capped_heap, key=lambda e: e[3])
+            if self._current(item_id, due)
+        ]
+
+        popped = []
+        while self._due_heap and self._due_heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._due_heap)
+            if self._valid(entry[2], entry[0]):
+                popped.append(entry)
+                result.append(self._items[entry[2]])
+        for entry in popped:
+            heapq.heappush(self._due_heap, entry)
+
+        return result
+
+    def next_due(self) -> Optional[datetime]:
+        """En yakın gelecekteki (veya gecikmiş) vade zamanı."""
+        capped = [e[3] for e in self._capped_heap if self._current(e[2], e[3])]
+        if capped:
+            return datetime.fromtimestamp(min(capped))
+        while self._due_heap:
+            due, _, item_id = self._due_heap[0]
+            if self._current(item_id, due):
+                return datetime.fromtimestamp(due)
+            heapq.heappop(self._due_heap)
+        return None
+
+__all__ = ['ReviewQueue']
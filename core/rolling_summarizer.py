@@ -0,0 +1,299 @@
+"""
+Enterprise AI Assistant - Rolling Conversation Summarizer
+Uzun konuşmalar için kayan özet
+
+Chat endpoint'leri prompt'a konuşma geçmişini aynen ekler; geçmiş uzadıkça
+prompt ve Ollama prefill süresi de büyür. Bu modül eski mesajları session
+metadata'sında saklanan tek bir özete katlar:
+
+- Prompt = kayıtlı özet + token bütçesine sığan son mesajlar
+- Özet, her N yeni mesajda bir arka planda (asyncio task) yenilenir
+- Oturum başına tek yenileme; istek yolu LLM özetini asla beklemez
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+SUMMARY_SYSTEM_PROMPT = (
+    "Sen bir konuşma özetleyicisisin. Sadece verilen konuşmadaki bilgileri kullan, "
+    "yorum ekleme. Türkçe yaz."
+)
+
+SUMMARY_PROMPT_TEMPLATE = """Aşağıda bir konuşmanın önceki özeti ve sonrasında gelen yeni mesajlar var.
+Önceki özeti yeni mesajlarla birleştirerek GÜNCEL özeti yaz.
+
+ÖNCEKİ ÖZET:
+{previous_summary}
+
+YENİ MESAJLAR:
+{transcript}
+
+ÖNEMLİ:
+1. Özet en fazla {max_words} kelime olmalı
+2. Kullanıcının sorularını, verilen kararları ve önemli bilgileri madde madde yaz
+3. Kullanıcının tercihlerini ve açık kalan konuları belirt
+
+GÜNCEL ÖZET:"""
+
+
+@dataclass
+class ConversationContext:
+    """Prompt için konuşma bağlamı."""
+    summary: str = ""
+    recent: List[Dict[str, Any]] = field(default_factory=list)
+    covered: int = 0  # Özetin kapsadığı ilk N mesaj
+    total: int = 0  # Oturumdaki toplam mesaj
+
+    @property
+    def omitted(self) -> int:
+        """Token bütçesine sığmadığı için son kesitten kırpılan mesaj sayısı."""
+        return max(self.total - len(self.recent) - self.covered, 0)
+
+
+class RollingConversationSummarizer:
+    """
+    Oturum geçmişini kayan özet + sınırlı son kesit olarak sunar.
+
+    Özet durumu Session.metadata["rolling_summary"] içinde saklanır
+    (bkz. Session.get_rolling_summary / SessionManager.set_rolling_summary),
+    böylece sunucu yeniden başlasa da özet kaybolmaz.
+    """
+
+    def __init__(
+        self,
+        session_store=None,
+        llm=None,
+        token_manager=None,
+        refresh_every: Optional[int] = None,
+        keep_recent: Optional[int] = None,
+        tail_token_budget: Optional[int] = None,
+        max_summary_chars: Optional[int] = None,
+        max_message_chars: int = 2000,
+    ):
+        """
+        Args:
+            session_store: SessionManager (None = global session_manager)
+            llm: generate_async(prompt, system_prompt, temperature) sağlayan LLM
+                 (None = global llm_manager)
+            token_manager: EnterpriseTokenManager (None = global token_manager)
+            refresh_every: Özet yenilemesi için gereken yeni mesaj sayısı
+            keep_recent: Özete katlanmadan aynen kalan en az son mesaj sayısı
+            tail_token_budget: Son kesit için token limiti
+            max_summary_chars: Kayıtlı özetin karakter sınırı
+            max_message_chars: Özetleme prompt'una giren mesaj başına karakter sınırı
+        """
+        self._session_store = session_store
+        self._llm = llm
+        self._token_manager = token_manager
+        self.refresh_every = max(1, refresh_every or settings.CHAT_SUMMARY_REFRESH_EVERY)
+        self.keep_recent = max(1, keep_recent or settings.CHAT_RECENT_MESSAGES)
+        self.tail_token_budget = tail_token_budget or settings.CHAT_HISTORY_TOKEN_BUDGET
+        self.max_summary_chars = max_summary_chars or settings.CHAT_SUMMARY_MAX_CHARS
+        self.max_message_chars = max_message_chars
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._stats = {"refreshes": 0, "fallbacks": 0, "errors": 0, "skipped_inflight": 0}
+
+    # ==================== DEPENDENCIES ====================
+
+    @property
+    def session_store(self):
+        if self._session_store is None:
+            from core.session_manager import session_manager
+            self._session_store = session_manager
+        return self._session_store
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            from core.llm_manager import llm_manager
+            self._llm = llm_manager
+        return self._llm
+
+    @property
+    def token_manager(self):
+        if self._token_manager is None:
+            from core.token_manager import token_manager
+            self._token_manager = token_manager
+        return self._token_manager
+
+    # ==================== PROMPT CONTEXT ====================
+
+    def build_context(self, session_id: str) -> ConversationContext:
+        """
+        Prompt için özet + son kesiti döndür.
+
+        Son kesit özetin kapsamadığı mesajların tamamıdır, yani özet ile son
+        kesit arasında boşluk kalmaz. Kesit yalnızca tail_token_budget ile
+        (en eskiden başlayarak) kırpılır; son mesaj (güncel kullanıcı mesajı)
+        bütçeyi aşsa bile her zaman dahildir. Kesitin boyu yenileme eşiğiyle
+        sınırlıdır: en fazla keep_recent + refresh_every - 1 mesaj (özet
+        yenilemesi sürerken biraz daha fazla). Token sayımı oturumun
+        ledger'ı ile artımlıdır: her turda yalnızca yeni mesajlar sayılır.
+        """
+        session = self.session_store.get_session(session_id)
+        if session is None:
+            return ConversationContext()
+
+        state = session.get_rolling_summary()
+        messages = session.messages
+        total = len(messages)
+
+        tail = [self._message_dict(m) for m in messages[state["covered"]:]]
+        if tail:
+            fitted = self.token_manager.fit_messages(
+                tail[:-1], self.tail_token_budget, conversation_id=session_id
+            )
+            tail = fitted + tail[-1:]
+
+        return ConversationContext(
+            summary=state["text"],
+            recent=tail,
+            covered=state["covered"],
+            total=total,
+        )
+
+    @staticmethod
+    def _message_dict(message) -> Dict[str, Any]:
+        return {
+            "role": message.role,
+            "content": message.content,
+            "timestamp": message.timestamp,
+        }
+
+    # ==================== BACKGROUND REFRESH ====================
+
+    def pending_messages(self, session_id: str) -> int:
+        """Özete katlanmayı bekleyen (son kesit dışındaki) mesaj sayısı."""
+        session = self.session_store.get_session(session_id)
+        if session is None:
+            return 0
+        covered = session.get_rolling_summary()["covered"]
+        return max(len(session.messages) - self.keep_recent - covered, 0)
+
+    def schedule_refresh(self, session_id: str) -> Optional[asyncio.Task]:
+        """
+        Yeterli yeni mesaj biriktiyse özeti arka planda yenile.
+
+        Çalışan bir event loop içinden çağrılmalıdır. Aynı oturum için
+        yenileme sürüyorsa yenisi başlatılmaz.
+        """
+        if self.pending_messages(session_id) < self.refresh_every:
+            return None
+
+        running = self._inflight.get(session_id)
+        if running is not None and not running.done():
+            self._stats["skipped_inflight"] += 1
+            return None
+
+        task = asyncio.create_task(self.refresh(session_id))
+        self._inflight[session_id] = task
+        task.add_done_callback(lambda t, sid=session_id: self._on_refresh_done(sid, t))
+        return task
+
+    def _on_refresh_done(self, session_id: str, task: asyncio.Task):
+        if self._inflight.get(session_id) is task:
+            del self._inflight[session_id]
+        if not task.cancelled() and task.exception() is not None:
+            self._stats["errors"] += 1
+            logger.warning(f"Konuşma özeti yenilenemedi ({session_id}): {task.exception()}")
+
+    async def refresh(self, session_id: str, force: bool = False) -> Optional[str]:
+        """
+        Son kesit dışındaki özetlenmemiş mesajları mevcut özete katla.
+
+        Args:
+            session_id: Oturum ID
+            force: refresh_every eşiğini beklemeden katla
+
+        Returns:
+            Yeni özet (katlanacak mesaj yoksa None)
+        """
+        session = self.session_store.get_session(session_id)
+        if session is None:
+            return None
+
+        state = session.get_rolling_summary()
+        covered = state["covered"]
+        fold_end = len(session.messages) - self.keep_recent
+        if fold_end <= covered or (not force and fold_end - covered < self.refresh_every):
+            return None
+
+        chunk = session.messages[covered:fold_end]
+        prompt = SUMMARY_PROMPT_TEMPLATE.format(
+            previous_summary=state["text"] or "(yok)",
+            transcript=self._format_transcript(chunk),
+            max_words=max(self.max_summary_chars // 8, 50),
+        )
+
+        try:
+            summary = (await self.llm.generate_async(
+                prompt, SUMMARY_SYSTEM_PROMPT, temperature=0.2
+            )).strip()
+        except Exception as e:
+            logger.warning(f"LLM özeti başarısız, basit özet kullanılıyor: {e}")
+            summary = ""
+
+        if not summary:
+            self._stats["fallbacks"] += 1
+            summary = self._fallback_summary(state["text"], chunk)
+
+        summary = self._clip(summary)
+        self.session_store.set_rolling_summary(session_id, summary, fold_end)
+        self._stats["refreshes"] += 1
+        return summary
+
+    def _format_transcript(self, messages) -> str:
+        lines = []
+        for msg in messages:
+            role_name = "Kullanıcı" if msg.role == "user" else "Asistan"
+            content = msg.content
+            if len(content) > self.max_message_chars:
+                content = content[:self.max_message_chars] + "..."
+            lines.append(f"{role_name}: {content}")
+        return "\n\n".join(lines)
+
+    def _fallback_summary(self, previous: str, messages) -> str:
+        """LLM olmadan extractive özet (core.quality ConversationSummarizer)."""
+        from core.quality.conversation_summarizer import (
+            Message as SummaryMessage,
+            MessageRole,
+            conversation_summarizer,
+        )
+
+        roles = {role.value: role for role in MessageRole}
+        return conversation_summarizer.incremental_summarize(
+            previous or None,
+            [SummaryMessage(roles.get(m.role, MessageRole.USER), m.content) for m in messages],
+        )
+
+    def _clip(self, summary: str) -> str:
+        """Özeti karakter sınırına indir (en yeni bilgiler korunur)."""
+        if len(summary) <= self.max_summary_chars:
+            return summary
+        clipped = summary[-self.max_summary_chars:]
+        newline = clipped.find("\n")
+        if 0 <= newline < len(clipped) // 2:
+            clipped = clipped[newline + 1:]
+        return "..." + clipped
+
+    async def wait_idle(self):
+        """Süren tüm yenilemelerin bitmesini bekle (test/shutdown için)."""
+        tasks = [t for t in self._inflight.values() if not t.done()]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Özetleyici istatistikleri."""
+        return {**self._stats, "inflight": sum(1 for t in self._inflight.values() if not t.done())}
+
+
+# Singleton instance
+rolling_summarizer = RollingConversationSummarizer()
@@ -80,6 +80,20 @@ class Session:
         
         return f"Başlangıç: {first}"
     
+    def get_rolling_summary(self) -> Dict[str, Any]:
+        """
+        Eski mesajların kayıtlı özetini al.
+        
+        Returns:
+            {"text": özet, "covered": özetlenen ilk N mesaj, "updated_at": ...}
+        """
+        state = self.metadata.get("rolling_summary") or {}
+        return {
+            "text": state.get("text", ""),
+            "covered": min(int(state.get("covered", 0)), len(self.messages)),
+            "updated_at": state.get("updated_at"),
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Session'ı dict'e çevir."""
         return {
@@ -390,6 +404,19 @@ class SessionManager:
             return message
         return None
     
+    def set_rolling_summary(self, session_id: str, text: str, covered: int) -> bool:
+        """İlk `covered` mesajı kapsayan konuşma özetini kaydet."""
+        session = self.get_session(session_id)
+        if not session:
+            return False
+        session.metadata["rolling_summary"] = {
+            "text": text,
+            "covered": covered,
+            "updated_at": datetime.now().isoformat(),
+        }
+        self._save_session(session)
+        return True
+    
     def _save_session(self, session: Session) -> None:
         """Session'ı dosyaya kaydet. Sadece mesaj varsa kaydeder."""
         # 0 mesajlı session'ları kaydetme
@@ -15,7 +15,7 @@ Bu modül token'ları saklar ve resume desteği sağlar.
 import time
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from threading import Lock
 from collections import OrderedDict
@@ -104,6 +104,9 @@ class StreamBuffer:
     Eski stream'ler otomatik temizlenir.
     
     Thread-safe: Lock kullanır.
+    
+    Listener'lar (ör. StreamHub) her token/durum değişikliğinde lock dışında
+    stream_id ile çağrılır; canlı takipçiler polling yapmadan uyanır.
     """
     
     MAX_STREAMS = 1000  # Maksimum aktif stream
@@ -115,9 +118,29 @@ class StreamBuffer:
         self._session_streams: Dict[str, str] = {}  # session_id -> active stream_id
         self._lock = Lock()
         self._last_cleanup = time.time()
+        self._listeners: List[Callable[[str], None]] = []
+    
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Stream değişikliklerinde çağrılacak listener ekle."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener: Callable[[str], None]) -> None:
+        """Listener'ı kaldır."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, stream_id: str) -> None:
+        """Listener'ları bilgilendir (lock dışında çağrılmalı)."""
+        for listener in self._listeners:
+            try:
+                listener(stream_id)
+            except Exception as e:
+                logger.debug(f"Stream listener error: {e}")
     
     def create_stream(self, session_id: str, message: str) -> StreamState:
         """Yeni stream oluştur."""
+        stopped_stream_id = None
         with self._lock:
             # Cleanup kontrolü
             self._maybe_cleanup()
@@ -130,6 +153,7 @@ class StreamBuffer:
                     if old_stream.is_active:
                         old_stream.status = "stopped"
                         old_stream.ended_at = time.time()
+                        stopped_stream_id = old_stream_id
             
             # Yeni stream oluştur
             stream_id = str(uuid.uuid4())
@@ -144,7 +168,10 @@ class StreamBuffer:
             self._session_streams[session_id] = stream_id
             
             logger.debug(f"Stream created: {stream_id} for session {session_id}")
-            return stream
+        
+        if stopped_stream_id:
+            self._notify(stopped_stream_id)
+        return stream
     
     def get_stream(self, stream_id: str) -> Optional[StreamState]:
         """Stream'i al."""
@@ -165,8 +192,12 @@ class StreamBuffer:
             stream = self._streams.get(stream_id)
             if stream and stream.is_active:
                 stream.status = "generating"
-                return stream.add_token(content)
-            return None
+                token = stream.add_token(content)
+            else:
+                token = None
+        if token is not None:
+            self._notify(stream_id)
+        return token
     
     def set_sources(self, stream_id: str, sources: List[dict]) -> None:
         """Stream'e kaynakları ekle."""
@@ -183,6 +214,7 @@ class StreamBuffer:
                 stream.status = "completed"
                 stream.ended_at = time.time()
                 logger.debug(f"Stream completed: {stream_id}, tokens: {stream.token_count}")
+        self._notify(stream_id)
     
     def stop_stream(self, stream_id: str) -> None:
         """Stream'i durdur."""
@@ -194,6 +226,7 @@ class StreamBuffer:
                     stream.status = "stopped"
                     stream.ended_at = time.time()
                 logger.debug(f"Stream stopped: {stream_id}, tokens: {stream.token_count}")
+        self._notify(stream_id)
     
     def error_stream(self, stream_id: str, error: str) -> None:
         """Stream'i hata ile sonlandır."""
@@ -203,6 +236,7 @@ class StreamBuffer:
                 stream.status = "error"
                 stream.error = error
                 stream.ended_at = time.time()
+        self._notify(stream_id)
     
     def request_stop(self, session_id: str) -> bool:
         """Session'ın aktif stream'ini durdurmak için istek gönder."""
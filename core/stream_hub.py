@@ -0,0 +1,217 @@
+"""
+📡 Stream Hub - Event-Driven Token Fan-out
+===========================================
+
+StreamBuffer üzerinde asyncio-native yayın katmanı.
+
+Prensipler:
+- Üretici token'ı StreamBuffer'a yazar, hub stream'e özel koşul ile
+  takipçileri uyandırır (50 ms polling yok)
+- Takipçiler token'ları birleştirilmiş (coalesced) frame'ler halinde alır:
+  zaman penceresi dolunca veya byte limiti aşılınca flush edilir
+- Yavaş client üreticiyi asla bekletmez: token'lar buffer'da birikir,
+  client bir sonraki frame'de aradaki her şeyi tek seferde alır
+
+Kullanım:
+    async for frame in stream_hub.subscribe(stream_id, from_index):
+        await websocket.send_json(frame)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Optional
+
+from core.stream_buffer import StreamBuffer, StreamState, stream_buffer
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _StreamChannel:
+    """Tek bir stream'in uyandırma kanalı (per-stream condition)."""
+    loop: asyncio.AbstractEventLoop
+    event: asyncio.Event = field(default_factory=asyncio.Event)
+    subscribers: int = 0
+
+    def wake(self) -> None:
+        """Bekleyen tüm takipçileri uyandır ve yeni nesil event başlat."""
+        event = self.event
+        self.event = asyncio.Event()
+        event.set()
+
+
+class StreamHub:
+    """
+    Asyncio stream fan-out hub.
+
+    StreamBuffer'a listener olarak bağlanır; token eklendiğinde veya stream
+    bittiğinde sadece o stream'in takipçileri uyanır. Takipçi başına
+    coalescing ile token başına JSON frame maliyeti ortadan kalkar.
+    """
+
+    FLUSH_INTERVAL = 0.03     # Coalescing penceresi (saniye)
+    MAX_FRAME_BYTES = 4096    # Bu boyuta ulaşınca pencere beklenmeden flush
+
+    def __init__(
+        self,
+        buffer: StreamBuffer,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_frame_bytes: int = MAX_FRAME_BYTES,
+    ):
+        self._buffer = buffer
+        self.flush_interval = flush_interval
+        self.max_frame_bytes = max_frame_bytes
+        self._channels: Dict[str, _StreamChannel] = {}
+        self._stats = {
+            "frames_sent": 0,
+            "tokens_sent": 0,
+        }
+        buffer.add_listener(self.notify)
+
+    def notify(self, stream_id: str) -> None:
+        """
+        Stream değişti - takipçileri uyandır.
+
+        Event loop dışındaki thread'lerden de güvenle çağrılabilir.
+        """
+        channel = self._channels.get(stream_id)
+        if channel is None:
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is channel.loop:
+            channel.wake()
+        elif not channel.loop.is_closed():
+            channel.loop.call_soon_threadsafe(channel.wake)
+
+    async def subscribe(
+        self,
+        stream_id: str,
+        from_index: int = 0,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream'i takip et ve birleştirilmiş token frame'leri üret.
+
+        Frame formatı mevcut protokolle uyumludur:
+            {"type": "token", "content": "...", "index": N, "count": K}
+
+        `index` frame'deki ilk token'ın index'idir; sonraki resume için
+        `index + count` kullanılır. Stream aktif olmaktan çıkıp tüm token'lar
+        gönderildiğinde iterasyon biter; bitiş mesajı çağıranın sorumluluğundadır.
+        """
+        state = self._buffer.get_stream(stream_id)
+        if state is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        channel = self._channels.get(stream_id)
+        if channel is None:
+            channel = _StreamChannel(loop=loop)
+            self._channels[stream_id] = channel
+        channel.subscribers += 1
+
+        index = max(0, from_index)
+        try:
+            while True:
+                # Uyandırma event'ini durumu kontrol etmeden önce yakala
+                wake_event = channel.event
+                if len(state.tokens) <= index:
+                    if not state.is_active:
+                        return
+                    await wake_event.wait()
+                    continue
+
+                await self._coalesce(state, channel, index, loop)
+
+                for frame in self._build_frames(state, index):
+                    index += frame["count"]
+                    self._stats["frames_sent"] += 1
+                    self._stats["tokens_sent"] += frame["count"]
+                    yield frame
+        finally:
+            channel.subscribers -= 1
+            if channel.subscribers <= 0 and self._channels.get(stream_id) is channel:
+                del self._channels[stream_id]
+
+    async def _coalesce(
+        self,
+        state: StreamState,
+        channel: _StreamChannel,
+        index: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Pencere dolana, byte limiti aşılana veya stream bitene kadar bekle."""
+        deadline = loop.time() + self.flush_interval
+        scanned = index
+        pending_bytes = 0
+
+        while True:
+            tokens = state.tokens
+            while scanned < len(tokens):
+                pending_bytes += len(tokens[scanned].content.encode("utf-8"))
+                scanned += 1
+
+            if pending_bytes >= self.max_frame_bytes or not state.is_active:
+                return
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+
+            wake_event = channel.event
+            if scanned < len(state.tokens):
+                continue
+            try:
+                await asyncio.wait_for(wake_event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+
+    def _build_frames(self, state: StreamState, index: int):
+        """index'ten itibaren mevcut token'ları byte limitine göre frame'lere böl."""
+        tokens = state.tokens[index:]
+        parts = []
+        frame_bytes = 0
+        first_index = index
+
+        for token in tokens:
+            size = len(token.content.encode("utf-8"))
+            if parts and frame_bytes + size > self.max_frame_bytes:
+                yield {
+                    "type": "token",
+                    "content": "".join(parts),
+                    "index": first_index,
+                    "count": len(parts),
+                }
+                first_index += len(parts)
+                parts = []
+                frame_bytes = 0
+            parts.append(token.content)
+            frame_bytes += size
+
+        if parts:
+            yield {
+                "type": "token",
+                "content": "".join(parts),
+                "index": first_index,
+                "count": len(parts),
+            }
+
+    def get_stats(self) -> dict:
+        """Hub istatistikleri."""
+        return {
+            "followed_streams": len(self._channels),
+            "subscribers": sum(c.subscribers for c in self._channels.values()),
+            "frames_sent": self._stats["frames_sent"],
+            "tokens_sent": self._stats["tokens_sent"],
+        }
+
+
+# Global singleton
+stream_hub = StreamHub(stream_buffer)
+
+__all__ = ['stream_hub', 'StreamHub']
@@ -10,16 +10,26 @@ Features:
 - Task retry with exponential backoff
 - Task cancellation
 - Progress tracking
-- Task persistence
+- Task persistence (batched, off the event loop)
 - Concurrent worker pool
+- Multi-process consumers with lease-based claiming (shared mode)
 """
 
 import asyncio
+import heapq
+import importlib
+import itertools
+import multiprocessing
+import os
+import socket
+import threading
+import time
 import uuid
 import sqlite3
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
@@ -86,6 +96,9 @@ class Task:
     timeout: Optional[float] = None  # seconds
     progress: float = 0.0  # 0.0 - 1.0
     metadata: Dict = field(default_factory=dict)
+    run_after: float = 0.0  # epoch seconds, delayed retry
+    lease_owner: Optional[str] = None  # shared mode
+    lease_expires: Optional[float] = None  # shared mode, epoch seconds
     
     def to_dict(self) -> Dict:
         return {
@@ -146,20 +159,39 @@ class TaskQueue:
     Features:
     - Priority queue
     - Concurrent workers
-    - Retry mechanism
+    - Retry mechanism (timer heap, worker'ları bloklamaz)
     - Progress tracking
-    - Persistence
+    - Persistence (toplu, event loop dışında)
+    - Shared mode: birden fazla OS süreci aynı SQLite kuyruğundan
+      lease tabanlı claim ile görev tüketir
     """
     
+    # SQLite kolonları (sıra _task_row ile aynı)
+    _COLUMNS = (
+        "id", "name", "func_name", "args", "kwargs", "status", "priority",
+        "created_at", "started_at", "completed_at", "result",
+        "retry_count", "max_retries", "progress", "metadata",
+        "retry_delay", "timeout", "run_after", "lease_owner", "lease_expires",
+    )
+    
     def __init__(
         self,
         db_path: Optional[Path] = None,
         max_workers: int = 4,
-        persist: bool = True
+        persist: bool = True,
+        shared: bool = False,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.5,
+        flush_interval: float = 0.2
     ):
         self.db_path = db_path or Path("data/task_queue.db")
         self.max_workers = max_workers
-        self.persist = persist
+        self.shared = shared
+        self.persist = persist or shared
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.flush_interval = flush_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
         
         self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self._tasks: Dict[str, Task] = {}
@@ -173,9 +205,53 @@ class TaskQueue:
             "on_progress": []
         }
         
+        # Delayed retries: (due_loop_time, seq, task_id)
+        self._delayed: List[tuple] = []
+        self._delayed_seq = itertools.count()
+        self._delayed_wakeup: Optional[asyncio.Event] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        
+        # Batched persistence
+        self._dirty: Dict[str, tuple] = {}
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._db_executor = self._new_db_executor()
+        self._db_local = threading.local()
+        
         if self.persist:
             self._init_db()
     
+    @staticmethod
+    def _new_db_executor() -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-queue-db")
+    
+    def _close_connection(self):
+        """DB thread'inin bağlantısını kapat (DB thread'inde çalışır)"""
+        conn = getattr(self._db_local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._db_local.conn = None
+    
+    async def _shutdown_db_executor(self):
+        """Bağlantıyı kapatıp DB thread'ini sonlandır; sonraki kullanım için yenisini hazırla"""
+        executor, self._db_executor = self._db_executor, self._new_db_executor()
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(executor, self._close_connection)
+        finally:
+            executor.shutdown(wait=True)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Thread başına kalıcı SQLite bağlantısı"""
+        conn = getattr(self._db_local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._db_local.conn = conn
+        return conn
+    
     def _init_db(self):
         """SQLite veritabanını başlat"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -203,6 +279,18 @@ class TaskQueue:
             )
         """)
         
+        # Migration: retry/lease kolonları
+        existing = {row[1] for row in cursor.execute("PRAGMA table_info(tasks)")}
+        for column, ddl in (
+            ("retry_delay", "REAL DEFAULT 1.0"),
+            ("timeout", "REAL"),
+            ("run_after", "REAL DEFAULT 0"),
+            ("lease_owner", "TEXT"),
+            ("lease_expires", "REAL"),
+        ):
+            if column not in existing:
+                cursor.execute(f"ALTER TABLE tasks ADD COLUMN {column} {ddl}")
+        
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_task_status ON tasks(status)
         """)
@@ -211,26 +299,22 @@ class TaskQueue:
             CREATE INDEX IF NOT EXISTS idx_task_priority ON tasks(priority DESC)
         """)
         
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_task_claim ON tasks(status, priority DESC, created_at)
+        """)
+        
         conn.commit()
         conn.close()
         
         logger.info("Task queue database initialized")
     
-    def _save_task(self, task: Task):
-        """Task'ı veritabanına kaydet"""
-        if not self.persist:
-            return
-        
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            INSERT OR REPLACE INTO tasks
-            (id, name, func_name, args, kwargs, status, priority,
-             created_at, started_at, completed_at, result,
-             retry_count, max_retries, progress, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    
+    def _task_row(self, task: Task) -> tuple:
+        """Task'ı SQLite satırına çevir (snapshot)"""
+        return (
             task.id,
             task.name,
             task.func_name,
@@ -245,52 +329,321 @@ class TaskQueue:
             task.retry_count,
             task.max_retries,
             task.progress,
-            json.dumps(task.metadata)
-        ))
+            json.dumps(task.metadata),
+            task.retry_delay,
+            task.timeout,
+            task.run_after,
+            task.lease_owner,
+            task.lease_expires,
+        )
+    
+    @staticmethod
+    def _row_to_task(row: sqlite3.Row) -> Task:
+        """SQLite satırından Task oluştur"""
+        result = json.loads(row["result"]) if row["result"] else None
+        return Task(
+            id=row["id"],
+            name=row["name"],
+            func_name=row["func_name"],
+            args=tuple(json.loads(row["args"] or "[]")),
+            kwargs=json.loads(row["kwargs"] or "{}"),
+            status=TaskStatus(row["status"]),
+            priority=TaskPriority(row["priority"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            started_at=datetime.fromisoformat(row["started_at"]) if row["started_at"] else None,
+            completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
+            result=TaskResult(**result) if result else None,
+            retry_count=row["retry_count"],
+            max_retries=row["max_retries"],
+            retry_delay=row["retry_delay"] if row["retry_delay"] is not None else 1.0,
+            timeout=row["timeout"],
+            progress=row["progress"],
+            metadata=json.loads(row["metadata"] or "{}"),
+            run_after=row["run_after"] or 0.0,
+            lease_owner=row["lease_owner"],
+            lease_expires=row["lease_expires"],
+        )
+    
+    def _write_rows(self, rows: List[tuple]):
+        """Satırları tek transaction'da yaz (DB thread'inde çalışır)"""
+        if not rows:
+            return
+        conn = self._connect()
+        placeholders = ", ".join("?" for _ in self._COLUMNS)
+        with conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO tasks ({', '.join(self._COLUMNS)}) VALUES ({placeholders})",
+                rows
+            )
+    
+    def _save_task(self, task: Task):
+        """
+        Task'ı kaydedilecekler listesine ekle.
         
-        conn.commit()
-        conn.close()
+        Yazma işlemi flusher task'ı tarafından toplu halde ve event loop
+        dışında yapılır. Çalışan bir event loop yoksa senkron yazılır.
+        """
+        if not self.persist:
+            return
+        
+        self._dirty[task.id] = self._task_row(task)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_sync()
+            return
+        
+        self._ensure_flusher()
+        self._flush_event.set()
+    
+    def _ensure_flusher(self):
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flush_event = asyncio.Event()
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Kirli task'ları periyodik olarak toplu yaz"""
+        try:
+            while True:
+                await self._flush_event.wait()
+                self._flush_event.clear()
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+    
+    async def flush(self):
+        """Bekleyen tüm kayıtları event loop'u bloklamadan yaz"""
+        if not self._dirty:
+            return
+        rows = list(self._dirty.values())
+        self._dirty.clear()
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._db_executor, self._write_rows, rows)
+        except Exception as e:
+            logger.error(f"Task persistence error: {e}")
+    
+    def flush_sync(self):
+        """Bekleyen kayıtları senkron yaz (event loop dışı kullanım)"""
+        rows = list(self._dirty.values())
+        self._dirty.clear()
+        if rows:
+            self._db_executor.submit(self._write_rows, rows).result()
     
     def _load_pending_tasks(self):
         """Pending task'ları veritabanından yükle"""
         if not self.persist or not self.db_path.exists():
             return
         
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        conn = self._connect()
+        rows = conn.execute("""
             SELECT * FROM tasks
             WHERE status IN ('pending', 'retrying')
             ORDER BY priority DESC, created_at ASC
-        """)
+        """).fetchall()
         
-        for row in cursor.fetchall():
-            task = Task(
-                id=row[0],
-                name=row[1],
-                func_name=row[2],
-                args=tuple(json.loads(row[3] or "[]")),
-                kwargs=json.loads(row[4] or "{}"),
-                status=TaskStatus(row[5]),
-                priority=TaskPriority(row[6]),
-                created_at=datetime.fromisoformat(row[7]),
-                retry_count=row[11],
-                max_retries=row[12],
-                progress=row[13],
-                metadata=json.loads(row[14] or "{}")
-            )
-            
-            self._tasks[task.id] = task
-            # Priority queue: (negative priority for max-heap behavior, created_at, task_id)
-            asyncio.create_task(
-                self._queue.put((-task.priority.value, task.created_at, task.id))
-            )
+        loop = asyncio.get_running_loop()
+        now = time.time()
         
-        conn.close()
+        for row in rows:
+            task = self._row_to_task(row)
+            self._tasks[task.id] = task
+            
+            if task.run_after > now:
+                self._push_delayed(task.id, loop.time() + (task.run_after - now))
+            else:
+                # Priority queue: (negative priority for max-heap behavior, created_at, task_id)
+                self._queue.put_nowait((-task.priority.value, task.created_at, task.id))
         
         logger.info(f"Loaded {len(self._tasks)} pending tasks from database")
     
+    # ------------------------------------------------------------------
+    # Delayed retries
+    # ------------------------------------------------------------------
+    
+    def _push_delayed(self, task_id: str, due: float):
+        """Task'ı timer heap'e ekle ve scheduler'ı uyandır"""
+        heapq.heappush(self._delayed, (due, next(self._delayed_seq), task_id))
+        if self._delayed_wakeup is None:
+            self._delayed_wakeup = asyncio.Event()
+        self._delayed_wakeup.set()
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = asyncio.create_task(self._delay_scheduler())
+    
+    def _schedule_retry(self, task: Task, delay: float):
+        """Retry'ı kilit tutmadan ve worker'ı bekletmeden planla"""
+        task.run_after = time.time() + delay
+        self._push_delayed(task.id, asyncio.get_running_loop().time() + delay)
+    
+    async def _delay_scheduler(self):
+        """Vadesi gelen retry'ları kuyruğa geri koy"""
+        loop = asyncio.get_running_loop()
+        try:
+            while self._delayed:
+                due, _, task_id = self._delayed[0]
+                wait = due - loop.time()
+                if wait > 0:
+                    self._delayed_wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._delayed_wakeup.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                
+                heapq.heappop(self._delayed)
+                task = self._tasks.get(task_id)
+                if task and task.status == TaskStatus.RETRYING:
+                    task.run_after = 0.0
+                    await self._queue.put((-task.priority.value, datetime.now(), task_id))
+        except asyncio.CancelledError:
+            pass
+    
+    # ------------------------------------------------------------------
+    # Shared (multi-process) mode
+    # ------------------------------------------------------------------
+    
+    def _claim_next(self) -> Optional[Task]:
+        """
+        Sıradaki uygun task'ı lease ile sahiplen (DB thread'inde çalışır).
+        
+        Uygun: pending/retrying ve vadesi gelmiş, ya da lease'i dolmuş running.
+        Lease'i dolmuş task'ın önceki denemesi başarısız sayılır: retry hakkı
+        bittiyse FAILED olarak kapatılır ve sıradaki adaya geçilir.
+        """
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            while True:
+                row = conn.execute("""
+                    SELECT * FROM tasks
+                    WHERE (status IN ('pending', 'retrying') AND COALESCE(run_after, 0) <= ?)
+                       OR (status = 'running' AND lease_expires IS NOT NULL AND lease_expires < ?)
+                    ORDER BY priority DESC, created_at ASC
+                    LIMIT 1
+                """, (now, now)).fetchone()
+                
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                
+                task = self._row_to_task(row)
+                
+                if task.status == TaskStatus.RUNNING:
+                    if task.retry_count >= task.max_retries:
+                        self._fail_abandoned(conn, task)
+                        continue
+                    task.retry_count += 1
+                    logger.warning(
+                        f"Task {task.id} lease expired, reclaiming "
+                        f"({task.retry_count}/{task.max_retries})"
+                    )
+                
+                task.status = TaskStatus.RUNNING
+                task.started_at = datetime.now()
+                task.lease_owner = self.worker_id
+                task.lease_expires = now + self.lease_seconds
+                conn.execute(
+                    "UPDATE tasks SET status = ?, started_at = ?, lease_owner = ?, lease_expires = ?, "
+                    "retry_count = ? WHERE id = ?",
+                    (task.status.value, task.started_at.isoformat(), task.lease_owner,
+                     task.lease_expires, task.retry_count, task.id)
+                )
+                conn.execute("COMMIT")
+                return task
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    def _fail_abandoned(self, conn: sqlite3.Connection, task: Task):
+        """Worker'ı kaybolan ve retry hakkı biten task'ı FAILED yap (transaction içinde)"""
+        task.status = TaskStatus.FAILED
+        task.completed_at = datetime.now()
+        task.result = TaskResult(
+            success=False,
+            error=f"Worker lost (lease expired) after {task.retry_count} retries"
+        )
+        task.lease_owner = None
+        task.lease_expires = None
+        row = self._task_row(task)
+        assignments = ", ".join(f"{col} = ?" for col in self._COLUMNS[1:])
+        conn.execute(f"UPDATE tasks SET {assignments} WHERE id = ?", (*row[1:], task.id))
+        logger.error(f"Task {task.id} failed: lease expired and retries exhausted")
+    
+    def _renew_lease(self, task: Task) -> bool:
+        """Lease süresini uzat; lease kaybedildiyse False"""
+        conn = self._connect()
+        expires = time.time() + self.lease_seconds
+        with conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, progress = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                (expires, task.progress, task.id, self.worker_id)
+            )
+        if cursor.rowcount:
+            task.lease_expires = expires
+        return bool(cursor.rowcount)
+    
+    def _finish_claimed(self, task: Task) -> bool:
+        """Sahiplenilmiş task'ın sonucunu lease hâlâ bizdeyse ve iptal edilmediyse yaz"""
+        conn = self._connect()
+        task.lease_owner = None
+        task.lease_expires = None
+        row = self._task_row(task)
+        assignments = ", ".join(f"{col} = ?" for col in self._COLUMNS[1:])
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE tasks SET {assignments} "
+                f"WHERE id = ? AND lease_owner = ? AND status = 'running'",
+                (*row[1:], task.id, self.worker_id)
+            )
+        return bool(cursor.rowcount)
+    
+    def _cancel_row(self, task_id: str, completed_at: str) -> bool:
+        """Task'ı yalnızca henüz bitmemişse iptal et (DB thread'inde çalışır)"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET status = 'cancelled', completed_at = ?,
+                    lease_owner = NULL, lease_expires = NULL
+                WHERE id = ? AND status IN ('pending', 'retrying', 'running')
+                """,
+                (completed_at, task_id)
+            )
+        return bool(cursor.rowcount)
+    
+    def _fetch_task(self, task_id: str) -> Optional[Task]:
+        row = self._connect().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._row_to_task(row) if row else None
+    
+    async def _refresh_task(self, task_id: str) -> Optional[Task]:
+        """Shared modda task'ın güncel halini DB'den oku"""
+        loop = asyncio.get_running_loop()
+        task = await loop.run_in_executor(self._db_executor, self._fetch_task, task_id)
+        if task:
+            self._tasks[task_id] = task
+        return task
+    
+    async def _lease_keeper(self, task: Task):
+        """Çalışan task'ın lease'ini periyodik yenile"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await asyncio.sleep(self.lease_seconds / 3)
+                renewed = await loop.run_in_executor(self._db_executor, self._renew_lease, task)
+                if not renewed:
+                    logger.warning(f"Lease lost for task {task.id}")
+                    return
+        except asyncio.CancelledError:
+            pass
+    
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    
     async def submit(
         self,
         func_name: str,
@@ -324,11 +677,17 @@ class TaskQueue:
             metadata=metadata or {}
         )
         
-        async with self._lock:
+        if self.shared:
+            # Diğer süreçler görebilsin diye hemen yaz
             self._tasks[task_id] = task
-            await self._queue.put((-priority.value, task.created_at, task_id))
-        
-        self._save_task(task)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._db_executor, self._write_rows, [self._task_row(task)])
+        else:
+            async with self._lock:
+                self._tasks[task_id] = task
+                await self._queue.put((-priority.value, task.created_at, task_id))
+            
+            self._save_task(task)
         
         logger.info(f"Task submitted: {task_id} ({task.name})")
         
@@ -336,6 +695,17 @@ class TaskQueue:
     
     async def cancel(self, task_id: str) -> bool:
         """Task'ı iptal et"""
+        if self.shared:
+            # Koşullu UPDATE: worker'ın sonucu ile yarışta iptal kaybolmaz
+            loop = asyncio.get_running_loop()
+            cancelled = await loop.run_in_executor(
+                self._db_executor, self._cancel_row, task_id, datetime.now().isoformat()
+            )
+            await self._refresh_task(task_id)
+            if cancelled:
+                logger.info(f"Task cancelled: {task_id}")
+            return cancelled
+        
         async with self._lock:
             if task_id not in self._tasks:
                 return False
@@ -378,6 +748,8 @@ class TaskQueue:
         start_time = datetime.now()
         
         while True:
+            if self.shared:
+                await self._refresh_task(task_id)
             task = self._tasks.get(task_id)
             
             if not task:
@@ -411,6 +783,13 @@ class TaskQueue:
         if event in self._callbacks:
             self._callbacks[event].append(callback)
     
+    def _fire(self, event: str, task: Task):
+        for callback in self._callbacks[event]:
+            try:
+                callback(task)
+            except Exception as e:
+                logger.error(f"{event} callback error: {e}")
+    
     async def _execute_task(self, task: Task) -> TaskResult:
         """Task'ı çalıştır"""
         func = task_registry.get(task.func_name)
@@ -465,6 +844,41 @@ class TaskQueue:
             loop = asyncio.get_event_loop()
             return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
     
+    def _apply_result(self, task: Task, result: TaskResult) -> Optional[float]:
+        """
+        Sonucu task'a uygula.
+        
+        Returns:
+            Retry gerekiyorsa bekleme süresi (saniye), aksi halde None
+        """
+        task.result = result
+        retry_delay = None
+        
+        if result.success:
+            task.status = TaskStatus.COMPLETED
+            task.progress = 1.0
+            self._fire("on_complete", task)
+        
+        elif task.retry_count < task.max_retries:
+            task.retry_count += 1
+            task.status = TaskStatus.RETRYING
+            
+            # Exponential backoff
+            retry_delay = task.retry_delay * (2 ** (task.retry_count - 1))
+            task.run_after = time.time() + retry_delay
+            
+            logger.warning(
+                f"Task {task.id} failed, retrying in {retry_delay}s "
+                f"({task.retry_count}/{task.max_retries})"
+            )
+        
+        else:
+            task.status = TaskStatus.FAILED
+            self._fire("on_error", task)
+        
+        task.completed_at = datetime.now()
+        return retry_delay
+    
     async def _worker(self, worker_id: int):
         """Worker coroutine"""
         logger.info(f"Worker {worker_id} started")
@@ -494,11 +908,7 @@ class TaskQueue:
                     task.started_at = datetime.now()
                 
                 # Trigger on_start callbacks
-                for callback in self._callbacks["on_start"]:
-                    try:
-                        callback(task)
-                    except Exception as e:
-                        logger.error(f"Start callback error: {e}")
+                self._fire("on_start", task)
                 
                 logger.info(f"Worker {worker_id} executing: {task_id} ({task.name})")
                 
@@ -506,48 +916,11 @@ class TaskQueue:
                 result = await self._execute_task(task)
                 
                 async with self._lock:
-                    task.result = result
-                    
-                    if result.success:
-                        task.status = TaskStatus.COMPLETED
-                        task.progress = 1.0
-                        
-                        # Trigger on_complete callbacks
-                        for callback in self._callbacks["on_complete"]:
-                            try:
-                                callback(task)
-                            except Exception as e:
-                                logger.error(f"Complete callback error: {e}")
-                    
-                    else:
-                        # Retry logic
-                        if task.retry_count < task.max_retries:
-                            task.retry_count += 1
-                            task.status = TaskStatus.RETRYING
-                            
-                            # Exponential backoff
-                            delay = task.retry_delay * (2 ** (task.retry_count - 1))
-                            
-                            logger.warning(
-                                f"Task {task_id} failed, retrying in {delay}s "
-                                f"({task.retry_count}/{task.max_retries})"
-                            )
-                            
-                            # Schedule retry
-                            await asyncio.sleep(delay)
-                            await self._queue.put((-task.priority.value, datetime.now(), task_id))
-                        
-                        else:
-                            task.status = TaskStatus.FAILED
-                            
-                            # Trigger on_error callbacks
-                            for callback in self._callbacks["on_error"]:
-                                try:
-                                    callback(task)
-                                except Exception as e:
-                                    logger.error(f"Error callback error: {e}")
-                    
-                    task.completed_at = datetime.now()
+                    retry_delay = self._apply_result(task, result)
+                
+                # Schedule retry outside the lock - other workers keep running
+                if retry_delay is not None:
+                    self._schedule_retry(task, retry_delay)
                 
                 self._save_task(task)
                 
@@ -558,6 +931,45 @@ class TaskQueue:
         
         logger.info(f"Worker {worker_id} stopped")
     
+    async def _shared_worker(self, worker_id: int):
+        """Shared mod worker'ı: SQLite'tan lease ile task sahiplenir"""
+        logger.info(f"Shared worker {worker_id} started ({self.worker_id})")
+        loop = asyncio.get_running_loop()
+        
+        while self._running:
+            try:
+                task = await loop.run_in_executor(self._db_executor, self._claim_next)
+                if task is None:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                
+                self._tasks[task.id] = task
+                self._fire("on_start", task)
+                
+                logger.info(f"Worker {worker_id} executing: {task.id} ({task.name})")
+                
+                keeper = asyncio.create_task(self._lease_keeper(task))
+                try:
+                    result = await self._execute_task(task)
+                finally:
+                    keeper.cancel()
+                
+                self._apply_result(task, result)
+                
+                owned = await loop.run_in_executor(self._db_executor, self._finish_claimed, task)
+                if not owned:
+                    logger.warning(f"Task {task.id} result discarded: cancelled or lease lost")
+                    await self._refresh_task(task.id)
+                    continue
+                
+                logger.info(f"Task {task.id} {task.status.value}: {result.execution_time:.2f}s")
+            
+            except Exception as e:
+                logger.error(f"Shared worker {worker_id} error: {e}\n{traceback.format_exc()}")
+                await asyncio.sleep(self.poll_interval)
+        
+        logger.info(f"Shared worker {worker_id} stopped")
+    
     async def start(self):
         """Task queue'yu başlat"""
         if self._running:
@@ -565,12 +977,16 @@ class TaskQueue:
         
         self._running = True
         
-        # Load pending tasks from database
-        self._load_pending_tasks()
+        if self.shared:
+            worker_fn = self._shared_worker
+        else:
+            # Load pending tasks from database
+            self._load_pending_tasks()
+            worker_fn = self._worker
         
         # Start workers
         for i in range(self.max_workers):
-            worker = asyncio.create_task(self._worker(i))
+            worker = asyncio.create_task(worker_fn(i))
             self._workers.append(worker)
         
         logger.info(f"Task queue started with {self.max_workers} workers")
@@ -585,15 +1001,34 @@ class TaskQueue:
         
         self._workers.clear()
         
+        for background in (self._scheduler_task, self._flusher_task):
+            if background and not background.done():
+                background.cancel()
+                await asyncio.gather(background, return_exceptions=True)
+        
+        await self.flush()
+        await self._shutdown_db_executor()
+        
         logger.info("Task queue stopped")
     
+    async def run_forever(self):
+        """Worker'ları başlat ve durdurulana kadar çalış (worker süreçleri için)"""
+        await self.start()
+        try:
+            await asyncio.gather(*self._workers)
+        finally:
+            await self.stop(wait=False)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Queue istatistiklerini al"""
         stats = {
             "total_tasks": len(self._tasks),
             "queue_size": self._queue.qsize(),
+            "delayed_retries": len(self._delayed),
+            "pending_writes": len(self._dirty),
             "workers": len(self._workers),
             "running": self._running,
+            "shared": self.shared,
             "by_status": {}
         }
         
@@ -620,6 +1055,67 @@ class TaskQueue:
         return tasks[:limit]
 
 
+# ========================
+# Multi-process Workers
+# ========================
+
+def run_worker_process(
+    db_path: str,
+    max_workers: int = 4,
+    imports: Sequence[str] = (),
+    lease_seconds: float = 30.0
+):
+    """
+    Shared SQLite kuyruğundan görev tüketen worker süreci giriş noktası.
+    
+    Args:
+        db_path: Paylaşılan kuyruk veritabanı
+        max_workers: Süreç içi eşzamanlı worker sayısı
+        imports: Task fonksiyonlarını kaydeden modüller (registry doldurulur)
+        lease_seconds: Lease süresi
+    """
+    for module in imports:
+        importlib.import_module(module)
+    
+    queue = TaskQueue(
+        db_path=Path(db_path),
+        max_workers=max_workers,
+        shared=True,
+        lease_seconds=lease_seconds
+    )
+    try:
+        asyncio.run(queue.run_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def spawn_worker_processes(
+    db_path: Union[str, Path],
+    processes: Optional[int] = None,
+    max_workers: int = 4,
+    imports: Sequence[str] = ()
+) -> List[multiprocessing.Process]:
+    """
+    Tüm çekirdekleri kullanmak için shared mod worker süreçleri başlat.
+    
+    Returns:
+        Başlatılan süreçler (terminate()/join() çağıranın sorumluluğunda)
+    """
+    processes = processes or os.cpu_count() or 1
+    ctx = multiprocessing.get_context("spawn")
+    started = []
+    for _ in range(processes):
+        proc = ctx.Process(
+            target=run_worker_process,
+            args=(str(db_path), max_workers, tuple(imports)),
+            daemon=True
+        )
+        proc.start()
+        started.append(proc)
+    logger.info(f"Spawned {len(started)} task queue worker processes")
+    return started
+
+
 # Global task queue instance
 task_queue = TaskQueue()
 
@@ -696,5 +1192,7 @@ __all__ = [
     "task_queue",
     "task_registry",
     "submit_task",
-    "get_task_status"
+    "get_task_status",
+    "run_worker_process",
+    "spawn_worker_processes"
 ]
@@ -7,13 +7,17 @@ Premium token yönetimi sistemi:
 - Token budget allocation
 - Priority-based context truncation
 - Token usage analytics
+- Content-hash token sayısı önbelleği ve artımlı konuşma toplamları
 
 Author: Enterprise AI Team
 Version: 1.0.0
 """
 
+import bisect
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -51,6 +55,148 @@ class TokenUsageStats:
         self.peak_output_tokens = max(self.peak_output_tokens, output_tokens)
 
 
+def content_digest(text: str) -> bytes:
+    """Metnin sabit uzunluklu içerik hash'i (önbellek anahtarı)."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class TokenCache:
+    """
+    Thread-safe, boyutu sınırlı LRU önbellek.
+    
+    Token sayıları, encode edilmiş token dizileri ve mesaj özellikleri
+    içerik hash'i ile anahtarlanır; aynı metin tekrar tokenize edilmez.
+    """
+    
+    def __init__(self, max_entries: int = 20000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Değeri döndür ve LRU sırasını güncelle."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+    
+    def set(self, key: Any, value: Any):
+        """Değeri yaz; limit aşılırsa en eski kaydı at."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+    
+    def clear(self):
+        """Önbelleği temizle."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Önbellek istatistikleri."""
+        with self._lock:
+            return {**self.stats, "size": len(self._entries), "max_entries": self.max_entries}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ConversationTokenLedger:
+    """
+    Bir konuşmanın mesaj token'larını artımlı olarak tutar.
+    
+    Mesaj başına token sayısı ve kümülatif toplamlar saklanır. Her turda
+    yalnızca yeni eklenen mesajlar sayılır; bütçeye sığan en uzun son kesit
+    kümülatif toplamlar üzerinde ikili arama ile bulunur. Ledger'lar
+    get_ledger üzerinden paylaşıldığı için durum değişiklikleri kilitlidir.
+    """
+    
+    # Mesaj başına role/formatting overhead'i (count_messages_tokens ile aynı)
+    MESSAGE_OVERHEAD = 4
+    
+    def __init__(self, token_manager: "EnterpriseTokenManager", model: str = "default"):
+        self.token_manager = token_manager
+        self.model = model
+        self._digests: List[bytes] = []
+        self._cumulative: List[int] = [0]
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._digests)
+    
+    @property
+    def total(self) -> int:
+        """Kayıtlı tüm mesajların toplam token sayısı."""
+        return self._cumulative[-1]
+    
+    def add(self, message: Dict[str, str]) -> int:
+        """Tek mesaj ekle, mesajın token sayısını döndür."""
+        content = message.get("content", "") or ""
+        digest = content_digest(content)
+        tokens = self.MESSAGE_OVERHEAD + self.token_manager.count_tokens(content, self.model, digest=digest)
+        with self._lock:
+            self._digests.append(digest)
+            self._cumulative.append(self._cumulative[-1] + tokens)
+        return tokens
+    
+    def sync(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Ledger'ı mesaj listesine eşitle ve toplamı döndür.
+        
+        Liste yalnızca sona ekleme ile büyüyorsa sadece yeni mesajlar
+        sayılır. İlk veya son kayıtlı mesaj değişmişse (geçmiş kırpılmış
+        ya da düzenlenmiş) ledger baştan kurulur.
+        """
+        with self._lock:
+            known = len(self._digests)
+            if known and (
+                len(messages) < known
+                or content_digest(messages[known - 1].get("content", "") or "") != self._digests[-1]
+                or content_digest(messages[0].get("content", "") or "") != self._digests[0]
+            ):
+                self.reset()
+                known = 0
+            
+            for message in messages[known:]:
+                self.add(message)
+            return self.total
+    
+    def sync_and_fit(self, messages: List[Dict[str, str]], max_tokens: int) -> int:
+        """sync + fit_recent tek kilit altında (araya başka sync girmez)."""
+        with self._lock:
+            self.sync(messages)
+            return self.fit_recent(max_tokens)
+    
+    def message_tokens(self, index: int) -> int:
+        """index'teki mesajın token sayısı (overhead dahil)."""
+        return self._cumulative[index + 1] - self._cumulative[index]
+    
+    def tokens_from(self, start: int) -> int:
+        """messages[start:] kesitinin toplam token sayısı."""
+        return self.total - self._cumulative[start]
+    
+    def fit_recent(self, max_tokens: int) -> int:
+        """
+        messages[start:] bütçeye sığacak en küçük start index'ini döndür.
+        
+        Hiçbir mesaj sığmıyorsa len(ledger) döner.
+        """
+        return bisect.bisect_left(self._cumulative, self.total - max_tokens, hi=len(self._digests))
+    
+    def reset(self):
+        """Ledger'ı sıfırla."""
+        with self._lock:
+            self._digests.clear()
+            self._cumulative = [0]
+
+
 class EnterpriseTokenManager:
     """
     Enterprise-grade token yönetimi.
@@ -61,8 +207,14 @@ class EnterpriseTokenManager:
     - Token budget management
     - Priority-based context truncation
     - Usage analytics
+    - Content-hash token cache + konuşma başına artımlı ledger
     """
     
+    # Önbellek limitleri
+    TOKEN_CACHE_SIZE = 20000
+    ENCODING_CACHE_SIZE = 256
+    MAX_LEDGERS = 512
+    
     # Model-specific token limits
     MODEL_CONTEXT_LIMITS = {
         # Llama models
@@ -108,6 +260,10 @@ class EnterpriseTokenManager:
         self._tokenizer_type = "fallback"
         self._stats = TokenUsageStats()
         self._model_stats: Dict[str, TokenUsageStats] = {}
+        self._token_cache = TokenCache(self.TOKEN_CACHE_SIZE)
+        self._encoding_cache = TokenCache(self.ENCODING_CACHE_SIZE)
+        self._ledgers: "OrderedDict[Tuple[str, str], ConversationTokenLedger]" = OrderedDict()
+        self._ledger_lock = threading.Lock()
         self._init_tokenizer()
     
     def _init_tokenizer(self):
@@ -124,13 +280,17 @@ class EnterpriseTokenManager:
             self._tokenizer = None
             self._tokenizer_type = "fallback"
     
-    def count_tokens(self, text: str, model: str = "default") -> int:
+    def count_tokens(self, text: str, model: str = "default", digest: Optional[bytes] = None) -> int:
         """
         Metindeki token sayısını hesapla.
         
+        Sonuç içerik hash'i ile önbelleğe alınır; aynı metin tekrar
+        tokenize edilmez.
+        
         Args:
             text: Token sayılacak metin
             model: Model adı (daha doğru hesaplama için)
+            digest: Önceden hesaplanmış content_digest(text) (opsiyonel)
             
         Returns:
             Token sayısı
@@ -138,30 +298,110 @@ class EnterpriseTokenManager:
         if not text:
             return 0
         
+        key = (self._count_namespace(model), digest or content_digest(text))
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        tokens = self._encode(text, key[1])
+        if tokens is not None:
+            count = len(tokens)
+        else:
+            # Fallback: karakter tabanlı tahmin
+            model_type = self._get_model_type(model)
+            chars_per_token = self.CHARS_PER_TOKEN.get(model_type, 4.0)
+            count = int(len(text) / chars_per_token)
+        
+        self._token_cache.set(key, count)
+        return count
+    
+    def _count_namespace(self, model: str) -> str:
+        """Token sayısının bağlı olduğu anahtar (tokenizer veya model tipi)."""
         if self._tokenizer_type == "tiktoken" and self._tokenizer:
-            try:
-                return len(self._tokenizer.encode(text))
-            except Exception as e:
-                logger.warning(f"tiktoken encode error: {e}, using fallback")
+            return "tiktoken"
+        return self._get_model_type(model)
+    
+    def _encode(self, text: str, digest: Optional[bytes] = None) -> Optional[Tuple[int, ...]]:
+        """tiktoken ile encode et (son kullanılanlar önbellekte); yoksa None."""
+        if self._tokenizer_type != "tiktoken" or not self._tokenizer:
+            return None
+        
+        key = digest or content_digest(text)
+        tokens = self._encoding_cache.get(key)
+        if tokens is not None:
+            return tokens
+        
+        try:
+            tokens = tuple(self._tokenizer.encode(text))
+        except Exception as e:
+            logger.warning(f"tiktoken encode error: {e}, using fallback")
+            return None
         
-        # Fallback: karakter tabanlı tahmin
-        model_type = self._get_model_type(model)
-        chars_per_token = self.CHARS_PER_TOKEN.get(model_type, 4.0)
-        return int(len(text) / chars_per_token)
+        self._encoding_cache.set(key, tokens)
+        return tokens
     
-    def count_messages_tokens(self, messages: List[Dict[str, str]], model: str = "default") -> int:
+    def count_messages_tokens(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "default",
+        conversation_id: Optional[str] = None,
+    ) -> int:
         """
         Mesaj listesindeki toplam token sayısı.
         
         Her mesaj için ~4 token overhead eklenir (role, formatting).
+        conversation_id verilirse konuşmanın ledger'ı kullanılır ve yalnızca
+        son çağrıdan beri eklenen mesajlar sayılır.
         """
+        if conversation_id is not None:
+            return self.get_ledger(conversation_id, model).sync(messages)
+        
         total = 0
         for msg in messages:
             content = msg.get("content", "")
             # Role için overhead: ~4 token
-            total += 4 + self.count_tokens(content, model)
+            total += ConversationTokenLedger.MESSAGE_OVERHEAD + self.count_tokens(content, model)
         return total
     
+    def get_ledger(self, conversation_id: str, model: str = "default") -> ConversationTokenLedger:
+        """Konuşma için artımlı token ledger'ı (en fazla MAX_LEDGERS, LRU)."""
+        key = (conversation_id, self._count_namespace(model))
+        with self._ledger_lock:
+            ledger = self._ledgers.get(key)
+            if ledger is None:
+                ledger = ConversationTokenLedger(self, model)
+                self._ledgers[key] = ledger
+                while len(self._ledgers) > self.MAX_LEDGERS:
+                    self._ledgers.popitem(last=False)
+            else:
+                self._ledgers.move_to_end(key)
+            return ledger
+    
+    def drop_ledger(self, conversation_id: str):
+        """Konuşmanın ledger'larını sil (örn. oturum silindiğinde)."""
+        with self._ledger_lock:
+            for key in [k for k in self._ledgers if k[0] == conversation_id]:
+                del self._ledgers[key]
+    
+    def fit_messages(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int,
+        model: str = "default",
+        conversation_id: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Bütçeye sığan en uzun son mesaj kesitini döndür.
+        
+        Kesit sınırı kümülatif token toplamları üzerinde ikili arama ile
+        bulunur; konuşma ledger'ı varsa yalnızca yeni mesajlar sayılır.
+        """
+        if conversation_id is not None:
+            ledger = self.get_ledger(conversation_id, model)
+        else:
+            ledger = ConversationTokenLedger(self, model)
+        return messages[ledger.sync_and_fit(messages, max_tokens):]
+    
     def get_context_limit(self, model: str) -> int:
         """Model için context limit'i döndür."""
         model_lower = model.lower()
@@ -310,7 +550,9 @@ class EnterpriseTokenManager:
         remaining = max_tokens
         
         for item in items:
-            tokens = item.get("tokens", self.count_tokens(item.get("content", ""), model))
+            tokens = item.get("tokens")
+            if tokens is None:
+                tokens = self.count_tokens(item.get("content", ""), model)
             
             if tokens <= remaining:
                 result.append(item)
@@ -328,14 +570,14 @@ class EnterpriseTokenManager:
         return result
     
     def _truncate_text(self, text: str, max_tokens: int, model: str) -> str:
-        """Metni token limitine göre truncate et."""
-        if self._tokenizer_type == "tiktoken" and self._tokenizer:
+        """Metni token limitine göre truncate et (önbellekteki encoding ile)."""
+        tokens = self._encode(text) if text else None
+        if tokens is not None:
             try:
-                tokens = self._tokenizer.encode(text)
                 if len(tokens) <= max_tokens:
                     return text
                 truncated_tokens = tokens[:max_tokens]
-                return self._tokenizer.decode(truncated_tokens) + "..."
+                return self._tokenizer.decode(list(truncated_tokens)) + "..."
             except Exception:
                 pass
         
@@ -386,8 +628,18 @@ class EnterpriseTokenManager:
                 for model, stats in self._model_stats.items()
             },
             "tokenizer_type": self._tokenizer_type,
+            "token_cache": self._token_cache.get_stats(),
+            "encoding_cache": self._encoding_cache.get_stats(),
+            "conversation_ledgers": len(self._ledgers),
         }
     
+    def clear_caches(self):
+        """Token önbelleklerini ve konuşma ledger'larını temizle."""
+        self._token_cache.clear()
+        self._encoding_cache.clear()
+        with self._ledger_lock:
+            self._ledgers.clear()
+    
     def reset_stats(self):
         """İstatistikleri sıfırla."""
         self._stats = TokenUsageStats()
@@ -415,8 +667,12 @@ class MessagePrioritizer:
         "assistant": 0.7,
     }
     
+    # Sorgudan bağımsız mesaj özellikleri önbelleği limiti
+    FEATURE_CACHE_SIZE = 5000
+    
     def __init__(self, token_manager: EnterpriseTokenManager):
         self.token_manager = token_manager
+        self._feature_cache = TokenCache(self.FEATURE_CACHE_SIZE)
     
     def prioritize_messages(
         self,
@@ -432,11 +688,15 @@ class MessagePrioritizer:
         """
         total = len(messages)
         prioritized = []
+        query_words = set(current_query.lower().split()) if current_query else set()
         
         for i, msg in enumerate(messages):
             content = msg.get("content", "")
             role = msg.get("role", "user")
             
+            # Sorgudan bağımsız özellikler mesaj başına bir kez hesaplanır
+            content_words, density, tokens = self._message_features(content, model)
+            
             # Recency score (0.5 - 1.0)
             recency = 0.5 + (0.5 * (i / max(total - 1, 1)))
             
@@ -444,10 +704,7 @@ class MessagePrioritizer:
             role_weight = self.ROLE_WEIGHTS.get(role, 0.5)
             
             # Content relevance (basit keyword overlap)
-            relevance = self._calculate_relevance(content, current_query) if current_query else 0.5
-            
-            # Information density (unique words / total words)
-            density = self._calculate_density(content)
+            relevance = self._calculate_relevance(content_words, query_words)
             
             # Combined priority
             priority = (
@@ -461,21 +718,29 @@ class MessagePrioritizer:
                 "role": role,
                 "content": content,
                 "priority": priority,
-                "tokens": self.token_manager.count_tokens(content, model),
+                "tokens": tokens,
                 "index": i,
             })
         
         return prioritized
     
-    def _calculate_relevance(self, content: str, query: str) -> float:
-        """Basit keyword-based relevance."""
-        if not query or not content:
-            return 0.5
-        
-        query_words = set(query.lower().split())
-        content_words = set(content.lower().split())
-        
-        if not query_words:
+    def _message_features(self, content: str, model: str) -> Tuple[frozenset, float, int]:
+        """(kelime kümesi, density, token sayısı) - içerik hash'i ile önbellekli."""
+        digest = content_digest(content or "")
+        key = (self.token_manager._count_namespace(model), digest)
+        features = self._feature_cache.get(key)
+        if features is None:
+            features = (
+                frozenset(content.lower().split()) if content else frozenset(),
+                self._calculate_density(content),
+                self.token_manager.count_tokens(content, model, digest=digest),
+            )
+            self._feature_cache.set(key, features)
+        return features
+    
+    def _calculate_relevance(self, content_words: frozenset, query_words: set) -> float:
+        """Basit keyword-based relevance (önceden ayrıştırılmış kelime kümeleri)."""
+        if not query_words or not content_words:
             return 0.5
         
         overlap = len(query_words & content_words)
@@ -510,6 +775,9 @@ __all__ = [
     "EnterpriseTokenManager",
     "MessagePrioritizer",
     "TokenUsageStats",
+    "TokenCache",
+    "ConversationTokenLedger",
+    "content_digest",
     "token_manager",
     "message_prioritizer",
 ]
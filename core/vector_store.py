@@ -505,33 +505,54 @@ class VectorStore:
         where: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Hazır embedding ile search yap (HyDE için)."""
+        return self.search_by_embeddings([embedding], n_results, where)[0]
+    
+    def search_by_embeddings(
+        self,
+        embeddings: List[List[float]],
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Birden fazla hazır embedding ile tek ChromaDB sorgusunda search yap.
+        
+        Returns:
+            Her embedding için (aynı sırada) skorlu sonuç listesi
+        """
+        if not embeddings:
+            return []
+        
         self._ensure_initialized()
         
         try:
             results = self._manager.query(
-                query_embeddings=[embedding],
+                query_embeddings=embeddings,
                 n_results=n_results,
                 where=where,
                 include=["documents", "metadatas", "distances"],
             )
             
-            scored_results = []
-            for i, doc in enumerate(results["documents"][0] if results["documents"] else []):
-                distance = results["distances"][0][i] if results["distances"] else 1.0
-                score = 1 - distance
-                
-                scored_results.append({
-                    "document": doc,
-                    "content": doc,
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                    "score": score,
-                    "id": results["ids"][0][i] if results["ids"] else None,
-                })
+            all_results = []
+            for q in range(len(embeddings)):
+                documents = results["documents"][q] if results["documents"] else []
+                scored_results = []
+                for i, doc in enumerate(documents):
+                    distance = results["distances"][q][i] if results["distances"] else 1.0
+                    score = 1 - distance
+                    
+                    scored_results.append({
+                        "document": doc,
+                        "content": doc,
+                        "metadata": results["metadatas"][q][i] if results["metadatas"] else {},
+                        "score": score,
+                        "id": results["ids"][q][i] if results["ids"] else None,
+                    })
+                all_results.append(scored_results)
             
-            return scored_results
+            return all_results
         except Exception as e:
             logger.error(f"Embedding search error: {e}")
-            return []
+            return [[] for _ in embeddings]
     
     def get_by_page_number(
         self,
@@ -7,12 +7,13 @@ Create, save, and execute complex AI workflows
 import asyncio
 import json
 import logging
+import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -121,16 +122,38 @@ class ExecutionContext:
     end_time: Optional[datetime] = None
 
 
+@dataclass
+class ExecutionPlan:
+    """
+    Compiled execution plan of a workflow.
+    
+    Only nodes reachable from the start node are included; END nodes do not
+    propagate. `in_degree` counts distinct reachable parents, so a merge node
+    becomes ready once, after all of its parents have finished.
+    """
+    start_id: str
+    nodes: Dict[str, WorkflowNode]
+    order: List[str]  # Topological order of reachable nodes
+    successors: Dict[str, List[str]]
+    incoming: Dict[str, List[WorkflowEdge]]
+    in_degree: Dict[str, int]
+
+
 class WorkflowEngine:
     """
     Execute AI workflows
+    
+    Workflows are compiled into a DAG execution plan; ready nodes run
+    concurrently up to `max_parallel_nodes`.
     """
     
-    def __init__(self, storage_dir: str = "data/workflows"):
+    def __init__(self, storage_dir: str = "data/workflows", max_parallel_nodes: int = 4):
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.max_parallel_nodes = max_parallel_nodes
         self.workflows: Dict[str, Workflow] = {}
         self.executions: Dict[str, ExecutionContext] = {}
+        self._plans: Dict[str, Tuple[Tuple, ExecutionPlan]] = {}
         self._load_workflows()
         
         # Node executors
@@ -366,6 +389,7 @@ class WorkflowEngine:
         """Delete workflow"""
         if workflow_id in self.workflows:
             del self.workflows[workflow_id]
+            self._plans.pop(workflow_id, None)
             path = self.storage_dir / f"{workflow_id}.json"
             if path.exists():
                 path.unlink()
@@ -378,7 +402,8 @@ class WorkflowEngine:
         self,
         workflow_id: str,
         inputs: Optional[Dict[str, Any]] = None,
-        variables: Optional[Dict[str, Any]] = None
+        variables: Optional[Dict[str, Any]] = None,
+        max_parallel: Optional[int] = None
     ) -> ExecutionContext:
         """Execute a workflow"""
         workflow = self.workflows.get(workflow_id)
@@ -397,13 +422,10 @@ class WorkflowEngine:
         self.executions[execution_id] = ctx
         
         try:
-            # Find start node
-            start_node = next((n for n in workflow.nodes if n.type == NodeType.START), None)
-            if not start_node:
-                raise ValueError("Workflow has no start node")
+            plan = self.compile_workflow(workflow)
             
             # Execute from start
-            await self._execute_node(workflow, start_node, ctx)
+            await self._run_plan(workflow, plan, ctx, max_parallel or self.max_parallel_nodes)
             
             ctx.status = WorkflowStatus.COMPLETED
             ctx.end_time = datetime.now()
@@ -417,6 +439,111 @@ class WorkflowEngine:
         
         return ctx
     
+    def compile_workflow(self, workflow: Workflow) -> ExecutionPlan:
+        """Compile (or reuse) the execution plan of a workflow"""
+        key = (workflow.version, workflow.updated_at, len(workflow.nodes), len(workflow.edges))
+        cached = self._plans.get(workflow.id)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        plan = self._build_plan(workflow)
+        self._plans[workflow.id] = (key, plan)
+        return plan
+    
+    def _build_plan(self, workflow: Workflow) -> ExecutionPlan:
+        """Build adjacency maps, in-degrees and topological order"""
+        nodes = {n.id: n for n in workflow.nodes}
+        start_node = next((n for n in workflow.nodes if n.type == NodeType.START), None)
+        if not start_node:
+            raise ValueError("Workflow has no start node")
+        
+        successors: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+        incoming: Dict[str, List[WorkflowEdge]] = {node_id: [] for node_id in nodes}
+        for edge in workflow.edges:
+            if edge.source_node not in nodes or edge.target_node not in nodes:
+                continue
+            incoming[edge.target_node].append(edge)
+            if edge.target_node not in successors[edge.source_node]:
+                successors[edge.source_node].append(edge.target_node)
+        
+        # END nodes stop propagation
+        for node_id, node in nodes.items():
+            if node.type == NodeType.END:
+                successors[node_id] = []
+        
+        # Reachable subgraph from start
+        reachable = {start_node.id}
+        stack = [start_node.id]
+        while stack:
+            for next_id in successors[stack.pop()]:
+                if next_id not in reachable:
+                    reachable.add(next_id)
+                    stack.append(next_id)
+        
+        successors = {node_id: successors[node_id] for node_id in nodes if node_id in reachable}
+        in_degree = {node_id: 0 for node_id in successors}
+        for targets in successors.values():
+            for next_id in targets:
+                in_degree[next_id] += 1
+        
+        # Kahn's algorithm
+        remaining = dict(in_degree)
+        order = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        for node_id in order:
+            for next_id in successors[node_id]:
+                remaining[next_id] -= 1
+                if remaining[next_id] == 0:
+                    order.append(next_id)
+        
+        if len(order) != len(successors):
+            cyclic = [node_id for node_id, degree in remaining.items() if degree > 0]
+            raise ValueError(f"Workflow contains a cycle: {', '.join(cyclic)}")
+        
+        return ExecutionPlan(
+            start_id=start_node.id,
+            nodes={node_id: nodes[node_id] for node_id in order},
+            order=order,
+            successors=successors,
+            incoming={node_id: incoming[node_id] for node_id in order},
+            in_degree=in_degree
+        )
+    
+    async def _run_plan(
+        self,
+        workflow: Workflow,
+        plan: ExecutionPlan,
+        ctx: ExecutionContext,
+        max_parallel: int
+    ):
+        """Run ready nodes concurrently; a node starts once all its parents finished"""
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+        remaining = dict(plan.in_degree)
+        running: Dict[asyncio.Task, str] = {}
+        
+        async def run(node: WorkflowNode):
+            async with semaphore:
+                return await self._execute_node(workflow, node, ctx)
+        
+        def launch(node_id: str):
+            running[asyncio.create_task(run(plan.nodes[node_id]))] = node_id
+        
+        launch(plan.start_id)
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = running.pop(task)
+                    task.result()  # Propagate node failure
+                    for next_id in plan.successors[node_id]:
+                        remaining[next_id] -= 1
+                        if remaining[next_id] == 0:
+                            launch(next_id)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+    
     async def _execute_node(
         self,
         workflow: Workflow,
@@ -425,6 +552,7 @@ class WorkflowEngine:
     ) -> Any:
         """Execute a single node"""
         ctx.current_node = node.id
+        started = time.perf_counter()
         
         # Log execution
         ctx.logs.append({
@@ -454,15 +582,10 @@ class WorkflowEngine:
                 "node_id": node.id,
                 "timestamp": datetime.now().isoformat(),
                 "status": "completed",
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
                 "output_preview": str(result)[:100] if result else None
             })
             
-            # Execute connected nodes
-            if node.type != NodeType.END:
-                next_nodes = self._get_next_nodes(workflow, node)
-                for next_node in next_nodes:
-                    await self._execute_node(workflow, next_node, ctx)
-            
             return result
             
         except Exception as e:
@@ -470,6 +593,7 @@ class WorkflowEngine:
                 "node_id": node.id,
                 "timestamp": datetime.now().isoformat(),
                 "status": "error",
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
                 "error": str(e)
             })
             raise
@@ -483,10 +607,8 @@ class WorkflowEngine:
         """Get inputs for a node from connected nodes"""
         inputs = {}
         
-        for edge in workflow.edges:
-            if edge.target_node == node.id:
-                source_output = ctx.node_outputs.get(edge.source_node)
-                inputs[edge.target_port] = source_output
+        for edge in self.compile_workflow(workflow).incoming.get(node.id, []):
+            inputs[edge.target_port] = ctx.node_outputs.get(edge.source_node)
         
         return inputs
     
@@ -496,12 +618,8 @@ class WorkflowEngine:
         node: WorkflowNode
     ) -> List[WorkflowNode]:
         """Get nodes connected to this node's output"""
-        next_ids = set()
-        for edge in workflow.edges:
-            if edge.source_node == node.id:
-                next_ids.add(edge.target_node)
-        
-        return [n for n in workflow.nodes if n.id in next_ids]
+        plan = self.compile_workflow(workflow)
+        return [plan.nodes[node_id] for node_id in plan.successors.get(node.id, [])]
     
     # Node Executors
     
@@ -25,6 +25,7 @@ import json
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -40,6 +41,8 @@ from typing import (
     Union,
 )
 
+import numpy as np
+
 from core.logger import get_logger
 
 logger = get_logger("rag.citation_verifier")
@@ -441,15 +444,28 @@ Claims (JSON):"""
 class SourceVerifier:
     """
     Claim'leri kaynaklara karşı doğrular.
+    
+    Toplu doğrulamada (`verify_claims`) kaynaklar yanıt başına bir kez
+    tokenize/embed edilir, tüm claim'ler tek batch'te embed edilir ve
+    tek bir claim x kaynak destek matrisi hesaplanır. Kelime örtüşmesi ve
+    kosinüs benzerliği yanlış sayı, isim veya olumsuzluğu yakalayamadığından
+    yüksek destek tek başına VERIFIED için yeterli değildir: LLM'siz onay
+    yalnızca claim kaynakta birebir (tüm sayılarıyla) geçiyorsa verilir.
     """
     
+    _NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+    
     def __init__(
         self,
         llm: Optional[LLMProtocol] = None,
-        embedding: Optional[EmbeddingProtocol] = None
+        embedding: Optional[EmbeddingProtocol] = None,
+        max_concurrency: int = 4,
+        support_floor: float = 0.1
     ):
         self._llm = llm
         self._embedding = embedding
+        self.max_concurrency = max(1, max_concurrency)
+        self.support_floor = support_floor
     
     def _lazy_load(self):
         if self._llm is None:
@@ -477,44 +493,197 @@ class SourceVerifier:
         relevant_sources = self._find_relevant_sources(claim, sources)
         
         if not relevant_sources:
-            return VerificationResult(
-                claim=claim,
-                status=VerificationStatus.UNSUPPORTED,
-                confidence=0.2,
-                supporting_sources=[],
-                explanation="No relevant sources found for this claim."
-            )
+            return self._unsupported(claim)
         
         # Verify against sources using LLM
         verification = self._llm_verify(claim, relevant_sources)
         
         return verification
     
-    def _find_relevant_sources(
+    def verify_claims(
         self,
-        claim: Claim,
+        claims: List[Claim],
         sources: List[SourceCitation],
         top_k: int = 3
-    ) -> List[SourceCitation]:
-        """İlgili kaynakları bul."""
-        scored_sources = []
+    ) -> List[VerificationResult]:
+        """
+        Tüm claim'leri tek destek matrisiyle doğrula.
         
-        claim_words = set(claim.text.lower().split())
+        - Destek < support_floor: LLM'siz UNSUPPORTED
+        - Claim kaynakta birebir geçiyorsa: LLM'siz VERIFIED
+        - Diğerleri: eşzamanlı LLM doğrulaması
+        """
+        if not claims:
+            return []
+        if not sources:
+            return [self.verify_claim(claim, sources) for claim in claims]
         
-        for source in sources:
-            source_words = set(source.content.lower().split())
+        support = self._support_matrix(claims, sources)
+        
+        results: List[Optional[VerificationResult]] = [None] * len(claims)
+        ambiguous: List[Tuple[int, List[SourceCitation]]] = []
+        
+        for i, claim in enumerate(claims):
+            row = support[i]
+            order = np.argsort(-row, kind="stable")[:top_k]
+            relevant = [sources[j] for j in order if row[j] > self.support_floor]
             
-            # Simple word overlap scoring
-            overlap = len(claim_words & source_words)
-            score = overlap / max(len(claim_words), 1)
+            if not relevant:
+                results[i] = self._unsupported(claim)
+                continue
             
-            scored_sources.append((score, source))
+            exact = self._exact_source(claim, relevant)
+            if exact is not None:
+                results[i] = self._verified_by_exact_match(claim, exact)
+            else:
+                ambiguous.append((i, relevant))
+        
+        if ambiguous:
+            self._lazy_load()
+            workers = min(self.max_concurrency, len(ambiguous))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="citation-verify") as executor:
+                verified = executor.map(
+                    lambda item: self._llm_verify(claims[item[0]], item[1]),
+                    ambiguous
+                )
+                for (i, _), result in zip(ambiguous, verified):
+                    results[i] = result
+        
+        return results
+    
+    @staticmethod
+    def _tokenize(text: str) -> Set[str]:
+        return set(text.lower().split())
+    
+    def _support_matrix(
+        self,
+        claims: List[Claim],
+        sources: List[SourceCitation]
+    ) -> np.ndarray:
+        """
+        claims x sources destek skoru.
+        
+        Kelime örtüşmesi (claim kelimelerinin kaynakta geçen oranı) ve
+        embedding varsa kosinüs benzerliğinin büyüğü.
+        """
+        claim_tokens = [self._tokenize(claim.text) for claim in claims]
+        vocabulary = {word: k for k, word in enumerate(set().union(*claim_tokens))}
+        
+        claim_matrix = np.zeros((len(claims), len(vocabulary)), dtype=np.float32)
+        for i, tokens in enumerate(claim_tokens):
+            claim_matrix[i, [vocabulary[w] for w in tokens]] = 1.0
         
-        # Sort by score
-        scored_sources.sort(key=lambda x: x[0], reverse=True)
+        # Kaynaklar yanıt başına bir kez tokenize edilir (yalnız claim kelimeleri)
+        source_matrix = np.zeros((len(sources), len(vocabulary)), dtype=np.float32)
+        for j, source in enumerate(sources):
+            hits = [vocabulary[w] for w in self._tokenize(source.content) if w in vocabulary]
+            source_matrix[j, hits] = 1.0
+        
+        claim_lengths = np.maximum(claim_matrix.sum(axis=1, keepdims=True), 1.0)
+        support = (claim_matrix @ source_matrix.T) / claim_lengths
+        
+        semantic = self._semantic_matrix(claims, sources)
+        if semantic is not None:
+            support = np.maximum(support, semantic)
+        
+        return support
+    
+    def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        if hasattr(self._embedding, "embed_texts"):
+            return self._embedding.embed_texts(texts)
+        return [self._embedding.embed_text(text) for text in texts]
+    
+    def _semantic_matrix(
+        self,
+        claims: List[Claim],
+        sources: List[SourceCitation]
+    ) -> Optional[np.ndarray]:
+        """Claim ve kaynak embedding'leri arasında kosinüs matrisi (tek batch)."""
+        if self._embedding is None:
+            return None
+        
+        try:
+            vectors = np.asarray(
+                self._embed_many([c.text for c in claims] + [s.content[:2000] for s in sources]),
+                dtype=np.float32
+            )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+            return vectors[:len(claims)] @ vectors[len(claims):].T
+        except Exception as e:
+            logger.warning(f"Claim embedding failed, using word overlap only: {e}")
+            return None
+    
+    def _unsupported(self, claim: Claim) -> VerificationResult:
+        return VerificationResult(
+            claim=claim,
+            status=VerificationStatus.UNSUPPORTED,
+            confidence=0.2,
+            supporting_sources=[],
+            explanation="No relevant sources found for this claim."
+        )
+    
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        return " ".join(text.lower().split())
+    
+    def _exact_source(
+        self,
+        claim: Claim,
+        sources: List[SourceCitation]
+    ) -> Optional[SourceCitation]:
+        """
+        Claim'i birebir (kelime sınırlarında, tüm sayılarıyla) içeren kaynak.
+        
+        Sondaki noktalama ve boşluk/harf farkı yok sayılır; başka hiçbir
+        yaklaşıklığa izin verilmez.
+        """
+        needle = self._normalize_text(claim.text).rstrip(".!?;: ")
+        if not needle:
+            return None
+        
+        phrase = re.compile(rf"(?<!\w){re.escape(needle)}(?!\w)")
+        numbers = [
+            re.compile(rf"(?<![\d.,]){re.escape(number)}(?![\d])")
+            for number in self._NUMBER_PATTERN.findall(needle)
+        ]
+        
+        for source in sources:
+            haystack = self._normalize_text(source.content)
+            if phrase.search(haystack) and all(n.search(haystack) for n in numbers):
+                return source
+        return None
+    
+    def _verified_by_exact_match(
+        self,
+        claim: Claim,
+        source: SourceCitation
+    ) -> VerificationResult:
+        """Kaynakta birebir geçen claim (LLM gerekmez)."""
+        claim.verification_status = VerificationStatus.VERIFIED
+        claim.confidence = 1.0
+        claim.supporting_sources = [source.id]
+        
+        return VerificationResult(
+            claim=claim,
+            status=VerificationStatus.VERIFIED,
+            confidence=1.0,
+            supporting_sources=[source],
+            explanation="Claim is stated verbatim in the source.",
+        )
+    
+    def _find_relevant_sources(
+        self,
+        claim: Claim,
+        sources: List[SourceCitation],
+        top_k: int = 3
+    ) -> List[SourceCitation]:
+        """İlgili kaynakları bul."""
+        row = self._support_matrix([claim], sources)[0]
+        order = np.argsort(-row, kind="stable")[:top_k]
         
         # Return top sources with decent scores
-        return [s for score, s in scored_sources[:top_k] if score > 0.1]
+        return [sources[j] for j in order if row[j] > self.support_floor]
     
     def _llm_verify(
         self,
@@ -748,11 +917,8 @@ class CitationVerifier:
         if not claims:
             return self._empty_analysis(response)
         
-        # 3. Verify each claim
-        verification_results = []
-        for claim in claims:
-            result = self.source_verifier.verify_claim(claim, source_citations)
-            verification_results.append(result)
+        # 3. Verify all claims (one support matrix, concurrent LLM checks)
+        verification_results = self.source_verifier.verify_claims(claims, source_citations)
         
         # 4. Detect hallucinations
         hallucination_reports = self.hallucination_detector.detect_hallucinations(
@@ -10,13 +10,22 @@ Features:
 - Relevance-based selection
 - Redundancy elimination
 - Hierarchical summarization
+
+Performans:
+- Cümle skorları seyrek terim matrisi üzerinden tek geçişte (NumPy)
+- Near-duplicate eleme prefix filtreli kovalarla (O(S²) karşılaştırma yok)
 """
 
 import logging
+import math
 import re
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
 from enum import Enum
+from itertools import chain, count
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +61,31 @@ class OptimizerConfig:
     preserve_structure: bool = True
 
 
+class _TermMatrix:
+    """
+    Cümle x terim seyrek ikili matrisi (CSR: satır başına tekil terim id'leri).
+    
+    Sorgu kesişimleri tüm cümleler için tek np.isin + bincount ile hesaplanır.
+    """
+    
+    def __init__(self, word_sets: Sequence[Set[str]]):
+        # Terim id'leri: her terimin ilk görüldüğü düz konum (sürekli olması
+        # gerekmez, yalnızca tekil). map + setdefault döngüyü C'de tutar.
+        self.vocab: Dict[str, int] = {}
+        ids = list(map(self.vocab.setdefault, chain.from_iterable(word_sets), count()))
+        self.sizes = np.fromiter((len(words) for words in word_sets), dtype=np.int64, count=len(word_sets))
+        self.indices = np.asarray(ids, dtype=np.int64)
+        self.rows = np.repeat(np.arange(len(word_sets)), self.sizes)
+    
+    def overlap(self, terms: Set[str]) -> np.ndarray:
+        """Her satırın terms ile ortak terim sayısı."""
+        term_ids = [self.vocab[term] for term in terms if term in self.vocab]
+        if not term_ids:
+            return np.zeros(len(self.sizes), dtype=np.int64)
+        hits = np.isin(self.indices, term_ids)
+        return np.bincount(self.rows[hits], minlength=len(self.sizes))
+
+
 class ContextOptimizer:
     """
     RAG context optimizer.
@@ -83,6 +117,12 @@ class ContextOptimizer:
             "ve", "ile", "için", "bu", "bir", "da", "de",
             "olan", "olarak", "gibi", "kadar", "daha"
         }
+        
+        # k marker için bonus; skalar toplamla birebir aynı float değerler
+        self._importance_bonus = np.array([
+            sum(0.1 for _ in range(hits))
+            for hits in range(len(self.importance_markers) + 1)
+        ])
     
     def optimize(
         self,
@@ -214,49 +254,27 @@ class ContextOptimizer:
         """Extractive summarization stratejisi."""
         query_words = set(query.lower().split())
         
-        # Tüm cümleleri topla ve skorla
-        all_sentences = []
+        # Tüm cümleleri topla ve tek seferde skorla
+        texts: List[str] = []
+        doc_ids: List[int] = []
+        positions: List[int] = []
         for doc_idx, doc in enumerate(documents):
-            content = doc.get("content", "")
-            sentences = self._split_sentences(content)
-            
-            for sent_idx, sentence in enumerate(sentences):
-                score = self._score_sentence(sentence, query_words, sent_idx)
-                all_sentences.append({
-                    "text": sentence,
-                    "score": score,
-                    "doc_idx": doc_idx,
-                    "sent_idx": sent_idx
-                })
-        
-        # Skora göre sırala
-        all_sentences.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Token limitine kadar ekle
-        result_parts = []
-        total_tokens = 0
-        used_docs = set()
+            sentences = self._split_sentences(doc.get("content", ""))
+            texts.extend(sentences)
+            doc_ids.extend([doc_idx] * len(sentences))
+            positions.extend(range(len(sentences)))
         
-        for sent in all_sentences:
-            sent_tokens = self._estimate_tokens(sent["text"])
-            if total_tokens + sent_tokens > max_tokens:
-                continue
-            
-            result_parts.append(sent)
-            total_tokens += sent_tokens
-            used_docs.add(sent["doc_idx"])
+        scores = self._score_sentences(texts, query_words, positions)
         
-        # Original sıraya göre düzenle
-        result_parts.sort(key=lambda x: (x["doc_idx"], x["sent_idx"]))
+        # Skora göre (kararlı) sırala, token limitine kadar ekle,
+        # sonra orijinal (doküman, cümle) sırasına döndür
+        selected = sorted(self._select_within_budget(texts, np.argsort(-scores, kind="stable"), max_tokens))
         
         # Group by document
         if self.config.preserve_structure:
-            grouped = {}
-            for sent in result_parts:
-                doc_idx = sent["doc_idx"]
-                if doc_idx not in grouped:
-                    grouped[doc_idx] = []
-                grouped[doc_idx].append(sent["text"])
+            grouped: Dict[int, List[str]] = {}
+            for i in selected:
+                grouped.setdefault(doc_ids[i], []).append(texts[i])
             
             final_parts = [
                 "\n".join(sents)
@@ -264,7 +282,25 @@ class ContextOptimizer:
             ]
             return "\n\n".join(final_parts), len(grouped)
         
-        return "\n".join(s["text"] for s in result_parts), len(used_docs)
+        return "\n".join(texts[i] for i in selected), len({doc_ids[i] for i in selected})
+    
+    def _select_within_budget(
+        self,
+        texts: List[str],
+        order: Sequence[int],
+        max_tokens: int
+    ) -> List[int]:
+        """Verilen sırayla, limite sığmayanları atlayarak cümle seç."""
+        selected = []
+        total_tokens = 0
+        for i in order:
+            i = int(i)
+            sent_tokens = self._estimate_tokens(texts[i])
+            if total_tokens + sent_tokens > max_tokens:
+                continue
+            selected.append(i)
+            total_tokens += sent_tokens
+        return selected
     
     def _optimize_hierarchical(
         self,
@@ -287,18 +323,15 @@ class ContextOptimizer:
         
         # Hala fazlaysa, en relevan olanları seç
         query_words = set(query.lower().split())
-        scored = []
-        for i, summary in enumerate(summaries):
-            score = self._score_sentence(summary, query_words, 0)
-            scored.append((i, summary, score))
-        
-        scored.sort(key=lambda x: x[2], reverse=True)
+        scores = self._score_sentences(summaries, query_words, [0] * len(summaries))
         
         result_parts = []
         total_tokens = 0
         used_count = 0
         
-        for idx, summary, score in scored:
+        for idx in np.argsort(-scores, kind="stable"):
+            idx = int(idx)
+            summary = summaries[idx]
             summary_tokens = self._estimate_tokens(summary)
             if total_tokens + summary_tokens > max_tokens:
                 break
@@ -318,56 +351,77 @@ class ContextOptimizer:
     ) -> Tuple[str, int]:
         """Semantic deduplication stratejisi."""
         # Cümleleri çıkar
-        all_sentences = []
+        texts: List[str] = []
+        doc_ids: List[int] = []
+        word_sets: List[Set[str]] = []
         for doc_idx, doc in enumerate(documents):
-            content = doc.get("content", "")
-            sentences = self._split_sentences(content)
-            for sent in sentences:
-                all_sentences.append({
-                    "text": sent,
-                    "doc_idx": doc_idx,
-                    "words": set(sent.lower().split()) - self.stop_words
-                })
+            for sent in self._split_sentences(doc.get("content", "")):
+                texts.append(sent)
+                doc_ids.append(doc_idx)
+                word_sets.append(set(sent.lower().split()) - self.stop_words)
         
         # Duplicate/similar cümleleri filtrele
-        unique_sentences = []
-        for sent in all_sentences:
-            is_duplicate = False
-            for existing in unique_sentences:
-                similarity = self._jaccard_similarity(
-                    sent["words"], existing["words"]
-                )
-                if similarity > self.config.overlap_threshold:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_sentences.append(sent)
+        unique = self._deduplicate(word_sets)
         
-        # Relevance skorla
+        # Relevance skorla: Jaccard(cümle, sorgu), tüm cümleler için tek geçiş
         query_words = set(query.lower().split()) - self.stop_words
-        for sent in unique_sentences:
-            relevance = self._jaccard_similarity(sent["words"], query_words)
-            sent["score"] = relevance
-        
-        # Skora göre sırala
-        unique_sentences.sort(key=lambda x: x["score"], reverse=True)
-        
-        # Token limitine kadar ekle
-        result_parts = []
-        total_tokens = 0
-        used_docs = set()
-        
-        for sent in unique_sentences:
-            sent_tokens = self._estimate_tokens(sent["text"])
-            if total_tokens + sent_tokens > max_tokens:
+        matrix = _TermMatrix([word_sets[i] for i in unique])
+        intersection = matrix.overlap(query_words)
+        union = matrix.sizes + len(query_words) - intersection
+        scores = np.zeros(len(unique))
+        if query_words:
+            nonempty = matrix.sizes > 0
+            scores[nonempty] = intersection[nonempty] / union[nonempty]
+        
+        # Skora göre sırala ve token limitine kadar ekle
+        order = [unique[i] for i in np.argsort(-scores, kind="stable")]
+        selected = self._select_within_budget(texts, order, max_tokens)
+        
+        return "\n".join(texts[i] for i in selected), len({doc_ids[i] for i in selected})
+    
+    def _deduplicate(self, word_sets: List[Set[str]]) -> List[int]:
+        """
+        Sırayla, daha önce tutulan bir cümleyle Jaccard'ı overlap_threshold'u
+        aşan cümleleri ele; tutulan cümlelerin index'lerini döndür.
+        
+        Birebir karşılaştırma yerine prefix filtreleme: terimler nadirden sıka
+        sıralanır ve her tutulan cümlenin yalnızca ilk |A| - ceil(t|A|) + 1
+        terimi kovalara yazılır. Jaccard >= t olan iki kümenin bu önekleri
+        mutlaka kesiştiğinden kesin Jaccard sadece ortak kovadaki adaylar için
+        hesaplanır; sonuç tüm çiftlerin karşılaştırılmasıyla aynıdır.
+        """
+        threshold = self.config.overlap_threshold
+        if threshold >= 1.0:
+            return list(range(len(word_sets)))
+        if threshold < 0:
+            # Her benzerlik (0 dahil) eşiği aşar: yalnızca ilk cümle kalır
+            return [0] if word_sets else []
+        
+        doc_freq = Counter(word for words in word_sets for word in words)
+        buckets: Dict[str, List[int]] = defaultdict(list)
+        kept: List[int] = []
+        
+        for i, words in enumerate(word_sets):
+            if not words:
+                # Boş küme hiçbir cümleye benzemez (_jaccard_similarity = 0)
+                kept.append(i)
                 continue
             
-            result_parts.append(sent)
-            total_tokens += sent_tokens
-            used_docs.add(sent["doc_idx"])
+            ordered = sorted(words, key=lambda word: (doc_freq[word], word))
+            prefix = ordered[:len(ordered) - math.ceil(threshold * len(ordered) - 1e-9) + 1]
+            
+            candidates = {j for word in prefix for j in buckets.get(word, ())}
+            if any(
+                self._jaccard_similarity(words, word_sets[j]) > threshold
+                for j in candidates
+            ):
+                continue
+            
+            kept.append(i)
+            for word in prefix:
+                buckets[word].append(i)
         
-        return "\n".join(s["text"] for s in result_parts), len(used_docs)
+        return kept
     
     def _split_sentences(self, text: str) -> List[str]:
         """Metni cümlelere ayır."""
@@ -409,6 +463,33 @@ class ContextOptimizer:
         return (overlap * 0.5 + importance_bonus + 
                 position_score * 0.2 + length_factor * 0.1)
     
+    def _score_sentences(
+        self,
+        sentences: Sequence[str],
+        query_words: set,
+        positions: Sequence[int]
+    ) -> np.ndarray:
+        """_score_sentence'in tüm cümleler için vektörel karşılığı (aynı skorlar)."""
+        lowered = [sentence.lower() for sentence in sentences]
+        matrix = _TermMatrix([set(sent.split()) for sent in lowered])
+        
+        overlap = matrix.overlap(query_words) / max(len(query_words), 1)
+        importance_bonus = self._importance_bonus[self._marker_counts(lowered)]
+        position_score = np.where(np.asarray(positions, dtype=np.int64) < 3, 1.0, 0.8)
+        length_factor = np.where(matrix.sizes < 5, 0.5, np.where(matrix.sizes > 50, 0.7, 1.0))
+        
+        return (overlap * 0.5 + importance_bonus +
+                position_score * 0.2 + length_factor * 0.1)
+    
+    def _marker_counts(self, lowered: List[str]) -> np.ndarray:
+        """Her cümlede geçen farklı importance marker sayısı."""
+        markers = tuple(self.importance_markers)
+        return np.fromiter(
+            (len([marker for marker in markers if marker in sent]) for sent in lowered),
+            dtype=np.int64,
+            count=len(lowered)
+        )
+    
     def _extract_key_sentences(
         self,
         text: str,
@@ -421,18 +502,11 @@ class ContextOptimizer:
             return text
         
         query_words = set(query.lower().split())
-        scored = []
-        for i, sent in enumerate(sentences):
-            score = self._score_sentence(sent, query_words, i)
-            scored.append((i, sent, score))
-        
-        # Top sentences
-        scored.sort(key=lambda x: x[2], reverse=True)
-        top = scored[:max_sentences]
-        
-        # Original order
-        top.sort(key=lambda x: x[0])
-        return " ".join(s for _, s, _ in top)
+        scores = self._score_sentences(sentences, query_words, range(len(sentences)))
+        
+        # Top sentences, original order
+        top = sorted(int(i) for i in np.argsort(-scores, kind="stable")[:max_sentences])
+        return " ".join(sentences[i] for i in top)
     
     def _jaccard_similarity(self, set1: set, set2: set) -> float:
         """Jaccard similarity hesapla."""
@@ -20,12 +20,20 @@ import asyncio
 import json
 import logging
 import re
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 import hashlib
 
+import numpy as np
+
+from core.config import settings
+
 # Premium Cache integration
 try:
     from core.premium_cache import get_embedding_cache, EmbeddingCache
@@ -75,6 +83,249 @@ class HyDEResult:
     generation_time_ms: int = 0
 
 
+# ============ TRANSFORM CACHE ============
+
+class QueryTransformCache:
+    """
+    HyDE dökümanları ve sorgu dönüşümü LLM cevapları için kalıcı önbellek.
+    
+    Anahtar (tür, normalize sorgu, template, model) üçlüsünden üretilir.
+    TTL'i dolan kayıtlar okunmaz; max_entries aşılınca en uzun süredir
+    kullanılmayan kayıtlar silinir (LRU). Anahtar tutmazsa aynı kapsamdaki
+    (tür, template, model) kayıtlar arasında sorgu embedding'i cosine
+    benzerliği similarity_threshold üzerinde olan en yakın kayıt döner;
+    böylece yeniden ifade edilmiş sorular da LLM çağrısı yapmaz.
+    db_path verilmezse bellek içi SQLite kullanılır.
+    """
+    
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        ttl_seconds: int = 86400 * 7,
+        max_entries: int = 5000,
+        similarity_threshold: float = 0.95,
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path) if self.db_path else ":memory:",
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_transforms ("
+            "key TEXT PRIMARY KEY, scope TEXT NOT NULL, query TEXT NOT NULL, "
+            "embedding BLOB, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_query_transforms_scope ON query_transforms (scope)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        # scope -> (anahtarlar, normalize embedding matrisi)
+        self._index: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        self._stats = {"hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0}
+    
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Büyük/küçük harf, noktalama ve boşluk farklarını yok say."""
+        return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+    
+    @staticmethod
+    def _digest(*parts: Any) -> str:
+        payload = json.dumps(parts, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def make_scope(self, kind: str, template: str = "", model: str = "") -> str:
+        return self._digest(kind, template, model)
+    
+    def make_key(self, kind: str, query: str, template: str = "", model: str = "") -> str:
+        return self._digest(kind, self.normalize_query(query), template, model)
+    
+    def _read(self, key: str) -> Optional[Any]:
+        """TTL içindeki kaydı oku ve erişim zamanını güncelle (kilit altında)."""
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value FROM query_transforms WHERE key = ? AND created_at >= ?",
+            (key, now - self.ttl_seconds),
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("UPDATE query_transforms SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return json.loads(row[0])
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Birebir anahtar ile oku."""
+        with self._lock:
+            value = self._read(key)
+            if value is not None:
+                self._stats["hits"] += 1
+        return value
+    
+    def _load_index(self, scope: str) -> Tuple[List[str], np.ndarray]:
+        index = self._index.get(scope)
+        if index is None:
+            rows = self._conn.execute(
+                "SELECT key, embedding FROM query_transforms "
+                "WHERE scope = ? AND embedding IS NOT NULL AND created_at >= ?",
+                (scope, time.time() - self.ttl_seconds),
+            ).fetchall()
+            keys = [key for key, _ in rows]
+            vectors = [np.frombuffer(blob, dtype=np.float32) for _, blob in rows]
+            dims = {len(v) for v in vectors}
+            if len(dims) == 1:
+                matrix = np.vstack(vectors)
+            else:
+                # Embedding modeli değişmişse yalnızca en güncel boyut kullanılır
+                dim = len(vectors[-1]) if vectors else 0
+                pairs = [(k, v) for k, v in zip(keys, vectors) if len(v) == dim]
+                keys = [k for k, _ in pairs]
+                matrix = np.vstack([v for _, v in pairs]) if pairs else np.zeros((0, 0), dtype=np.float32)
+            index = (keys, matrix)
+            self._index[scope] = index
+        return index
+    
+    @staticmethod
+    def _normalized(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def get_similar(self, scope: str, embedding: List[float]) -> Optional[Any]:
+        """Aynı kapsamda embedding'i en yakın (eşik üstü) kaydı oku."""
+        query_vector = self._normalized(embedding)
+        with self._lock:
+            keys, matrix = self._load_index(scope)
+            if not keys or matrix.shape[1] != query_vector.shape[0]:
+                return None
+            scores = matrix @ query_vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity_threshold:
+                return None
+            value = self._read(keys[best])
+            if value is not None:
+                self._stats["semantic_hits"] += 1
+        return value
+    
+    def put(
+        self,
+        key: str,
+        scope: str,
+        query: str,
+        value: Any,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        """Kaydet; süresi dolanları ve LRU fazlasını sil."""
+        blob = self._normalized(embedding).tobytes() if embedding is not None else None
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO query_transforms "
+                "(key, scope, query, embedding, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, scope, query, blob, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._index.pop(scope, None)
+            
+            removed = self._conn.execute(
+                "DELETE FROM query_transforms WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            overflow = self._conn.execute("SELECT COUNT(*) FROM query_transforms").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                removed += self._conn.execute(
+                    "DELETE FROM query_transforms WHERE key IN ("
+                    "SELECT key FROM query_transforms ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+            if removed:
+                self._stats["evictions"] += removed
+                self._index.clear()
+            self._conn.commit()
+    
+    async def get_or_compute(
+        self,
+        kind: str,
+        query: str,
+        compute: Callable[[], Awaitable[Any]],
+        template: str = "",
+        model: str = "",
+        embed: Optional[Callable[[str], Awaitable[Optional[List[float]]]]] = None,
+    ) -> Any:
+        """
+        Önbellekten döndür, yoksa hesapla ve kaydet.
+        
+        Sıra: birebir anahtar -> embedding benzerliği -> compute().
+        Boş sonuçlar (başarısız LLM çağrısı) kaydedilmez.
+        """
+        key = self.make_key(kind, query, template, model)
+        value = await asyncio.to_thread(self.get, key)
+        if value is not None:
+            return value
+        
+        scope = self.make_scope(kind, template, model)
+        embedding = None
+        if embed is not None:
+            try:
+                embedding = await embed(self.normalize_query(query))
+            except Exception as e:
+                logger.warning(f"Query embedding for cache lookup failed: {e}")
+            if embedding is not None:
+                value = await asyncio.to_thread(self.get_similar, scope, embedding)
+                if value is not None:
+                    return value
+        
+        self._stats["misses"] += 1
+        value = await compute()
+        if value:
+            await asyncio.to_thread(self.put, key, scope, query, value, embedding)
+        return value
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM query_transforms")
+            self._conn.commit()
+            self._index.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM query_transforms").fetchone()[0]
+        return {**self._stats, "size": size}
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_transform_cache: Optional[QueryTransformCache] = None
+_transform_cache_lock = threading.Lock()
+
+
+def get_transform_cache() -> QueryTransformCache:
+    """HyDE ve QueryTransformer'ın paylaştığı global önbellek."""
+    global _transform_cache
+    with _transform_cache_lock:
+        if _transform_cache is None:
+            _transform_cache = QueryTransformCache(settings.DATA_DIR / "query_transform_cache.db")
+        return _transform_cache
+
+
+def _llm_model_name(llm_client) -> str:
+    """Önbellek anahtarı için LLM model adı (yerel fallback: Ollama llama3.2)."""
+    if llm_client is None:
+        return "llama3.2"
+    return str(
+        getattr(llm_client, "model", None)
+        or getattr(llm_client, "model_name", None)
+        or type(llm_client).__name__
+    )
+
+
 class QueryAnalyzer:
     """Sorgu analizi ve sınıflandırma"""
     
@@ -247,16 +498,25 @@ Soru: {query}
 Varsayımsal Döküman:""",
     }
     
-    def __init__(self, llm_client=None, embedding_func=None):
+    def __init__(
+        self,
+        llm_client=None,
+        embedding_func=None,
+        cache: Optional[QueryTransformCache] = None,
+        use_cache: bool = True,
+    ):
         """
         Args:
             llm_client: LLM client (ollama, openai, etc.)
             embedding_func: Embedding function (optional)
+            cache: Paylaşılan dönüşüm önbelleği (None = global önbellek)
+            use_cache: Önbelleği kullan
         """
         self.llm_client = llm_client
         self.embedding_func = embedding_func
         self.analyzer = QueryAnalyzer()
-        self._cache: Dict[str, HyDEResult] = {}
+        self._cache = cache
+        self.use_cache = use_cache
         
         # Try to get default embedding function
         if self.embedding_func is None:
@@ -275,6 +535,13 @@ Varsayımsal Döküman:""",
             pass
         return None
     
+    def _get_cache(self) -> Optional[QueryTransformCache]:
+        if not self.use_cache:
+            return None
+        if self._cache is None:
+            self._cache = get_transform_cache()
+        return self._cache
+    
     async def generate(
         self,
         query: str,
@@ -294,14 +561,8 @@ Varsayımsal Döküman:""",
         Returns:
             HyDEResult
         """
-        import time
         start_time = time.time()
         
-        # Cache check
-        cache_key = hashlib.md5(f"{query}:{template_type}".encode()).hexdigest()
-        if use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
-        
         # Analyze query
         analysis = self.analyzer.analyze(query)
         
@@ -312,13 +573,35 @@ Varsayımsal Döküman:""",
         template = self.TEMPLATES.get(template_type, self.TEMPLATES["general"])
         prompt = template.format(query=query)
         
-        # Generate hypothetical document
-        hypothetical_doc = await self._generate_document(prompt)
+        async def compute() -> Optional[Dict[str, Any]]:
+            document = await self._llm_document(prompt)
+            if not document:
+                return None
+            embedding = await self._generate_embedding(document) if generate_embedding else None
+            return {"document": document, "embedding": embedding}
+        
+        # Generate hypothetical document (aynı/benzer sorgu için önbellekten)
+        cache = self._get_cache() if use_cache else None
+        if cache is not None:
+            cached = await cache.get_or_compute(
+                "hyde", query, compute,
+                template=template,
+                model=_llm_model_name(self.llm_client),
+                embed=self._generate_embedding,
+            )
+        else:
+            cached = await compute()
         
-        # Generate embedding for hypothetical document
-        embedding = None
-        if generate_embedding and hypothetical_doc:
-            embedding = await self._generate_embedding(hypothetical_doc)
+        if cached:
+            hypothetical_doc = cached["document"]
+            embedding = cached.get("embedding")
+            if generate_embedding and embedding is None:
+                embedding = await self._generate_embedding(hypothetical_doc)
+        else:
+            hypothetical_doc = self._fallback_document(prompt)
+            embedding = None
+            if generate_embedding:
+                embedding = await self._generate_embedding(hypothetical_doc)
         
         # Generate additional retrieval queries
         retrieval_queries = self._generate_retrieval_queries(query, hypothetical_doc)
@@ -333,10 +616,6 @@ Varsayımsal Döküman:""",
             generation_time_ms=generation_time,
         )
         
-        # Cache
-        if use_cache:
-            self._cache[cache_key] = result
-        
         return result
     
     async def _generate_embedding(self, text: str) -> Optional[List[float]]:
@@ -411,6 +690,10 @@ Varsayımsal Döküman:""",
     
     async def _generate_document(self, prompt: str) -> str:
         """LLM ile döküman oluştur"""
+        return await self._llm_document(prompt) or self._fallback_document(prompt)
+    
+    async def _llm_document(self, prompt: str) -> Optional[str]:
+        """LLM (veya yerel Ollama) ile döküman oluştur; başarısızsa None"""
         if self.llm_client:
             try:
                 # Use provided LLM client
@@ -440,7 +723,10 @@ Varsayımsal Döküman:""",
         except Exception as e:
             logger.warning(f"Ollama generation failed: {e}")
         
-        # Ultimate fallback: Return query-based document
+        return None
+    
+    def _fallback_document(self, prompt: str) -> str:
+        """Ultimate fallback: Return query-based document"""
         return f"This document discusses {prompt.split('Query:')[-1].strip().split(chr(10))[0]}. It provides comprehensive information about the topic, including key concepts, definitions, and relevant details."
     
     def _generate_retrieval_queries(
@@ -473,9 +759,14 @@ class QueryTransformer:
     - Multi-Query Generation
     """
     
-    def __init__(self, llm_client=None):
+    def __init__(
+        self,
+        llm_client=None,
+        cache: Optional[QueryTransformCache] = None,
+        use_cache: bool = True,
+    ):
         self.llm_client = llm_client
-        self.hyde = HyDEGenerator(llm_client)
+        self.hyde = HyDEGenerator(llm_client, cache=cache, use_cache=use_cache)
         self.analyzer = QueryAnalyzer()
     
     async def transform(
@@ -612,7 +903,7 @@ Original query: {query}
 
 Alternative queries (one per line):"""
         
-        response = await self._call_llm(prompt)
+        response = await self._cached_llm("expansion", query, prompt)
         queries = [q.strip() for q in response.split('\n') if q.strip()]
         return [query] + queries[:3]
     
@@ -625,7 +916,7 @@ Main question: {query}
 
 Sub-questions (one per line):"""
         
-        response = await self._call_llm(prompt)
+        response = await self._cached_llm("decomposition", query, prompt)
         sub_questions = [q.strip() for q in response.split('\n') if q.strip()]
         return sub_questions[:4] if sub_questions else [query]
     
@@ -638,7 +929,7 @@ Specific question: {query}
 
 General question:"""
         
-        response = await self._call_llm(prompt)
+        response = await self._cached_llm("step_back", query, prompt)
         return response.strip() or query
     
     async def _llm_rewrite_query(self, query: str) -> str:
@@ -650,9 +941,23 @@ Original: {query}
 
 Rewritten:"""
         
-        response = await self._call_llm(prompt)
+        response = await self._cached_llm("rewrite", query, prompt)
         return response.strip() or query
     
+    async def _cached_llm(self, kind: str, query: str, prompt: str) -> str:
+        """Önbellekli LLM çağrısı: aynı veya benzer sorgu için cevabı yeniden kullan"""
+        cache = self.hyde._get_cache()
+        if cache is None:
+            return await self._call_llm(prompt)
+        
+        response = await cache.get_or_compute(
+            kind, query, lambda: self._call_llm(prompt),
+            template=prompt.replace(query, "{query}"),
+            model=_llm_model_name(self.llm_client),
+            embed=self.hyde._generate_embedding,
+        )
+        return response or ""
+    
     async def _call_llm(self, prompt: str) -> str:
         """LLM çağrısı"""
         if self.llm_client:
@@ -827,22 +1132,52 @@ class AdvancedRetriever:
                 QueryTransformationType.MULTI_QUERY
             )
             
-            all_results = []
-            for variant_query in transformed.transformed_queries[:3]:
-                results = self.vector_store.search_with_scores(
-                    query=variant_query,
-                    n_results=top_k // 2,
+            variants = transformed.transformed_queries[:3]
+            n_results = max(1, top_k // 2)
+            
+            # Tüm varyantlar tek batch'te embed edilir, tek sorguda aranır
+            if hasattr(self.vector_store, "search_by_embeddings"):
+                embeddings = self.embedding_func(variants)
+                result_lists = self.vector_store.search_by_embeddings(
+                    embeddings=embeddings,
+                    n_results=n_results,
                 )
+            else:
+                result_lists = [
+                    self.vector_store.search_with_scores(query=variant, n_results=n_results)
+                    for variant in variants
+                ]
+            
+            for variant_query, results in zip(variants, result_lists):
                 for r in results:
                     r["retrieval_method"] = "multi_query"
                     r["variant_query"] = variant_query
-                all_results.extend(results)
             
-            return all_results
+            return self._rrf_merge(result_lists)
         except Exception as e:
             logger.warning(f"Multi-query retrieval error: {e}")
             return []
     
+    def _rrf_merge(self, result_lists: List[List[Dict]], k: int = 60) -> List[Dict]:
+        """Reciprocal Rank Fusion ile varyant sonuçlarını birleştir"""
+        rrf_scores: Dict[str, float] = {}
+        best: Dict[str, Dict] = {}
+        
+        for results in result_lists:
+            for rank, r in enumerate(results, 1):
+                key = r.get("id") or hashlib.md5(r.get("document", "")[:200].encode()).hexdigest()
+                rrf_scores[key] = rrf_scores.get(key, 0.0) + 1.0 / (k + rank)
+                if key not in best or r.get("score", 0) > best[key].get("score", 0):
+                    best[key] = r
+        
+        merged = []
+        for key in sorted(rrf_scores, key=rrf_scores.get, reverse=True):
+            r = best[key]
+            r["rrf_score"] = rrf_scores[key]
+            merged.append(r)
+        
+        return merged
+    
     def _deduplicate(self, results: List[Dict]) -> List[Dict]:
         """Sonuçları deduplicate et"""
         seen = set()
@@ -632,8 +632,8 @@ class ContextWindowOptimizer:
                 seen_content.add(content_hash)
                 unique_chunks.append(chunk)
         
-        # 2. Score'a göre sırala
-        unique_chunks.sort(key=lambda x: x.score, reverse=True)
+        # 2. Score'a göre sırala (RRF ile birleştirilmişse füzyon sırası korunur)
+        unique_chunks.sort(key=lambda x: x.metadata.get("rrf_score", x.score), reverse=True)
         
         # 3. Token limitine uydur
         total_tokens = 0
@@ -854,32 +854,95 @@ class RAGPipeline:
         semantic_results.sort(key=lambda x: x.score, reverse=True)
         return semantic_results[:top_k]
     
+    def _batch_semantic_search(
+        self,
+        queries: List[str],
+        top_k: int,
+        filter_metadata: Dict = None,
+        score_threshold: float = 0.3,
+    ) -> List[List[RetrievedChunk]]:
+        """
+        Birden fazla sorgu için tek seferde semantic search.
+        
+        Tüm sorgular tek batch'te embed edilir ve vector store'a tek
+        çoklu-sorgu isteği gönderilir. Store bunu desteklemiyorsa her
+        sorgu ayrı aranır.
+        """
+        if not hasattr(self._vector_store, "search_by_embeddings"):
+            return [self._semantic_search(q, top_k, filter_metadata) for q in queries]
+        
+        embeddings = self._embedding_manager.embed_texts(queries)
+        result_lists = self._vector_store.search_by_embeddings(
+            embeddings=embeddings,
+            n_results=top_k,
+            where=filter_metadata,
+        )
+        
+        return [
+            [
+                RetrievedChunk(
+                    id=r.get("id", ""),
+                    content=r.get("document", ""),
+                    score=r.get("score", 0.0),
+                    metadata=r.get("metadata", {}),
+                    retrieval_strategy=RetrievalStrategy.SEMANTIC,
+                )
+                for r in results
+                if r.get("score", 0.0) >= score_threshold
+            ]
+            for results in result_lists
+        ]
+    
+    def _rrf_fuse(
+        self,
+        result_lists: List[List[RetrievedChunk]],
+        top_k: int,
+        strategy: RetrievalStrategy,
+        k: int = 60,
+    ) -> List[RetrievedChunk]:
+        """
+        Reciprocal Rank Fusion ile sonuç listelerini birleştir.
+        
+        Sıralama RRF'e göredir; `score` chunk'ın en iyi benzerlik skoru olarak
+        kalır (citation confidence), RRF değeri metadata["rrf_score"]'dadır.
+        """
+        rrf_scores = defaultdict(float)
+        chunk_map = {}
+        
+        for results in result_lists:
+            for rank, chunk in enumerate(results, 1):
+                key = chunk.id or hash(chunk.content[:100])
+                rrf_scores[key] += 1.0 / (k + rank)
+                
+                if key not in chunk_map or chunk.score > chunk_map[key].score:
+                    chunk_map[key] = chunk
+        
+        # Sort by RRF score
+        sorted_keys = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
+        
+        fused_chunks = []
+        for key in sorted_keys[:top_k]:
+            chunk = chunk_map[key]
+            chunk.metadata = {**chunk.metadata, "rrf_score": rrf_scores[key]}
+            chunk.retrieval_strategy = strategy
+            fused_chunks.append(chunk)
+        
+        return fused_chunks
+    
     def _multi_query_search(
         self,
         query: str,
         top_k: int,
         filter_metadata: Dict = None,
     ) -> List[RetrievedChunk]:
-        """Multi-query expansion search."""
+        """Multi-query expansion search (tek batch embedding + RRF)."""
         # Generate query variations
         queries = self._generate_query_variations(query)
         
-        # Search with all queries
-        all_results = {}
-        
-        for q in queries:
-            results = self._semantic_search(q, top_k, filter_metadata)
-            for r in results:
-                key = r.id or hash(r.content[:100])
-                if key not in all_results or r.score > all_results[key].score:
-                    all_results[key] = r
+        # Search with all queries in one round trip
+        result_lists = self._batch_semantic_search(queries, top_k, filter_metadata)
         
-        # Sort and return
-        chunks = sorted(all_results.values(), key=lambda x: x.score, reverse=True)
-        for c in chunks:
-            c.retrieval_strategy = RetrievalStrategy.MULTI_QUERY
-        
-        return chunks[:top_k]
+        return self._rrf_fuse(result_lists, top_k, RetrievalStrategy.MULTI_QUERY)
     
     def _fusion_search(
         self,
@@ -906,28 +969,7 @@ class RAGPipeline:
             pass
         
         # RRF fusion
-        rrf_scores = defaultdict(float)
-        chunk_map = {}
-        
-        for results in result_lists:
-            for rank, chunk in enumerate(results, 1):
-                key = chunk.id or hash(chunk.content[:100])
-                rrf_scores[key] += 1.0 / (k + rank)
-                
-                if key not in chunk_map or chunk.score > chunk_map[key].score:
-                    chunk_map[key] = chunk
-        
-        # Sort by RRF score
-        sorted_keys = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
-        
-        fused_chunks = []
-        for key in sorted_keys[:top_k]:
-            chunk = chunk_map[key]
-            chunk.score = rrf_scores[key]
-            chunk.retrieval_strategy = RetrievalStrategy.FUSION
-            fused_chunks.append(chunk)
-        
-        return fused_chunks
+        return self._rrf_fuse(result_lists, top_k, RetrievalStrategy.FUSION, k=k)
     
     def _retrieve_by_pages(
         self,
@@ -25,7 +25,8 @@ Enterprise Features:
 - Statistical analysis and confidence intervals
 - Export to various formats (JSON, CSV, HTML)
 - Integration with common LLM providers
-- Caching for repeated evaluations
+- Caching for repeated evaluations (LLM judgements keyed by content hash)
+- Concurrent batch evaluation with resumable JSONL checkpoints
 
 Author: AI Assistant
 Version: 2.0.0
@@ -37,13 +38,17 @@ import json
 import logging
 import math
 import re
+import sqlite3
 import statistics
+import threading
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import (
     Any,
     Callable,
@@ -242,6 +247,145 @@ class EmbeddingProtocol(Protocol):
         ...
 
 
+# =============================================================================
+# JUDGEMENT CACHE
+# =============================================================================
+
+class JudgementCache:
+    """
+    LLM yargıları ve embedding'ler için içerik-hash anahtarlı önbellek.
+    
+    Prompt'lar örnek içeriğini (soru, cevap, context) içerdiğinden prompt
+    hash'i örnek başına anahtardır; aynı örnek tekrar değerlendirildiğinde
+    LLM çağrısı yapılmaz. db_path verilmezse bellek içi SQLite kullanılır.
+    Kayıt sayısı `max_entries`'i aşınca en uzun süredir kullanılmayanlar
+    silinir (None: sınırsız, yalnızca toplu koşular için).
+    """
+    
+    DEFAULT_MAX_ENTRIES = 10000
+    
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.max_entries = max_entries
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path) if self.db_path else ":memory:",
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS judgements ("
+            "key TEXT PRIMARY KEY, kind TEXT NOT NULL, value TEXT NOT NULL, "
+            "used_at REAL NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(judgements)")}
+        if "used_at" not in columns:
+            # Eski şema: LRU sütunu sonradan eklendi
+            self._conn.execute("ALTER TABLE judgements ADD COLUMN used_at REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_judgements_used ON judgements (used_at)")
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(kind: str, *parts: Any) -> str:
+        payload = json.dumps([kind, *parts], ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM judgements WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE judgements SET used_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return json.loads(row[0])
+    
+    def put(self, key: str, kind: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO judgements (key, kind, value, used_at) VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+            if self.max_entries is not None:
+                overflow = self._conn.execute("SELECT COUNT(*) FROM judgements").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    self._conn.execute(
+                        "DELETE FROM judgements WHERE key IN "
+                        "(SELECT key FROM judgements ORDER BY used_at ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                    self.evictions += overflow
+            self._conn.commit()
+    
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM judgements").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size, "evictions": self.evictions}
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedLLM:
+    """LLM'i JudgementCache ile saran vekil (LLMProtocol)."""
+    
+    def __init__(self, llm: Optional[LLMProtocol], cache: JudgementCache):
+        self._llm = llm
+        self.cache = cache
+    
+    def _model_name(self) -> str:
+        """Yargıç modelin adı (model değişince eski yargılar kullanılmaz)."""
+        for attr in ("_current_model", "model_name", "model"):
+            value = getattr(self._llm, attr, None)
+            if isinstance(value, str) and value:
+                return value
+        return type(self._llm).__name__
+    
+    def generate(self, prompt: str, **kwargs) -> str:
+        if self._llm is None:
+            from core.llm_manager import llm_manager
+            self._llm = llm_manager
+        
+        key = self.cache.make_key("llm", self._model_name(), prompt, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = self._llm.generate(prompt, **kwargs)
+        self.cache.put(key, "llm", response)
+        return response
+
+
+class CachedEmbedding:
+    """Embedding modelini JudgementCache ile saran vekil (EmbeddingProtocol)."""
+    
+    def __init__(self, embedding: EmbeddingProtocol, cache: JudgementCache):
+        self._embedding = embedding
+        self.cache = cache
+    
+    def embed_text(self, text: str) -> List[float]:
+        key = self.cache.make_key("embedding", text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        vector = list(self._embedding.embed_text(text))
+        self.cache.put(key, "embedding", vector)
+        return vector
+
+
 # =============================================================================
 # METRIC IMPLEMENTATIONS
 # =============================================================================
@@ -1090,10 +1234,19 @@ class RAGASEvaluator:
         llm: Optional[LLMProtocol] = None,
         embedding_model: Optional[EmbeddingProtocol] = None,
         evaluation_level: EvaluationLevel = EvaluationLevel.STANDARD,
+        cache: Optional[JudgementCache] = None,
+        enable_cache: bool = True,
     ):
+        self.cache = cache or (JudgementCache() if enable_cache else None)
+        if self.cache is not None:
+            llm = CachedLLM(llm, self.cache)
+            if embedding_model is not None:
+                embedding_model = CachedEmbedding(embedding_model, self.cache)
+        
         self._llm = llm
         self._embedding = embedding_model
         self.evaluation_level = evaluation_level
+        self._stats_lock = threading.Lock()
         
         # Initialize metrics
         self._metrics: Dict[MetricType, BaseMetric] = {}
@@ -1197,8 +1350,9 @@ class RAGASEvaluator:
         total_time = int((time.time() - start_time) * 1000)
         
         # Update stats
-        self._evaluation_count += 1
-        self._total_processing_time += total_time
+        with self._stats_lock:
+            self._evaluation_count += 1
+            self._total_processing_time += total_time
         
         return RAGASResult(
             input=input_data,
@@ -1229,44 +1383,191 @@ class RAGASEvaluator:
         self,
         samples: List[Dict[str, Any]],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: int = 4,
+        checkpoint_path: Optional[Union[str, Path]] = None,
     ) -> BatchEvaluationResult:
         """
         Toplu değerlendirme.
         
+        Örnekler en fazla `max_workers` eşzamanlı worker ile değerlendirilir.
+        `checkpoint_path` verilirse tamamlanan her örnek JSONL dosyasına
+        yazılır; aynı dosyayla tekrar çağrıldığında tamamlanmış örnekler
+        atlanır (yarım kalan koşu kaldığı yerden devam eder).
+        
         Args:
             samples: List of dicts with 'question', 'answer', 'contexts', 'ground_truth'
             progress_callback: Progress callback(current, total)
+            max_workers: Eşzamanlı değerlendirme sayısı
+            checkpoint_path: JSONL checkpoint dosyası
             
         Returns:
             BatchEvaluationResult
         """
-        results: List[RAGASResult] = []
+        keys = [self._sample_key(sample) for sample in samples]
+        completed = self._load_checkpoint(checkpoint_path) if checkpoint_path else {}
+        
+        results: List[Optional[RAGASResult]] = [completed.get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
         failed = 0
+        done = len(samples) - len(pending)
         
-        for i, sample in enumerate(samples):
-            try:
-                result = self.evaluate(
-                    question=sample.get("question", ""),
-                    answer=sample.get("answer", ""),
-                    contexts=sample.get("contexts", []),
-                    ground_truth=sample.get("ground_truth"),
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Sample {i} failed: {e}")
-                failed += 1
-            
+        if done:
+            logger.info(f"Resuming batch evaluation: {done}/{len(samples)} samples from checkpoint")
             if progress_callback:
-                progress_callback(i + 1, len(samples))
+                progress_callback(done, len(samples))
+        
+        checkpoint = open(checkpoint_path, "a", encoding="utf-8") if checkpoint_path else None
+        
+        def run(i: int) -> RAGASResult:
+            sample = samples[i]
+            return self.evaluate(
+                question=sample.get("question", ""),
+                answer=sample.get("answer", ""),
+                contexts=sample.get("contexts", []),
+                ground_truth=sample.get("ground_truth"),
+            )
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="ragas-eval")
+        try:
+            futures = {executor.submit(run, i): i for i in pending}
+            
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    result = future.result()
+                    results[i] = result
+                    if checkpoint:
+                        line = json.dumps(
+                            {"key": keys[i], "index": i, "result": self._result_to_record(result)},
+                            ensure_ascii=False,
+                        )
+                        checkpoint.write(line + "\n")
+                        checkpoint.flush()
+                except Exception as e:
+                    logger.error(f"Sample {i} failed: {e}")
+                    failed += 1
+                
+                done += 1
+                if progress_callback:
+                    progress_callback(done, len(samples))
+        finally:
+            # Kesintide (Ctrl+C vb.) kuyruktaki örnekler başlatılmaz
+            executor.shutdown(wait=True, cancel_futures=True)
+            if checkpoint:
+                checkpoint.close()
+        
+        successful = [r for r in results if r is not None]
         
         # Calculate aggregate statistics
-        batch_result = self._calculate_batch_statistics(results)
+        batch_result = self._calculate_batch_statistics(successful)
         batch_result.total_samples = len(samples)
-        batch_result.successful_samples = len(results)
+        batch_result.successful_samples = len(successful)
         batch_result.failed_samples = failed
         
         return batch_result
     
+    async def evaluate_batch_async(
+        self,
+        samples: List[Dict[str, Any]],
+        max_workers: int = 4,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+    ) -> BatchEvaluationResult:
+        """Asenkron toplu değerlendirme (event loop'u bloklamaz)."""
+        return await asyncio.to_thread(
+            self.evaluate_batch,
+            samples,
+            max_workers=max_workers,
+            checkpoint_path=checkpoint_path,
+        )
+    
+    # -------------------------------------------------------------------------
+    # Checkpoint helpers
+    # -------------------------------------------------------------------------
+    
+    def _sample_key(self, sample: Dict[str, Any]) -> str:
+        """Örnek içeriği ve metrik seti için hash anahtarı."""
+        return JudgementCache.make_key(
+            "sample",
+            sample.get("question", ""),
+            sample.get("answer", ""),
+            sample.get("contexts", []),
+            sample.get("ground_truth"),
+            [m.value for m in self._get_metrics_for_level()],
+        )
+    
+    def _load_checkpoint(self, checkpoint_path: Union[str, Path]) -> Dict[str, RAGASResult]:
+        """JSONL checkpoint'ten tamamlanmış örnekleri yükle."""
+        path = Path(checkpoint_path)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return {}
+        
+        completed: Dict[str, RAGASResult] = {}
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    completed[record["key"]] = self._result_from_record(record["result"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    # Yarım yazılmış son satır (kesinti) atlanır
+                    logger.warning(f"Skipping invalid checkpoint line {line_no}: {e}")
+        
+        return completed
+    
+    @staticmethod
+    def _result_to_record(result: RAGASResult) -> Dict[str, Any]:
+        """RAGASResult'ı kayıpsız JSON kaydına dönüştür."""
+        return {
+            "input": {
+                "question": result.input.question,
+                "answer": result.input.answer,
+                "contexts": result.input.contexts,
+                "ground_truth": result.input.ground_truth,
+                "question_id": result.input.question_id,
+                "metadata": result.input.metadata,
+            },
+            "metrics": {
+                metric_type.value: {
+                    "score": metric.score,
+                    "confidence": metric.confidence,
+                    "explanation": metric.explanation,
+                    "sub_scores": metric.sub_scores,
+                    "processing_time_ms": metric.processing_time_ms,
+                    "method_used": metric.method_used,
+                }
+                for metric_type, metric in result.metrics.items()
+            },
+            "overall_score": result.overall_score,
+            "category_scores": result.category_scores,
+            "quality_tier": result.quality_tier.value,
+            "issues_detected": result.issues_detected,
+            "recommendations": result.recommendations,
+            "total_processing_time_ms": result.total_processing_time_ms,
+            "evaluated_at": result.evaluated_at,
+        }
+    
+    @staticmethod
+    def _result_from_record(record: Dict[str, Any]) -> RAGASResult:
+        """JSON kaydından RAGASResult oluştur."""
+        metrics = {
+            MetricType(name): MetricResult(metric_type=MetricType(name), **data)
+            for name, data in record["metrics"].items()
+        }
+        return RAGASResult(
+            input=RAGASInput(**record["input"]),
+            metrics=metrics,
+            overall_score=record["overall_score"],
+            category_scores=record["category_scores"],
+            quality_tier=QualityTier(record["quality_tier"]),
+            issues_detected=record["issues_detected"],
+            recommendations=record["recommendations"],
+            total_processing_time_ms=record["total_processing_time_ms"],
+            evaluated_at=record["evaluated_at"],
+        )
+    
     def _calculate_overall_score(self, metrics: Dict[MetricType, MetricResult]) -> float:
         """Genel skor hesapla."""
         if not metrics:
@@ -1420,6 +1721,7 @@ class RAGASEvaluator:
             "avg_processing_time_ms": self._total_processing_time / max(self._evaluation_count, 1),
             "evaluation_level": self.evaluation_level.value,
             "metrics_available": [m.value for m in self._metrics.keys()],
+            "cache": self.cache.get_stats() if self.cache else None,
         }
 
 
@@ -1449,6 +1751,9 @@ __all__ = [
     "RAGASResult",
     "MetricResult",
     "BatchEvaluationResult",
+    "JudgementCache",
+    "CachedLLM",
+    "CachedEmbedding",
     "MetricType",
     "EvaluationLevel",
     "QualityTier",
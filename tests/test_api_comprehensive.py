@@ -335,7 +335,7 @@ class TestWebSearchEndpoints:
             mock_result.related_queries = []
             mock_result.cached = False
             
-            mock_engine.return_value.search.return_value = mock_result
+            mock_engine.return_value.search_async = AsyncMock(return_value=mock_result)
             mock_engine.return_value.get_sources_for_ui.return_value = []
             
             response = client.post(
@@ -0,0 +1,155 @@
+"""
+Enterprise AI Assistant - Citation Verifier Tests
+=================================================
+
+Claim x kaynak destek matrisi ve yalnızca belirsiz claim'ler için
+eşzamanlı LLM doğrulaması testleri.
+"""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag.citation_verifier import (
+    CitationVerifier,
+    Claim,
+    ClaimType,
+    SourceCitation,
+    SourceVerifier,
+    VerificationStatus,
+)
+
+
+SOURCES = [
+    {"content": "Python dili 1991 yılında Guido van Rossum tarafından yayınlandı.", "id": "s1"},
+    {"content": "Django Python ile yazılmış bir web çatısıdır ve hızlı geliştirme sağlar.", "id": "s2"},
+]
+
+
+class FakeLLM:
+    """Gecikmeli, eşzamanlılığı ölçen sahte LLM."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return json.dumps({
+            "status": "partial", "confidence": 0.6,
+            "supporting_source_indices": [1], "explanation": "kısmen",
+        })
+
+
+def make_claim(text: str, i: int = 0) -> Claim:
+    return Claim(id=f"c{i}", text=text, claim_type=ClaimType.FACTUAL, sentence_index=i)
+
+
+class TestSupportMatrix:
+    """Destek matrisi testleri."""
+
+    def test_matches_word_overlap(self):
+        """Matris, claim başına kelime örtüşme skoruyla aynı olmalı."""
+        rng = random.Random(7)
+        words = [f"w{i}" for i in range(40)]
+        claims = [make_claim(" ".join(rng.sample(words, 6)), i) for i in range(25)]
+        sources = [
+            SourceCitation(id=f"s{j}", document_id=f"d{j}", content=" ".join(rng.sample(words, 15)))
+            for j in range(8)
+        ]
+
+        matrix = SourceVerifier(llm=FakeLLM())._support_matrix(claims, sources)
+
+        for i, claim in enumerate(claims):
+            claim_words = set(claim.text.lower().split())
+            for j, source in enumerate(sources):
+                expected = len(claim_words & set(source.content.lower().split())) / len(claim_words)
+                assert matrix[i, j] == pytest.approx(expected)
+
+
+class TestVerifyResponse:
+    """Toplu doğrulama testleri."""
+
+    def test_llm_only_for_ambiguous_claims(self):
+        """Açık destekli ve desteksiz claim'ler LLM'e gitmemeli."""
+        llm = FakeLLM(delay=0)
+        verifier = CitationVerifier(llm=llm)
+        response = (
+            "Python dili 1991 yılında Guido van Rossum tarafından yayınlandı. "
+            "Django hızlı geliştirme için kullanılan popüler bir araçtır. "
+            "Kuantum bilgisayarlar kriptografiyi tamamen dönüştürecek."
+        )
+
+        analysis = verifier.verify_response(response, SOURCES)
+        statuses = [r.status for r in analysis.verification_results]
+
+        assert statuses == [
+            VerificationStatus.VERIFIED,
+            VerificationStatus.PARTIALLY_VERIFIED,
+            VerificationStatus.UNSUPPORTED,
+        ]
+        assert llm.calls == 1
+        assert analysis.verified_claims == 1
+        assert analysis.claims[0].supporting_sources == ["cite_0"]
+
+    def test_high_overlap_with_wrong_number_goes_to_llm(self):
+        """Kelimeleri örtüşen ama sayısı farklı claim LLM'siz onaylanmamalı."""
+        llm = FakeLLM(delay=0)
+        verifier = SourceVerifier(llm=llm)
+        sources = [
+            SourceCitation(id=f"cite_{i}", document_id=f"d{i}", content=s["content"])
+            for i, s in enumerate(SOURCES)
+        ]
+        claims = [
+            make_claim("Python dili 1995 yılında Guido van Rossum tarafından yayınlandı.", 0),
+            make_claim("python dili 1991 yılında guido van rossum tarafından yayınlandı", 1),
+            make_claim("Python dili 991 yılında Guido van Rossum tarafından yayınlandı.", 2),
+        ]
+
+        results = verifier.verify_claims(claims, sources)
+
+        assert [r.status for r in results] == [
+            VerificationStatus.PARTIALLY_VERIFIED,
+            VerificationStatus.VERIFIED,
+            VerificationStatus.PARTIALLY_VERIFIED,
+        ]
+        assert llm.calls == 2
+        assert results[1].confidence == 1.0
+
+    def test_ambiguous_claims_verified_concurrently(self):
+        """Belirsiz claim'ler sınırlı eşzamanlılıkla doğrulanmalı."""
+        llm = FakeLLM(delay=0.05)
+        verifier = CitationVerifier(llm=llm)
+        verifier.source_verifier.max_concurrency = 4
+        response = " ".join(
+            f"Django çatısı proje {i} için hızlı geliştirme sağlar." for i in range(40)
+        )
+
+        started = time.perf_counter()
+        analysis = verifier.verify_response(response, SOURCES)
+        elapsed = time.perf_counter() - started
+
+        assert len(analysis.claims) == 40
+        assert llm.calls == 40
+        assert llm.max_active == 4
+        assert elapsed < 1.0
+        assert all(
+            r.status == VerificationStatus.PARTIALLY_VERIFIED
+            for r in analysis.verification_results
+        )
@@ -0,0 +1,144 @@
+"""
+Enterprise AI Assistant - Code Interpreter Tests
+================================================
+
+CodeInterpreter worker havuzu testleri.
+Oturum izolasyonu, paralel çalışma, timeout'ta süreç öldürme ve fallback.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.code_interpreter import CodeInterpreter, ExecutionStatus, SandboxConfig
+
+
+@pytest.fixture
+def interpreter(tmp_path):
+    """İki worker'lı yorumlayıcı."""
+    ci = CodeInterpreter(SandboxConfig(work_dir=str(tmp_path), worker_processes=2))
+    yield ci
+    ci.shutdown()
+
+
+class TestWorkerPool:
+    """Önceden ısıtılmış worker havuzu testleri."""
+
+    @pytest.mark.asyncio
+    async def test_session_state_and_work_dir_isolated(self, interpreter):
+        """Oturum değişkenleri korunmalı, çalışma dizinleri karışmamalı."""
+        await interpreter.warm_up()
+        first = interpreter.create_session()
+        second = interpreter.create_session()
+
+        await interpreter.execute_python("x = 41", first)
+        result = await interpreter.execute_python("_result = x + 1", first)
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.return_value == 42
+
+        results = await asyncio.gather(
+            interpreter.execute_python("import os\n_result = os.getcwd()", first),
+            interpreter.execute_python("import os\n_result = os.getcwd()", second),
+        )
+        assert results[0].return_value == interpreter.get_session(first)["work_dir"]
+        assert results[1].return_value == interpreter.get_session(second)["work_dir"]
+
+    @pytest.mark.asyncio
+    async def test_sessions_run_in_parallel(self, interpreter):
+        """Farklı worker'lardaki oturumlar paralel çalışmalı."""
+        await interpreter.warm_up()
+        sessions = [interpreter.create_session() for _ in range(2)]
+
+        start = time.monotonic()
+        results = await asyncio.gather(*(
+            interpreter.execute_python("import time\ntime.sleep(0.5)", sid) for sid in sessions
+        ))
+        assert all(r.status == ExecutionStatus.SUCCESS for r in results)
+        assert time.monotonic() - start < 0.9
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_worker_and_restores_session(self, interpreter):
+        """Sonsuz döngü öldürülmeli, oturum değişkenleri yeni worker'a aktarılmalı."""
+        session = interpreter.create_session()
+        await interpreter.execute_python("counter = 7", session)
+
+        result = await interpreter.execute_python("while True:\n    pass", session, timeout=1)
+        assert result.status == ExecutionStatus.TIMEOUT
+
+        result = await interpreter.execute_python("_result = counter", session)
+        assert result.status == ExecutionStatus.SUCCESS
+        assert result.return_value == 7
+        assert sum(w["restarts"] for w in interpreter._pool.get_stats()["workers"]) == 1
+
+
+class TestInlineFallback:
+    """Havuz kapalıyken süreç içi çalışma testleri."""
+
+    @pytest.mark.asyncio
+    async def test_inline_execution(self, tmp_path):
+        """worker_processes=0 iken kod thread'de çalışmalı."""
+        ci = CodeInterpreter(SandboxConfig(work_dir=str(tmp_path), worker_processes=0))
+        session = ci.create_session()
+
+        result = await ci.execute_python("print('merhaba')\n_result = [1, 2]", session)
+        assert result.stdout.strip() == "merhaba"
+        assert result.return_value == [1, 2]
+
+        result = await ci.execute_python("raise ValueError('hata')", session)
+        assert result.status == ExecutionStatus.ERROR
+        assert "hata" in result.error
+
+    @pytest.mark.asyncio
+    async def test_inline_does_not_change_process_cwd(self, tmp_path):
+        """Thread'de çalışan kod süreç cwd'sini değiştirmemeli; göreli dosyalar oturum dizinine yazılmalı."""
+        ci = CodeInterpreter(SandboxConfig(work_dir=str(tmp_path), worker_processes=0))
+        sessions = [ci.create_session() for _ in range(2)]
+        cwd = os.getcwd()
+
+        await asyncio.gather(*(
+            ci.execute_python(f"with open('veri.txt', 'w') as f:\n    f.write('{sid}')", sid)
+            for sid in sessions
+        ))
+
+        assert os.getcwd() == cwd
+        for sid in sessions:
+            assert (Path(ci.get_session(sid)["work_dir"]) / "veri.txt").read_text() == sid
+
+    @pytest.mark.asyncio
+    async def test_pool_failure_recreates_pool(self, tmp_path):
+        """Havuz hatası havuzu kalıcı olarak kapatmamalı."""
+        ci = CodeInterpreter(SandboxConfig(work_dir=str(tmp_path), worker_processes=1))
+        broken = ci._pool
+
+        async def failing_execute(*args, **kwargs):
+            raise RuntimeError("worker başlatılamadı")
+
+        broken.execute = failing_execute
+        session = ci.create_session()
+
+        result = await ci.execute_python("_result = 5", session)
+        assert result.return_value == 5
+        assert ci._pool is not None and ci._pool is not broken
+        assert ci._pool_retry_at > time.time()
+
+
+class TestModuleImport:
+    """Modül import yan etkileri testleri."""
+
+    def test_import_creates_no_work_dir(self, tmp_path):
+        """Spawn worker'larının yaptığı gibi modülü import etmek geçici dizin açmamalı."""
+        root = Path(__file__).parent.parent
+        env = {**os.environ, "TMPDIR": str(tmp_path), "PYTHONPATH": str(root)}
+        subprocess.run(
+            [sys.executable, "-c", "import core.code_interpreter"],
+            cwd=root, env=env, check=True, capture_output=True, timeout=120
+        )
+
+        assert not list(tmp_path.glob("code_interpreter_*"))
@@ -0,0 +1,192 @@
+"""
+Enterprise AI Assistant - Content Prefetcher Tests
+==================================================
+
+Paket içeriği ön üretim motoru testleri.
+Konum tahmini, arka plan zenginleştirme, tekil uçuş ve kalıcı depo.
+"""
+
+import asyncio
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.learning_journey_v2 import (
+    ContentPrefetcher,
+    CurriculumPlannerAgent,
+    LearningGoal,
+    PackageStatus,
+)
+
+
+class SlowLLM:
+    """Gecikmeli ve çağrı sayan LLM servisi."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = 0
+
+    async def generate_async(self, prompt: str, **kwargs) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return f"LLM içeriği #{self.calls}"
+
+
+async def make_plan():
+    planner = CurriculumPlannerAgent(use_llm=False)
+    plan, _ = await planner.plan_curriculum(
+        LearningGoal(title="AYT Matematik", subject="Matematik", target_outcome="35 net")
+    )
+    return planner, plan
+
+
+def packages_of(plan):
+    return [(stage, package) for stage in plan.stages for package in stage.packages]
+
+
+class TestContentPrefetcher:
+    """ContentPrefetcher testleri."""
+
+    @pytest.mark.asyncio
+    async def test_predicts_from_journey_position(self):
+        """Tahmin ilk tamamlanmamış paketten başlamalı."""
+        planner, plan = await make_plan()
+        prefetcher = ContentPrefetcher(planner, lookahead=2, store_path=None)
+        ordered = packages_of(plan)
+
+        ordered[0][1].status = PackageStatus.PASSED
+        predicted = prefetcher.predict_next(plan)
+
+        assert [p.id for _, p in predicted] == [ordered[1][1].id, ordered[2][1].id]
+
+    @pytest.mark.asyncio
+    async def test_background_prefetch_makes_open_instant(self, tmp_path):
+        """Arka planda hazırlanan paket açılışta LLM beklemeden dönmeli."""
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM()
+        prefetcher = ContentPrefetcher(planner, lookahead=2, store_path=tmp_path / "cache.db")
+
+        scheduled = prefetcher.schedule_journey(plan)
+        assert len(scheduled) == 2
+
+        for _ in range(100):
+            if prefetcher.get_stats()["prefetched"] == 2:
+                break
+            await asyncio.sleep(0.02)
+
+        stage, package = packages_of(plan)[0]
+        assert package.llm_content_ready
+        assert all(b.metadata.get("llm_enhanced") is not False for b in package.content_blocks)
+
+        calls = planner.llm_service.calls
+        assert await prefetcher.ensure_ready(package, stage, plan.goal)
+        assert planner.llm_service.calls == calls
+        assert prefetcher.get_stats()["ready_on_open"] == 1
+
+        await prefetcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_open_joins_inflight_prefetch(self):
+        """Arka planda üretilen paket açılırsa iş tekrarlanmamalı."""
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM(delay=0.1)
+        prefetcher = ContentPrefetcher(planner, lookahead=1, store_path=None)
+        stage, package = packages_of(plan)[0]
+
+        prefetcher.schedule_journey(plan)
+        await asyncio.sleep(0.02)
+        assert prefetcher.get_stats()["inflight"] == 1
+        calls_in_flight = planner.llm_service.calls
+
+        assert await prefetcher.ensure_ready(package, stage, plan.goal)
+        assert planner.llm_service.calls == calls_in_flight
+
+        await prefetcher.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_store_restores_without_llm(self, tmp_path):
+        """Kalıcı depodaki içerik yeni yolculukta LLM çağrısı olmadan gelmeli."""
+        db_path = tmp_path / "cache.db"
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM(delay=0)
+        stage, package = packages_of(plan)[0]
+
+        first = ContentPrefetcher(planner, store_path=db_path)
+        assert await first.ensure_ready(package, stage, plan.goal)
+        intro = package.content_blocks[0].content["markdown"]
+        await first.shutdown()
+
+        planner2, plan2 = await make_plan()
+        planner2.llm_service = SlowLLM(delay=0)
+        stage2, package2 = packages_of(plan2)[0]
+
+        second = ContentPrefetcher(planner2, store_path=db_path)
+        assert await second.ensure_ready(package2, stage2, plan2.goal)
+
+        assert planner2.llm_service.calls == 0
+        assert package2.content_blocks[0].content["markdown"] == intro
+        assert second.get_stats()["restored_blocks"] > 0
+        await second.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_does_not_cancel_joined_open(self):
+        """Spekülatif iş durdurulsa da ona katılan paket açılışı sonuç almalı."""
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM(delay=0.1)
+        prefetcher = ContentPrefetcher(planner, lookahead=1, store_path=None)
+        stage, package = packages_of(plan)[0]
+
+        prefetcher.schedule_journey(plan)
+        await asyncio.sleep(0.02)
+        opening = asyncio.ensure_future(prefetcher.ensure_ready(package, stage, plan.goal))
+        await asyncio.sleep(0)
+
+        await prefetcher.shutdown()
+
+        assert await opening
+        assert package.llm_content_ready
+        stats = prefetcher.get_stats()
+        assert stats["waited_on_open"] == 1 and stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_is_cancelled(self):
+        """Bekleyeni kalmayan spekülatif iş iptal edilmeli."""
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM(delay=0.2)
+        prefetcher = ContentPrefetcher(planner, lookahead=1, store_path=None)
+        stage, package = packages_of(plan)[0]
+
+        prefetcher.schedule_journey(plan)
+        await asyncio.sleep(0.02)
+        job = prefetcher._inflight[package.id]
+
+        await prefetcher.shutdown()
+        await asyncio.sleep(0)
+
+        assert job.cancelled()
+        assert not package.llm_content_ready
+
+    @pytest.mark.asyncio
+    async def test_store_restore_counts_as_ready(self, tmp_path):
+        """Depodan gelen içerik açılışta 'waited' sayılmamalı."""
+        db_path = tmp_path / "cache.db"
+        planner, plan = await make_plan()
+        planner.llm_service = SlowLLM(delay=0)
+        stage, package = packages_of(plan)[0]
+        first = ContentPrefetcher(planner, store_path=db_path)
+        await first.ensure_ready(package, stage, plan.goal)
+        assert first.get_stats()["waited_on_open"] == 1
+        await first.shutdown()
+
+        planner2, plan2 = await make_plan()
+        planner2.llm_service = SlowLLM(delay=0)
+        stage2, package2 = packages_of(plan2)[0]
+        second = ContentPrefetcher(planner2, store_path=db_path)
+        await second.ensure_ready(package2, stage2, plan2.goal)
+
+        stats = second.get_stats()
+        assert stats["ready_on_open"] == 1 and stats["waited_on_open"] == 0
+        await second.shutdown()
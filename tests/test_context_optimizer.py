@@ -0,0 +1,137 @@
+"""
+Enterprise AI Assistant - Context Optimizer Tests
+=================================================
+
+Prefix filtreli near-duplicate eleme ve vektörel cümle skorlamasının
+birebir karşılaştırmalı (brute-force) sonuçlarla aynı seçimi yaptığını doğrular.
+"""
+
+import random
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag.context_optimizer import CompressionStrategy, ContextOptimizer, OptimizerConfig
+
+
+WORDS = (
+    "python decorator fonksiyon sınıf veri model bellek önbellek sorgu cevap "
+    "ve bu için bir the is önemli sonuç olarak dikkat temel kritik"
+).split()
+
+
+def random_documents(rng: random.Random, num_docs: int, sentences_per_doc: int):
+    """Tekrarlı cümleler içeren rastgele dokümanlar."""
+    pool = []
+    documents = []
+    for _ in range(num_docs):
+        sentences = []
+        for _ in range(sentences_per_doc):
+            if pool and rng.random() < 0.3:
+                sentences.append(rng.choice(pool))
+                continue
+            words = [rng.choice(WORDS) for _ in range(rng.choice([2, 4, 7, 12, 55]))]
+            sentence = " ".join(words).capitalize() + "."
+            pool.append(sentence)
+            sentences.append(sentence)
+        documents.append({"content": " ".join(sentences)})
+    return documents
+
+
+def brute_force_deduplicate(optimizer: ContextOptimizer, word_sets):
+    """Tüm çiftleri karşılaştıran referans eleme."""
+    kept = []
+    for i, words in enumerate(word_sets):
+        if not any(
+            optimizer._jaccard_similarity(words, word_sets[j]) > optimizer.config.overlap_threshold
+            for j in kept
+        ):
+            kept.append(i)
+    return kept
+
+
+class TestDeduplication:
+    """Near-duplicate eleme testleri."""
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.7, 0.85, 0.95, 1.0, -0.1])
+    def test_matches_pairwise_comparison(self, threshold):
+        """Prefix filtreleme tüm çiftlerin karşılaştırılmasıyla aynı cümleleri tutmalı."""
+        optimizer = ContextOptimizer(OptimizerConfig(overlap_threshold=threshold))
+        rng = random.Random(threshold)
+
+        for _ in range(30):
+            word_sets = [
+                set(rng.sample(WORDS, rng.randint(0, 8))) - optimizer.stop_words
+                for _ in range(rng.randint(0, 40))
+            ]
+            assert optimizer._deduplicate(word_sets) == brute_force_deduplicate(optimizer, word_sets)
+
+    def test_semantic_strategy_drops_repeats(self):
+        """Aynı cümle birden fazla dokümanda geçse de bir kez seçilmeli."""
+        optimizer = ContextOptimizer()
+        documents = [
+            {"content": "Python decorator fonksiyonu sarar. Önbellek sorguyu hızlandırır."},
+            {"content": "Python decorator fonksiyonu sarar. Model cevabı üretir."},
+        ]
+
+        result = optimizer.optimize(documents, "decorator", max_tokens=500, strategy=CompressionStrategy.SEMANTIC)
+
+        assert result.content.count("Python decorator fonksiyonu sarar.") == 1
+        assert result.content.splitlines()[0] == "Python decorator fonksiyonu sarar."
+
+
+class TestVectorizedScoring:
+    """Vektörel skorlama testleri."""
+
+    def test_scores_equal_scalar_scores(self):
+        """Vektörel skorlar _score_sentence ile bit düzeyinde aynı olmalı."""
+        optimizer = ContextOptimizer()
+        rng = random.Random(3)
+        sentences = optimizer._split_sentences(random_documents(rng, 1, 200)[0]["content"])
+        query_words = {"python", "decorator", "önemli"}
+
+        scores = optimizer._score_sentences(sentences, query_words, range(len(sentences)))
+        expected = [optimizer._score_sentence(s, query_words, i) for i, s in enumerate(sentences)]
+
+        assert scores.tolist() == expected
+        assert optimizer._score_sentences([], query_words, []).tolist() == []
+
+    @pytest.mark.parametrize("strategy", [
+        CompressionStrategy.EXTRACTIVE,
+        CompressionStrategy.HIERARCHICAL,
+        CompressionStrategy.SEMANTIC,
+    ])
+    def test_selection_respects_budget(self, strategy):
+        """Seçilen içerik token limitini aşmamalı ve kaynak sayısı tutarlı olmalı."""
+        optimizer = ContextOptimizer(OptimizerConfig(preserve_structure=False))
+        documents = random_documents(random.Random(5), 6, 30)
+
+        for max_tokens in (10, 80, 400):
+            result = optimizer.optimize(documents, "python önbellek", max_tokens=max_tokens, strategy=strategy)
+            sentence_tokens = sum(
+                optimizer._estimate_tokens(line) for line in result.content.splitlines()
+            )
+            if strategy != CompressionStrategy.HIERARCHICAL:
+                assert sentence_tokens <= max_tokens
+            assert 0 <= result.sources_used <= len(documents)
+
+    def test_large_document_set_is_fast(self):
+        """Binlerce cümlelik semantic optimizasyon ikili karşılaştırmaya düşmemeli."""
+        rng = random.Random(11)
+        vocab = [f"terim{i}" for i in range(3000)]
+        base = [" ".join(rng.choice(vocab) for _ in range(rng.randint(6, 20))) + "." for _ in range(1500)]
+        sentences = base + [rng.choice(base) for _ in range(500)]
+        documents = [{"content": " ".join(sentences[i:i + 100])} for i in range(0, len(sentences), 100)]
+
+        start = time.perf_counter()
+        result = ContextOptimizer().optimize(
+            documents, "terim1 terim2", max_tokens=2000, strategy=CompressionStrategy.SEMANTIC
+        )
+
+        assert time.perf_counter() - start < 5.0
+        lines = result.content.splitlines()
+        assert lines and len(lines) == len(set(lines))
@@ -365,5 +365,138 @@ class TestCRAGMetrics:
         assert result.confidence == 0.8
 
 
+class FakeGraderLLM:
+    """Çağrı başına gecikme enjekte edilebilen sahte LLM grader."""
+    
+    def __init__(self, delays: Dict[str, float]):
+        self.delays = delays
+        self.calls: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def __call__(self, query: str, content: str) -> float:
+        self.calls.append(content)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delays.get(content, 0.05))
+        self.in_flight -= 1
+        return 0.9
+    
+    async def batch(self, query: str, contents: List[str]) -> List[float]:
+        self.calls.append(f"batch:{len(contents)}")
+        await asyncio.sleep(0.05)
+        return [0.9] * len(contents)
+
+
+class FakeEmbedder:
+    """Kelime torbası tabanlı sahte embedder."""
+    
+    VOCAB = ["python", "dil", "programlama", "hava", "yemek", "futbol"]
+    
+    def _vec(self, text: str) -> List[float]:
+        words = text.lower().split()
+        return [float(sum(w.startswith(v) for w in words)) for v in self.VOCAB]
+    
+    def embed_query(self, query: str) -> List[float]:
+        return self._vec(query)
+    
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        return [self._vec(t) for t in texts]
+
+
+def make_docs(relevant: int, misses: int) -> List[Dict[str, Any]]:
+    docs = [
+        {"content": f"Python programlama dili örnek {i}", "source": f"py{i}.txt"}
+        for i in range(relevant)
+    ]
+    docs += [
+        {"content": f"Bugün hava yağmurlu ve futbol maçı ertelendi {i}", "source": f"x{i}.txt"}
+        for i in range(misses)
+    ]
+    return docs
+
+
+class TestConcurrentGrading:
+    """Eşzamanlı ve ön filtreli grading testleri."""
+    
+    @pytest.mark.asyncio
+    async def test_latency_tracks_slowest_grade(self):
+        """Toplam süre en yavaş grade'e yakın olmalı, toplamına değil."""
+        import time
+        from core.crag_system import RelevanceGrader
+        
+        docs = make_docs(relevant=12, misses=0)
+        delays = {d["content"]: 0.05 for d in docs}
+        delays[docs[3]["content"]] = 0.3
+        llm = FakeGraderLLM(delays)
+        grader = RelevanceGrader(llm_grader=llm, max_concurrency=16)
+        
+        started = time.perf_counter()
+        graded = await grader.grade_documents("Python programlama dili", docs)
+        elapsed = time.perf_counter() - started
+        
+        assert len(graded) == 12
+        assert len(llm.calls) == 12
+        assert 0.3 <= elapsed < 0.5
+        assert all(d.relevance_score > 0.8 for d in graded)
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Aynı anda en fazla max_concurrency LLM çağrısı olmalı."""
+        from core.crag_system import RelevanceGrader
+        
+        llm = FakeGraderLLM({})
+        grader = RelevanceGrader(llm_grader=llm, max_concurrency=3)
+        
+        await grader.grade_documents("Python programlama dili", make_docs(relevant=10, misses=0))
+        
+        assert llm.max_in_flight == 3
+    
+    @pytest.mark.asyncio
+    async def test_prefilter_skips_clear_misses(self):
+        """Açık ıskalar LLM'e gitmeden düşük notla dönmeli."""
+        from core.crag_system import RelevanceGrader, RelevanceGrade
+        
+        llm = FakeGraderLLM({})
+        grader = RelevanceGrader(llm_grader=llm, embedder=FakeEmbedder())
+        docs = make_docs(relevant=3, misses=5)
+        
+        graded = await grader.grade_documents("Python programlama dili", docs)
+        
+        assert len(graded) == 8
+        assert sorted(llm.calls) == sorted(d["content"] for d in docs[:3])
+        misses = [d for d in graded if d.metadata.get("prefiltered")]
+        assert len(misses) == 5
+        assert all(d.grade == RelevanceGrade.NOT_RELEVANT for d in misses)
+        assert grader.stats["prefiltered"] == 5
+    
+    @pytest.mark.asyncio
+    async def test_semantic_signal_keeps_paraphrases(self):
+        """Kelime örtüşmesi olmayan ama anlamca yakın doküman elenmemeli."""
+        from core.crag_system import RelevanceGrader
+        
+        llm = FakeGraderLLM({})
+        grader = RelevanceGrader(llm_grader=llm, embedder=FakeEmbedder())
+        doc = {"content": "yılan adlı yazılım aracı", "source": "p.txt", "embedding": [1.0, 1.0, 0, 0, 0, 0]}
+        
+        graded = await grader.grade_documents("Python programlama", [doc])
+        
+        assert llm.calls == ["yılan adlı yazılım aracı"]
+        assert not graded[0].metadata.get("prefiltered")
+    
+    @pytest.mark.asyncio
+    async def test_batch_grader_groups_calls(self):
+        """Batch grader varsa dokümanlar gruplar halinde tek çağrıyla notlanmalı."""
+        from core.crag_system import RelevanceGrader
+        
+        llm = FakeGraderLLM({})
+        grader = RelevanceGrader(llm_batch_grader=llm.batch, batch_size=4)
+        
+        graded = await grader.grade_documents("Python programlama dili", make_docs(relevant=10, misses=0))
+        
+        assert sorted(llm.calls) == ["batch:2", "batch:4", "batch:4"]
+        assert all(d.relevance_score > 0.8 for d in graded)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,157 @@
+"""
+Enterprise AI Assistant - DeepScholar Pipeline Tests
+====================================================
+
+DeepScholarOrchestrator bölüm pipeline'ı testleri.
+Eşzamanlı araştırma, sıralı yazım, event akışı ve pause checkpoint'i.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.deep_scholar import (
+    DeepScholarConfig,
+    DeepScholarOrchestrator,
+    EventType,
+    SectionOutline,
+)
+
+
+def _outline(count: int):
+    return [
+        SectionOutline(id=f"s{i}", title=f"Bölüm {i}", level=1,
+                       page_start=i, page_end=i + 1, word_target=100)
+        for i in range(count)
+    ]
+
+
+def _config(**overrides):
+    values = dict(
+        title="Test", topic="Test konusu", page_count=3,
+        enable_fact_checking=False, enable_user_proxy=False, enable_visuals=False,
+        enable_originality_check=False, enable_analytics=False,
+        enable_dynamic_pages=False, enable_realtime_streaming=False,
+    )
+    values.update(overrides)
+    return DeepScholarConfig(**values)
+
+
+class _FakeAgents:
+    """Gecikmeli sahte ajan davranışları."""
+
+    def __init__(self, research_delay=0.2, write_delay=0.1, on_write=None):
+        self.research_delay = research_delay
+        self.write_delay = write_delay
+        self.on_write = on_write
+        self.active_research = 0
+        self.max_active_research = 0
+        self.previous_summaries = []
+
+    async def research(self, section, config, local_state):
+        self.active_research += 1
+        self.max_active_research = max(self.max_active_research, self.active_research)
+        await asyncio.sleep(self.research_delay)
+        self.active_research -= 1
+        return []
+
+    async def write(self, section, research, local_state, config):
+        self.previous_summaries.append(local_state.previous_section_summary)
+        await asyncio.sleep(self.write_delay)
+        if self.on_write:
+            self.on_write(section)
+        return f"# {section.title}\nİçerik", []
+
+    async def summarize(self, prompt, temperature=0.7, timeout=600):
+        return "özet:" + prompt.split("# ")[-1].split("\n")[0]
+
+    def patches(self, outline):
+        async def plan(agent, config):
+            return outline
+        return [
+            patch("core.deep_scholar.PlannerAgent.create_master_outline", plan),
+            patch("core.deep_scholar.ResearcherAgent.research_section", self.research),
+            patch("core.deep_scholar.WriterAgent.write_section", self.write),
+            patch("core.deep_scholar.WriterAgent._llm_generate", self.summarize),
+        ]
+
+
+async def _run(orchestrator, config, fakes, outline):
+    patches = fakes.patches(outline)
+    for p in patches:
+        p.start()
+    try:
+        return [event async for event in orchestrator.generate_document(config)]
+    finally:
+        for p in patches:
+            p.stop()
+
+
+class TestSectionPipeline:
+    """Pipeline zamanlama ve event testleri."""
+
+    @pytest.mark.asyncio
+    async def test_research_runs_concurrently_with_bounded_budget(self):
+        """Araştırmalar sınırlı eşzamanlılıkla paralel çalışmalı."""
+        fakes = _FakeAgents(research_delay=0.2, write_delay=0.05)
+        outline = _outline(6)
+
+        start = time.monotonic()
+        events = await _run(DeepScholarOrchestrator(), _config(max_parallel_sections=3), fakes, outline)
+        elapsed = time.monotonic() - start
+
+        assert events[-1]["type"] == EventType.COMPLETE.value
+        assert fakes.max_active_research == 3
+        # Sıralı: 6 * 0.2 + 6 * 0.05 = 1.5s
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_writing_is_ordered_and_uses_previous_summary(self):
+        """Yazım sırayla ilerlemeli ve önceki bölüm özetini almalı."""
+        fakes = _FakeAgents(research_delay=0.01, write_delay=0.01)
+        events = await _run(DeepScholarOrchestrator(), _config(), fakes, _outline(3))
+
+        completed = [e["section_index"] for e in events if e["type"] == EventType.SECTION_COMPLETE.value]
+        assert completed == [0, 1, 2]
+        assert fakes.previous_summaries == ["", "özet:Bölüm 0", "özet:Bölüm 1"]
+
+        progress = [e["progress"] for e in events if "progress" in e]
+        assert progress == sorted(progress)
+
+        document = events[-1]["document"]["content"]
+        assert document.index("Bölüm 0") < document.index("Bölüm 2")
+
+    @pytest.mark.asyncio
+    async def test_pause_saves_checkpoint(self):
+        """Duraklatmada tamamlanan ve bekleyen bölümler checkpoint'e yazılmalı."""
+        document_id = "pipeline-pause-test"
+        orchestrator = DeepScholarOrchestrator()
+        orchestrator.set_document_id(document_id)
+
+        def pause_after_first(section):
+            if section.id == "s0":
+                DeepScholarOrchestrator.pause_generation(document_id)
+                asyncio.get_running_loop().call_later(
+                    0.2, DeepScholarOrchestrator.resume_generation, document_id
+                )
+
+        fakes = _FakeAgents(research_delay=0.01, write_delay=0.01, on_write=pause_after_first)
+        try:
+            events = await _run(orchestrator, _config(), fakes, _outline(3))
+
+            types = [e["type"] for e in events]
+            assert EventType.PAUSED.value in types
+            assert types.index(EventType.PAUSED.value) < types.index(EventType.RESUMED.value)
+
+            checkpoint = DeepScholarOrchestrator.get_checkpoint(document_id)
+            assert [s["id"] for s in checkpoint.completed_sections] == ["s0"]
+            assert [s["id"] for s in checkpoint.pending_sections] == ["s1", "s2"]
+            assert events[-1]["type"] == EventType.COMPLETE.value
+        finally:
+            DeepScholarOrchestrator.delete_checkpoint(document_id)
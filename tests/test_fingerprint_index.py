@@ -0,0 +1,176 @@
+"""
+Enterprise AI Assistant - Fingerprint Index Tests
+=================================================
+
+Winnowing + MinHash/LSH parmak izi indeksi testleri.
+Tam eşleşme aralıkları, parafraz adayları ve kontrolcü entegrasyonu.
+"""
+
+import random
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.deep_scholar_premium.quality.fingerprint_index import FingerprintIndex
+from core.deep_scholar_premium.quality.plagiarism_detector import PlagiarismDetector
+from core.deep_scholar_premium.advanced.originality_checker import OriginalityChecker
+
+
+VOCAB = [f"kelime{i}" for i in range(2000)]
+
+
+def make_text(rng: random.Random, sentences: int, words: int = 15) -> str:
+    return " ".join(
+        " ".join(rng.choice(VOCAB) for _ in range(words)) + "." for _ in range(sentences)
+    )
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(7)
+    sources = {f"s{i}": make_text(rng, 40) for i in range(20)}
+    return rng, sources
+
+
+class TestFingerprintIndex:
+    """FingerprintIndex testleri."""
+
+    def test_exact_span_located_in_both_texts(self, corpus):
+        """Kopyalanan aralık her iki metinde doğru konumla bulunmalı."""
+        rng, sources = corpus
+        index = FingerprintIndex()
+        for doc_id, text in sources.items():
+            index.add_document(doc_id, text)
+
+        copied = sources["s3"].split(".")[5].strip()
+        query = make_text(rng, 10) + " " + copied + ". " + make_text(rng, 10)
+
+        spans = index.find_exact_matches(query, min_words=8)
+
+        assert len(spans) == 1
+        span = spans[0]
+        assert span.doc_id == "s3"
+        assert query[span.query_start:span.query_end] == copied
+        assert sources["s3"][span.source_start:span.source_end] == copied
+        assert span.word_count == 15
+
+    def test_case_insensitive_and_doc_filter(self, corpus):
+        """Büyük/küçük harf farkı eşleşmeyi bozmamalı; doc_ids filtresi uygulanmalı."""
+        _, sources = corpus
+        index = FingerprintIndex()
+        for doc_id, text in sources.items():
+            index.add_document(doc_id, text)
+
+        query = sources["s1"].split(".")[2].upper()
+
+        assert [s.doc_id for s in index.find_exact_matches(query)] == ["s1"]
+        assert index.find_exact_matches(query, doc_ids=["s2"]) == []
+
+    def test_paraphrase_found_via_lsh(self, corpus):
+        """Birkaç kelimesi değişmiş cümle LSH adayı olarak bulunmalı."""
+        rng, sources = corpus
+        index = FingerprintIndex()
+        for doc_id, text in sources.items():
+            index.add_document(doc_id, text)
+
+        words = sources["s9"].split(".")[4].split()
+        words[2], words[10] = "değişti", "farklı"
+        query = make_text(rng, 5) + " " + " ".join(words) + ". " + make_text(rng, 5)
+
+        matches = index.find_similar_sentences(query, threshold=0.5)
+
+        assert [m.doc_id for m in matches] == ["s9"]
+        assert 0.5 <= matches[0].similarity < 1.0
+
+    def test_remove_and_replace_document(self, corpus):
+        """Silinen kaynak eşleşmemeli, aynı id ile yeniden eklenen güncel olmalı."""
+        rng, sources = corpus
+        index = FingerprintIndex()
+        for doc_id, text in sources.items():
+            index.add_document(doc_id, text)
+        query = sources["s4"].split(".")[1]
+
+        index.remove_document("s4")
+        assert index.find_exact_matches(query) == []
+        assert len(index) == 19
+
+        index.add_document("s0", sources["s4"])
+        assert [s.doc_id for s in index.find_exact_matches(query)] == ["s0"]
+        assert len(index) == 19
+
+    def test_jaccard_against_indexed_document(self, corpus):
+        """Aynı metnin Jaccard'ı 1, ilgisiz metninki ~0 olmalı."""
+        rng, sources = corpus
+        index = FingerprintIndex()
+        index.add_document("s0", sources["s0"])
+
+        assert index.jaccard(index.kgram_set(sources["s0"]), "s0") == pytest.approx(1.0)
+        assert index.jaccard(index.kgram_set(make_text(rng, 20)), "s0") < 0.01
+
+
+class TestCheckerIntegration:
+    """İntihal ve orijinallik kontrolcüleri entegrasyon testleri."""
+
+    @pytest.mark.asyncio
+    async def test_plagiarism_detector_reports_exact_and_paraphrase(self, corpus):
+        """Tam kopya ve parafraz ayrı ayrı raporlanmalı."""
+        rng, sources = corpus
+        copied = sources["s5"].split(".")[3].strip()
+        words = sources["s7"].split(".")[2].split()
+        words[3], words[8] = "değişti", "farklı"
+        document = " ".join([make_text(rng, 30), copied + ".", " ".join(words) + ".", make_text(rng, 30)])
+
+        detector = PlagiarismDetector()
+        report = await detector.check_document(
+            document,
+            [{"id": doc_id, "title": doc_id, "content": text} for doc_id, text in sources.items()]
+        )
+
+        assert report.exact_matches == 1
+        assert report.paraphrase_matches == 1
+        kinds = {m.match_type: m.source_id for m in report.matches}
+        assert kinds == {"exact": "s5", "paraphrase": "s7"}
+
+    def test_originality_matching_phrases(self, corpus):
+        """Eşleşen ifade hedef metindeki konumuyla dönmeli."""
+        _, sources = corpus
+        copied = sources["s2"].split(".")[6].strip()
+        target = "önce " + copied + " sonra"
+
+        checker = OriginalityChecker()
+        phrases = checker.ngram_analyzer.find_matching_phrases(target, sources["s2"])
+
+        assert phrases == [(copied, 5, 5 + len(copied))]
+
+    def test_short_copied_phrases_are_found(self, corpus):
+        """min_length ile k + window - 1 arasındaki kısa kopyalar kaçırılmamalı."""
+        rng, sources = corpus
+        checker = OriginalityChecker()
+        words = sources["s4"].split(".")[3].split()
+
+        for length in (5, 6, 7):
+            copied = " ".join(words[:length])
+            target = make_text(rng, 2) + " " + copied + " " + make_text(rng, 2)
+            phrases = checker.ngram_analyzer.find_matching_phrases(target, sources["s4"], min_length=5)
+            assert [p for p, _, _ in phrases] == [copied]
+
+        analyzer = checker.ngram_analyzer
+        assert analyzer.index.k + analyzer.index.window - 1 <= 5
+
+    def test_source_eviction_is_lru(self, corpus, monkeypatch):
+        """İndeks dolunca tüm kaynaklar değil, en eski kullanılan kaynak çıkmalı."""
+        _, sources = corpus
+        checker = OriginalityChecker()
+        analyzer = checker.ngram_analyzer
+        monkeypatch.setattr(analyzer, "MAX_INDEXED_SOURCES", 3)
+
+        ids = [analyzer.index_source(sources[f"s{i}"]) for i in range(3)]
+        analyzer.index_source(sources["s0"])  # s0 yeniden kullanıldı
+        analyzer.index_source(sources["s3"])
+
+        assert len(analyzer.index) == 3
+        assert ids[1] not in analyzer.index
+        assert ids[0] in analyzer.index and ids[2] in analyzer.index
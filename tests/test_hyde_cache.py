@@ -0,0 +1,169 @@
+"""
+Enterprise AI Assistant - HyDE / Query Transform Cache Tests
+============================================================
+
+HyDE dökümanları ve sorgu dönüşümü LLM cevapları için kalıcı önbellek
+testleri: normalize anahtar, embedding ile paraphrase eşleşmesi, TTL ve LRU.
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import rag.hyde_transformer as hyde_module
+from rag.hyde_transformer import (
+    HyDEGenerator,
+    QueryTransformCache,
+    QueryTransformationType,
+    QueryTransformer,
+)
+
+
+class CountingLLM:
+    """Çağrı sayan sahte LLM client."""
+
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs) -> str:
+        self.calls += 1
+        return f"Varsayımsal cevap #{self.calls}. Konu hakkında ayrıntılı bir açıklama içerir."
+
+
+def bag_of_words_embedding(text: str):
+    """Uzun kelimelerin hash tabanlı kelime torbası embedding'i."""
+    vector = np.zeros(64, dtype=np.float32)
+    for word in text.lower().split():
+        if len(word) > 3:
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1.0
+    return vector.tolist()
+
+
+@pytest.fixture(autouse=True)
+def no_global_embedding_cache(monkeypatch):
+    monkeypatch.setattr(hyde_module, "CACHE_ENABLED", False)
+
+
+class TestHyDECache:
+    """HyDEGenerator önbellek testleri."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_repeat_skips_llm(self):
+        """Büyük/küçük harf ve noktalama farkı LLM çağrısı yapmamalı."""
+        llm = CountingLLM()
+        hyde = HyDEGenerator(llm, embedding_func=bag_of_words_embedding, cache=QueryTransformCache())
+
+        first = await hyde.generate("Decorator nedir?")
+        second = await hyde.generate("  DECORATOR nedir ")
+
+        assert llm.calls == 1
+        assert second.hypothetical_document == first.hypothetical_document
+        assert second.document_embedding == first.document_embedding
+        assert second.original_query == "  DECORATOR nedir "
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_served_by_embedding(self):
+        """Yeniden ifade edilen soru embedding eşleşmesiyle önbellekten dönmeli."""
+        llm = CountingLLM()
+        cache = QueryTransformCache()
+        hyde = HyDEGenerator(llm, embedding_func=bag_of_words_embedding, cache=cache)
+
+        await hyde.generate("Python'da decorator nasıl kullanılır?")
+        result = await hyde.generate("python decorator nasıl kullanılır")
+
+        assert llm.calls == 1
+        assert cache.get_stats()["semantic_hits"] == 1
+        assert result.retrieval_queries[0] == "python decorator nasıl kullanılır"
+
+        await hyde.generate("Java stream API nasıl çalışır?")
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_cached(self):
+        """LLM hatasında fallback döküman döner ama önbelleğe yazılmaz."""
+        cache = QueryTransformCache()
+        hyde = HyDEGenerator(CountingLLM(), embedding_func=bag_of_words_embedding, cache=cache)
+        attempts = []
+
+        async def failing_document(prompt):
+            attempts.append(prompt)
+            return None
+
+        hyde._llm_document = failing_document
+
+        result = await hyde.generate("Decorator nedir?")
+        await hyde.generate("Decorator nedir?")
+
+        assert result.hypothetical_document.startswith("This document discusses")
+        assert len(attempts) == 2
+        assert cache.get_stats()["size"] == 0
+
+
+class TestQueryTransformCache:
+    """QueryTransformer paylaşımı, kalıcılık, TTL ve LRU testleri."""
+
+    @pytest.mark.asyncio
+    async def test_transforms_persist_across_instances(self, tmp_path):
+        """Dönüşüm cevapları diske yazılmalı ve yeni örnekte LLM çağrılmamalı."""
+        db_path = tmp_path / "transforms.db"
+        llm = CountingLLM()
+        transformer = QueryTransformer(llm, cache=QueryTransformCache(db_path))
+        transformer.hyde.embedding_func = bag_of_words_embedding
+
+        first = await transformer.transform("Decorator nedir?", QueryTransformationType.EXPANSION)
+        await transformer.transform("decorator nedir", QueryTransformationType.EXPANSION)
+        await transformer.transform("Decorator nedir?", QueryTransformationType.REWRITE)
+        assert llm.calls == 2
+
+        reopened = QueryTransformer(llm, cache=QueryTransformCache(db_path))
+        reopened.hyde.embedding_func = bag_of_words_embedding
+        again = await reopened.transform("Decorator nedir?", QueryTransformationType.EXPANSION)
+
+        assert llm.calls == 2
+        assert again.transformed_queries == first.transformed_queries
+
+    def test_ttl_expiry(self, monkeypatch):
+        """TTL'i dolan kayıt okunmamalı."""
+        cache = QueryTransformCache(ttl_seconds=60)
+        key = cache.make_key("rewrite", "soru")
+        cache.put(key, cache.make_scope("rewrite"), "soru", "cevap", embedding=[1.0, 0.0])
+        assert cache.get(key) == "cevap"
+
+        now = hyde_module.time.time()
+        monkeypatch.setattr(hyde_module.time, "time", lambda: now + 120)
+
+        assert cache.get(key) is None
+        assert cache.get_similar(cache.make_scope("rewrite"), [1.0, 0.0]) is None
+
+    def test_lru_eviction(self):
+        """max_entries aşılınca en uzun süredir kullanılmayan kayıt silinmeli."""
+        cache = QueryTransformCache(max_entries=2)
+        scope = cache.make_scope("rewrite")
+        keys = [cache.make_key("rewrite", f"soru {i}") for i in range(3)]
+
+        cache.put(keys[0], scope, "soru 0", "cevap 0")
+        cache.put(keys[1], scope, "soru 1", "cevap 1")
+        assert cache.get(keys[0]) == "cevap 0"  # 0 yeniden kullanıldı
+        cache.put(keys[2], scope, "soru 2", "cevap 2")
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "cevap 0"
+        assert cache.get_stats()["size"] == 2
+
+    def test_global_cache_lives_under_data_dir(self, tmp_path, monkeypatch):
+        """Paylaşılan önbellek çalışma dizinine değil DATA_DIR'e yazılmalı."""
+        monkeypatch.setattr(hyde_module.settings, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(hyde_module, "_transform_cache", None)
+
+        cache = hyde_module.get_transform_cache()
+
+        assert cache.db_path == tmp_path / "query_transform_cache.db"
+        assert cache.db_path.exists()
+        cache.close()
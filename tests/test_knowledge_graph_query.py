@@ -0,0 +1,117 @@
+"""
+Enterprise AI Assistant - Knowledge Graph Query Index Tests
+===========================================================
+
+EnterpriseKnowledgeGraph sorgu motoru testleri.
+Trigram indeks, komşuluk haritası, yol bulma ve vektörel auto-link testleri.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.enterprise_knowledge_graph import (
+    EnterpriseKnowledgeGraph,
+    EntityType,
+    GraphQuery,
+    GraphQueryIndex,
+    RelationType,
+)
+
+
+@pytest.fixture
+def graph(tmp_path):
+    """Küçük örnek graf."""
+    kg = EnterpriseKnowledgeGraph(storage_dir=str(tmp_path / "kg"))
+    python = kg.add_entity("Python", EntityType.TECHNOLOGY, description="Programlama dili")
+    guido = kg.add_entity("Guido van Rossum", EntityType.PERSON, aliases=["BDFL"])
+    cwi = kg.add_entity("CWI", EntityType.ORGANIZATION, description="Amsterdam araştırma enstitüsü")
+    kg.add_relationship(python.id, guido.id, RelationType.CREATED_BY)
+    kg.add_relationship(guido.id, cwi.id, RelationType.WORKS_AT)
+    return kg, python, guido, cwi
+
+
+class TestGraphQueryIndex:
+    """Trigram indeks testleri."""
+
+    def test_search_matches_substring_fields(self, graph):
+        """İsim, açıklama ve alias alt-dizeleri bulunmalı."""
+        kg, python, guido, cwi = graph
+        index = kg._query_index
+
+        assert [eid for eid, _ in index.search("pyth")] == [python.id]
+        assert [eid for eid, _ in index.search("bdf")] == [guido.id]
+        assert [eid for eid, _ in index.search("amsterdam")] == [cwi.id]
+        assert index.search("bulunmayan") == []
+
+    def test_search_relevance_weights(self, graph):
+        """İsim eşleşmesi açıklama eşleşmesinden önce gelmeli."""
+        kg, python, guido, cwi = graph
+        kg.update_entity(cwi.id, {"description": "Python ile ilgili enstitü"})
+
+        results = kg._query_index.search("python")
+        assert results[0] == (python.id, 0.5)
+        assert results[1] == (cwi.id, 0.3)
+
+    def test_short_query_falls_back_to_scan(self, graph):
+        """Trigramdan kısa sorgular da çalışmalı."""
+        kg, python, guido, cwi = graph
+        ids = {eid for eid, _ in kg._query_index.search("wi")}
+        assert cwi.id in ids
+
+    def test_shortest_path_respects_max_hops(self, graph):
+        """Yol bulma yönsüz görünümde ve hop sınırıyla çalışmalı."""
+        kg, python, guido, cwi = graph
+        index = kg._query_index
+
+        assert index.shortest_path(cwi.id, python.id, 2) == [cwi.id, guido.id, python.id]
+        assert index.shortest_path(cwi.id, python.id, 1) is None
+
+    def test_similar_entities_vectorized(self):
+        """Embedding matrisi üzerinden benzerlik hesaplanmalı."""
+        from core.enterprise_knowledge_graph import Entity
+
+        index = GraphQueryIndex()
+        for eid, vector in [("a", [1.0, 0.0]), ("b", [0.9, 0.1]), ("c", [0.0, 1.0])]:
+            index.add_entity(Entity(id=eid, name=eid, type=EntityType.CONCEPT, embedding=vector))
+
+        similar = index.similar_entities({"a": [1.0, 0.0]}, threshold=0.7, top_k=3, exclude={"a"})
+        assert [eid for eid, _ in similar["a"]] == ["b"]
+
+
+class TestIndexedQuery:
+    """Graf sorgu entegrasyon testleri."""
+
+    @pytest.mark.asyncio
+    async def test_query_returns_relationships_and_paths(self, graph):
+        """Sorgu ilişkileri ve yolları indeks üzerinden döndürmeli."""
+        kg, python, guido, cwi = graph
+
+        result = await kg.query(GraphQuery(query_text="o", max_hops=2))
+
+        names = {e.name for e in result.entities}
+        assert {"Python", "Guido van Rossum"} <= names
+        assert len(result.relationships) == 2
+        assert any(path.nodes[0] == python.id and path.edges for path in result.paths)
+
+    def test_delete_entity_updates_index(self, graph):
+        """Silinen varlık ve ilişkileri indeksten kalkmalı."""
+        kg, python, guido, cwi = graph
+
+        kg.delete_entity(guido.id)
+
+        assert kg._query_index.search("guido") == []
+        assert kg.relationships == {}
+        assert kg.get_relationships(python.id) == []
+        assert kg._query_index.shortest_path(python.id, cwi.id, 3) is None
+
+    def test_index_rebuilt_on_load(self, graph, tmp_path):
+        """Diskten yüklenen graf aynı indekslere sahip olmalı."""
+        kg, python, guido, cwi = graph
+
+        reloaded = EnterpriseKnowledgeGraph(storage_dir=str(tmp_path / "kg"))
+
+        assert len(reloaded.get_relationships(guido.id)) == 2
+        assert reloaded._query_index.relationship_between(cwi.id, guido.id) is not None
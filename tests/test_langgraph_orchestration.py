@@ -0,0 +1,153 @@
+"""
+Enterprise AI Assistant - LangGraph Orchestration Tests
+=======================================================
+
+Paralel super-step, reducer birleştirme ve diff tabanlı checkpoint testleri.
+"""
+
+import asyncio
+import operator
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.langgraph_orchestration import CheckpointStore, StateGraph, TaskState
+
+
+def fan_out_graph(delay: float = 0.1, reducers=None) -> StateGraph:
+    """plan -> (a, b, c paralel) -> combine -> END."""
+    graph = StateGraph(TaskState, reducers=reducers)
+
+    def plan(state):
+        state.plan = "üç dal"
+        return state
+
+    def worker(name):
+        async def handler(state):
+            await asyncio.sleep(delay)
+            state.results.append(name)
+            state.add_message("assistant", f"{name} tamam")
+            state.context[name] = True
+            return state
+        return handler
+
+    def combine(state):
+        state.context["combined"] = sorted(state.results)
+        return state
+
+    graph.add_node("plan", plan)
+    graph.add_node("combine", combine)
+    graph.set_entry_point("plan")
+    for name in ("a", "b", "c"):
+        graph.add_node(name, worker(name))
+        graph.add_edge("plan", name)
+        graph.add_edge(name, "combine")
+    graph.set_finish("combine")
+    return graph
+
+
+class TestParallelSuperSteps:
+    """Paralel super-step testleri."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_runs_concurrently_and_merges(self):
+        """Hazır düğümler eşzamanlı çalışmalı, güncellemeler birleşmeli."""
+        app = fan_out_graph(delay=0.2).compile()
+
+        started = time.perf_counter()
+        state = await app.invoke(TaskState(task_description="görev"), config={"parallel": True})
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.45
+        assert sorted(state.results) == ["a", "b", "c"]
+        assert len(state.messages) == 3
+        assert state.context["combined"] == ["a", "b", "c"]
+        assert {"a", "b", "c"} <= set(state.context)
+        assert state.total_steps == 3
+
+    @pytest.mark.asyncio
+    async def test_custom_reducer(self):
+        """Alan için verilen reducer varsayılan birleştirmenin yerine geçmeli."""
+        app = fan_out_graph(delay=0, reducers={"results": lambda current, update: current + [len(update)]}).compile()
+
+        state = await app.invoke(TaskState(), config={"parallel": True})
+
+        assert state.results == [1, 1, 1]
+
+    def test_set_diff_bypasses_reducer(self):
+        """Değeri değiştiren dal reducer'a verilmemeli, yalnızca eklemeler verilmeli."""
+        app = fan_out_graph(delay=0, reducers={"results": operator.add}).compile()
+        base = TaskState(results=["x"])
+
+        replaced = base.model_copy(deep=True)
+        replaced.results = ["y"]
+        appended = base.model_copy(deep=True)
+        appended.results.append("z")
+
+        merged = app._merge_states(base, [replaced, appended])
+
+        assert merged.results == ["y", "z"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_unchanged(self):
+        """Varsayılan mod tek düğüm izlemeye devam etmeli."""
+        app = fan_out_graph(delay=0).compile()
+
+        state = await app.invoke(TaskState())
+
+        assert state.results == ["a"]
+        assert state.total_steps == 3
+
+
+class TestDiffCheckpoints:
+    """Diff tabanlı checkpoint testleri."""
+
+    @pytest.mark.asyncio
+    async def test_diffs_restore_every_step(self):
+        """Her adım diff'ten aynen geri kurulmalı; sadece değişenler saklanmalı."""
+        graph = StateGraph(TaskState)
+
+        def grow(state):
+            state.add_message("assistant", "x" * 200)
+            return state
+
+        graph.add_node("grow", grow)
+        graph.set_entry_point("grow")
+        graph.add_conditional_edges("grow", {"more": "grow", "done": "__end__"},
+                                    lambda s: "more" if len(s.messages) < 20 else "done")
+        app = graph.compile(checkpointer=CheckpointStore(keyframe_interval=8))
+
+        final = await app.invoke(TaskState(), config={"checkpoints": True, "execution_id": "run1"})
+
+        history = app.checkpoints.list_steps("run1")
+        assert [h["kind"] for h in history][:9] == ["full"] + ["diff"] * 7 + ["full"]
+        records = app.checkpoints._records["run1"]
+        assert records[3][3]["messages"][0] == "extend"
+        assert len(records[3][3]["messages"][1]) == 1
+
+        restored = app.get_state("run1", step=5)
+        assert len(restored.messages) == 5
+        assert app.get_state("run1").messages == final.messages
+        assert "run1" not in app.checkpoints._last
+
+    @pytest.mark.asyncio
+    async def test_sqlite_persistence(self, tmp_path):
+        """SQLite'a yazılan checkpoint yeni depoda okunabilmeli."""
+        db_path = tmp_path / "checkpoints.db"
+        app = fan_out_graph(delay=0).compile(checkpointer=CheckpointStore(db_path=db_path))
+
+        await app.invoke(TaskState(), config={"parallel": True, "checkpoints": True, "execution_id": "p1"})
+        app.checkpoints.close()
+
+        store = CheckpointStore(db_path=db_path)
+        history = store.list_steps("p1")
+        assert [h["nodes"] for h in history] == [["plan"], ["a", "b", "c"], ["combine"]]
+
+        state = TaskState.model_validate(store.load("p1", step=2))
+        assert sorted(state.results) == ["a", "b", "c"]
+        assert "combined" not in state.context
+        store.close()
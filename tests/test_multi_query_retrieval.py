@@ -0,0 +1,132 @@
+"""
+Enterprise AI Assistant - Multi-Query Retrieval Tests
+=====================================================
+
+Tek batch embedding ve tek çoklu-sorgu vector store isteği ile
+multi-query retrieval testleri (RAGPipeline ve AdvancedRetriever).
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag.pipeline import RAGPipeline, RetrievalStrategy
+from rag.hyde_transformer import AdvancedRetriever
+
+
+class FakeEmbedder:
+    """Çağrıları sayan sahte embedding yöneticisi."""
+
+    def __init__(self):
+        self.batches = []
+
+    def embed_texts(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(t)), 1.0] for t in texts]
+
+    def __call__(self, texts):
+        return self.embed_texts(texts)
+
+
+class FakeVectorStore:
+    """Her embedding için sabit sıralı sonuç döndüren sahte store."""
+
+    def __init__(self, rankings):
+        self.rankings = rankings
+        self.batch_calls = []
+        self.single_calls = 0
+
+    def _results_for(self, index):
+        return [
+            {"id": doc_id, "document": f"doc {doc_id}", "metadata": {}, "score": score}
+            for doc_id, score in self.rankings[index]
+        ]
+
+    def search_by_embeddings(self, embeddings, n_results=5, where=None):
+        self.batch_calls.append(len(embeddings))
+        return [self._results_for(i)[:n_results] for i in range(len(embeddings))]
+
+    def search_with_scores(self, query, n_results=5, score_threshold=0.0, where=None):
+        self.single_calls += 1
+        return []
+
+    def count(self):
+        return 3
+
+
+class FakeLLM:
+    def generate(self, prompt, max_tokens=200):
+        return "1. Python nedir\n2. Python ne işe yarar\n3. Python dili"
+
+
+RANKINGS = [
+    [("a", 0.9), ("b", 0.8), ("c", 0.7)],
+    [("b", 0.85), ("c", 0.6), ("a", 0.5)],
+    [("b", 0.8), ("d", 0.75), ("a", 0.2)],
+    [("c", 0.9), ("b", 0.7)],
+]
+
+
+class TestPipelineMultiQuery:
+    """RAGPipeline multi-query testleri."""
+
+    def test_single_embedding_batch_and_store_call(self):
+        """Tüm varyantlar tek embed ve tek store çağrısıyla aranmalı."""
+        store = FakeVectorStore(RANKINGS)
+        embedder = FakeEmbedder()
+        pipeline = RAGPipeline(vector_store=store, embedding_manager=embedder, llm_manager=FakeLLM())
+
+        chunks = pipeline._multi_query_search("Python nedir?", top_k=3)
+
+        assert len(embedder.batches) == 1
+        assert len(embedder.batches[0]) == 4
+        assert store.batch_calls == [4]
+        assert store.single_calls == 0
+        assert all(c.retrieval_strategy == RetrievalStrategy.MULTI_QUERY for c in chunks)
+
+    def test_rrf_ranking_and_threshold(self):
+        """Sonuçlar RRF ile sıralanmalı; eşik altı skorlar elenmeli."""
+        store = FakeVectorStore(RANKINGS)
+        pipeline = RAGPipeline(vector_store=store, embedding_manager=FakeEmbedder(), llm_manager=FakeLLM())
+
+        chunks = pipeline._multi_query_search("Python nedir?", top_k=4)
+
+        # b: 1/62 + 1/61 + 1/61 + 1/62 en yüksek; a'nın 0.2 skorlu kaydı elenir
+        assert [c.id for c in chunks] == ["b", "c", "a", "d"]
+        expected_b = 2 / 62 + 2 / 61
+        assert chunks[0].metadata["rrf_score"] == pytest.approx(expected_b)
+
+    def test_rrf_keeps_similarity_score_for_citations(self):
+        """RRF sıralaması citation confidence'ı ezmemeli."""
+        store = FakeVectorStore(RANKINGS)
+        pipeline = RAGPipeline(vector_store=store, embedding_manager=FakeEmbedder(), llm_manager=FakeLLM())
+
+        chunks = pipeline._multi_query_search("Python nedir?", top_k=4)
+        optimized = pipeline.context_optimizer.optimize(chunks, "Python nedir?")
+
+        # En iyi kosinüs skorları korunur, sıralama RRF'te kalır
+        assert {c.id: c.score for c in chunks} == {"b": 0.85, "c": 0.9, "a": 0.9, "d": 0.75}
+        assert chunks[0].get_citation().confidence == 0.85
+        assert [c.id for c in optimized] == ["b", "c", "a", "d"]
+
+
+class TestAdvancedRetrieverMultiQuery:
+    """AdvancedRetriever multi-query testleri."""
+
+    @pytest.mark.asyncio
+    async def test_variants_use_one_batch(self):
+        """Varyantlar tek embedding batch'i ve tek store isteği kullanmalı."""
+        store = FakeVectorStore(RANKINGS)
+        embedder = FakeEmbedder()
+        retriever = AdvancedRetriever(store, embedder)
+
+        results = await retriever._retrieve_multi_query("Python programlama dili", top_k=6)
+
+        assert len(embedder.batches) == 1
+        assert store.batch_calls == [len(embedder.batches[0])]
+        assert store.single_calls == 0
+        assert [r["id"] for r in results][0] == "b"
+        assert len({r["id"] for r in results}) == len(results)
+        assert all(r["retrieval_method"] == "multi_query" for r in results)
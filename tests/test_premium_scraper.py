@@ -0,0 +1,299 @@
+"""
+Enterprise AI Assistant - Premium Scraper Tests
+===============================================
+
+Sayfa havuzu, domain başına eşzamanlılık ve worker havuzunda çıkarım testleri.
+Yerel HTTP taklidi ve sahte tarayıcı üzerinde çalışır; ağ gerekmez.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tools.premium_scraper as premium_scraper
+from tools.premium_scraper import PlaywrightExtractor, ScraperConfig, UltraPremiumScraper
+
+
+# ==================== FAKE BROWSER ====================
+
+class FakeRequest:
+    def __init__(self, resource_type: str):
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, resource_type: str):
+        self.request = FakeRequest(resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def continue_(self):
+        self.outcome = "continued"
+
+
+class FakePage:
+    def __init__(self, context, browser):
+        self.context = context
+        self.browser = browser
+        self.url = None
+        self.closed = False
+
+    async def goto(self, url, **kwargs):
+        if "broken" in url:
+            raise RuntimeError("navigation failed")
+        self.browser.active += 1
+        self.browser.max_active = max(self.browser.max_active, self.browser.active)
+        await asyncio.sleep(0.05)
+        self.browser.active -= 1
+        self.url = url
+
+    async def evaluate(self, script):
+        return None
+
+    async def content(self):
+        return f"<html><body>{self.url}</body></html>"
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.handler = None
+        self.init_scripts = []
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+    async def new_page(self):
+        if self.browser.crashed:
+            raise RuntimeError("browser crashed")
+        page = FakePage(self, self.browser)
+        self.browser.pages.append(page)
+        return page
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.pages = []
+        self.active = 0
+        self.max_active = 0
+        self.connected = True
+        self.crashed = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **kwargs):
+        if self.crashed:
+            raise RuntimeError("browser crashed")
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    """async_playwright().start() taklidi; her launch yeni FakeBrowser döner."""
+
+    def __init__(self):
+        self.launched = []
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    monkeypatch.setattr(premium_scraper, "PLAYWRIGHT_AVAILABLE", True)
+    return FakeBrowser()
+
+
+# ==================== LOCAL WEB ====================
+
+class LocalWeb:
+    """Domain başına eşzamanlı istek sayısını ölçen yerel sunucu."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.hits = 0
+        self.in_flight = {}
+        self.max_in_flight = {}
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.hits += 1
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        await asyncio.sleep(self.delay)
+        self.in_flight[host] -= 1
+        return httpx.Response(200, text=f"<html><body><p>{request.url.path}</p></body></html>")
+
+
+class TestPlaywrightPool:
+    """PlaywrightExtractor sayfa havuzu testleri."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_reused_and_bounded(self, fake_browser):
+        """Sayfalar havuz boyutunu aşmamalı ve URL'ler arasında yeniden kullanılmalı."""
+        extractor = PlaywrightExtractor(max_contexts=2, pages_per_context=2)
+        extractor._browser = fake_browser
+
+        htmls = await asyncio.gather(*(
+            extractor.extract(f"https://site.example/{i}") for i in range(8)
+        ))
+
+        assert all(f"/{i}" in html for i, html in enumerate(htmls))
+        assert len(fake_browser.pages) == 4
+        assert len(fake_browser.contexts) == 2
+        assert fake_browser.max_active == 4
+        stats = extractor.get_stats()
+        assert stats["pages_reused"] == 4
+        assert stats["idle_pages"] == 4
+
+    @pytest.mark.asyncio
+    async def test_blocks_heavy_resources(self, fake_browser):
+        """Görsel, font ve medya istekleri iptal edilmeli."""
+        extractor = PlaywrightExtractor()
+        extractor._browser = fake_browser
+        await extractor.extract("https://site.example/")
+
+        handler = fake_browser.contexts[0].handler
+        outcomes = {}
+        for resource_type in ("image", "font", "media", "document", "script"):
+            route = FakeRoute(resource_type)
+            await handler(route)
+            outcomes[resource_type] = route.outcome
+
+        assert outcomes == {
+            "image": "aborted", "font": "aborted", "media": "aborted",
+            "document": "continued", "script": "continued",
+        }
+        assert fake_browser.contexts[0].init_scripts
+
+    @pytest.mark.asyncio
+    async def test_broken_page_is_replaced(self, fake_browser):
+        """Hata veren sayfa kapatılıp yerine yenisi açılmalı."""
+        extractor = PlaywrightExtractor(max_contexts=1, pages_per_context=1)
+        extractor._browser = fake_browser
+
+        assert await extractor.extract("https://site.example/broken") is None
+        assert fake_browser.pages[0].closed
+        assert "/ok" in await extractor.extract("https://site.example/ok")
+        assert extractor.get_stats()["open_pages"] == 1
+
+
+    @pytest.mark.asyncio
+    async def test_failed_replacement_does_not_leak_slot(self, fake_browser):
+        """Yeni sayfa açılamasa da slot geri bırakılmalı, bekleyenler takılmamalı."""
+        extractor = PlaywrightExtractor(max_contexts=1, pages_per_context=1, acquire_timeout=1.0)
+        extractor._browser = fake_browser
+
+        assert await extractor.extract("https://site.example/broken") is None
+        fake_browser.crashed = True
+        assert await extractor.extract("https://site.example/a") is None
+        fake_browser.crashed = False
+
+        assert "/b" in await extractor.extract("https://site.example/b")
+        assert extractor.get_stats()["leased_pages"] == 0
+        assert extractor.get_stats()["acquire_timeouts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_dead_browser_is_relaunched(self, fake_browser, monkeypatch):
+        """Bağlantısı kopan tarayıcı yeniden başlatılmalı."""
+        launcher = FakePlaywright()
+        monkeypatch.setattr(premium_scraper, "async_playwright", launcher, raising=False)
+        extractor = PlaywrightExtractor(max_contexts=1, pages_per_context=1)
+        extractor._browser = fake_browser
+
+        await extractor.extract("https://site.example/1")
+        fake_browser.connected = False
+
+        assert "/2" in await extractor.extract("https://site.example/2")
+        assert len(launcher.launched) == 1
+        assert extractor.get_stats()["browser_restarts"] == 1
+        assert extractor.get_stats()["open_pages"] == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout_and_close_wake_waiters(self, fake_browser):
+        """Dolu havuzda bekleme sınırlı olmalı; close() bekleyenleri serbest bırakmalı."""
+        extractor = PlaywrightExtractor(max_contexts=1, pages_per_context=1, acquire_timeout=0.05)
+        extractor._browser = fake_browser
+        page = await extractor._acquire_page()
+
+        assert await extractor._acquire_page() is None
+        assert extractor.get_stats()["acquire_timeouts"] == 1
+
+        extractor.acquire_timeout = 10.0
+        waiter = asyncio.ensure_future(extractor._acquire_page())
+        await asyncio.sleep(0.01)
+        await extractor.close()
+
+        assert await asyncio.wait_for(waiter, 1.0) is None
+        await extractor._release_page(page, healthy=True)
+        assert extractor.get_stats()["idle_pages"] == 0
+
+
+class TestScraperBatch:
+    """UltraPremiumScraper toplu çıkarım testleri."""
+
+    @pytest.mark.asyncio
+    async def test_batch_respects_domain_limit(self):
+        """Domainler paralel, domain içi istekler sınırlı çekilmeli."""
+        web = LocalWeb(delay=0.2)
+        scraper = UltraPremiumScraper(ScraperConfig(cache_enabled=False, max_concurrent_per_domain=4))
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(web.handler))
+
+        threads = set()
+
+        def fake_extract(html, url):
+            threads.add(threading.current_thread().name)
+            return {"title": url, "content": html}
+
+        scraper.beautifulsoup.extract = fake_extract
+
+        urls = [f"https://site{i % 5}.example/page{i}" for i in range(50)]
+        started = time.perf_counter()
+        results = await scraper.extract_batch(urls + urls[:5])
+        elapsed = time.perf_counter() - started
+
+        assert [r.url for r in results] == urls + urls[:5]
+        assert web.hits == 50
+        assert max(web.max_in_flight.values()) == 4
+        assert elapsed < 1.5
+        assert threads and all(name.startswith("scraper-extract") for name in threads)
+        await scraper.close()
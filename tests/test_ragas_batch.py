@@ -0,0 +1,161 @@
+"""
+Enterprise AI Assistant - RAGAS Batch Evaluation Tests
+======================================================
+
+Eşzamanlı toplu değerlendirme, içerik-hash önbelleği ve
+JSONL checkpoint ile devam ettirme testleri.
+"""
+
+import threading
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rag.ragas_metrics import EvaluationLevel, JudgementCache, RAGASEvaluator
+
+
+class FakeJudgeLLM:
+    """Gecikmeli, thread-safe çağrı sayan sahte LLM."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, **kwargs) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if "questions" in prompt.lower():
+            return "Python nedir?\nPython ne için kullanılır?"
+        return "YES 8"
+
+
+class Interrupted(Exception):
+    pass
+
+
+def make_samples(count: int):
+    return [
+        {
+            "question": f"Python nedir? ({i})",
+            "answer": f"Python bir programlama dilidir. Örnek {i}.",
+            "contexts": [f"Python yüksek seviyeli bir dildir. Belge {i}."],
+        }
+        for i in range(count)
+    ]
+
+
+class TestBatchEvaluation:
+    """RAGASEvaluator.evaluate_batch testleri."""
+
+    def test_concurrent_preserves_order(self):
+        """Eşzamanlı çalışma sırayı korumalı ve sıralıdan hızlı olmalı."""
+        llm = FakeJudgeLLM(delay=0.02)
+        evaluator = RAGASEvaluator(llm=llm, evaluation_level=EvaluationLevel.BASIC)
+        samples = make_samples(16)
+
+        started = time.perf_counter()
+        batch = evaluator.evaluate_batch(samples, max_workers=8)
+        elapsed = time.perf_counter() - started
+
+        sequential = llm.calls * llm.delay
+        assert batch.successful_samples == 16
+        assert [r.input.question for r in batch.results] == [s["question"] for s in samples]
+        assert elapsed < sequential / 3
+
+    def test_cache_skips_repeated_judgements(self, tmp_path):
+        """Aynı içerik tekrar değerlendirilince LLM çağrılmamalı (disk önbelleği dahil)."""
+        llm = FakeJudgeLLM()
+        cache_path = tmp_path / "judgements.db"
+        samples = make_samples(5)
+
+        first = RAGASEvaluator(llm=llm, cache=JudgementCache(cache_path))
+        first_batch = first.evaluate_batch(samples)
+        calls = llm.calls
+
+        second = RAGASEvaluator(llm=llm, cache=JudgementCache(cache_path))
+        second_batch = second.evaluate_batch(samples)
+
+        assert calls > 0
+        assert llm.calls == calls
+        assert second_batch.mean_scores == first_batch.mean_scores
+
+    def test_resume_from_checkpoint(self, tmp_path):
+        """Kesilen koşu checkpoint'ten devam etmeli, biten örnekler tekrarlanmamalı."""
+        checkpoint = tmp_path / "run.jsonl"
+        samples = make_samples(12)
+
+        probe = FakeJudgeLLM()
+        RAGASEvaluator(llm=probe, evaluation_level=EvaluationLevel.BASIC, enable_cache=False).evaluate_batch(samples[:1])
+        per_sample_calls = probe.calls
+
+        def interrupt_after_five(done, total):
+            if done == 5:
+                raise Interrupted()
+
+        llm = FakeJudgeLLM()
+        evaluator = RAGASEvaluator(llm=llm, evaluation_level=EvaluationLevel.BASIC, enable_cache=False)
+        with pytest.raises(Interrupted):
+            evaluator.evaluate_batch(
+                samples, max_workers=1, checkpoint_path=checkpoint,
+                progress_callback=interrupt_after_five,
+            )
+        assert len(checkpoint.read_text(encoding="utf-8").splitlines()) == 5
+
+        # Yarım yazılmış satır (kesinti anı) yok sayılmalı
+        with open(checkpoint, "a", encoding="utf-8") as f:
+            f.write('{"key": "yarim"')
+
+        resumed_llm = FakeJudgeLLM()
+        resumed = RAGASEvaluator(llm=resumed_llm, evaluation_level=EvaluationLevel.BASIC, enable_cache=False)
+        progress = []
+        batch = resumed.evaluate_batch(
+            samples, max_workers=4, checkpoint_path=checkpoint,
+            progress_callback=lambda done, total: progress.append(done),
+        )
+
+        assert batch.successful_samples == 12
+        assert resumed_llm.calls == per_sample_calls * 7
+        assert progress[0] == 5 and progress[-1] == 12
+        assert [r.input.question for r in batch.results] == [s["question"] for s in samples]
+
+
+class TestJudgementCache:
+    """JudgementCache sınırı ve anahtar testleri."""
+
+    def test_cache_is_bounded_lru(self):
+        """Sınır aşılınca en uzun süredir kullanılmayan kayıt silinmeli."""
+        cache = JudgementCache(max_entries=2)
+        cache.put("a", "llm", "1")
+        time.sleep(0.001)
+        cache.put("b", "llm", "2")
+        time.sleep(0.001)
+        assert cache.get("a") == "1"
+        time.sleep(0.001)
+        cache.put("c", "llm", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1" and cache.get("c") == "3"
+        assert cache.get_stats()["size"] == 2
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_judge_model_is_part_of_key(self):
+        """Yargıç model değişince önbellekteki eski yargı dönmemeli."""
+        from rag.ragas_metrics import CachedLLM
+
+        llm = FakeJudgeLLM()
+        llm.model = "llama3"
+        cached = CachedLLM(llm, JudgementCache())
+
+        cached.generate("Cevap doğru mu?")
+        cached.generate("Cevap doğru mu?")
+        assert llm.calls == 1
+
+        llm.model = "qwen"
+        cached.generate("Cevap doğru mu?")
+        assert llm.calls == 2
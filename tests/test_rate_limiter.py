@@ -0,0 +1,172 @@
+"""
+Enterprise AI Assistant - Rate Limiter Tests
+============================================
+
+GCRA tabanlı rate limiter testleri.
+Çok pencereli limitler, cooldown, idle-key temizliği ve SQLite paylaşımlı mod.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rate_limiter import (
+    GCRALimiter,
+    RateLimitConfig,
+    RateLimiter,
+    RateWindow,
+    SQLiteRateStore,
+)
+
+
+class FakeClock:
+    """Test için elle ilerletilen saat."""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class TestGCRALimiter:
+    """GCRA motoru testleri."""
+
+    def test_allows_burst_up_to_limit(self):
+        """Limit kadar istek anında geçmeli, fazlası reddedilmeli."""
+        clock = FakeClock()
+        limiter = GCRALimiter([RateWindow("w", 5, 10)], clock=clock)
+
+        results = [limiter.acquire("client").allowed for _ in range(6)]
+
+        assert results == [True] * 5 + [False]
+
+    def test_recovers_after_emission_interval(self):
+        """Emission interval sonrası yeni istek geçmeli."""
+        clock = FakeClock()
+        limiter = GCRALimiter([RateWindow("w", 5, 10)], clock=clock)
+        for _ in range(5):
+            limiter.acquire("client")
+
+        decision = limiter.acquire("client")
+        assert not decision.allowed
+        assert decision.retry_after == pytest.approx(2.0)
+
+        clock.advance(2.0)
+        assert limiter.acquire("client").allowed
+
+    def test_multi_window_rejects_on_tightest(self):
+        """Birden fazla pencerede en sıkı olan reddetmeli."""
+        clock = FakeClock()
+        limiter = GCRALimiter(
+            [RateWindow("second", 10, 1), RateWindow("minute", 3, 60)],
+            clock=clock,
+        )
+        for _ in range(3):
+            assert limiter.acquire("client").allowed
+
+        decision = limiter.acquire("client")
+        assert not decision.allowed
+        assert decision.window == "minute"
+
+    def test_constant_memory_and_idle_eviction(self):
+        """Anahtar başına sabit durum tutulmalı ve boşta kalanlar silinmeli."""
+        clock = FakeClock()
+        limiter = GCRALimiter([RateWindow("w", 100, 60)], clock=clock, evict_interval=30)
+        for _ in range(1000):
+            limiter.acquire("busy")
+        limiter.acquire("idle")
+
+        assert len(limiter.store.get("busy")) == 1
+        assert len(limiter) == 2
+
+        clock.advance(120)
+        limiter.acquire("busy")
+        assert len(limiter) == 1
+
+    def test_sqlite_store_shared_between_instances(self, tmp_path):
+        """SQLite modunda limit durumu instance'lar arasında paylaşılmalı."""
+        clock = FakeClock()
+        db_path = tmp_path / "limits.db"
+        first = GCRALimiter([RateWindow("w", 3, 60)], store=SQLiteRateStore(db_path), clock=clock)
+        second = GCRALimiter([RateWindow("w", 3, 60)], store=SQLiteRateStore(db_path), clock=clock)
+
+        assert first.acquire("client").allowed
+        assert second.acquire("client").allowed
+        assert first.acquire("client").allowed
+        assert not second.acquire("client").allowed
+
+
+class TestRateLimiterGCRA:
+    """RateLimiter API testleri."""
+
+    def test_minute_limit_blocks_with_cooldown(self):
+        """Dakikalık limit aşımında cooldown uygulanmalı."""
+        clock = FakeClock()
+        config = RateLimitConfig(requests_per_minute=3, burst_limit=10, cooldown_seconds=30)
+        limiter = RateLimiter(config, clock=clock)
+
+        for _ in range(3):
+            allowed, _ = limiter.check_limit("ip")
+            assert allowed
+            limiter.record_request("ip")
+
+        allowed, message = limiter.check_limit("ip")
+        assert not allowed
+        assert message == "Dakikalık limit aşıldı."
+        assert limiter.get_client_stats("ip")["is_blocked"]
+
+        clock.advance(31)
+        allowed, _ = limiter.check_limit("ip")
+        assert allowed
+
+    def test_burst_limit(self):
+        """Burst limiti aşılınca yavaşlama mesajı dönmeli."""
+        clock = FakeClock()
+        limiter = RateLimiter(RateLimitConfig(burst_limit=2), clock=clock)
+
+        for _ in range(2):
+            limiter.record_request("ip")
+
+        allowed, message = limiter.check_limit("ip")
+        assert not allowed
+        assert "yavaşlayın" in message
+
+    def test_stats_report_window_usage(self):
+        """İstatistikler pencere kullanımını ve global sayaçları göstermeli."""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        for _ in range(4):
+            limiter.record_request("ip")
+
+        stats = limiter.get_client_stats("ip")
+        assert stats["minute_requests"] == 4
+        assert stats["day_requests"] == 4
+        assert stats["total_requests"] == 4
+
+        global_stats = limiter.get_global_stats()
+        assert global_stats["requests_last_minute"] == 4
+
+        clock.advance(120)
+        global_stats = limiter.get_global_stats()
+        assert global_stats["requests_last_minute"] == 0
+        assert global_stats["requests_last_hour"] == 4
+
+    def test_sqlite_mode_survives_restart(self, tmp_path):
+        """SQLite modunda limitler yeniden başlatma sonrası korunmalı."""
+        clock = FakeClock()
+        db_path = str(tmp_path / "limits.db")
+        config = RateLimitConfig(requests_per_minute=2, burst_limit=10)
+
+        limiter = RateLimiter(config, db_path=db_path, clock=clock)
+        limiter.record_request("ip")
+        limiter.record_request("ip")
+
+        restarted = RateLimiter(config, db_path=db_path, clock=clock)
+        allowed, _ = restarted.check_limit("ip")
+        assert not allowed
@@ -0,0 +1,141 @@
+"""
+Enterprise AI Assistant - ReAct Parallel Actions Tests
+======================================================
+
+Paralel aksiyon modu testleri.
+Tek adımda çoklu araç çağrısı, araç bazlı timeout ve trace önbelleği.
+"""
+
+import asyncio
+import importlib
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.react_agent import Action, ReActAgent, ToolExecutor
+
+# agents paketi aynı adlı singleton'ı dışa aktarır; modülün kendisi gerekli
+react_module = importlib.import_module("agents.react_agent")
+
+
+class ScriptedLLM:
+    """Sıradaki hazır yanıtı döndüren LLM."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate(self, prompt, system_prompt=None, temperature=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def make_agent(**kwargs):
+    executor = ToolExecutor()
+    calls = []
+
+    async def lookup(key: str):
+        calls.append(key)
+        await asyncio.sleep(0.2)
+        return {"key": key, "value": key.upper()}
+
+    async def stuck(key: str):
+        await asyncio.sleep(5)
+
+    agent = ReActAgent(tool_executor=executor, verbose=False, **kwargs)
+    agent.register_tool("lookup", lookup, "Anahtar ara", {"key": {"type": "string"}})
+    agent.register_tool("stuck", stuck, "Takılan araç", {"key": {"type": "string"}}, timeout_seconds=0.1)
+    return agent, calls
+
+
+class TestParallelActions:
+    """ReActAgent paralel aksiyon testleri."""
+
+    @pytest.mark.asyncio
+    async def test_multiple_actions_in_one_round_trip(self, monkeypatch):
+        """Bağımsız aramalar tek LLM turunda ve eşzamanlı çalışmalı."""
+        llm = ScriptedLLM([
+            'Thought: Üç bağımsız bilgi gerekli.\n'
+            'Action: lookup(key="a")\nAction: lookup(key="b")\nAction: lookup(key="c")\n'
+            'Observation: uydurma',
+            'Thought: Hepsi geldi.\nAction: finish(answer="A B C")',
+        ])
+        monkeypatch.setattr(react_module, "llm_manager", llm)
+        agent, calls = make_agent(parallel_actions=True)
+
+        started = time.perf_counter()
+        trace = await agent.run("a, b ve c nedir?")
+        elapsed = time.perf_counter() - started
+
+        assert trace.final_answer == "A B C"
+        assert llm.calls == 2
+        assert sorted(calls) == ["a", "b", "c"]
+        assert elapsed < 0.5
+        assert trace.tool_calls_count == 3
+        assert [o.content["value"] for o in trace.steps[0].observations] == ["A", "B", "C"]
+        # step.action çalıştırılan ilk aksiyonun kendisi olmalı
+        first = trace.steps[0]
+        assert first.action is first.actions[0]
+        assert first.observation.action_id == first.action.id
+
+    @pytest.mark.asyncio
+    async def test_observations_cached_within_trace(self, monkeypatch):
+        """Aynı (araç, argüman) çağrısı trace içinde tekrar çalışmamalı."""
+        llm = ScriptedLLM([
+            'Thought: Ara.\nAction: lookup(key="a")\nAction: lookup(key="a")',
+            'Thought: Tekrar kontrol.\nAction: lookup(key="a")',
+            'Thought: Tamam.\nAction: finish(answer="A")',
+        ])
+        monkeypatch.setattr(react_module, "llm_manager", llm)
+        agent, calls = make_agent(parallel_actions=True)
+
+        trace = await agent.run("a nedir?")
+
+        assert calls == ["a"]
+        assert trace.steps[1].observation.metadata.get("cached") is True
+        assert trace.steps[1].observation.content == {"key": "a", "value": "A"}
+
+    @pytest.mark.asyncio
+    async def test_per_tool_timeout(self):
+        """Araç tanımındaki timeout diğer çağrıları beklemeden uygulanmalı."""
+        agent, _ = make_agent()
+
+        started = time.perf_counter()
+        observations = await agent.tool_executor.execute_many([
+            Action(tool_name="stuck", arguments={"key": "x"}),
+            Action(tool_name="lookup", arguments={"key": "y"}),
+        ])
+
+        assert time.perf_counter() - started < 0.5
+        assert not observations[0].success and "timed out" in observations[0].error
+        assert observations[1].success
+
+    def test_sequential_mode_keeps_first_action(self):
+        """Paralel mod kapalıyken yalnızca ilk aksiyon seçilmeli."""
+        agent, _ = make_agent()
+        response = 'Thought: Ara.\nAction: lookup(key="a")\nAction: lookup(key="b")'
+
+        thought, action = agent._parse_llm_response(response)
+
+        assert [a.arguments for a in agent._select_actions(response, thought, action)] == [{"key": "a"}]
+
+    def test_multiline_finish_answer_with_parentheses(self):
+        """Satırı ")" ile biten çok satırlı finish cevabı bölünmemeli."""
+        agent, _ = make_agent()
+        response = (
+            'Thought: Cevabı biliyorum.\n'
+            'Action: finish(answer="Sonuç: İstanbul (en kalabalık)\nAnkara ise başkenttir.")'
+        )
+
+        _, action = agent._parse_llm_response(response)
+
+        assert action.arguments == {"answer": "Sonuç: İstanbul (en kalabalık)\nAnkara ise başkenttir."}
+
+        parallel, _ = make_agent(parallel_actions=True)
+        thought, action = parallel._parse_llm_response(response)
+        assert parallel._select_actions(response, thought, action)[0].arguments == action.arguments
+        assert parallel._parse_llm_response("Action: finish()")[1].arguments == {}
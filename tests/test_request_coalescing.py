@@ -0,0 +1,281 @@
+"""
+Enterprise AI Assistant - Request Coalescing Tests
+==================================================
+
+Eşzamanlı özdeş chat/search isteklerinin tek çalıştırmayı (single-flight)
+ve tek canlı token akışını paylaşması testleri.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.performance import (
+    AsyncSingleFlight,
+    StreamCoalescer,
+    iterate_in_thread,
+    make_request_key,
+    normalize_request_text,
+)
+
+
+async def token_source(tokens, gate: asyncio.Event = None, calls: list = None):
+    """Her token arasında kontrolü bırakan sahte LLM stream'i."""
+    if calls is not None:
+        calls.append(1)
+    for i, token in enumerate(tokens):
+        if gate is not None and i == 2:
+            await gate.wait()
+        await asyncio.sleep(0)
+        yield token
+
+
+class TestRequestKey:
+    """Anahtar üretimi testleri."""
+
+    def test_key_normalization(self):
+        """Boşluk/harf farkı ve dict sırası anahtarı değiştirmemeli."""
+        first = make_request_key("chat", normalize_request_text("  Python  NEDIR? "), {"a": 1, "b": 2}, "llama3")
+        second = make_request_key("chat", normalize_request_text("python nedir?"), {"b": 2, "a": 1}, "llama3")
+        other_model = make_request_key("chat", normalize_request_text("python nedir?"), {"a": 1, "b": 2}, "qwen")
+
+        assert first == second
+        assert first != other_model
+
+
+class TestAsyncSingleFlight:
+    """Tek sonuçlu (chat/search) birleştirme testleri."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Aynı anahtarlı eşzamanlı çağrılar tek çalıştırmayı paylaşmalı."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def search():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ["sonuç"]
+
+        results = await asyncio.gather(*(flight.do("k", search) for _ in range(5)))
+
+        assert calls == [1]
+        assert all(result == ["sonuç"] for result in results)
+        assert flight.stats == {"leaders": 1, "followers": 4}
+        assert flight.in_flight() == 0
+
+        # Tamamlanan sonuç önbelleğe alınmaz
+        await flight.do("k", search)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_not_sticky(self):
+        """Leader hatası tüm bekleyenlere iletilmeli, sonraki istek yeniden denemeli."""
+        flight = AsyncSingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0)
+            raise RuntimeError("ollama kapalı")
+
+        results = await asyncio.gather(*(flight.do("k", failing) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def ok():
+            return "tamam"
+
+        assert await flight.do("k", ok) == "tamam"
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_does_not_break_followers(self):
+        """Leader'ın bağlantısı koparsa follower yine sonucu almalı."""
+        flight = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return 42
+
+        leader = asyncio.ensure_future(flight.do("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", slow))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == 42
+
+
+class TestStreamCoalescer:
+    """Canlı token akışı paylaşımı testleri."""
+
+    @pytest.mark.asyncio
+    async def test_late_follower_gets_full_stream(self):
+        """Akış ortasında katılan abone önceki token'ları ve devamını almalı."""
+        coalescer = StreamCoalescer()
+        gate = asyncio.Event()
+        calls = []
+        tokens = ["Mer", "ha", "ba", " dün", "ya"]
+
+        async def consume():
+            return [t async for t in coalescer.subscribe("k", lambda: token_source(tokens, gate, calls))]
+
+        leader = asyncio.ensure_future(consume())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        follower = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        gate.set()
+
+        assert await leader == tokens
+        assert await follower == tokens
+        assert calls == [1]
+        assert coalescer.stats["followers"] == 1
+        assert coalescer.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_subscriber_disconnect(self):
+        """Leader ayrılınca üretim sürmeli; herkes ayrılınca iptal edilmeli."""
+        coalescer = StreamCoalescer()
+        gate = asyncio.Event()
+        tokens = ["a", "b", "c", "d"]
+
+        leader_stream = coalescer.subscribe("k", lambda: token_source(tokens, gate))
+        follower_stream = coalescer.subscribe("k", lambda: token_source(tokens, gate))
+        assert await leader_stream.__anext__() == "a"
+        assert await follower_stream.__anext__() == "a"
+
+        await leader_stream.aclose()
+        gate.set()
+        assert [t async for t in follower_stream] == ["b", "c", "d"]
+        assert coalescer.stats["cancelled"] == 0
+
+        lonely_gate = asyncio.Event()
+        lonely = coalescer.subscribe("k2", lambda: token_source(tokens, lonely_gate))
+        await lonely.__anext__()
+        await lonely.aclose()
+        await asyncio.sleep(0)
+
+        assert coalescer.stats["cancelled"] == 1
+        assert coalescer.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_after_cancel_starts_fresh(self):
+        """İptal sürerken gelen abone ölmekte olan stream'e değil yenisine katılmalı."""
+        coalescer = StreamCoalescer()
+        calls = []
+        tokens = ["a", "b", "c"]
+
+        first = coalescer.subscribe("k", lambda: token_source(tokens, asyncio.Event(), calls))
+        assert await first.__anext__() == "a"
+        await first.aclose()
+
+        # _pump iptali henüz işlenmeden yeni abone gelir
+        late = [t async for t in coalescer.subscribe("k", lambda: token_source(tokens, calls=calls))]
+
+        assert late == tokens
+        assert len(calls) == 2
+        assert coalescer.stats["leaders"] == 2
+        assert coalescer.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_producer_error_reaches_all_subscribers(self):
+        """Üretim hatası tüm abonelere iletilmeli."""
+        coalescer = StreamCoalescer()
+
+        async def broken():
+            yield "ilk"
+            await asyncio.sleep(0)
+            raise ConnectionError("stream koptu")
+
+        async def consume():
+            received = []
+            with pytest.raises(ConnectionError):
+                async for token in coalescer.subscribe("k", broken):
+                    received.append(token)
+            return received
+
+        assert await asyncio.gather(consume(), consume()) == [["ilk"], ["ilk"]]
+
+
+class TestIterateInThread:
+    """Senkron stream'in thread'de tüketilmesi testleri."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_iterator_does_not_block_loop(self):
+        """Bloklayan generator event loop'u durdurmamalı."""
+        ticks = []
+
+        def blocking_tokens():
+            for token in ["x", "y", "z"]:
+                time.sleep(0.02)
+                yield token
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        tokens, _ = await asyncio.gather(
+            _collect(iterate_in_thread(blocking_tokens)),
+            ticker(),
+        )
+
+        assert tokens == ["x", "y", "z"]
+        assert len(ticks) == 5
+
+    @pytest.mark.asyncio
+    async def test_consumer_exit_stops_thread(self):
+        """Tüketici ayrılınca thread sonraki token'da durmalı."""
+        produced = []
+        finished = threading.Event()
+
+        def endless():
+            try:
+                for i in range(1000):
+                    produced.append(i)
+                    time.sleep(0.001)
+                    yield i
+            finally:
+                finished.set()
+
+        stream = iterate_in_thread(endless)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+
+        assert await asyncio.to_thread(finished.wait, 2.0)
+        assert len(produced) < 1000
+
+    @pytest.mark.asyncio
+    async def test_abandoned_iterator_is_closed(self):
+        """Tüketici ayrılınca worker iterator'ı close() ile kapatmalı."""
+        closed = threading.Event()
+
+        class HTTPStream:
+            """close() çağrısını kaydeden, generator olmayan iterator."""
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                time.sleep(0.001)
+                return "token"
+
+            def close(self):
+                closed.set()
+
+        stream = iterate_in_thread(HTTPStream)
+        assert await stream.__anext__() == "token"
+        await stream.aclose()
+
+        assert await asyncio.to_thread(closed.wait, 2.0)
+
+
+async def _collect(stream):
+    return [item async for item in stream]
@@ -0,0 +1,100 @@
+"""
+Enterprise AI Assistant - Retrieval Benchmark Tests
+===================================================
+
+Sentetik korpus, hash embedder ve strateji benchmark raporu testleri.
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.retrieval_benchmark import (
+    ALL_STRATEGIES,
+    HashEmbedder,
+    RetrievalBenchmark,
+    compare_reports,
+    generate_corpus,
+)
+
+
+class TestSyntheticCorpus:
+    """Korpus üretici ve sahte embedder testleri."""
+
+    def test_corpus_is_deterministic(self):
+        """Aynı seed aynı korpusu, farklı seed farklı korpusu üretmeli."""
+        first = generate_corpus(num_chunks=300, num_queries=10, seed=7)
+        second = generate_corpus(num_chunks=300, num_queries=10, seed=7)
+        other = generate_corpus(num_chunks=300, num_queries=10, seed=8)
+
+        assert first.documents == second.documents
+        assert [q.text for q in first.queries] == [q.text for q in second.queries]
+        assert first.documents != other.documents
+        assert len(first) == 300
+
+    def test_answers_are_planted(self):
+        """Doğru chunk'lar sorgunun tüm anahtar terimlerini içermeli."""
+        corpus = generate_corpus(num_chunks=300, num_queries=10)
+        by_id = dict(zip(corpus.ids, corpus.documents))
+
+        for query in corpus.queries:
+            assert len(query.relevant_ids) == 2
+            for relevant_id in query.relevant_ids:
+                words = by_id[relevant_id].split()
+                assert all(term in words for term in query.key_terms)
+
+        with pytest.raises(ValueError):
+            generate_corpus(num_chunks=10, num_queries=10)
+
+    def test_hash_embedder_is_stable(self):
+        """Embedding deterministik, normalize ve ortak tokenlara duyarlı olmalı."""
+        embedder = HashEmbedder(dim=64)
+        vector = np.array(embedder.embed_query("alfa beta gama"))
+
+        assert vector.tolist() == HashEmbedder(dim=64).embed_text("alfa beta gama")
+        assert np.linalg.norm(vector) == pytest.approx(1.0, abs=1e-5)
+
+        matrix = embedder.embed_matrix(["alfa beta gama delta", "zeta eta teta iota"])
+        assert matrix[0] @ vector > matrix[1] @ vector
+
+
+class TestRetrievalBenchmark:
+    """Strateji benchmark testleri."""
+
+    @pytest.fixture(scope="class")
+    def report(self):
+        corpus = generate_corpus(num_chunks=400, num_queries=8)
+        return RetrievalBenchmark(corpus, top_k=5, rerank_candidates=20).run()
+
+    def test_reports_every_strategy(self, report):
+        """Her strateji için gecikme yüzdelikleri, verim ve recall raporlanmalı."""
+        assert list(report["strategies"]) == ALL_STRATEGIES
+
+        for name, result in report["strategies"].items():
+            assert "skipped" not in result, name
+            assert result["errors"] == 0, name
+            assert 0 <= result["p50_ms"] <= result["p95_ms"] <= result["p99_ms"]
+            assert result["throughput_qps"] > 0
+            assert 0.0 <= result["recall_at_k"] <= 1.0
+
+    def test_keyword_strategies_find_planted_answers(self, report):
+        """Yerleştirilmiş cevaplar keyword ve hybrid aramada bulunmalı."""
+        strategies = report["strategies"]
+        for name in ("api.fusion", "api.hybrid", "hybrid_searcher.sparse", "hybrid_searcher.hybrid", "rerank.bm25"):
+            assert strategies[name]["recall_at_k"] >= 0.9, name
+
+    def test_baseline_comparison(self, report):
+        """Baseline karşılaştırması yüzde değişim ve recall farkı vermeli."""
+        baseline = {"strategies": {
+            name: {**result, "p95_ms": result["p95_ms"] * 2, "recall_at_k": result["recall_at_k"] - 0.5}
+            for name, result in report["strategies"].items()
+        }}
+
+        deltas = compare_reports(report, baseline)
+
+        assert set(deltas) == set(ALL_STRATEGIES)
+        assert deltas["rerank.bm25"]["p95_ms_change_pct"] == pytest.approx(-50.0, abs=0.1)
+        assert deltas["rerank.bm25"]["recall_delta"] == pytest.approx(0.5)
@@ -0,0 +1,208 @@
+"""
+Enterprise AI Assistant - Rolling Conversation Summarizer Tests
+===============================================================
+
+Eski mesajların arka planda kayan özete katlanması ve prompt geçmişinin
+oturum uzunluğundan bağımsız olarak sınırlı kalması testleri.
+"""
+
+import asyncio
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.rolling_summarizer import RollingConversationSummarizer
+from core.session_manager import SessionManager
+from core.token_manager import EnterpriseTokenManager
+
+
+class FakeLLM:
+    """Çağrıları kaydeden ve isteğe bağlı bekleyen sahte LLM."""
+
+    def __init__(self, fail: bool = False):
+        self.prompts = []
+        self.fail = fail
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def generate_async(self, prompt, system_prompt=None, temperature=0.7, max_tokens=None):
+        self.prompts.append(prompt)
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("ollama kapalı")
+        return f"Özet #{len(self.prompts)}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionManager(storage_dir=tmp_path)
+
+
+def make_summarizer(store, llm, **kwargs):
+    options = {"refresh_every": 4, "keep_recent": 4, "tail_token_budget": 10_000}
+    options.update(kwargs)
+    return RollingConversationSummarizer(
+        session_store=store, llm=llm, token_manager=EnterpriseTokenManager(), **options
+    )
+
+
+def add_turns(store, session_id, count, start=0):
+    for i in range(start, start + count):
+        store.add_message(session_id, "user", f"Soru {i}: decorator nasıl çalışır?")
+        store.add_message(session_id, "assistant", f"Cevap {i}. Decorator bir fonksiyonu sarar.")
+
+
+class TestRollingSummary:
+    """Özet yenileme testleri."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_folds_old_messages(self, store):
+        """Eşik dolunca eski mesajlar özete katlanmalı ve kalıcı olmalı."""
+        llm = FakeLLM()
+        summarizer = make_summarizer(store, llm)
+        session = store.create_session()
+
+        add_turns(store, session.id, 3)  # 6 mesaj: 2 bekleyen < 4
+        assert summarizer.schedule_refresh(session.id) is None
+
+        add_turns(store, session.id, 1, start=3)  # 8 mesaj: 4 bekleyen
+        await summarizer.schedule_refresh(session.id)
+
+        state = store.get_session(session.id).get_rolling_summary()
+        assert state["text"] == "Özet #1"
+        assert state["covered"] == 4
+        assert "Soru 0" in llm.prompts[0] and "Soru 2" not in llm.prompts[0]
+
+        reloaded = SessionManager(storage_dir=store.storage_dir).get_session(session.id)
+        assert reloaded.get_rolling_summary()["covered"] == 4
+
+        add_turns(store, session.id, 2, start=4)
+        await summarizer.schedule_refresh(session.id)
+
+        assert "Özet #1" in llm.prompts[1]
+        assert store.get_session(session.id).get_rolling_summary()["covered"] == 8
+
+    @pytest.mark.asyncio
+    async def test_single_refresh_in_flight(self, store):
+        """Aynı oturum için yenileme sürerken ikincisi başlatılmamalı."""
+        llm = FakeLLM()
+        llm.release.clear()
+        summarizer = make_summarizer(store, llm)
+        session = store.create_session()
+        add_turns(store, session.id, 5)
+
+        task = summarizer.schedule_refresh(session.id)
+        await asyncio.sleep(0)
+        assert summarizer.schedule_refresh(session.id) is None
+
+        llm.release.set()
+        await task
+        await summarizer.wait_idle()
+
+        assert len(llm.prompts) == 1
+        assert summarizer.get_stats()["skipped_inflight"] == 1
+        assert summarizer.get_stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_uses_extractive_fallback(self, store):
+        """LLM hatasında extractive özet kaydedilmeli ve kapsam ilerlemeli."""
+        summarizer = make_summarizer(store, FakeLLM(fail=True))
+        session = store.create_session()
+        add_turns(store, session.id, 4)
+
+        summary = await summarizer.refresh(session.id)
+
+        assert summary
+        assert store.get_session(session.id).get_rolling_summary()["covered"] == 4
+        assert summarizer.get_stats()["fallbacks"] == 1
+
+
+class TestPromptContext:
+    """Prompt bağlamı testleri."""
+
+    @pytest.mark.asyncio
+    async def test_prompt_history_stays_bounded(self, store):
+        """Oturum uzadıkça prompt'a giren geçmiş sabit kalmalı."""
+        summarizer = make_summarizer(store, FakeLLM(), max_summary_chars=200)
+        session = store.create_session()
+        sizes = []
+
+        for turn in range(40):
+            store.add_message(session.id, "user", f"Soru {turn}: " + "ayrıntı " * 20)
+            context = summarizer.build_context(session.id)
+            sizes.append(len(context.summary) + sum(len(m["content"]) for m in context.recent))
+            assert context.recent[-1]["content"].startswith(f"Soru {turn}:")
+
+            store.add_message(session.id, "assistant", f"Cevap {turn}. " + "açıklama " * 30)
+            task = summarizer.schedule_refresh(session.id)
+            if task:
+                await task
+
+        assert max(sizes[20:]) <= max(sizes[:10]) * 2
+        assert len(summarizer.build_context(session.id).summary) <= len("...") + 200
+
+    @pytest.mark.asyncio
+    async def test_no_gap_between_summary_and_tail(self, store):
+        """Her mesaj ya özette ya da son kesitte olmalı (yenileme sürerken de)."""
+        llm = FakeLLM()
+        summarizer = make_summarizer(store, llm, refresh_every=6, keep_recent=8)
+        session = store.create_session()
+
+        for turn in range(15):
+            add_turns(store, session.id, 1, start=turn)
+            context = summarizer.build_context(session.id)
+
+            assert context.covered + len(context.recent) == context.total
+            assert context.omitted == 0
+            if turn < 8:
+                # keep_recent + refresh_every - 1, tur başına iki mesaj eklendiği için +2
+                assert len(context.recent) <= 8 + 6 + 1
+
+            if turn == 8:
+                llm.release.clear()
+            summarizer.schedule_refresh(session.id)
+            await asyncio.sleep(0)
+
+        # Yenileme askıdayken kesit büyür ama yine boşluk kalmaz
+        context = summarizer.build_context(session.id)
+        assert context.covered + len(context.recent) == context.total
+        llm.release.set()
+        await summarizer.wait_idle()
+
+    def test_tail_respects_token_budget(self, store):
+        """Son kesit token limitine göre kırpılmalı, son mesaj her zaman kalmalı."""
+        summarizer = make_summarizer(store, FakeLLM(), keep_recent=10, tail_token_budget=30)
+        session = store.create_session()
+        for i in range(6):
+            store.add_message(session.id, "user", f"mesaj {i} " + "x" * 80)
+        store.add_message(session.id, "user", "güncel soru " + "y" * 400)
+
+        context = summarizer.build_context(session.id)
+
+        assert context.recent[-1]["content"].startswith("güncel soru")
+        assert 1 < len(context.recent) < 7
+        assert context.summary == ""
+
+    def test_tail_tokens_counted_incrementally(self, store):
+        """Her turda oturum ledger'ı kullanılmalı, yalnızca yeni mesajlar sayılmalı."""
+        summarizer = make_summarizer(store, FakeLLM(), refresh_every=100)
+        session = store.create_session()
+        add_turns(store, session.id, 3)
+        summarizer.build_context(session.id)
+
+        ledger = summarizer.token_manager.get_ledger(session.id)
+        assert len(ledger) == 5
+
+        add_turns(store, session.id, 1, start=3)
+        context = summarizer.build_context(session.id)
+
+        assert len(ledger) == 7
+        assert context.covered + len(context.recent) == context.total
+
+    def test_unknown_session(self, store):
+        """Olmayan oturum boş bağlam döndürmeli."""
+        context = make_summarizer(store, FakeLLM()).build_context("yok")
+        assert context.recent == [] and context.summary == ""
@@ -0,0 +1,208 @@
+"""
+Enterprise AI Assistant - Spaced Repetition Tests
+=================================================
+
+Vade sıralı tekrar kuyruğu ve vektörel SM-2/FSRS testleri.
+"""
+
+import copy
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.review_queue import ReviewQueue
+from core.learning_journey_v2.spaced_repetition import SM2Algorithm, ReviewItem, MasteryTracker
+from core.full_meta_spaced_rep import FSRS, AdvancedSpacedRepetitionEngine, RecallQuality
+
+
+def make_deck(count: int, seed: int = 3):
+    """Gecikmiş, gelecekteki ve yeni öğelerden oluşan deste."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    items = []
+    for i in range(count):
+        item = ReviewItem(
+            item_id=f"item{i}", topic_id="t", package_id="p", stage_id="s",
+            item_type="question", difficulty_score=rng.random()
+        )
+        kind = rng.random()
+        if kind < 0.1:
+            pass  # yeni
+        else:
+            offset = rng.randint(-60, 20)
+            item.next_review = now + timedelta(days=offset, hours=-1 if offset <= 0 else 1)
+            item.last_review = item.next_review - timedelta(days=rng.randint(1, 10))
+            item.interval = rng.randint(1, 30)
+            item.total_reviews = rng.randint(1, 10)
+            item.correct_reviews = rng.randint(0, item.total_reviews)
+            item.ease_factor = rng.uniform(1.3, 3.0)
+        items.append(item)
+    return items
+
+
+class TestReviewQueue:
+    """ReviewQueue testleri."""
+
+    def test_matches_sm2_due_order(self):
+        """Kuyruk sıralaması SM-2 get_due_items ile aynı olmalı."""
+        items = make_deck(500)
+        queue = ReviewQueue()
+        for item in items:
+            queue.push(item)
+
+        for max_items in (5, 20, 200, 600):
+            expected = SM2Algorithm().get_due_items(items, max_items)
+            actual = queue.get_due(max_items)
+            assert [i.item_id for i in actual] == [i.item_id for i in expected]
+
+        # Sorgu kuyruğu bozmamalı
+        assert [i.item_id for i in queue.get_due(20)] == [
+            i.item_id for i in SM2Algorithm().get_due_items(items, 20)
+        ]
+
+    def test_self_heals_after_external_update(self):
+        """Vadesi dışarıdan ertelenen öğe due listesinden düşmeli."""
+        items = make_deck(50)
+        queue = ReviewQueue()
+        for item in items:
+            queue.push(item)
+
+        first = queue.get_due(1, include_new=False)[0]
+        SM2Algorithm().calculate_next_review(first, 5)
+
+        due_ids = {i.item_id for i in queue.get_due(100, include_new=False)}
+        assert first.item_id not in due_ids
+        assert first.item_id in queue
+
+    def test_remove(self):
+        """Silinen öğe dönmemeli."""
+        items = make_deck(30)
+        queue = ReviewQueue()
+        for item in items:
+            queue.push(item)
+
+        top = queue.get_due(1)[0]
+        queue.remove(top.item_id)
+
+        assert top.item_id not in {i.item_id for i in queue.get_due(100)}
+        assert len(queue) == 29
+
+
+class TestVectorizedSM2:
+    """Vektörel SM-2 testleri."""
+
+    def test_batch_update_matches_scalar(self):
+        """Toplu güncelleme tekil güncellemeyle aynı sonucu vermeli."""
+        algorithm = SM2Algorithm()
+        items = [i for i in make_deck(200) if i.next_review]
+        scalar = copy.deepcopy(items)
+        qualities = [random.Random(i).randint(0, 5) for i in range(len(items))]
+
+        algorithm.calculate_next_reviews(items, qualities)
+        for item, quality in zip(scalar, qualities):
+            algorithm.calculate_next_review(item, quality)
+
+        for batch_item, scalar_item in zip(items, scalar):
+            assert batch_item.interval == scalar_item.interval
+            assert batch_item.repetition == scalar_item.repetition
+            assert batch_item.ease_factor == pytest.approx(scalar_item.ease_factor)
+            assert batch_item.difficulty_score == pytest.approx(scalar_item.difficulty_score)
+            assert batch_item.average_quality == pytest.approx(scalar_item.average_quality)
+            assert batch_item.correct_reviews == scalar_item.correct_reviews
+
+    def test_retention_and_stats_match_scalar(self):
+        """Vektörel retention ve seviye sayıları tekil hesapla uyumlu olmalı."""
+        algorithm = SM2Algorithm()
+        items = make_deck(300)
+
+        rates = algorithm.calculate_retention_rates(items)
+        assert rates == pytest.approx([algorithm.calculate_retention_rate(i) for i in items])
+
+        stats = algorithm.get_study_stats(items)
+        expected = {}
+        for item in items:
+            level, _ = algorithm.get_mastery_level(item)
+            expected[level] = expected.get(level, 0) + 1
+        assert {k: v for k, v in stats["levels"].items() if v} == expected
+        assert sum(stats["levels"].values()) == len(items)
+
+    def test_schedule_keeps_overflow(self):
+        """Kapasite aşımında hiçbir öğe kaybolmamalı."""
+        algorithm = SM2Algorithm()
+        items = [i for i in make_deck(120) if i.next_review]
+
+        schedule = algorithm.optimize_review_schedule(items, daily_minutes=15, avg_item_minutes=3)
+
+        assert all(len(day) <= 5 for day in schedule)
+        assert sorted(i.item_id for day in schedule for i in day) == sorted(i.item_id for i in items)
+
+    def test_mastery_tracker_uses_queue(self):
+        """MasteryTracker kayıtları kuyruğa yansımalı."""
+        tracker = MasteryTracker(SM2Algorithm())
+        tracker.record_topic_attempt(
+            "topic", 0.4,
+            question_results=[{"question_id": "q1", "score": 0.2}, {"question_id": "q1", "score": 0.9}]
+        )
+
+        item = tracker.review_items["q1"]
+        assert item.total_reviews == 2
+        assert "q1" in tracker.review_queue
+        assert tracker.get_due_reviews() == []
+
+        updated = tracker.complete_review("q1", 1)
+        assert updated.repetition == 0
+
+
+class TestVectorizedFSRS:
+    """Vektörel FSRS testleri."""
+
+    def test_batch_matches_scalar(self):
+        """Batch FSRS fonksiyonları tekil karşılıklarıyla aynı olmalı."""
+        fsrs = FSRS()
+        rng = np.random.default_rng(0)
+        d = rng.uniform(1, 10, 100)
+        s = rng.uniform(0.5, 50, 100)
+        r = rng.uniform(0.3, 1.0, 100)
+        ratings = rng.integers(1, 5, 100)
+
+        batch_d, batch_s = fsrs.next_ds_batch(d, s, r, ratings)
+        for i in range(100):
+            scalar_d, scalar_s = fsrs.next_ds(d[i], s[i], r[i], int(ratings[i]))
+            assert batch_d[i] == pytest.approx(scalar_d)
+            assert batch_s[i] == pytest.approx(scalar_s)
+
+        init_d, init_s = fsrs.init_ds_batch(ratings)
+        assert list(zip(init_d, init_s)) == [fsrs.init_ds(int(x)) for x in ratings]
+        assert list(fsrs.next_interval_batch(s)) == [fsrs.next_interval(x) for x in s]
+        assert fsrs.retrievability_batch(s, r * 10) == pytest.approx(
+            [fsrs.retrievability(a, b * 10) for a, b in zip(s, r)]
+        )
+
+    def test_interval_reaches_requested_retention(self):
+        """Hesaplanan aralıkta retrievability hedef orana inmeli."""
+        fsrs = FSRS()
+        interval = fsrs.next_interval(20.0)
+
+        assert interval == 20
+        assert fsrs.retrievability(20.0, interval) == pytest.approx(fsrs.request_retention)
+
+    def test_engine_batch_review_and_due_cards(self):
+        """Toplu tekrar sonrası kartlar due listesinden çıkmalı."""
+        engine = AdvancedSpacedRepetitionEngine()
+        cards = [engine.create_card("u1", f"ön {i}", f"arka {i}") for i in range(50)]
+        engine.create_card("u2", "başka", "kullanıcı")
+
+        assert len(engine.get_due_cards("u1", limit=100)) == 50
+
+        result = engine.review_cards_batch([(c.id, RecallQuality.EASY) for c in cards[:30]])
+
+        assert result["reviewed"] == 30
+        due = engine.get_due_cards("u1", limit=100)
+        assert {c.id for c in due} == {c.id for c in cards[30:]}
+        assert engine.get_forecast("u1", days=3)["total_cards"] == 50
@@ -0,0 +1,220 @@
+"""
+Enterprise AI Assistant - Task Queue Tests
+==========================================
+
+TaskQueue testleri.
+Bloklamayan retry, toplu kalıcılık ve lease tabanlı paylaşımlı mod.
+"""
+
+import asyncio
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.task_queue import TaskQueue, TaskStatus, task_registry
+
+
+_attempts = {}
+
+
+@task_registry.register("test_flaky")
+async def _flaky(key: str, fail_times: int):
+    _attempts[key] = _attempts.get(key, 0) + 1
+    if _attempts[key] <= fail_times:
+        raise RuntimeError("geçici hata")
+    return _attempts[key]
+
+
+@task_registry.register("test_echo")
+async def _echo(value):
+    return value
+
+
+@task_registry.register("test_slow")
+async def _slow(seconds: float):
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+class TestTaskQueueRetries:
+    """Retry zamanlama testleri."""
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_does_not_block_other_tasks(self, tmp_path):
+        """Backoff bekleyen task diğer task'ların çalışmasını engellememeli."""
+        queue = TaskQueue(db_path=tmp_path / "q.db", max_workers=1)
+        await queue.start()
+        try:
+            flaky_id = await queue.submit("test_flaky", "retry-a", 1, retry_delay=0.5)
+            await asyncio.sleep(0.1)
+            echo_id = await queue.submit("test_echo", "ok")
+
+            start = time.monotonic()
+            echo_result = await queue.wait_for_task(echo_id, timeout=2)
+            assert echo_result.data == "ok"
+            assert time.monotonic() - start < 0.4
+
+            flaky_result = await queue.wait_for_task(flaky_id, timeout=3)
+            assert flaky_result.success
+            assert queue.get_task(flaky_id).retry_count == 1
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_fails_after_max_retries(self, tmp_path):
+        """Retry hakkı bitince task FAILED olmalı."""
+        queue = TaskQueue(db_path=tmp_path / "q.db", max_workers=2)
+        await queue.start()
+        try:
+            task_id = await queue.submit("test_flaky", "retry-b", 10, max_retries=2, retry_delay=0.01)
+            result = await queue.wait_for_task(task_id, timeout=3)
+            assert not result.success
+            assert queue.get_task_status(task_id) == TaskStatus.FAILED
+            assert _attempts["retry-b"] == 3
+        finally:
+            await queue.stop()
+
+
+class TestTaskQueuePersistence:
+    """Toplu kalıcılık testleri."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_batched_rows(self, tmp_path):
+        """Kayıtlar stop/flush sonrası veritabanında olmalı."""
+        db_path = tmp_path / "q.db"
+        queue = TaskQueue(db_path=db_path, max_workers=2)
+        await queue.start()
+        ids = [await queue.submit("test_echo", i) for i in range(20)]
+        for task_id in ids:
+            await queue.wait_for_task(task_id, timeout=2)
+        await queue.stop()
+
+        conn = sqlite3.connect(str(db_path))
+        rows = conn.execute("SELECT status FROM tasks").fetchall()
+        conn.close()
+        assert len(rows) == 20
+        assert {row[0] for row in rows} == {"completed"}
+
+    @pytest.mark.asyncio
+    async def test_pending_tasks_reloaded(self, tmp_path):
+        """Çalıştırılmamış task'lar yeniden başlatmada yüklenmeli."""
+        db_path = tmp_path / "q.db"
+        queue = TaskQueue(db_path=db_path)
+        task_id = await queue.submit("test_echo", "sonra")
+        await queue.stop()
+
+        restarted = TaskQueue(db_path=db_path)
+        await restarted.start()
+        try:
+            result = await restarted.wait_for_task(task_id, timeout=2)
+            assert result.data == "sonra"
+        finally:
+            await restarted.stop()
+
+
+class TestSharedTaskQueue:
+    """Paylaşımlı (çok süreçli) mod testleri."""
+
+    @pytest.mark.asyncio
+    async def test_consumers_claim_each_task_once(self, tmp_path):
+        """Aynı veritabanını paylaşan tüketiciler her task'ı bir kez çalıştırmalı."""
+        db_path = tmp_path / "shared.db"
+        producer = TaskQueue(db_path=db_path, shared=True)
+        consumers = [
+            TaskQueue(db_path=db_path, shared=True, max_workers=2, poll_interval=0.02)
+            for _ in range(2)
+        ]
+
+        ids = [await producer.submit("test_echo", i) for i in range(10)]
+        for consumer in consumers:
+            await consumer.start()
+        try:
+            results = [await producer.wait_for_task(task_id, timeout=5) for task_id in ids]
+            assert [r.data for r in results] == list(range(10))
+
+            owners = [set(c._tasks) for c in consumers]
+            assert not owners[0] & owners[1]
+            assert owners[0] | owners[1] == set(ids)
+        finally:
+            for consumer in consumers:
+                await consumer.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, tmp_path):
+        """Lease'i dolan running task başka tüketici tarafından alınmalı."""
+        db_path = tmp_path / "shared.db"
+        producer = TaskQueue(db_path=db_path, shared=True)
+        task_id = await producer.submit("test_echo", "kurtarıldı")
+
+        crashed = TaskQueue(db_path=db_path, shared=True, lease_seconds=0.1)
+        claimed = crashed._claim_next()
+        assert claimed.id == task_id
+        assert crashed._claim_next() is None
+
+        await asyncio.sleep(0.15)
+        survivor = TaskQueue(db_path=db_path, shared=True, poll_interval=0.02)
+        await survivor.start()
+        try:
+            result = await producer.wait_for_task(task_id, timeout=3)
+            assert result.data == "kurtarıldı"
+            assert not crashed._finish_claimed(claimed)
+        finally:
+            await survivor.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_is_not_overwritten_by_worker(self, tmp_path):
+        """Çalışırken iptal edilen task'ın sonucu iptali ezmemeli."""
+        db_path = tmp_path / "shared.db"
+        producer = TaskQueue(db_path=db_path, shared=True)
+        task_id = await producer.submit("test_slow", 0.3)
+
+        consumer = TaskQueue(db_path=db_path, shared=True, poll_interval=0.02)
+        await consumer.start()
+        try:
+            await asyncio.sleep(0.1)
+            assert await producer.cancel(task_id)
+            await asyncio.sleep(0.4)
+
+            assert (await producer._refresh_task(task_id)).status == TaskStatus.CANCELLED
+            assert not await producer.cancel(task_id)
+        finally:
+            await consumer.stop()
+
+    @pytest.mark.asyncio
+    async def test_reclaim_counts_as_retry(self, tmp_path):
+        """Worker'ını kaybeden task sonsuza kadar yeniden alınmamalı."""
+        db_path = tmp_path / "shared.db"
+        producer = TaskQueue(db_path=db_path, shared=True)
+        task_id = await producer.submit("test_echo", "asla", max_retries=1)
+
+        crashed = TaskQueue(db_path=db_path, shared=True, lease_seconds=0.05)
+        assert crashed._claim_next().retry_count == 0
+        await asyncio.sleep(0.1)
+        assert crashed._claim_next().retry_count == 1
+        await asyncio.sleep(0.1)
+        assert crashed._claim_next() is None
+
+        task = await producer._refresh_task(task_id)
+        assert task.status == TaskStatus.FAILED
+        assert "lease expired" in task.result.error
+
+    @pytest.mark.asyncio
+    async def test_stop_shuts_down_db_thread(self, tmp_path):
+        """stop() DB thread'ini kapatmalı, kuyruk yeniden başlatılabilmeli."""
+        queue = TaskQueue(db_path=tmp_path / "shared.db", shared=True, poll_interval=0.02)
+        await queue.start()
+        executor = queue._db_executor
+        await queue.stop()
+
+        assert executor._shutdown
+        await queue.start()
+        try:
+            task_id = await queue.submit("test_echo", "tekrar")
+            assert (await queue.wait_for_task(task_id, timeout=2)).data == "tekrar"
+        finally:
+            await queue.stop()
@@ -0,0 +1,214 @@
+"""
+Enterprise AI Assistant - Token Manager Tests
+=============================================
+
+Content-hash token önbelleği, artımlı konuşma ledger'ı ve önbellekli
+mesaj önceliklendirme testleri.
+"""
+
+import random
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.token_manager import (
+    ConversationTokenLedger,
+    EnterpriseTokenManager,
+    MessagePrioritizer,
+    TokenCache,
+)
+
+
+class CountingTokenizer:
+    """encode çağrılarını sayan sahte tokenizer (kelime = token)."""
+
+    def __init__(self):
+        self.encode_calls = 0
+
+    def encode(self, text):
+        self.encode_calls += 1
+        return list(range(len(text.split())))
+
+    def decode(self, tokens):
+        return " ".join(f"t{t}" for t in tokens)
+
+
+@pytest.fixture
+def manager():
+    return EnterpriseTokenManager()
+
+
+@pytest.fixture
+def counting_manager():
+    tm = EnterpriseTokenManager()
+    tm._tokenizer = CountingTokenizer()
+    tm._tokenizer_type = "tiktoken"
+    return tm
+
+
+def make_history(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant",
+         "content": " ".join(rng.choice(["kod", "veri", "model", "sorgu", "cevap"]) for _ in range(rng.randint(1, 40)))}
+        for i in range(count)
+    ]
+
+
+class TestTokenCache:
+    """Token sayısı önbelleği testleri."""
+
+    def test_repeated_text_is_not_reencoded(self, counting_manager):
+        """Aynı metin ikinci kez sayıldığında tokenizer çağrılmamalı."""
+        text = "bir iki üç dört"
+
+        assert counting_manager.count_tokens(text) == 4
+        assert counting_manager.count_tokens(text) == 4
+        assert counting_manager._tokenizer.encode_calls == 1
+
+        # Truncation önbellekteki encoding'i kullanır
+        assert counting_manager._truncate_text(text, 2, "default") == "t0 t1..."
+        assert counting_manager._tokenizer.encode_calls == 1
+
+    def test_fallback_counts_are_model_specific(self, manager):
+        """Fallback modda önbellek anahtarı model tipine göre ayrılmalı."""
+        text = "x" * 70
+
+        assert manager.count_tokens(text, "llama3") == 17
+        assert manager.count_tokens(text, "qwen2.5") == 20
+        assert manager.count_tokens(text, "llama3") == 17
+
+    def test_cache_is_bounded(self):
+        """Limit aşılınca en eski kayıt atılmalı."""
+        cache = TokenCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+
+class TestConversationLedger:
+    """Artımlı konuşma token toplamı testleri."""
+
+    def test_incremental_total_matches_full_count(self, counting_manager):
+        """Ledger toplamı tam sayımla aynı olmalı ve yalnızca yeni mesajlar sayılmalı."""
+        history = make_history(50)
+
+        for turn in range(1, len(history) + 1):
+            total = counting_manager.count_messages_tokens(history[:turn], conversation_id="s1")
+            assert total == counting_manager.count_messages_tokens(history[:turn])
+
+        ledger = counting_manager.get_ledger("s1")
+        calls = counting_manager._tokenizer.encode_calls
+        history.append({"role": "user", "content": "yepyeni bir soru"})
+
+        counting_manager.count_messages_tokens(history, conversation_id="s1")
+
+        assert counting_manager._tokenizer.encode_calls == calls + 1
+        assert len(ledger) == 51
+
+    def test_edited_history_rebuilds(self, manager):
+        """Geçmiş kırpılır veya değişirse ledger yeniden kurulmalı."""
+        history = make_history(10)
+        manager.count_messages_tokens(history, conversation_id="s2")
+
+        trimmed = history[4:]
+        assert manager.count_messages_tokens(trimmed, conversation_id="s2") == manager.count_messages_tokens(trimmed)
+
+        edited = trimmed[:-1] + [{"role": "assistant", "content": "farklı " * 30}]
+        assert manager.count_messages_tokens(edited, conversation_id="s2") == manager.count_messages_tokens(edited)
+
+    def test_fit_messages_matches_linear_scan(self, manager):
+        """İkili arama ile bulunan kesit doğrusal taramayla aynı olmalı."""
+        history = make_history(40, seed=3)
+
+        for budget in (-1, 0, 3, 20, 150, 400, 10_000):
+            start = len(history)
+            while start > 0 and manager.count_messages_tokens(history[start - 1:]) <= budget:
+                start -= 1
+
+            assert manager.fit_messages(history, budget) == history[start:]
+            assert manager.fit_messages(history, budget, conversation_id="s3") == history[start:]
+
+    def test_ledgers_are_bounded(self, manager, monkeypatch):
+        """Ledger sayısı MAX_LEDGERS ile sınırlı olmalı."""
+        monkeypatch.setattr(EnterpriseTokenManager, "MAX_LEDGERS", 3)
+        for i in range(5):
+            manager.get_ledger(f"oturum-{i}")
+
+        assert manager.get_stats()["conversation_ledgers"] == 3
+        assert isinstance(manager.get_ledger("oturum-4"), ConversationTokenLedger)
+
+    def test_shared_ledger_concurrent_sync(self, manager):
+        """Aynı ledger'a eşzamanlı sync tutarlı toplam üretmeli."""
+        import threading
+
+        history = make_history(60, seed=7)
+        expected = manager.count_messages_tokens(history)
+        barrier = threading.Barrier(8)
+        totals = []
+
+        def worker(offset):
+            barrier.wait()
+            for turn in range(offset, len(history) + 1, 4):
+                manager.count_messages_tokens(history[:turn], conversation_id="paylasilan")
+            totals.append(manager.count_messages_tokens(history, conversation_id="paylasilan"))
+
+        threads = [threading.Thread(target=worker, args=(i % 4 + 1,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ledger = manager.get_ledger("paylasilan")
+        assert totals == [expected] * 8
+        assert len(ledger) == len(history)
+        assert ledger._cumulative[-1] == expected
+
+
+class TestMessagePrioritizer:
+    """Önbellekli önceliklendirme testleri."""
+
+    def test_features_computed_once(self, counting_manager):
+        """Aynı mesajlar farklı sorgularla tekrar skorlanınca tokenizer çağrılmamalı."""
+        prioritizer = MessagePrioritizer(counting_manager)
+        history = make_history(20, seed=5)
+
+        first = prioritizer.prioritize_messages(history, "kod veri")
+        calls = counting_manager._tokenizer.encode_calls
+        second = prioritizer.prioritize_messages(history, "model")
+
+        assert counting_manager._tokenizer.encode_calls == calls
+        assert [m["tokens"] for m in first] == [m["tokens"] for m in second]
+
+    def test_priorities_match_reference(self, manager):
+        """Skorlar keyword overlap / _calculate_density referansıyla aynı olmalı."""
+        prioritizer = MessagePrioritizer(manager)
+        history = make_history(15, seed=9) + [{"role": "user", "content": ""}]
+        query = "Kod model"
+
+        result = prioritizer.prioritize_messages(history, query)
+
+        query_words = set(query.lower().split())
+        for i, (msg, scored) in enumerate(zip(history, result)):
+            recency = 0.5 + (0.5 * (i / max(len(history) - 1, 1)))
+            content_words = set(msg["content"].lower().split())
+            relevance = (
+                min(1.0, 0.3 + (len(query_words & content_words) / len(query_words)) * 0.7)
+                if content_words else 0.5
+            )
+            expected = (
+                recency * 0.35
+                + prioritizer.ROLE_WEIGHTS.get(msg["role"], 0.5) * 0.25
+                + relevance * 0.25
+                + prioritizer._calculate_density(msg["content"]) * 0.15
+            )
+            assert scored["priority"] == expected
+            assert scored["tokens"] == manager.count_tokens(msg["content"])
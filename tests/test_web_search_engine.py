@@ -0,0 +1,252 @@
+"""
+Enterprise AI Assistant - Web Search Engine Tests
+=================================================
+
+Havuzlu HTTP katmanı ve async arama motoru testleri.
+Yerel HTTP taklidi (httpx.MockTransport) üzerinde çalışır; ağ gerekmez.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.http_client import HTTPCache, PooledHTTPClient
+from tools.web_search_engine import PremiumWebSearchEngine
+
+
+ARTICLE = "<p>" + " ".join(f"Yapay zeka konusunda ayrıntılı cümle {i}." for i in range(60)) + "</p>"
+
+
+class LocalWeb:
+    """DuckDuckGo, Wikipedia ve içerik sayfalarını taklit eden yerel sunucu."""
+
+    def __init__(self, page_delay: float = 0.2, pages: int = 6):
+        self.page_delay = page_delay
+        self.pages = pages
+        self.hits = {}
+        self.conditional = 0
+        self.in_flight = {}
+        self.max_in_flight = {}
+
+    def count(self, key):
+        self.hits[key] = self.hits.get(key, 0) + 1
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        try:
+            return await self._route(request)
+        finally:
+            self.in_flight[host] -= 1
+
+    async def _route(self, request: httpx.Request) -> httpx.Response:
+        host, path = request.url.host, request.url.path
+        if host == "html.duckduckgo.com":
+            self.count("ddg")
+            links = "".join(
+                f'<div class="result"><a class="result__a" href="https://site{i}.example/makale">'
+                f'Yapay zeka makalesi {i}</a><div class="result__snippet">Özet {i}</div></div>'
+                for i in range(self.pages)
+            )
+            return httpx.Response(200, text=f"<html><body>{links}</body></html>")
+        if host == "api.duckduckgo.com":
+            self.count("instant")
+            return httpx.Response(200, json={"Abstract": "Yapay zeka özeti", "Heading": "Yapay zeka"})
+        if host.endswith("wikipedia.org"):
+            params = request.url.params
+            if params.get("list") == "search":
+                self.count("wiki_search")
+                return httpx.Response(200, json={"query": {"search": [
+                    {"pageid": 1, "title": "Yapay zeka", "snippet": "<b>Yapay</b> zeka"},
+                    {"pageid": 2, "title": "Makine öğrenimi", "snippet": "öğrenme"},
+                ]}})
+            self.count("wiki_extracts")
+            return httpx.Response(200, json={"query": {"pages": {
+                "1": {"extract": "Yapay zeka girişi. " * 20},
+                "2": {"extract": "Makine öğrenimi girişi. " * 20},
+            }}})
+        if host.startswith("site"):
+            self.count(host)
+            etag = f'"{host}-v1"'
+            if request.headers.get("if-none-match") == etag:
+                self.conditional += 1
+                return httpx.Response(304, headers={"ETag": etag})
+            await asyncio.sleep(self.page_delay)
+            html = f"<html><head><title>{host}</title></head><body><article>{ARTICLE}</article></body></html>"
+            return httpx.Response(200, text=html, headers={"ETag": etag, "Cache-Control": "max-age=0"})
+        return httpx.Response(404)
+
+
+def make_engine(web: LocalWeb, db_path=None, **kwargs) -> PremiumWebSearchEngine:
+    client = PooledHTTPClient(cache=HTTPCache(db_path), transport=httpx.MockTransport(web.handler), **kwargs)
+    return PremiumWebSearchEngine(http_client=client, max_concurrent_extractions=8)
+
+
+class TestPooledHTTPClient:
+    """PooledHTTPClient testleri."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_hit_and_etag_revalidation(self):
+        """Taze kayıt ağa çıkmamalı; bayat kayıt 304 ile yeniden doğrulanmalı."""
+        web = LocalWeb(page_delay=0)
+        client = PooledHTTPClient(cache=HTTPCache(), transport=httpx.MockTransport(web.handler))
+
+        first = await client.get("https://site1.example/makale", ttl=60)
+        again = await client.get("https://site1.example/makale", ttl=60)
+        assert again.from_cache and again.text == first.text
+        assert web.hits["site1.example"] == 1
+
+        # max-age=0 -> her istekte koşullu doğrulama
+        stale = await client.get("https://site2.example/makale")
+        revalidated = await client.get("https://site2.example/makale")
+        assert revalidated.revalidated and revalidated.text == stale.text
+        assert web.conditional == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        """Aynı host'a eşzamanlı istek sayısı sınırı aşmamalı."""
+        web = LocalWeb(page_delay=0.05)
+        client = PooledHTTPClient(max_per_host=2, transport=httpx.MockTransport(web.handler))
+
+        await asyncio.gather(*(
+            client.get(f"https://site{i % 2}.example/makale?n={i}", use_cache=False) for i in range(10)
+        ))
+
+        assert web.max_in_flight["site0.example"] == 2
+        assert web.max_in_flight["site1.example"] == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_eviction_is_bounded(self):
+        """HTTP kayıtları LRU ile sınırlanmalı; bayatlığı aşanlar silinmeli."""
+        web = LocalWeb(page_delay=0)
+        cache = HTTPCache(max_entries=3, max_stale=60)
+        client = PooledHTTPClient(cache=cache, transport=httpx.MockTransport(web.handler))
+
+        for i in range(3):
+            await client.get(f"https://site{i}.example/makale", ttl=600)
+        # site0 okunur -> en uzun süredir okunmayan site1 olur
+        await client.get("https://site0.example/makale", ttl=600)
+        await client.get("https://site3.example/makale", ttl=600)
+
+        stats = cache.get_stats()
+        assert stats["http_entries"] == 3 and stats["evicted"] == 1
+        assert cache.get(client.cache_key("GET", "https://site1.example/makale")) is None
+        assert cache.get(client.cache_key("GET", "https://site0.example/makale")) is not None
+
+        # TTL + max_stale geçmiş kayıt bir sonraki yazmada silinir
+        key = client.cache_key("GET", "https://site2.example/makale")
+        with cache._lock:
+            cache._connect().execute("UPDATE http_cache SET fetched_at = 0 WHERE key = ?", (key,))
+        cache.prune()
+        assert cache.get(key) is None
+
+        cache.put_json("extraction", "eski", {"a": 1}, ttl=-1)
+        cache.put_json("extraction", "yeni", {"a": 2}, ttl=60)
+        assert cache.get_stats()["artifacts"] == 1
+        await client.aclose()
+
+
+class TestPremiumWebSearchEngine:
+    """Async arama motoru testleri."""
+
+    @pytest.mark.asyncio
+    async def test_search_pipelines_extraction(self, tmp_path):
+        """Sayfalar eşzamanlı çekilmeli; süre tek sayfa gecikmesine yakın olmalı."""
+        web = LocalWeb(page_delay=0.2, pages=6)
+        engine = make_engine(web, tmp_path / "web.db")
+
+        started = time.perf_counter()
+        response = await engine.search_async("yapay zeka", num_results=10)
+        elapsed = time.perf_counter() - started
+
+        assert response.success
+        assert elapsed < 0.8
+        assert response.instant_answer["title"] == "Yapay zeka"
+        assert response.providers_used == ["DuckDuckGo", "Wikipedia"]
+        assert sum(1 for r in response.results if "ayrıntılı cümle" in r.full_content) == 6
+        assert web.hits["wiki_extracts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_cache_survives_restart(self, tmp_path):
+        """Disk önbelleği yeni motor örneğinde de ağa çıkmadan dönmeli."""
+        db_path = tmp_path / "web.db"
+        web = LocalWeb(page_delay=0)
+        first = await make_engine(web, db_path).search_async("yapay zeka", num_results=5)
+        network_hits = dict(web.hits)
+
+        second = await make_engine(web, db_path).search_async("yapay zeka", num_results=5)
+
+        assert second.cached
+        assert web.hits == network_hits
+        assert [r.url for r in second.results] == [r.url for r in first.results]
+        assert second.results[0].source_type == first.results[0].source_type
+
+    @pytest.mark.asyncio
+    async def test_search_cache_io_runs_off_loop(self, tmp_path):
+        """Arama önbelleği okuma/yazması event loop thread'inde yapılmamalı."""
+        web = LocalWeb(page_delay=0)
+        engine = make_engine(web, tmp_path / "web.db")
+        threads = []
+        original_get, original_set = engine.cache.get, engine.cache.set
+
+        def get(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return original_get(*args, **kwargs)
+
+        def set_(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return original_set(*args, **kwargs)
+
+        engine.cache.get, engine.cache.set = get, set_
+        response = await engine.search_async("yapay zeka", num_results=5)
+
+        assert response.success
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_failed_search_cancels_provider_tasks(self, tmp_path):
+        """Arama hata verirse başlatılan sağlayıcı task'ları iptal edilmeli."""
+        engine = make_engine(LocalWeb(page_delay=0), tmp_path / "web.db")
+        cancelled = []
+
+        async def slow_provider(*args, **kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+
+        async def broken_search(*args, **kwargs):
+            await asyncio.sleep(0)
+            raise RuntimeError("ddg kapalı")
+
+        engine.ddg.instant_answer_async = slow_provider
+        engine.wiki.search_async = slow_provider
+        engine.ddg.search_async = broken_search
+
+        response = await asyncio.wait_for(engine.search_async("yapay zeka"), timeout=1.0)
+
+        assert not response.success and "ddg kapalı" in response.error_message
+        assert cancelled == [1, 1]
+
+    def test_sync_search_uses_background_loop(self, tmp_path):
+        """Senkron search aynı havuzlu katmanı kullanmalı."""
+        web = LocalWeb(page_delay=0)
+        engine = make_engine(web, tmp_path / "web.db")
+
+        response = engine.search("yapay zeka", num_results=5, include_wikipedia=False)
+
+        assert response.success
+        assert response.providers_used == ["DuckDuckGo"]
+        assert engine.get_stats()["http"]["network"] > 0
@@ -143,6 +143,75 @@ class TestStreamBuffer:
         assert state2.full_response == "Session 2"
 
 
+class TestStreamHub:
+    """Stream Hub (event-driven fan-out) testleri."""
+
+    @pytest.mark.asyncio
+    async def test_follower_receives_coalesced_frames(self):
+        """Takipçi token'ları birleştirilmiş frame'lerle almalı."""
+        from core.stream_buffer import StreamBuffer
+        from core.stream_hub import StreamHub
+
+        buffer = StreamBuffer()
+        hub = StreamHub(buffer, flush_interval=0.05)
+        stream = buffer.create_stream(session_id="hub-session", message="test")
+        buffer.add_token(stream.stream_id, "Merhaba")
+
+        async def produce():
+            for i in range(20):
+                buffer.add_token(stream.stream_id, f" t{i}")
+                await asyncio.sleep(0)
+            buffer.complete_stream(stream.stream_id)
+
+        producer = asyncio.create_task(produce())
+        frames = [frame async for frame in hub.subscribe(stream.stream_id, from_index=1)]
+        await producer
+
+        assert "".join(f["content"] for f in frames) == "".join(f" t{i}" for i in range(20))
+        assert sum(f["count"] for f in frames) == 20
+        assert frames[0]["index"] == 1
+        assert len(frames) < 20
+        assert hub.get_stats()["followed_streams"] == 0
+
+    @pytest.mark.asyncio
+    async def test_frames_split_by_byte_limit(self):
+        """Byte limiti aşan token'lar ayrı frame'lere bölünmeli."""
+        from core.stream_buffer import StreamBuffer
+        from core.stream_hub import StreamHub
+
+        buffer = StreamBuffer()
+        hub = StreamHub(buffer, flush_interval=0.01, max_frame_bytes=10)
+        stream = buffer.create_stream(session_id="hub-session", message="test")
+        for _ in range(5):
+            buffer.add_token(stream.stream_id, "abcdef")
+        buffer.complete_stream(stream.stream_id)
+
+        frames = [frame async for frame in hub.subscribe(stream.stream_id)]
+
+        assert [f["count"] for f in frames] == [1, 1, 1, 1, 1]
+        assert [f["index"] for f in frames] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_follower_wakes_on_stop(self):
+        """Stream durdurulunca takipçi polling olmadan sonlanmalı."""
+        from core.stream_buffer import StreamBuffer
+        from core.stream_hub import StreamHub
+
+        buffer = StreamBuffer()
+        hub = StreamHub(buffer)
+        stream = buffer.create_stream(session_id="hub-session", message="test")
+
+        async def follow():
+            return [frame async for frame in hub.subscribe(stream.stream_id)]
+
+        task = asyncio.create_task(follow())
+        await asyncio.sleep(0.01)
+        buffer.stop_stream(stream.stream_id)
+
+        frames = await asyncio.wait_for(task, timeout=1.0)
+        assert frames == []
+
+
 class TestWebSocketHandler:
     """WebSocket Handler testleri."""
     
@@ -168,6 +237,153 @@ class TestWebSocketHandler:
         assert manager is not None
         assert manager.active_count == 0
 
+    @pytest.mark.asyncio
+    async def test_follow_stream_cancellation_propagates(self, mock_websocket):
+        """Takip iptal edilince abonelik kapanmalı ve CancelledError yükselmeli."""
+        from api.websocket_v2 import WebSocketManagerV2, WebSocketHandlerV2
+        from core.stream_buffer import stream_buffer
+        from core.stream_hub import stream_hub
+
+        manager = WebSocketManagerV2()
+        conn = await manager.connect(mock_websocket, "follower")
+        handler = WebSocketHandlerV2(conn, manager)
+        stream = stream_buffer.create_stream(session_id="follow-cancel", message="test")
+
+        task = asyncio.create_task(handler._follow_stream(stream.stream_id, 0))
+        await asyncio.sleep(0.01)
+        assert stream.stream_id in stream_hub._channels
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert stream.stream_id not in stream_hub._channels
+
+        stream_buffer.stop_stream(stream.stream_id)
+        await manager.disconnect("follower")
+
+
+class TestWebSocketBroadcast:
+    """Eşzamanlı, backpressure-aware broadcast testleri."""
+
+    @staticmethod
+    def _make_ws(delay: float = 0.0):
+        from starlette.websockets import WebSocketState
+
+        ws = AsyncMock()
+        ws.client_state = WebSocketState.CONNECTED
+        ws.sent = []
+
+        async def send_text(text):
+            if delay:
+                await asyncio.sleep(delay)
+            ws.sent.append(text)
+
+        ws.send_text = AsyncMock(side_effect=send_text)
+        return ws
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self):
+        """Yavaş client diğer client'ların teslimatını geciktirmemeli."""
+        from api.websocket_v2 import WebSocketManagerV2
+
+        manager = WebSocketManagerV2()
+        slow = self._make_ws(delay=1.0)
+        fast = [self._make_ws() for _ in range(20)]
+        await manager.connect(slow, "slow")
+        for i, ws in enumerate(fast):
+            await manager.connect(ws, f"fast-{i}")
+
+        sent = await manager.broadcast({"type": "notice", "text": "merhaba"})
+        await asyncio.sleep(0.05)
+
+        assert sent == 21
+        assert all(json.loads(ws.sent[0])["text"] == "merhaba" for ws in fast)
+        assert slow.sent == []
+
+        for client_id in list(manager._connections):
+            await manager.disconnect(client_id)
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_and_lag_stats(self):
+        """Kuyruğu dolan client'ta en eski mesajlar atılmalı ve lag raporlanmalı."""
+        from api.websocket_v2 import WebSocketManagerV2
+
+        manager = WebSocketManagerV2(queue_size=2, slow_client_policy="drop")
+        ws = self._make_ws(delay=0.2)
+        await manager.connect(ws, "lagging")
+        manager.join_room("lagging", "room-1")
+
+        for i in range(5):
+            await manager.send_to_room("room-1", {"seq": i})
+
+        lag = manager.get_stats()["client_lag"]["lagging"]
+        assert lag["dropped"] >= 2
+        assert lag["queue_depth"] <= 2
+
+        await manager.disconnect("lagging")
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_evicts_slow_client(self):
+        """disconnect politikasında geride kalan client kapatılmalı."""
+        from api.websocket_v2 import WebSocketManagerV2
+
+        manager = WebSocketManagerV2(queue_size=1, slow_client_policy="disconnect")
+        ws = self._make_ws(delay=0.5)
+        await manager.connect(ws, "stuck")
+
+        for i in range(4):
+            await manager.broadcast({"seq": i})
+        await asyncio.sleep(0.05)
+
+        assert manager.get_connection("stuck") is None
+        assert manager.get_stats()["slow_disconnects"] == 1
+        ws.close.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_evicts_once(self):
+        """Gönderim zaman aşımı yazmayı durdurmalı ve tahliye tek sefer yapılmalı."""
+        from api.websocket_v2 import WebSocketManagerV2
+
+        manager = WebSocketManagerV2(queue_size=1, slow_client_policy="disconnect", send_timeout=0.05)
+        ws = self._make_ws(delay=0.5)
+        closed = asyncio.Event()
+
+        async def slow_close(**kwargs):
+            await asyncio.sleep(0.01)
+            closed.set()
+
+        ws.close = AsyncMock(side_effect=slow_close)
+        await manager.connect(ws, "stuck")
+
+        # Writer ilk mesajda takılır; kuyruk dolunca enqueue de tahliye ister
+        for i in range(4):
+            await manager.broadcast({"seq": i})
+        await asyncio.sleep(0.1)
+        assert await manager.broadcast({"seq": 99}) == 0
+        await asyncio.wait_for(closed.wait(), timeout=1.0)
+        await asyncio.sleep(0.02)
+
+        assert manager.get_connection("stuck") is None
+        assert manager.get_stats()["slow_disconnects"] == 1
+        assert ws.close.await_count == 1
+        assert ws.send_text.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_stops_writer_under_drop_policy(self):
+        """drop politikasında da zaman aşımı sonrası sokete yazılmamalı."""
+        from api.websocket_v2 import WebSocketManagerV2
+
+        manager = WebSocketManagerV2(queue_size=4, slow_client_policy="drop", send_timeout=0.05)
+        ws = self._make_ws(delay=0.5)
+        await manager.connect(ws, "stuck")
+
+        for i in range(3):
+            await manager.broadcast({"seq": i})
+        await asyncio.sleep(0.15)
+
+        assert ws.send_text.await_count == 1
+        assert manager.get_connection("stuck") is None
+
 
 class TestWebSocketReconnection:
     """WebSocket yeniden bağlanma testleri."""
@@ -0,0 +1,100 @@
+"""
+Enterprise AI Assistant - Workflow Engine Tests
+===============================================
+
+DAG yürütme planı testleri.
+Paralel dallar, birleşme düğümleri, döngü tespiti ve düğüm süreleri.
+"""
+
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.workflow_engine import WorkflowEngine, WorkflowStatus
+
+
+def node(node_id, node_type, **config):
+    return {"id": node_id, "type": node_type, "name": node_id, "config": config}
+
+
+def edge(source, target, target_port="input"):
+    return {"source_node": source, "target_node": target, "target_port": target_port}
+
+
+def fan_out_workflow(engine, branches=4, seconds=0.2):
+    """Start -> N gecikme dalı -> merge -> end."""
+    nodes = [node("start", "start"), node("merge", "merge"), node("end", "end")]
+    edges = [edge("merge", "end")]
+    for i in range(branches):
+        nodes.append(node(f"d{i}", "delay", seconds=seconds))
+        edges += [edge("start", f"d{i}"), edge(f"d{i}", "merge", target_port=f"input{i}")]
+    return engine.create_workflow("fan-out", nodes=nodes, edges=edges)
+
+
+class TestWorkflowEngine:
+    """WorkflowEngine DAG zamanlayıcı testleri."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_runs_in_longest_branch_time(self, tmp_path):
+        """Bağımsız dallar paralel çalışmalı; süre en uzun dal kadar olmalı."""
+        engine = WorkflowEngine(storage_dir=str(tmp_path))
+        workflow = fan_out_workflow(engine, branches=4, seconds=0.2)
+
+        started = time.perf_counter()
+        ctx = await engine.execute_workflow(workflow.id, inputs={"x": 1})
+        elapsed = time.perf_counter() - started
+
+        assert ctx.status == WorkflowStatus.COMPLETED
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_merge_runs_once_with_all_inputs(self, tmp_path):
+        """Birleşme düğümü tüm ebeveynler bittikten sonra bir kez çalışmalı."""
+        engine = WorkflowEngine(storage_dir=str(tmp_path))
+        workflow = fan_out_workflow(engine, branches=3, seconds=0.01)
+
+        ctx = await engine.execute_workflow(workflow.id, inputs={"x": 1})
+
+        merge_runs = [log for log in ctx.logs if log["node_id"] == "merge" and log["status"] == "started"]
+        assert len(merge_runs) == 1
+        assert set(ctx.node_outputs["merge"]) == {"input0", "input1", "input2"}
+        assert len([log for log in ctx.logs if log["node_id"] == "end" and log["status"] == "started"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_parallel_limit_and_timings(self, tmp_path):
+        """Eşzamanlılık sınırı uygulanmalı ve loglarda düğüm süresi olmalı."""
+        engine = WorkflowEngine(storage_dir=str(tmp_path))
+        workflow = fan_out_workflow(engine, branches=4, seconds=0.1)
+
+        started = time.perf_counter()
+        ctx = await engine.execute_workflow(workflow.id, max_parallel=1)
+        elapsed = time.perf_counter() - started
+
+        assert ctx.status == WorkflowStatus.COMPLETED
+        assert elapsed >= 0.4
+        completed = {log["node_id"]: log for log in ctx.logs if log["status"] == "completed"}
+        assert set(completed) == {"start", "d0", "d1", "d2", "d3", "merge", "end"}
+        assert completed["d0"]["duration_ms"] >= 90
+
+    @pytest.mark.asyncio
+    async def test_cycle_fails_and_plan_is_cached(self, tmp_path):
+        """Döngülü iş akışı hata vermeli; plan sürüm değişmedikçe yeniden derlenmemeli."""
+        engine = WorkflowEngine(storage_dir=str(tmp_path))
+        workflow = engine.create_workflow(
+            "cycle",
+            nodes=[node("start", "start"), node("a", "template", template="a"), node("b", "template", template="b")],
+            edges=[edge("start", "a"), edge("a", "b"), edge("b", "a")]
+        )
+
+        ctx = await engine.execute_workflow(workflow.id)
+        assert ctx.status == WorkflowStatus.FAILED
+        assert "cycle" in ctx.error
+
+        engine.update_workflow(workflow.id, edges=[edge("start", "a"), edge("a", "b")])
+        plan = engine.compile_workflow(workflow)
+        assert plan.order == ["start", "a", "b"]
+        assert engine.compile_workflow(workflow) is plan
@@ -0,0 +1,493 @@
+"""
+🔌 Pooled HTTP Client
+=====================
+
+Web araçları için ortak, havuzlu ve önbellekli asenkron HTTP katmanı.
+
+Özellikler:
+- Tek paylaşılan httpx.AsyncClient (event loop başına) ve keep-alive havuzu
+- Host başına eşzamanlı bağlantı sınırı
+- SQLite disk önbelleği: TTL, ETag/Last-Modified ile koşullu yeniden doğrulama
+- Önbellek sınırı: bayatlığı aşan kayıtlar silinir, kalanlar LRU ile kırpılır
+- Ağ hatasında eski (stale) yanıta düşme
+- Türetilmiş sonuçlar (arama yanıtı, içerik çıkarımı) için JSON artefakt deposu
+- Senkron çağıranlar için arka plan event loop'u (havuz çağrılar arasında korunur)
+
+Testlerde `transport=httpx.MockTransport(handler)` ile yerel bir HTTP
+taklidine karşı çalıştırılabilir.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Dict, Optional, TypeVar, Union
+from urllib.parse import urlparse
+
+import httpx
+
+from core.config import settings
+
+T = TypeVar("T")
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+
+# ============ RESPONSE ============
+
+@dataclass
+class HTTPResponse:
+    """Önbellekten veya ağdan gelen yanıt"""
+    url: str
+    status_code: int
+    text: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+    revalidated: bool = False
+    stale: bool = False
+    body_hash: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+# ============ DISK CACHE ============
+
+class HTTPCache:
+    """
+    SQLite tabanlı HTTP ve artefakt önbelleği.
+
+    `db_path` verilmezse bellek içi SQLite kullanılır. HTTP kayıtları TTL'i
+    dolduktan sonra `max_stale` saniye daha yeniden doğrulama / bayat yanıt
+    için tutulur; toplam kayıt sayısı `max_entries`'i aşarsa en uzun süredir
+    okunmayanlar silinir. Süresi dolmuş artefaktlar yazma sırasında temizlenir.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        max_entries: int = 5000,
+        max_stale: float = 7 * 24 * 3600,
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.max_entries = max_entries
+        self.max_stale = max_stale
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._evicted = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.db_path is not None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+            else:
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, body TEXT NOT NULL, body_hash TEXT NOT NULL, "
+                "etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL, ttl REAL NOT NULL, "
+                "accessed_at REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(http_cache)")}
+            if "accessed_at" not in columns:
+                # Eski şema: LRU sütunu sonradan eklendi
+                self._conn.execute("ALTER TABLE http_cache ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+                "expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    # ---------- HTTP entries ----------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT url, status, headers, body, body_hash, etag, last_modified, fetched_at, ttl "
+                "FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+        if row is None:
+            return None
+        return {
+            "url": row[0], "status": row[1], "headers": json.loads(row[2]), "body": row[3],
+            "body_hash": row[4], "etag": row[5], "last_modified": row[6],
+            "fetched_at": row[7], "ttl": row[8],
+        }
+
+    def put(self, key: str, response: HTTPResponse, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(key, url, status, headers, body, body_hash, etag, last_modified, fetched_at, ttl, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, response.url, response.status_code, json.dumps(response.headers),
+                    response.text, response.body_hash, response.headers.get("etag"),
+                    response.headers.get("last-modified"), now, ttl, now,
+                )
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def touch(self, key: str) -> None:
+        """304 sonrası tazelik süresini yenile"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("UPDATE http_cache SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            conn.commit()
+
+    # ---------- Artifacts ----------
+
+    def get_json(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, expires_at FROM artifacts WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return json.loads(row[0])
+
+    def put_json(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts (namespace, key, payload, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False, default=str), expires_at)
+            )
+            conn.execute("DELETE FROM artifacts WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+            conn.commit()
+
+    # ---------- Maintenance ----------
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Bayatlık süresini aşan kayıtları sil, sonra sayıyı LRU ile sınırla (kilit altında)"""
+        cursor = conn.execute(
+            "DELETE FROM http_cache WHERE fetched_at + ttl + ? < ?", (self.max_stale, now)
+        )
+        evicted = max(cursor.rowcount, 0)
+        overflow = conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0] - self.max_entries
+        if overflow > 0:
+            cursor = conn.execute(
+                "DELETE FROM http_cache WHERE key IN "
+                "(SELECT key FROM http_cache ORDER BY accessed_at ASC LIMIT ?)", (overflow,)
+            )
+            evicted += max(cursor.rowcount, 0)
+        self._evicted += evicted
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            conn = self._connect()
+            if namespace is None:
+                conn.execute("DELETE FROM http_cache")
+                conn.execute("DELETE FROM artifacts")
+            else:
+                conn.execute("DELETE FROM artifacts WHERE namespace = ?", (namespace,))
+            conn.commit()
+
+    def prune(self) -> None:
+        """Süresi dolmuş artefaktları ve sınırı aşan HTTP kayıtlarını sil"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM artifacts WHERE expires_at IS NOT NULL AND expires_at < ?", (now,))
+            self._evict(conn, now)
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            http_entries = conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+            artifacts = conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+        return {
+            "path": str(self.db_path) if self.db_path else ":memory:",
+            "http_entries": http_entries,
+            "artifacts": artifacts,
+            "max_entries": self.max_entries,
+            "evicted": self._evicted,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# ============ POOLED CLIENT ============
+
+@dataclass
+class _LoopState:
+    client: httpx.AsyncClient
+    host_slots: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+class PooledHTTPClient:
+    """
+    Paylaşılan asenkron HTTP istemcisi.
+
+    Her event loop için tek bir httpx.AsyncClient tutulur; bağlantılar
+    keep-alive ile yeniden kullanılır. Aynı host'a aynı anda en fazla
+    `max_per_host` istek gider.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_per_host: int = 6,
+        timeout: float = 12.0,
+        default_ttl: float = 900.0,
+        cache: Optional[HTTPCache] = None,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.default_ttl = default_ttl
+        self.cache = cache
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.transport = transport
+
+        self._states: Dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "network": 0,
+            "cache_hits": 0,
+            "revalidated": 0,
+            "stale_served": 0,
+            "errors": 0,
+        }
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                for closed in [l for l in self._states if l.is_closed()]:
+                    del self._states[closed]
+                state = _LoopState(client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    follow_redirects=True,
+                    transport=self.transport,
+                ))
+                self._states[loop] = state
+            return state
+
+    def _host_slot(self, state: _LoopState, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        slot = state.host_slots.get(host)
+        if slot is None:
+            slot = state.host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slot
+
+    @staticmethod
+    def cache_key(method: str, url: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> str:
+        payload = json.dumps(
+            [method.upper(), url, sorted((params or {}).items()), sorted((data or {}).items())],
+            ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _max_age(headers: Dict[str, str]) -> Optional[float]:
+        cache_control = headers.get("cache-control", "")
+        match = re.search(r"max-age=(\d+)", cache_control)
+        return float(match.group(1)) if match else None
+
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any], **flags) -> HTTPResponse:
+        return HTTPResponse(
+            url=entry["url"],
+            status_code=entry["status"],
+            text=entry["body"],
+            headers=entry["headers"],
+            from_cache=True,
+            body_hash=entry["body_hash"],
+            **flags,
+        )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: Optional[float] = None,
+        use_cache: bool = True,
+    ) -> HTTPResponse:
+        """
+        İstek gönder.
+
+        Taze önbellek kaydı varsa ağa çıkılmaz; bayat kayıt ETag /
+        Last-Modified ile koşullu olarak yeniden doğrulanır (304 -> kayıt
+        tazelenir). Ağ hatasında bayat kayıt varsa o döner.
+        """
+        self._stats["requests"] += 1
+        cache = self.cache if use_cache else None
+        key = self.cache_key(method, url, params, data)
+        # SQLite çağrıları event loop'u bloklamasın diye thread'de
+        entry = await asyncio.to_thread(cache.get, key) if cache is not None else None
+
+        if entry is not None and time.time() - entry["fetched_at"] < entry["ttl"]:
+            self._stats["cache_hits"] += 1
+            return self._from_entry(entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        state = self._state()
+        try:
+            async with self._host_slot(state, url):
+                self._stats["network"] += 1
+                response = await state.client.request(
+                    method, url, params=params, data=data, headers=request_headers
+                )
+        except httpx.HTTPError:
+            self._stats["errors"] += 1
+            if entry is not None:
+                self._stats["stale_served"] += 1
+                return self._from_entry(entry, stale=True)
+            raise
+
+        if response.status_code == 304 and entry is not None:
+            await asyncio.to_thread(cache.touch, key)
+            self._stats["revalidated"] += 1
+            return self._from_entry(entry, revalidated=True)
+
+        text = response.text
+        result = HTTPResponse(
+            url=str(response.url),
+            status_code=response.status_code,
+            text=text,
+            headers={k.lower(): v for k, v in response.headers.items()},
+            body_hash=hashlib.sha256(text.encode("utf-8")).hexdigest()[:32],
+        )
+
+        # max-age=0 kaydı tutulur ama her istekte koşullu doğrulanır
+        if cache is not None and result.ok and "no-store" not in result.headers.get("cache-control", ""):
+            max_age = self._max_age(result.headers)
+            entry_ttl = ttl if ttl is not None else (max_age if max_age is not None else self.default_ttl)
+            await asyncio.to_thread(cache.put, key, result, entry_ttl)
+
+        return result
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Çalışan loop'a ait istemciyi kapat"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.pop(loop, None)
+        if state is not None:
+            await state.client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats["active_loops"] = len(self._states)
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
+
+
+# ============ SYNC BRIDGE ============
+
+class _BackgroundLoop:
+    """Senkron çağıranlar için kalıcı event loop (daemon thread)"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="http-client-loop", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure())
+        return future.result(timeout)
+
+
+_background_loop = _BackgroundLoop()
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Coroutine'i senkron koddan çalıştır.
+
+    Arka plandaki kalıcı loop kullanıldığı için havuzdaki bağlantılar
+    ardışık senkron çağrılar arasında yeniden kullanılır.
+    """
+    return _background_loop.run(coro, timeout)
+
+
+# ============ SINGLETON ============
+
+_http_client: Optional[PooledHTTPClient] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """Web araçlarının paylaştığı istemci (disk önbellekli)"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = PooledHTTPClient(cache=HTTPCache(settings.DATA_DIR / "cache" / "web_http_cache.db"))
+        return _http_client
+
+
+__all__ = [
+    "HTTPResponse",
+    "HTTPCache",
+    "PooledHTTPClient",
+    "get_http_client",
+    "run_sync",
+]
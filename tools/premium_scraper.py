@@ -151,6 +151,13 @@ class ScraperConfig:
     # Caching
     cache_enabled: bool = True
     cache_ttl_hours: int = 24
+    
+    # Concurrency
+    max_concurrent_per_domain: int = 4
+    extraction_workers: int = 4
+    browser_contexts: int = 2
+    pages_per_context: int = 2
+    block_resources: bool = True
 
 
 class ContentCache:
@@ -305,13 +312,68 @@ class NewspaperExtractor:
 
 
 class PlaywrightExtractor:
-    """Playwright-based JavaScript rendering."""
+    """
+    Playwright-based JavaScript rendering with a warm page pool.
     
-    def __init__(self):
+    Browser is launched once; pages are spread over a few browser contexts
+    and reused between URLs. Image, font and media requests are aborted
+    at the context level so only the document and scripts are loaded.
+    
+    Havuz kapasitesi sayfa nesnelerinden bağımsız bir sayaçla tutulur:
+    açılamayan veya bozulan sayfa slotunu her durumda geri bırakır, kopan
+    tarayıcı yeniden başlatılır ve `close()` bekleyen tüm çağrıları uyandırır.
+    """
+    
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+    
+    STEALTH_SCRIPT = """
+        Object.defineProperty(navigator, 'webdriver', {
+            get: () => undefined
+        });
+    """
+    
+    def __init__(
+        self,
+        max_contexts: int = 2,
+        pages_per_context: int = 2,
+        block_resources: bool = True,
+        acquire_timeout: float = 30.0
+    ):
+        self.max_contexts = max(1, max_contexts)
+        self.pages_per_context = max(1, pages_per_context)
+        self.block_resources = block_resources
+        self.acquire_timeout = acquire_timeout
+        
         self._browser: Optional[Browser] = None
         self._playwright = None
+        self._lock = asyncio.Lock()
+        self._pool_changed = asyncio.Condition(self._lock)
+        self._idle_pages: List[Any] = []
+        # context -> open page count
+        self._contexts: Dict[Any, int] = {}
+        # Ödünç verilen sayfa -> havuz kuşağı (close() kuşağı artırır)
+        self._leases: Dict[Any, int] = {}
+        self._generation = 0
+        
+        self._stats = {
+            "pages_created": 0,
+            "pages_reused": 0,
+            "pages_discarded": 0,
+            "blocked_requests": 0,
+            "browser_restarts": 0,
+            "acquire_timeouts": 0,
+        }
     
-    async def _get_browser(self) -> Browser:
+    @property
+    def pool_size(self) -> int:
+        return self.max_contexts * self.pages_per_context
+    
+    async def _get_browser(self) -> "Browser":
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("Playwright browser disconnected, relaunching")
+            self._stats["browser_restarts"] += 1
+            await self._shutdown_browser()
+        
         if self._browser is None and PLAYWRIGHT_AVAILABLE:
             self._playwright = await async_playwright().start()
             self._browser = await self._playwright.chromium.launch(
@@ -324,6 +386,121 @@ class PlaywrightExtractor:
             )
         return self._browser
     
+    async def _shutdown_browser(self) -> None:
+        """Context'leri, boştaki sayfaları ve tarayıcıyı kapat (lock altında)."""
+        for context in list(self._contexts):
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._contexts.clear()
+        self._idle_pages.clear()
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+    
+    async def _block_route(self, route) -> None:
+        """Ağır kaynakları (görsel, font, medya) indirmeden iptal et."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            self._stats["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _new_page(self, browser: "Browser"):
+        """En az dolu context'te (gerekirse yeni context'te) sayfa aç."""
+        context = min(self._contexts, key=self._contexts.get, default=None)
+        if context is None or (
+            self._contexts[context] >= self.pages_per_context
+            and len(self._contexts) < self.max_contexts
+        ):
+            context = await browser.new_context()
+            await context.add_init_script(self.STEALTH_SCRIPT)
+            if self.block_resources:
+                await context.route("**/*", self._block_route)
+            self._contexts[context] = 0
+        
+        page = await context.new_page()
+        self._contexts[context] += 1
+        self._stats["pages_created"] += 1
+        return page
+    
+    async def _acquire_page(self):
+        """
+        Havuzdan sayfa al; havuz doluysa en fazla `acquire_timeout` bekle.
+        
+        Zaman aşımında, havuz kapatıldığında veya sayfa açılamadığında None.
+        """
+        generation = self._generation
+        async with self._pool_changed:
+            try:
+                await asyncio.wait_for(
+                    self._pool_changed.wait_for(
+                        lambda: self._generation != generation or len(self._leases) < self.pool_size
+                    ),
+                    timeout=self.acquire_timeout
+                )
+            except asyncio.TimeoutError:
+                self._stats["acquire_timeouts"] += 1
+                logger.warning(f"Playwright page pool busy for {self.acquire_timeout}s")
+                return None
+            if self._generation != generation:
+                return None
+            
+            try:
+                browser = await self._get_browser()
+                if not browser:
+                    return None
+                while self._idle_pages:
+                    page = self._idle_pages.pop()
+                    if not page.is_closed():
+                        self._stats["pages_reused"] += 1
+                        break
+                    self._forget_page(page)
+                else:
+                    page = await self._new_page(browser)
+            except Exception as e:
+                logger.warning(f"Playwright page creation failed: {e}")
+                self._pool_changed.notify()
+                return None
+            
+            self._leases[page] = self._generation
+            return page
+    
+    def _forget_page(self, page) -> None:
+        self._stats["pages_discarded"] += 1
+        context = page.context
+        if context in self._contexts:
+            self._contexts[context] -= 1
+    
+    async def _release_page(self, page, healthy: bool) -> None:
+        """Sağlam sayfayı havuza geri koy, bozuk sayfayı kapat; slotu her durumda bırak."""
+        keep = healthy and not page.is_closed()
+        if not keep:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        
+        async with self._pool_changed:
+            if self._leases.pop(page, None) != self._generation:
+                # Havuz bu sayfa ödünçteyken kapatıldı
+                return
+            if keep and page.context in self._contexts:
+                self._idle_pages.append(page)
+            else:
+                self._forget_page(page)
+            self._pool_changed.notify()
+    
     async def extract(
         self,
         url: str,
@@ -333,21 +510,12 @@ class PlaywrightExtractor:
         if not PLAYWRIGHT_AVAILABLE:
             return None
         
-        browser = await self._get_browser()
-        if not browser:
+        page = await self._acquire_page()
+        if page is None:
             return None
         
-        page = None
+        healthy = True
         try:
-            page = await browser.new_page()
-            
-            # Anti-detection
-            await page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """)
-            
             await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
             
             # Wait for specific selector if provided
@@ -368,16 +536,27 @@ class PlaywrightExtractor:
             
         except Exception as e:
             logger.warning(f"Playwright extraction failed: {e}")
+            healthy = False
             return None
         finally:
-            if page:
-                await page.close()
+            await self._release_page(page, healthy)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "contexts": len(self._contexts),
+            "open_pages": sum(self._contexts.values()),
+            "idle_pages": len(self._idle_pages),
+            "leased_pages": len(self._leases),
+        }
     
     async def close(self):
-        if self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        async with self._pool_changed:
+            # Bekleyen _acquire_page çağrıları kuşak değişimini görüp None döner
+            self._generation += 1
+            self._leases.clear()
+            self._pool_changed.notify_all()
+            await self._shutdown_browser()
 
 
 class BeautifulSoupExtractor:
@@ -559,9 +738,21 @@ class UltraPremiumScraper:
         # Extractors
         self.trafilatura = TrafilaturaExtractor()
         self.newspaper = NewspaperExtractor()
-        self.playwright = PlaywrightExtractor() if PLAYWRIGHT_AVAILABLE else None
+        self.playwright = PlaywrightExtractor(
+            max_contexts=self.config.browser_contexts,
+            pages_per_context=self.config.pages_per_context,
+            block_resources=self.config.block_resources,
+            acquire_timeout=self.config.render_timeout
+        ) if PLAYWRIGHT_AVAILABLE else None
         self.beautifulsoup = BeautifulSoupExtractor()
         
+        # CPU-bound HTML parsing runs off the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.extraction_workers,
+            thread_name_prefix="scraper-extract"
+        )
+        self._domain_slots: Dict[str, asyncio.Semaphore] = {}
+        
         # Utilities
         self.user_agent = UserAgentRotator()
         self.cache = ContentCache(
@@ -609,14 +800,15 @@ class UltraPremiumScraper:
                 cached.metadata["from_cache"] = True
                 return cached
         
-        # Fetch HTML
+        # Fetch HTML (per-domain limit)
         html = None
         
-        if use_javascript and self.playwright:
-            html = await self.playwright.extract(url)
-        
-        if not html:
-            html = await self._fetch_html(url)
+        async with self._domain_slot(url):
+            if use_javascript and self.playwright:
+                html = await self.playwright.extract(url)
+            
+            if not html:
+                html = await self._fetch_html(url)
         
         if not html:
             return ExtractedContent(
@@ -648,19 +840,35 @@ class UltraPremiumScraper:
         self,
         urls: List[str],
         method: ExtractionMethod = ExtractionMethod.AUTO,
-        max_concurrent: int = 5
+        max_concurrent: int = 16,
+        use_javascript: bool = False
     ) -> List[ExtractedContent]:
         """
         Birden fazla URL'den paralel içerik çıkar.
+        
+        Toplam eşzamanlılık `max_concurrent`, domain başına eşzamanlılık
+        `config.max_concurrent_per_domain` ile sınırlıdır. Tekrarlanan
+        URL'ler bir kez çekilir.
         """
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def extract_with_semaphore(url: str) -> ExtractedContent:
             async with semaphore:
-                return await self.extract(url, method)
+                return await self.extract(url, method, use_javascript=use_javascript)
         
-        tasks = [extract_with_semaphore(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(extract_with_semaphore(url) for url in unique_urls))
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
+    
+    def _domain_slot(self, url: str) -> asyncio.Semaphore:
+        """Domain başına eşzamanlı istek sınırı."""
+        domain = urlparse(url).netloc.lower()
+        slot = self._domain_slots.get(domain)
+        if slot is None:
+            slot = asyncio.Semaphore(self.config.max_concurrent_per_domain)
+            self._domain_slots[domain] = slot
+        return slot
     
     async def _fetch_html(self, url: str) -> Optional[str]:
         """HTML içeriğini çek."""
@@ -689,7 +897,19 @@ class UltraPremiumScraper:
         html: str,
         method: ExtractionMethod
     ) -> ExtractedContent:
-        """Belirtilen yöntemle içerik çıkar."""
+        """Belirtilen yöntemle içerik çıkar (worker havuzunda)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._extract_sync, url, html, method
+        )
+    
+    def _extract_sync(
+        self,
+        url: str,
+        html: str,
+        method: ExtractionMethod
+    ) -> ExtractedContent:
+        """CPU-bound çıkarım; event loop thread'inde çalıştırılmamalı."""
         
         if method == ExtractionMethod.AUTO or method == ExtractionMethod.HYBRID:
             # Try multiple methods and merge
@@ -901,6 +1121,7 @@ class UltraPremiumScraper:
         await self.client.aclose()
         if self.playwright:
             await self.playwright.close()
+        self._executor.shutdown(wait=False)
 
 
 # Singleton instance
@@ -920,7 +1141,7 @@ async def extract_url(url: str, use_javascript: bool = False) -> ExtractedConten
     return await scraper.extract(url, use_javascript=use_javascript)
 
 
-async def extract_urls(urls: List[str], max_concurrent: int = 5) -> List[ExtractedContent]:
+async def extract_urls(urls: List[str], max_concurrent: int = 16) -> List[ExtractedContent]:
     """Paralel URL çıkarımı."""
     scraper = get_premium_scraper()
     return await scraper.extract_batch(urls, max_concurrent=max_concurrent)
@@ -10,9 +10,9 @@ Perplexity AI, ChatGPT Browse, Google Bard kalitesinde sonuçlar.
 - Gerçek içerik çıkarma (sadece link değil)
 - AI-powered özet ve sentez
 - Kaynak doğrulama ve güvenilirlik skoru
-- Akıllı cache sistemi
+- Akıllı cache sistemi (disk, TTL, ETag/Last-Modified yeniden doğrulama)
 - Rate limiting ve hata yönetimi
-- Paralel işleme
+- Paralel işleme (havuzlu async HTTP, sınırlı eşzamanlı içerik çıkarma)
 - Dil algılama ve çoklu dil desteği
 """
 
@@ -21,12 +21,11 @@ import hashlib
 import json
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus, urljoin, urlparse
-import concurrent.futures
 from functools import lru_cache
 import threading
 
@@ -34,6 +33,8 @@ import httpx
 import requests
 from bs4 import BeautifulSoup
 
+from tools.http_client import HTTPCache, PooledHTTPClient, get_http_client, run_sync
+
 # ============ PREMIUM EXTRACTION (OPTIONAL) ============
 # Trafilatura - Best-in-class article extraction
 try:
@@ -152,13 +153,45 @@ class ContentExtraction:
 
 # ============ CACHE SYSTEM ============
 
+def _response_to_dict(response: SearchResponse) -> Dict[str, Any]:
+    """SearchResponse -> JSON uyumlu sözlük"""
+    data = asdict(response)
+    for result in data["results"]:
+        result["source_type"] = result["source_type"].value
+        result["quality"] = result["quality"].value
+        result["provider"] = result["provider"].value
+    return data
+
+
+def _response_from_dict(data: Dict[str, Any]) -> SearchResponse:
+    """Sözlük -> SearchResponse"""
+    results = [
+        SearchResult(**{
+            **r,
+            "source_type": SourceType(r["source_type"]),
+            "quality": ContentQuality(r["quality"]),
+            "provider": SearchProvider(r["provider"]),
+        })
+        for r in data.get("results", [])
+    ]
+    return SearchResponse(**{**data, "results": results})
+
+
 class SearchCache:
-    """Thread-safe arama cache sistemi"""
+    """
+    Thread-safe arama cache sistemi.
+    
+    Bellek içi katmanın arkasında opsiyonel disk deposu (`store`) vardır;
+    yanıtlar yeniden başlatmadan sonra da TTL boyunca kullanılır.
+    """
+    
+    NAMESPACE = "search"
     
-    def __init__(self, max_size: int = 500, ttl_minutes: int = 30):
+    def __init__(self, max_size: int = 500, ttl_minutes: int = 30, store: Optional[HTTPCache] = None):
         self.cache: Dict[str, Tuple[SearchResponse, datetime]] = {}
         self.max_size = max_size
         self.ttl = timedelta(minutes=ttl_minutes)
+        self.store = store
         self.lock = threading.Lock()
         self.hits = 0
         self.misses = 0
@@ -184,9 +217,21 @@ class SearchCache:
                     return response
                 else:
                     del self.cache[key]
-            
+        
+        # Disk katmanı
+        if self.store is not None:
+            data = self.store.get_json(self.NAMESPACE, key)
+            if data is not None:
+                response = _response_from_dict(data)
+                response.cached = True
+                with self.lock:
+                    self.cache[key] = (response, datetime.fromisoformat(response.timestamp))
+                    self.hits += 1
+                return response
+        
+        with self.lock:
             self.misses += 1
-            return None
+        return None
     
     def set(self, query: str, response: SearchResponse, params: Dict = None):
         """Cache'e kaydet"""
@@ -200,6 +245,9 @@ class SearchCache:
             
             key = self._hash_query(query, params)
             self.cache[key] = (response, datetime.now())
+        
+        if self.store is not None:
+            self.store.put_json(self.NAMESPACE, key, _response_to_dict(response), ttl=self.ttl.total_seconds())
     
     def clear(self):
         """Cache'i temizle"""
@@ -207,6 +255,8 @@ class SearchCache:
             self.cache.clear()
             self.hits = 0
             self.misses = 0
+        if self.store is not None:
+            self.store.clear(self.NAMESPACE)
     
     def get_stats(self) -> Dict[str, Any]:
         """Cache istatistikleri"""
@@ -218,7 +268,8 @@ class SearchCache:
                 "hits": self.hits,
                 "misses": self.misses,
                 "hit_rate": (self.hits / total * 100) if total > 0 else 0,
-                "ttl_minutes": self.ttl.seconds // 60
+                "ttl_minutes": self.ttl.seconds // 60,
+                "persistent": self.store is not None
             }
 
 
@@ -267,9 +318,18 @@ class ContentExtractor:
         'stackoverflow.com', 'github.com'
     ]
     
-    def __init__(self, timeout: float = 15.0, max_content_length: int = 15000):
+    # Çıkarım artefaktlarının disk önbelleğindeki ömrü (saniye)
+    EXTRACTION_TTL = 7 * 24 * 3600
+    
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_content_length: int = 15000,
+        http_client: Optional[PooledHTTPClient] = None
+    ):
         self.timeout = timeout
         self.max_content_length = max_content_length
+        self.http = http_client or get_http_client()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -291,8 +351,44 @@ class ContentExtractor:
             if response.encoding is None:
                 response.encoding = 'utf-8'
             
-            html = response.text
+            return self.extract_from_html(response.text, url, use_premium)
             
+        except Exception as e:
+            return None
+    
+    async def extract_async(self, url: str, use_premium: bool = True) -> Optional[ContentExtraction]:
+        """
+        URL'den içerik çıkar (havuzlu async HTTP).
+        
+        Sayfa HTTP önbelleğinden ETag/Last-Modified ile yeniden doğrulanır;
+        gövde değişmediyse önceki çıkarım diskten döner, ayrıştırma
+        event loop'u bloklamamak için thread'de yapılır.
+        """
+        try:
+            response = await self.http.get(url)
+            if not response.ok:
+                return None
+            
+            cache = self.http.cache
+            key = f"{url}|{response.body_hash}|{int(use_premium)}"
+            if cache is not None:
+                cached = await asyncio.to_thread(cache.get_json, "extraction", key)
+                if cached is not None:
+                    return ContentExtraction(**cached)
+            
+            extraction = await asyncio.to_thread(self.extract_from_html, response.text, url, use_premium)
+            if extraction and cache is not None:
+                await asyncio.to_thread(
+                    cache.put_json, "extraction", key, asdict(extraction), self.EXTRACTION_TTL
+                )
+            return extraction
+            
+        except Exception:
+            return None
+    
+    def extract_from_html(self, html: str, url: str, use_premium: bool = True) -> Optional[ContentExtraction]:
+        """İndirilmiş HTML'den içerik çıkar"""
+        try:
             # Premium extraction with Trafilatura (if available)
             if use_premium and TRAFILATURA_AVAILABLE:
                 premium_result = self._extract_with_trafilatura(html, url)
@@ -752,98 +848,139 @@ class DuckDuckGoProvider:
     INSTANT_ANSWER_API = "https://api.duckduckgo.com/"
     HTML_SEARCH_URL = "https://html.duckduckgo.com/html/"
     
-    def __init__(self, timeout: float = 12.0):
+    # Sonuç sayfaları kısa süre, anlık cevaplar daha uzun önbellekte tutulur
+    SEARCH_TTL = 600
+    INSTANT_ANSWER_TTL = 3600
+    
+    def __init__(self, timeout: float = 12.0, http_client: Optional[PooledHTTPClient] = None):
         self.timeout = timeout
+        self.http = http_client or get_http_client()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         })
     
+    @staticmethod
+    def _instant_answer_params(query: str) -> Dict[str, Any]:
+        return {
+            "q": query,
+            "format": "json",
+            "no_html": 1,
+            "skip_disambig": 1,
+        }
+    
     def instant_answer(self, query: str) -> Optional[Dict[str, Any]]:
         """Instant Answer API"""
         try:
-            params = {
-                "q": query,
-                "format": "json",
-                "no_html": 1,
-                "skip_disambig": 1,
-            }
-            
             response = self.session.get(
                 self.INSTANT_ANSWER_API,
-                params=params,
+                params=self._instant_answer_params(query),
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("Abstract"):
-                    return {
-                        "type": "instant_answer",
-                        "title": data.get("Heading", ""),
-                        "abstract": data.get("Abstract", ""),
-                        "source": data.get("AbstractSource", ""),
-                        "url": data.get("AbstractURL", ""),
-                        "image": data.get("Image", ""),
-                        "related_topics": [
-                            {"text": t.get("Text", ""), "url": t.get("FirstURL", "")}
-                            for t in data.get("RelatedTopics", [])[:5]
-                            if isinstance(t, dict) and "Text" in t
-                        ]
-                    }
-                
-                # Infobox (knowledge panel)
-                if data.get("Infobox"):
-                    return {
-                        "type": "knowledge_panel",
-                        "title": data.get("Heading", ""),
-                        "content": data.get("Infobox", {}).get("content", []),
-                        "url": data.get("AbstractURL", "")
-                    }
+                return self._parse_instant_answer(response.json())
         except:
             pass
         
         return None
     
+    async def instant_answer_async(self, query: str) -> Optional[Dict[str, Any]]:
+        """Instant Answer API (async, önbellekli)"""
+        try:
+            response = await self.http.get(
+                self.INSTANT_ANSWER_API,
+                params=self._instant_answer_params(query),
+                ttl=self.INSTANT_ANSWER_TTL
+            )
+            if response.status_code == 200:
+                return self._parse_instant_answer(response.json())
+        except Exception:
+            pass
+        
+        return None
+    
+    def _parse_instant_answer(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Instant Answer JSON'unu ayrıştır"""
+        if data.get("Abstract"):
+            return {
+                "type": "instant_answer",
+                "title": data.get("Heading", ""),
+                "abstract": data.get("Abstract", ""),
+                "source": data.get("AbstractSource", ""),
+                "url": data.get("AbstractURL", ""),
+                "image": data.get("Image", ""),
+                "related_topics": [
+                    {"text": t.get("Text", ""), "url": t.get("FirstURL", "")}
+                    for t in data.get("RelatedTopics", [])[:5]
+                    if isinstance(t, dict) and "Text" in t
+                ]
+            }
+        
+        # Infobox (knowledge panel)
+        if data.get("Infobox"):
+            return {
+                "type": "knowledge_panel",
+                "title": data.get("Heading", ""),
+                "content": data.get("Infobox", {}).get("content", []),
+                "url": data.get("AbstractURL", "")
+            }
+        
+        return None
+    
     def search(self, query: str, num_results: int = 10) -> List[Dict[str, str]]:
         """HTML arama"""
-        results = []
-        
         try:
-            data = {
-                "q": query,
-                "kl": "tr-tr",  # Türkiye
-            }
-            
             response = self.session.post(
                 self.HTML_SEARCH_URL,
-                data=data,
+                data={"q": query, "kl": "tr-tr"},  # Türkiye
                 timeout=self.timeout
             )
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Sonuçları parse et
-                for result in soup.select('.result')[:num_results]:
-                    link_elem = result.select_one('.result__a')
-                    snippet_elem = result.select_one('.result__snippet')
-                    
-                    if link_elem:
-                        url = link_elem.get('href', '')
-                        title = link_elem.get_text(strip=True)
-                        snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
-                        
-                        if url and title:
-                            results.append({
-                                "title": title,
-                                "url": url,
-                                "snippet": snippet
-                            })
+                return self._parse_results(response.text, num_results)
         except:
             pass
         
+        return []
+    
+    async def search_async(self, query: str, num_results: int = 10) -> List[Dict[str, str]]:
+        """HTML arama (async, önbellekli)"""
+        try:
+            response = await self.http.post(
+                self.HTML_SEARCH_URL,
+                data={"q": query, "kl": "tr-tr"},
+                ttl=self.SEARCH_TTL
+            )
+            if response.status_code == 200:
+                return await asyncio.to_thread(self._parse_results, response.text, num_results)
+        except Exception:
+            pass
+        
+        return []
+    
+    @staticmethod
+    def _parse_results(html: str, num_results: int) -> List[Dict[str, str]]:
+        """Sonuç sayfasını ayrıştır"""
+        results = []
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        for result in soup.select('.result')[:num_results]:
+            link_elem = result.select_one('.result__a')
+            snippet_elem = result.select_one('.result__snippet')
+            
+            if link_elem:
+                url = link_elem.get('href', '')
+                title = link_elem.get_text(strip=True)
+                snippet = snippet_elem.get_text(strip=True) if snippet_elem else ""
+                
+                if url and title:
+                    results.append({
+                        "title": title,
+                        "url": url,
+                        "snippet": snippet
+                    })
+        
         return results
 
 
@@ -852,10 +989,83 @@ class WikipediaProvider:
     
     API_URL = "https://tr.wikipedia.org/w/api.php"
     
-    def __init__(self, timeout: float = 10.0, language: str = "tr"):
+    CACHE_TTL = 3600
+    
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        language: str = "tr",
+        http_client: Optional[PooledHTTPClient] = None
+    ):
         self.timeout = timeout
         self.language = language
         self.api_url = f"https://{language}.wikipedia.org/w/api.php"
+        self.http = http_client or get_http_client()
+        self.session = requests.Session()
+    
+    @staticmethod
+    def _search_params(query: str, num_results: int) -> Dict[str, Any]:
+        return {
+            "action": "query",
+            "list": "search",
+            "srsearch": query,
+            "format": "json",
+            "srlimit": num_results,
+            "utf8": 1
+        }
+    
+    @staticmethod
+    def _extract_params(page_ids: List[int]) -> Dict[str, Any]:
+        return {
+            "action": "query",
+            "pageids": "|".join(str(p) for p in page_ids),
+            "prop": "extracts",
+            "exintro": 1,  # Sadece giriş
+            "explaintext": 1,  # Plain text
+            "exlimit": "max",
+            "format": "json"
+        }
+    
+    def _page_url(self, title: str) -> str:
+        return f"https://{self.language}.wikipedia.org/wiki/{quote_plus(title.replace(' ', '_'))}"
+    
+    async def search_async(self, query: str, num_results: int = 3) -> List[Dict[str, Any]]:
+        """
+        Wikipedia arama (async, önbellekli).
+        
+        Sayfa girişleri tek tek değil, tek bir toplu extracts isteğiyle alınır.
+        """
+        try:
+            response = await self.http.get(
+                self.api_url, params=self._search_params(query, num_results), ttl=self.CACHE_TTL
+            )
+            if response.status_code != 200:
+                return []
+            items = response.json().get("query", {}).get("search", [])
+            if not items:
+                return []
+            
+            page_ids = [item.get("pageid") for item in items]
+            contents: Dict[str, str] = {}
+            extracts = await self.http.get(
+                self.api_url, params=self._extract_params(page_ids), ttl=self.CACHE_TTL
+            )
+            if extracts.status_code == 200:
+                pages = extracts.json().get("query", {}).get("pages", {})
+                contents = {pid: page.get("extract", "")[:3000] for pid, page in pages.items()}
+            
+            return [
+                {
+                    "title": item.get("title", ""),
+                    "url": self._page_url(item.get("title", "")),
+                    "snippet": re.sub(r'<[^>]+>', '', item.get("snippet", "")),
+                    "content": contents.get(str(item.get("pageid")), ""),
+                    "source": "Wikipedia"
+                }
+                for item in items
+            ]
+        except Exception:
+            return []
     
     def search(self, query: str, num_results: int = 3) -> List[Dict[str, Any]]:
         """Wikipedia arama"""
@@ -863,16 +1073,9 @@ class WikipediaProvider:
         
         try:
             # Arama yap
-            params = {
-                "action": "query",
-                "list": "search",
-                "srsearch": query,
-                "format": "json",
-                "srlimit": num_results,
-                "utf8": 1
-            }
+            params = self._search_params(query, num_results)
             
-            response = requests.get(self.api_url, params=params, timeout=self.timeout)
+            response = self.session.get(self.api_url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -889,7 +1092,7 @@ class WikipediaProvider:
                     # Sayfa içeriğini al
                     content = self._get_page_content(page_id)
                     
-                    url = f"https://{self.language}.wikipedia.org/wiki/{quote_plus(title.replace(' ', '_'))}"
+                    url = self._page_url(title)
                     
                     results.append({
                         "title": title,
@@ -906,16 +1109,9 @@ class WikipediaProvider:
     def _get_page_content(self, page_id: int) -> str:
         """Sayfa içeriğini al"""
         try:
-            params = {
-                "action": "query",
-                "pageids": page_id,
-                "prop": "extracts",
-                "exintro": 1,  # Sadece giriş
-                "explaintext": 1,  # Plain text
-                "format": "json"
-            }
+            params = self._extract_params([page_id])
             
-            response = requests.get(self.api_url, params=params, timeout=self.timeout)
+            response = self.session.get(self.api_url, params=params, timeout=self.timeout)
             
             if response.status_code == 200:
                 data = response.json()
@@ -944,7 +1140,9 @@ class PremiumWebSearchEngine:
         use_wikipedia: bool = True,
         cache_enabled: bool = True,
         parallel_extraction: bool = True,
-        min_content_length: int = 200
+        min_content_length: int = 200,
+        max_concurrent_extractions: int = 8,
+        http_client: Optional[PooledHTTPClient] = None
     ):
         self.max_results = max_results
         self.extract_content = extract_content
@@ -952,14 +1150,20 @@ class PremiumWebSearchEngine:
         self.cache_enabled = cache_enabled
         self.parallel_extraction = parallel_extraction
         self.min_content_length = min_content_length
+        self.max_concurrent_extractions = max_concurrent_extractions
+        
+        # Shared pooled HTTP client
+        if http_client is None:
+            http_client = get_http_client() if cache_enabled else PooledHTTPClient()
+        self.http = http_client
         
         # Providers
-        self.ddg = DuckDuckGoProvider()
-        self.wiki = WikipediaProvider()
-        self.extractor = ContentExtractor()
+        self.ddg = DuckDuckGoProvider(http_client=self.http)
+        self.wiki = WikipediaProvider(http_client=self.http)
+        self.extractor = ContentExtractor(http_client=self.http)
         
         # Cache
-        self.cache = SearchCache() if cache_enabled else None
+        self.cache = SearchCache(store=self.http.cache) if cache_enabled else None
         
         # Stats
         self.stats = {
@@ -975,10 +1179,29 @@ class PremiumWebSearchEngine:
         num_results: Optional[int] = None,
         extract_content: Optional[bool] = None,
         include_wikipedia: Optional[bool] = None
+    ) -> SearchResponse:
+        """
+        Ana arama fonksiyonu (senkron).
+        
+        `search_async` arka plandaki kalıcı event loop'ta çalıştırılır;
+        async koddan doğrudan `await search_async(...)` kullanın.
+        """
+        return run_sync(self.search_async(query, num_results, extract_content, include_wikipedia))
+    
+    async def search_async(
+        self,
+        query: str,
+        num_results: Optional[int] = None,
+        extract_content: Optional[bool] = None,
+        include_wikipedia: Optional[bool] = None
     ) -> SearchResponse:
         """
         Ana arama fonksiyonu.
         
+        Instant answer, web araması ve Wikipedia eşzamanlı istenir; web
+        sonuçlarının içerik çıkarımı arama sonucu gelir gelmez (diğer
+        sağlayıcıları beklemeden) sınırlı eşzamanlılıkla başlar.
+        
         Args:
             query: Arama sorgusu
             num_results: Sonuç sayısı
@@ -995,9 +1218,9 @@ class PremiumWebSearchEngine:
         extract_content = extract_content if extract_content is not None else self.extract_content
         include_wikipedia = include_wikipedia if include_wikipedia is not None else self.use_wikipedia
         
-        # Cache kontrolü
+        # Cache kontrolü (disk katmanı SQLite, event loop'u bloklamasın)
         if self.cache_enabled and self.cache:
-            cached = self.cache.get(query, {"num_results": num_results})
+            cached = await asyncio.to_thread(self.cache.get, query, {"num_results": num_results})
             if cached:
                 return cached
         
@@ -1006,21 +1229,17 @@ class PremiumWebSearchEngine:
         instant_answer = None
         knowledge_panel = None
         related_queries = []
+        ia_task = wiki_task = extraction_task = None
         
         try:
-            # 1. DuckDuckGo Instant Answer
-            ia = self.ddg.instant_answer(query)
-            if ia:
-                if ia.get("type") == "instant_answer":
-                    instant_answer = ia
-                elif ia.get("type") == "knowledge_panel":
-                    knowledge_panel = ia
-                
-                related = ia.get("related_topics", [])
-                related_queries = [r.get("text", "")[:100] for r in related if r.get("text")]
+            # 1. Sağlayıcılar eşzamanlı
+            ia_task = asyncio.create_task(self.ddg.instant_answer_async(query))
+            wiki_task = (
+                asyncio.create_task(self.wiki.search_async(query, 2)) if include_wikipedia else None
+            )
             
             # 2. DuckDuckGo Web Search
-            ddg_results = self.ddg.search(query, num_results + 2)
+            ddg_results = await self.ddg.search_async(query, num_results + 2)
             providers_used.append("DuckDuckGo")
             
             for r in ddg_results:
@@ -1039,9 +1258,14 @@ class PremiumWebSearchEngine:
                 
                 results.append(result)
             
-            # 3. Wikipedia (opsiyonel)
-            if include_wikipedia:
-                wiki_results = self.wiki.search(query, 2)
+            # 3. İçerik çıkarma - Wikipedia'yı beklemeden başlar
+            extraction_task = None
+            if extract_content and results:
+                extraction_task = asyncio.create_task(self._extract_contents_async(list(results)))
+            
+            # 4. Wikipedia (opsiyonel)
+            if wiki_task is not None:
+                wiki_results = await wiki_task
                 providers_used.append("Wikipedia")
                 
                 for w in wiki_results:
@@ -1057,9 +1281,18 @@ class PremiumWebSearchEngine:
                     )
                     results.insert(0, result)  # Wikipedia'yı başa al
             
-            # 4. İçerik çıkarma (paralel)
-            if extract_content and results:
-                results = self._extract_contents_parallel(results)
+            if extraction_task is not None:
+                await extraction_task
+            
+            ia = await ia_task
+            if ia:
+                if ia.get("type") == "instant_answer":
+                    instant_answer = ia
+                elif ia.get("type") == "knowledge_panel":
+                    knowledge_panel = ia
+                
+                related = ia.get("related_topics", [])
+                related_queries = [r.get("text", "")[:100] for r in related if r.get("text")]
             
             # Sonuçları filtrele ve sırala
             results = self._filter_and_rank(results, query)
@@ -1088,7 +1321,7 @@ class PremiumWebSearchEngine:
             
             # Cache'e kaydet
             if self.cache_enabled and self.cache and response.success:
-                self.cache.set(query, response, {"num_results": num_results})
+                await asyncio.to_thread(self.cache.set, query, response, {"num_results": num_results})
             
             return response
             
@@ -1100,39 +1333,59 @@ class PremiumWebSearchEngine:
                 error_message=str(e),
                 search_time_ms=int((time.time() - start_time) * 1000)
             )
+        finally:
+            # Hata/iptal yolunda yarım kalan sağlayıcı task'ları sahipsiz kalmasın
+            await self._reap_tasks(ia_task, wiki_task, extraction_task)
+    
+    @staticmethod
+    async def _reap_tasks(*tasks: Optional[asyncio.Task]) -> None:
+        """Bitmemiş task'ları iptal et ve hepsini bekle (sonuç/hata tüketilir)."""
+        tasks = [t for t in tasks if t is not None]
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
     
     def _extract_contents_parallel(self, results: List[SearchResult]) -> List[SearchResult]:
         """Paralel içerik çıkarma"""
         if not self.parallel_extraction:
             return self._extract_contents_sequential(results)
         
-        def extract_single(result: SearchResult) -> SearchResult:
+        return run_sync(self._extract_contents_async(results))
+    
+    async def _extract_contents_async(self, results: List[SearchResult]) -> List[SearchResult]:
+        """
+        Sınırlı eşzamanlılıkla içerik çıkarma.
+        
+        En fazla `max_concurrent_extractions` sayfa aynı anda indirilir;
+        host başına sınır HTTP istemcisinde uygulanır.
+        """
+        limit = self.max_concurrent_extractions if self.parallel_extraction else 1
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def extract_single(result: SearchResult) -> SearchResult:
             if result.full_content:  # Zaten var (Wikipedia gibi)
                 return result
             
-            try:
-                extraction = self.extractor.extract(result.url)
-                if extraction:
-                    result.full_content = extraction.main_content
-                    result.word_count = extraction.word_count
-                    result.language = extraction.language
-                    result.published_date = extraction.published_date
-                    result.author = extraction.author
-                    
-                    if extraction.meta_description and not result.snippet:
-                        result.snippet = extraction.meta_description
-                    
-                    self.stats["content_extractions"] += 1
-            except:
-                pass
+            async with semaphore:
+                extraction = await self.extractor.extract_async(result.url)
+            
+            if extraction:
+                result.full_content = extraction.main_content
+                result.word_count = extraction.word_count
+                result.language = extraction.language
+                result.published_date = extraction.published_date
+                result.author = extraction.author
+                
+                if extraction.meta_description and not result.snippet:
+                    result.snippet = extraction.meta_description
+                
+                self.stats["content_extractions"] += 1
             
             return result
         
-        # Paralel çalıştır
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(extract_single, results))
-        
-        return results
+        return list(await asyncio.gather(*(extract_single(r) for r in results)))
     
     def _extract_contents_sequential(self, results: List[SearchResult]) -> List[SearchResult]:
         """Sıralı içerik çıkarma"""
@@ -1327,6 +1580,8 @@ URL: {result.url}
         if self.cache:
             stats["cache"] = self.cache.get_stats()
         
+        stats["http"] = self.http.get_stats()
+        
         return stats
     
     def clear_cache(self):